@@ -15,8 +15,10 @@
 import csv
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from flask import Flask
 from ppr_api.exceptions import BusinessException
@@ -24,8 +26,9 @@ from ppr_api.models import db, Registration, SearchRequest, TestSearch, TestSear
 
 from search_tester import create_app
 from search_tester.utils.db_utils import QUERY_LEGACY_RESULTS_DATE, QUERY_LEGACY_RESULTS_DATE_TIME, QUERY_LEGACY_RESULTS_MOST_RECENT
-from search_tester.utils.helpers import TO_API_SEARCH_TYPE
+from search_tester.utils.helpers import TO_API_SEARCH_TYPE, parse_quotient_sweep
 from search_tester.utils.logging import setup_logging
+from search_tester.utils.timing import get_db_time, percentile, register_db_timer, start_db_timer
 
 
 setup_logging(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'logging.conf'))
@@ -53,7 +56,7 @@ def add_legacy_results(search: TestSearch, result_list: List[dict], match_type:
         result.index = index
         search.results.append(result)
 
-def add_api_results(search: TestSearch, results: List[dict]):
+def add_api_results(search: TestSearch, search_type: str, results: List[dict]):
     """Add the given api results to the TestSearch obj."""
     exact_index = 0
     similar_index = 0
@@ -136,6 +139,88 @@ def get_batch_searches_table(app: Flask, batch_searches: dict):
     rows = results.fetchall()
     return parse_results(batch_searches, [r._asdict() for r in rows], True)
 
+def get_api_criteria(search_type: str, legacy_criteria: str) -> dict:
+    """Return the ppr-api search criteria for the legacy search criteria."""
+    criteria = {'value': legacy_criteria}
+    if search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
+        # remove dbl spaces
+        name = re.sub(' +', ' ', legacy_criteria).split(' ')
+        criteria = {'debtorName': {'first': name[1], 'last': name[0]}}
+        if len(name) > 2:
+            criteria['debtorName']['second'] = name[2]
+    elif search_type == SearchRequest.SearchTypes.BUSINESS_DEBTOR.value:
+        criteria = {'debtorName': {'business': legacy_criteria}}
+    return criteria
+
+
+def run_search(app: Flask, search_type: str, legacy_search: dict) -> Tuple[TestSearch, dict]:
+    """Run one search in a worker thread with its own app context and db session, returning the search and times."""
+    with app.app_context():
+        search = TestSearch()
+        search.search_criteria = str(legacy_search['criteria'])
+        search.results = []
+        # add legacy results exact
+        add_legacy_results(search, legacy_search['exact_matches'], TestSearchResult.MatchType.EXACT)
+        # add legacy results similar
+        add_legacy_results(search, legacy_search['similar_matches'], TestSearchResult.MatchType.SIMILAR)
+
+        ### get ppr-api search results
+        request_json = {
+            'criteria': get_api_criteria(search_type, legacy_search['criteria']),
+            'type': TO_API_SEARCH_TYPE[search_type]
+        }
+        query = SearchRequest.create_from_json(request_json, '0', 'search-tester')
+        # run search on api fn
+        start_db_timer()
+        start = time.perf_counter()
+        query.search()
+        search.run_time = time.perf_counter() - start
+        db_time = get_db_time()
+        # save results
+        start = time.perf_counter()
+        add_api_results(search, search_type, query.search_response or [])
+        build_time = time.perf_counter() - start
+        return search, {'run_time': search.run_time, 'db_time': db_time, 'build_time': build_time}
+
+
+def run_batch(app: Flask, search_type: str, legacy_searches: dict, quotients: dict) -> TestSearchBatch:
+    """Run and save a batch of searches concurrently with the similarity quotients, recording the batch stats."""
+    app.config.update(quotients)
+    workers = max(app.config['SEARCH_WORKERS'], 1)
+    batch = TestSearchBatch()
+    batch.search_type = search_type
+    batch.test_date = datetime.utcnow()
+    batch.sim_val_business = float(app.config['SIMILARITY_QUOTIENT_BUSINESS_NAME'])
+    batch.sim_val_first_name = float(app.config['SIMILARITY_QUOTIENT_FIRST_NAME'])
+    batch.sim_val_last_name = float(app.config['SIMILARITY_QUOTIENT_LAST_NAME'])
+    batch.sim_val_default = float(app.config['SIMILARITY_QUOTIENT_DEFAULT'])
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_search, app, search_type, legacy_search) for legacy_search in legacy_searches.values()
+        ]
+        results = [future.result() for future in futures]
+    batch.elapsed_time = time.perf_counter() - start
+    batch.searches = [search for search, _ in results]
+    run_times = sorted(times['run_time'] for _, times in results)
+    batch.workers = workers
+    batch.search_count = len(results)
+    batch.p50_time = percentile(run_times, 50)
+    batch.p95_time = percentile(run_times, 95)
+    batch.p99_time = percentile(run_times, 99)
+    batch.db_time = sum(times['db_time'] for _, times in results)
+    batch.python_time = sum(run_times) - batch.db_time
+    batch.build_time = sum(times['build_time'] for _, times in results)
+    # save batch to db
+    batch.save()
+    app.logger.debug(
+        f'Batch {search_type} {quotients}: {batch.search_count} searches with {workers} workers in '
+        f'{batch.elapsed_time:.2f}s p50={batch.p50_time}s p95={batch.p95_time}s p99={batch.p99_time}s '
+        f'db={batch.db_time:.2f}s python={batch.python_time:.2f}s build={batch.build_time:.2f}s'
+    )
+    return batch
+
+
 if __name__ == '__main__':
     try:
         app = create_app()
@@ -160,66 +245,24 @@ if __name__ == '__main__':
             else:
                 batch_searches = get_batch_searches_table(app, batch_searches)
 
+            register_db_timer()
+            # without a sweep run each batch once with the configured quotients
+            quotient_settings = parse_quotient_sweep(app.config['SIMILARITY_QUOTIENT_SWEEP']) or [{}]
             for search_type in batch_searches:
-                try:
-                    if not batch_searches[search_type]:
-                        # only do search batches for search types we got legacy data for
-                        continue
-                    # init new batch
-                    batch = TestSearchBatch()
-                    batch.search_type = search_type
-                    batch.test_date = datetime.utcnow()
-                    batch.sim_val_business = app.config['SIMILARITY_QUOTIENT_BUSINESS_NAME']
-                    batch.sim_val_first_name = app.config['SIMILARITY_QUOTIENT_FIRST_NAME']
-                    batch.sim_val_last_name = app.config['SIMILARITY_QUOTIENT_LAST_NAME']
-                    batch.searches = []
-                    # populate searches
-                    for time in batch_searches[search_type]:
-                        legacy_search = batch_searches[search_type][time]
-                        search = TestSearch()
-                        search.search_criteria = str(legacy_search['criteria'])
-                        search.results = []
-                        # add legacy results exact
-                        add_legacy_results(search, legacy_search['exact_matches'], TestSearchResult.MatchType.EXACT)
-                        # add legacy results similar
-                        add_legacy_results(search, legacy_search['similar_matches'], TestSearchResult.MatchType.SIMILAR)
-                    
-                        ### get ppr-api search results
-                        # prep search
-                        criteria = { 'value': legacy_search['criteria'] }
-                        if search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
-                            # remove dbl spaces
-                            legacy_search['criteria'] = re.sub(' +', ' ', legacy_search['criteria'])
-                            name = legacy_search['criteria'].split(' ')
-                            criteria = { 'debtorName': { 'first': name[1], 'last': name[0] }}
-                            if len(name) > 2:
-                                criteria['debtorName']['second'] = name[2]
-                        elif search_type == SearchRequest.SearchTypes.BUSINESS_DEBTOR.value:
-                            criteria = { 'debtorName': { 'business': legacy_search['criteria'] }}
-
-                        request_json = { 'criteria': criteria, 'type': TO_API_SEARCH_TYPE[search_type] }
-                        query = SearchRequest.create_from_json(request_json, '0', 'search-tester')
-                        # run search on api fn
-                        start = datetime.utcnow()
-                        query.search()
-                        end  = datetime.utcnow()
-                        interval = end - start
-                        search.run_time = interval.total_seconds()
-                        # save results
-                        results = query.search_response or []
-                        add_api_results(search, results)
-                        # add search to batch
-                        batch.searches.append(search)
-                    # save batch to db
-                    batch.save()
-                    completed += 1
-                    
-                except Exception as err:
-                    app.logger.error(err.with_traceback(None))
-                    app.logger.debug('Error occurred, rolling back db...')
-                    db.session.rollback()
-                    app.logger.debug(f'Rollback successful. Skipping batch for {search_type}')
-                    skipped += 1
+                if not batch_searches[search_type]:
+                    # only do search batches for search types we got legacy data for
+                    continue
+                for quotients in quotient_settings:
+                    try:
+                        run_batch(app, search_type, batch_searches[search_type], quotients)
+                        completed += 1
+
+                    except Exception as err:
+                        app.logger.error(err.with_traceback(None))
+                        app.logger.debug('Error occurred, rolling back db...')
+                        db.session.rollback()
+                        app.logger.debug(f'Rollback successful. Skipping batch for {search_type} {quotients}')
+                        skipped += 1
 
         app.logger.debug(f'Job completed.')
         app.logger.debug(f'Completed {completed} batches.')
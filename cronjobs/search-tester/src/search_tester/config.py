@@ -72,6 +72,10 @@ class _Config():  # pylint: disable=too-few-public-methods
     SIMILARITY_QUOTIENT_FIRST_NAME = os.getenv('SIMILARITY_QUOTIENT_FIRST_NAME', '0.23')
     SIMILARITY_QUOTIENT_LAST_NAME = os.getenv('SIMILARITY_QUOTIENT_LAST_NAME', '0.29')
     SIMILARITY_QUOTIENT_DEFAULT = os.getenv('SIMILARITY_QUOTIENT_DEFAULT', '0.5')
+    # Semicolon separated business,first name,last name[,default] quotient settings: each runs as a separate batch.
+    SIMILARITY_QUOTIENT_SWEEP = os.getenv('SIMILARITY_QUOTIENT_SWEEP', None)
+    # Number of searches run concurrently, each worker with its own database session.
+    SEARCH_WORKERS = int(os.getenv('SEARCH_WORKERS', '1'))
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
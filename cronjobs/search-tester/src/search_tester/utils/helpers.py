@@ -25,3 +25,23 @@ TO_API_SEARCH_TYPE = {
     'RG': 'REGISTRATION_NUMBER',
     'SS': 'SERIAL_NUMBER'
 }
+
+
+def parse_quotient_sweep(sweep: str) -> list:
+    """Parse the semicolon separated business,first name,last name[,default] similarity quotient settings."""
+    settings = []
+    if not sweep:
+        return settings
+    for setting in sweep.split(';'):
+        if not setting.strip():
+            continue
+        values = [float(value) for value in setting.split(',')]
+        quotients = {
+            'SIMILARITY_QUOTIENT_BUSINESS_NAME': values[0],
+            'SIMILARITY_QUOTIENT_FIRST_NAME': values[1],
+            'SIMILARITY_QUOTIENT_LAST_NAME': values[2]
+        }
+        if len(values) > 3:
+            quotients['SIMILARITY_QUOTIENT_DEFAULT'] = values[3]
+        settings.append(quotients)
+    return settings
@@ -0,0 +1,65 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Search timing utilities.
+
+Database time is the time spent executing statements, recorded per thread with SQLAlchemy engine events so
+concurrent workers each measure only their own searches.
+"""
+import math
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+_local = threading.local()
+
+
+def register_db_timer():
+    """Register the engine events that record statement execution time."""
+    if not event.contains(Engine, 'before_cursor_execute', before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+
+
+def start_db_timer():
+    """Start recording the database time for the current thread."""
+    _local.db_time = 0.0
+
+
+def get_db_time() -> float:
+    """Return the database time in seconds recorded for the current thread since the timer started."""
+    return getattr(_local, 'db_time', 0.0)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    """Engine event: note the statement start time."""
+    conn.info.setdefault('search_tester_start', []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    """Engine event: add the statement duration to the current thread database time."""
+    starts = conn.info.get('search_tester_start')
+    if starts and hasattr(_local, 'db_time'):
+        _local.db_time += time.perf_counter() - starts.pop()
+    elif starts:
+        starts.pop()
+
+
+def percentile(sorted_values: list, percent: int) -> float:
+    """Nearest rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)]
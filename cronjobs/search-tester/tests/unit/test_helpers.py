@@ -0,0 +1,51 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search tester helpers are working as expected."""
+import pytest
+
+from search_tester.utils.helpers import parse_quotient_sweep
+
+
+# testdata pattern is ({description}, {sweep}, {expected})
+TEST_SWEEP_DATA = [
+    ('None', None, []),
+    ('Empty', '', []),
+    ('Single', '0.4,0.23,0.29', [
+        {
+            'SIMILARITY_QUOTIENT_BUSINESS_NAME': 0.4,
+            'SIMILARITY_QUOTIENT_FIRST_NAME': 0.23,
+            'SIMILARITY_QUOTIENT_LAST_NAME': 0.29
+        }
+    ]),
+    ('Default and trailing separator', '0.4,0.23,0.29,0.5;0.5,0.3,0.3;', [
+        {
+            'SIMILARITY_QUOTIENT_BUSINESS_NAME': 0.4,
+            'SIMILARITY_QUOTIENT_FIRST_NAME': 0.23,
+            'SIMILARITY_QUOTIENT_LAST_NAME': 0.29,
+            'SIMILARITY_QUOTIENT_DEFAULT': 0.5
+        },
+        {
+            'SIMILARITY_QUOTIENT_BUSINESS_NAME': 0.5,
+            'SIMILARITY_QUOTIENT_FIRST_NAME': 0.3,
+            'SIMILARITY_QUOTIENT_LAST_NAME': 0.3
+        }
+    ])
+]
+
+
+@pytest.mark.parametrize('desc,sweep,expected', TEST_SWEEP_DATA)
+def test_parse_quotient_sweep(desc, sweep, expected):
+    """Assert that parsing the similarity quotient sweep setting works as expected."""
+    assert parse_quotient_sweep(sweep) == expected
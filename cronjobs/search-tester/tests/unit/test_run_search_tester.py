@@ -0,0 +1,85 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the concurrent search tester batches are working as expected."""
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+import run_search_tester
+
+
+QUOTIENTS = {
+    'SIMILARITY_QUOTIENT_BUSINESS_NAME': 0.5,
+    'SIMILARITY_QUOTIENT_FIRST_NAME': 0.3,
+    'SIMILARITY_QUOTIENT_LAST_NAME': 0.3,
+    'SIMILARITY_QUOTIENT_DEFAULT': 0.6
+}
+# testdata pattern is ({description}, {configured workers}, {workers}, {search count})
+TEST_BATCH_DATA = [
+    ('Sequential', 1, 1, 4),
+    ('Concurrent', 3, 3, 6),
+    ('Invalid workers', 0, 1, 2),
+    ('Empty', 2, 2, 0)
+]
+
+
+@pytest.mark.parametrize('desc,config_workers,workers,count', TEST_BATCH_DATA)
+def test_run_batch(mocker, desc, config_workers, workers, count):
+    """Assert that a batch runs its searches with the worker pool and records the batch statistics."""
+    app = Flask(__name__)
+    app.config['SEARCH_WORKERS'] = config_workers
+    legacy_searches = {f'10:0{index}': {'criteria': f'CRITERIA{index}'} for index in range(count)}
+    threads = set()
+    lock = threading.Lock()
+
+    def run_search(run_app, search_type, legacy_search):
+        assert run_app is app
+        assert search_type == 'BS'
+        with lock:
+            threads.add(threading.get_ident())
+        time.sleep(0.01)
+        search = run_search_tester.TestSearch()
+        search.search_criteria = legacy_search['criteria']
+        index = int(legacy_search['criteria'][-1])
+        return search, {'run_time': 0.1 * (index + 1), 'db_time': 0.05, 'build_time': 0.01}
+
+    mocker.patch.object(run_search_tester, 'run_search', side_effect=run_search)
+    save = mocker.patch.object(run_search_tester.TestSearchBatch, 'save')
+    batch = run_search_tester.run_batch(app, 'BS', legacy_searches, QUOTIENTS)
+
+    save.assert_called_once()
+    assert app.config['SIMILARITY_QUOTIENT_DEFAULT'] == 0.6
+    assert batch.search_type == 'BS'
+    assert batch.sim_val_business == 0.5
+    assert batch.sim_val_default == 0.6
+    assert batch.workers == workers
+    assert batch.search_count == count
+    assert len(threads) <= workers
+    assert [search.search_criteria for search in batch.searches] == [
+        search['criteria'] for search in legacy_searches.values()
+    ]
+    assert batch.elapsed_time >= 0
+    if not count:
+        assert batch.p50_time is None
+        assert batch.db_time == 0
+        return
+    run_times = [0.1 * (index + 1) for index in range(count)]
+    assert batch.p50_time == run_search_tester.percentile(run_times, 50)
+    assert batch.p99_time == run_times[-1]
+    assert batch.db_time == pytest.approx(0.05 * count)
+    assert batch.python_time == pytest.approx(sum(run_times) - 0.05 * count)
+    assert batch.build_time == pytest.approx(0.01 * count)
@@ -0,0 +1,64 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search timing utilities are working as expected."""
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from search_tester.utils.timing import get_db_time, percentile, register_db_timer, start_db_timer
+
+
+# testdata pattern is ({description}, {values}, {percent}, {expected})
+TEST_PERCENTILE_DATA = [
+    ('Empty', [], 50, None),
+    ('Single', [1.5], 99, 1.5),
+    ('Median', [1, 2, 3, 4], 50, 2),
+    ('p95', list(range(1, 101)), 95, 95),
+    ('p99 small', [1, 2, 3], 99, 3)
+]
+
+
+@pytest.mark.parametrize('desc,values,percent,expected', TEST_PERCENTILE_DATA)
+def test_percentile(desc, values, percent, expected):
+    """Assert that the nearest rank percentile works as expected."""
+    assert percentile(values, percent) == expected
+
+
+def test_db_timer():
+    """Assert that statement time is only recorded for the thread that started the timer."""
+    engine = create_engine('sqlite://')
+    register_db_timer()
+    register_db_timer()  # Registering again does not double count.
+    other_times = []
+
+    def run_other():
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        other_times.append(get_db_time())
+
+    start_db_timer()
+    assert get_db_time() == 0.0
+    with engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+    db_time = get_db_time()
+    assert db_time > 0
+    thread = threading.Thread(target=run_other)
+    thread.start()
+    thread.join()
+    assert other_times == [0.0]
+    assert get_db_time() == db_time
+    start_db_timer()
+    assert get_db_time() == 0.0
@@ -72,6 +72,56 @@ DELETE
                     WHERE r.registration_number = uer.registration_number
                       AND r.account_id LIKE '%_HIS')
 """
+# Defined once in the ppr-api searchable_financing_statements_reconcile db function.
+RECONCILE_SEARCHABLE = 'SELECT deleted_count, updated_count FROM searchable_financing_statements_reconcile()'
+SEARCH_HISTORY_BATCH_SIZE = 10000
+UPDATE_SEARCH_HISTORY_CRITERIA = """
+UPDATE search_requests sc
+   SET history_criteria =
+         CASE WHEN sc.search_type = 'BS' THEN UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'business')
+              WHEN sc.search_type = 'IS' THEN concat(UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'last'),
+                                                     ' ',
+                                                     UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'first'))
+              WHEN sc.search_type = 'MI' THEN concat(UPPER(sc.api_criteria -> 'criteria' -> 'ownerName' ->> 'last'),
+                                                     ' ',
+                                                     UPPER(sc.api_criteria -> 'criteria' -> 'ownerName' ->> 'first'))
+              ELSE UPPER(sc.api_criteria -> 'criteria' ->> 'value') END,
+       history_username =
+         COALESCE((SELECT CASE WHEN u.lastname IS NOT NULL AND u.firstname IS NOT NULL
+                               THEN u.firstname || ' ' || u.lastname
+                               WHEN u.lastname IS NULL AND u.firstname IS NOT NULL THEN u.firstname
+                               WHEN u.lastname IS NOT NULL AND u.firstname IS NULL THEN u.lastname
+                               ELSE '' END
+                     FROM users u
+                    WHERE u.username = sc.user_id
+                    FETCH FIRST 1 ROWS ONLY), '')
+ WHERE sc.id IN (SELECT sc2.id
+                   FROM search_requests sc2
+                  WHERE sc2.history_username IS NULL
+                  FETCH FIRST {batch_size} ROWS ONLY)
+"""
+UPDATE_SEARCH_HISTORY_COUNTS = """
+UPDATE search_results sr
+   SET selected_match_count =
+         CASE WHEN json_typeof(sr.api_result) = 'array' THEN json_array_length(sr.api_result) END,
+       selected_exact_count =
+         CASE WHEN sc.search_type IN ('MM', 'MI', 'MO', 'MS') THEN -1
+              WHEN json_typeof(sc.updated_selection) = 'array' THEN
+                   (SELECT COUNT(*)
+                      FROM json_array_elements(sc.updated_selection) sc2
+                     WHERE sc2 ->> 'matchType' = 'EXACT')
+              WHEN json_typeof(sr.api_result) = 'array' THEN
+                   (SELECT COUNT(*)
+                      FROM json_array_elements(sr.api_result) sr2
+                     WHERE sr2 ->> 'matchType' = 'EXACT')
+              ELSE 0 END
+  FROM search_requests sc
+ WHERE sc.id = sr.search_id
+   AND sr.search_id IN (SELECT sr3.search_id
+                          FROM search_results sr3
+                         WHERE sr3.selected_exact_count IS NULL
+                         FETCH FIRST {batch_size} ROWS ONLY)
+"""
 INSERT_EVENT: Final = """
 INSERT INTO event_tracking(id, key_id, event_ts, event_tracking_type, status, message)
   VALUES(nextval('event_tracking_id_seq'), {job_id}, CURRENT_TIMESTAMP  at time zone 'utc', 'REG_HIST_JOB',
@@ -131,6 +181,29 @@ def job(config):
         db_cursor.execute(DELETE_EXTRA_HISTORICAL)
         db_conn.commit()
 
+        # Reconcile the PPR search searchable financing statements with the registrations.
+        job_message += '\n5. Reconcile searchable financing statements.'
+        logging.info('Starting step 5: reconcile searchable financing statements:')
+        logging.info(RECONCILE_SEARCHABLE)
+        db_cursor.execute(RECONCILE_SEARCHABLE)
+        deleted_count, updated_count = db_cursor.fetchone()
+        logging.info(f'Deleted {deleted_count} searchable financing statements.')
+        logging.info(f'Added or updated {updated_count} searchable financing statements.')
+        db_conn.commit()
+
+        # Populate the account search history summary values of searches saved before they existed.
+        job_message += '\n6. Populate missing search history summary values.'
+        logging.info('Starting step 6: populate missing search history summary values:')
+        for sql_template in (UPDATE_SEARCH_HISTORY_CRITERIA, UPDATE_SEARCH_HISTORY_COUNTS):
+            sql_statement = sql_template.format(batch_size=SEARCH_HISTORY_BATCH_SIZE)
+            logging.info(sql_statement)
+            updated_count: int = SEARCH_HISTORY_BATCH_SIZE
+            while updated_count == SEARCH_HISTORY_BATCH_SIZE:
+                db_cursor.execute(sql_statement)
+                updated_count = db_cursor.rowcount
+                db_conn.commit()
+                logging.info(f'Updated {updated_count} search history rows.')
+
         logging.info('Run completed without error.')
         track_event(db_conn, db_cursor, HTTPStatus.OK, job_message)
     except (psycopg2.Error, Exception) as err:
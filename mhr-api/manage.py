@@ -17,13 +17,15 @@
 import logging
 import os
 
+import click
 from flask.cli import FlaskGroup  # replaces flask_script Manager
 from sqlalchemy.sql import text
 
 # models included so that migrate can build the database migrations
 from mhr_api import models  # pylint: disable=unused-import
 from mhr_api import create_app
-from mhr_api.models import db
+from mhr_api.models import MhrSearchIndex, db
+from test_data import scale_data, search_benchmark, selection_benchmark
 
 APP = create_app()
 CLI = FlaskGroup(APP)  # replaces MANAGER
@@ -77,6 +79,51 @@ def create_test_data():
     for filename in sorted_names:
         execute_script(db.session, os.path.join(os.getcwd(), ("test_data/postgres_data_files_ppr/" + filename)))
     execute_script(db.session, os.path.join(os.getcwd(), "test_data/postgres_create_last.sql"))
+    MhrSearchIndex.rebuild()
+
+
+@CLI.command("generate_scale_data")
+@click.option("--count", type=int, default=100000, help="Number of home registrations to add.")
+@click.option("--batch-size", "batch_size", type=int, default=10000, help="Number of records per transaction.")
+@click.option("--seed", type=int, default=None, help="Random seed for repeatable names and serial numbers.")
+@click.option("--transfer-rate", "transfer_rate", type=float, default=0.3, help="Fraction transferred.")
+@click.option("--exempt-rate", "exempt_rate", type=float, default=0.05, help="Fraction exempt.")
+@click.confirmation_option(prompt="Add synthetic home registrations to the configured database?")
+def generate_scale_data(count, batch_size, seed, transfer_rate, exempt_rate):
+    """Add synthetic home registrations for local scale testing: never run in a shared environment."""
+    scale_data.generate(db.session, count, batch_size, seed, transfer_rate=transfer_rate, exempt_rate=exempt_rate)
+    MhrSearchIndex.rebuild()
+
+
+@CLI.command("rebuild_search_index")
+def rebuild_search_index():
+    """Replace all the MHR search index rows from the search views: run after loading data outside the API."""
+    count = MhrSearchIndex.rebuild()
+    print(f"Rebuilt the MHR search index: {count} rows.")
+
+
+@CLI.command("benchmark_search")
+@click.option("--iterations", type=int, default=10, help="Timed runs of each query and criteria value.")
+@click.option("--criteria", "criteria_file", type=click.Path(exists=True), help="JSON criteria by benchmark name.")
+@click.option("--baseline", "baseline_file", help="Baseline JSON file to compare to, or to create.")
+@click.option("--save-baseline", "save_baseline", is_flag=True, help="Save the results as the baseline.")
+@click.option("--output", "output_file", help="JSON file for the results, including the query plans.")
+@click.option("--tolerance", type=float, default=0.5, help="Allowed p95 latency increase as a baseline fraction.")
+def benchmark_search(iterations, criteria_file, baseline_file, save_baseline, output_file, tolerance):
+    """Benchmark the search queries, exiting with an error on a plan or latency regression from the baseline."""
+    regressions = search_benchmark.run(
+        db.session, iterations, criteria_file, baseline_file, save_baseline, output_file, tolerance
+    )
+    if regressions:
+        raise SystemExit(1)
+
+
+@CLI.command("benchmark_selection")
+@click.option("--iterations", type=int, default=5, help="Timed runs of each selection size: the fastest is reported.")
+def benchmark_selection(iterations):
+    """Benchmark the search selection index, exiting with an error if its results differ from the nested scans."""
+    if selection_benchmark.run(iterations=iterations):
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,40 @@
+"""0009_test_search_batch_stats
+
+Revision ID: a6c1f93e0b84
+Revises: f4b2d8e61c93
+Create Date: 2026-10-18 15:41:27.203518
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c1f93e0b84'
+down_revision = 'f4b2d8e61c93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ### Manually created: the tables are shared by the PPR and MHR APIs, so add the columns only if they do not exist.
+    # Search tester batch aggregate run statistics. ###
+    op.execute("""
+ALTER TABLE test_search_batches
+  ADD COLUMN IF NOT EXISTS sim_val_default FLOAT,
+  ADD COLUMN IF NOT EXISTS workers INTEGER,
+  ADD COLUMN IF NOT EXISTS search_count INTEGER,
+  ADD COLUMN IF NOT EXISTS elapsed_time FLOAT,
+  ADD COLUMN IF NOT EXISTS p50_time FLOAT,
+  ADD COLUMN IF NOT EXISTS p95_time FLOAT,
+  ADD COLUMN IF NOT EXISTS p99_time FLOAT,
+  ADD COLUMN IF NOT EXISTS db_time FLOAT,
+  ADD COLUMN IF NOT EXISTS python_time FLOAT,
+  ADD COLUMN IF NOT EXISTS build_time FLOAT
+    """)
+    # ### end Alembic commands ###
+
+
+def downgrade():
+    # ### Manually created: the columns are shared with the other API's test_search_batches model, so they are not
+    # dropped here. Drop them manually once neither API maps them. ###
+    pass
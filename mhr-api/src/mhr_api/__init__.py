@@ -23,16 +23,18 @@ from flask_migrate import Migrate, upgrade
 from registry_schemas import __version__ as registry_schemas_version
 from sqlalchemy.sql import text
 
-from mhr_api import errorhandlers, models
+from mhr_api import errorhandlers, models, reports
 from mhr_api.config import config
 from mhr_api.metadata import APP_RUNNING_ENVIRONMENT, APP_VERSION
-from mhr_api.models import db
+from mhr_api.models import db, reference_cache
+from mhr_api.models.type_tables import REFERENCE_TYPES
 from mhr_api.resources import endpoints
 from mhr_api.schemas import rsbc_schemas
-from mhr_api.services import auth_service, queue_service, storage_service
+from mhr_api.services import auth_service, queue_service, report_service, sql_profiler, storage_service
 from mhr_api.translations import babel
 from mhr_api.utils.auth import jwt
 from mhr_api.utils.logging import logger, setup_logging
+from mhr_api.utils.metrics import metrics
 
 setup_logging(os.path.join(os.path.abspath(os.path.dirname(__file__)), "logging.yaml"))  # important to do this first
 
@@ -63,6 +65,10 @@ def create_app(service_environment=APP_RUNNING_ENVIRONMENT, **kwargs):
     storage_service.init_app(app)
     endpoints.init_app(app)
     queue_service.init_app(app)
+    report_service.init_app(app)
+    sql_profiler.init_app(app)
+    metrics.init_app(app)
+    reports.init_app(app)
 
     setup_jwt_manager(app, jwt)
 
@@ -77,6 +83,7 @@ def create_app(service_environment=APP_RUNNING_ENVIRONMENT, **kwargs):
     if app.config.get("DEPLOYMENT_ENV", "") == "testing":  # CI only create test data.
         with app.app_context():
             setup_test_data()
+    reference_cache.init_app(app, REFERENCE_TYPES)
 
     return app
 
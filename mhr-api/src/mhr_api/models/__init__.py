@@ -35,8 +35,10 @@ from .mhr_party import MhrParty
 from .mhr_qualified_supplier import MhrQualifiedSupplier
 from .mhr_registration import MhrRegistration
 from .mhr_registration_report import MhrRegistrationReport
+from .mhr_registration_snapshot import MhrRegistrationSnapshot
 from .mhr_review_registration import MhrReviewRegistration
 from .mhr_review_step import MhrReviewStep
+from .mhr_search_index import MhrSearchIndex
 from .mhr_section import MhrSection
 from .mhr_service_agreement import MhrServiceAgreement
 from .party import Party
@@ -88,6 +90,7 @@ __all__ = (
     "MhrParty",
     "MhrRegistration",
     "MhrRegistrationReport",
+    "MhrRegistrationSnapshot",
     "MhrReviewRegistration",
     "MhrDocumentType",
     "MhrLocationType",
@@ -100,6 +103,7 @@ __all__ = (
     "MhrRegistrationType",
     "MhrReviewStatusType",
     "MhrReviewStep",
+    "MhrSearchIndex",
     "MhrSection",
     "MhrStatusType",
     "MhrServiceAgreement",
@@ -274,18 +274,13 @@ def batch_location_report_response(raw_data, report_url: str, notify: bool):
     return response_json, HTTPStatus.OK, headers
 
 
-def batch_location_report_exists(batch_storage_url: str, notify: bool, return_link: bool):
-    """Create response when batch manufacturer registration report already exists."""
-    report_url: str = None
-    raw_data = None
-    logger.info(f"Fetching batch noc location registration report for: {batch_storage_url}.")
-    if return_link:
-        report_url = GoogleStorageService.get_document_link(
-            batch_storage_url, DocumentTypes.BATCH_REGISTRATION, DEFAULT_DOWNLOAD_DAYS
-        )
-    else:
-        raw_data = GoogleStorageService.get_document(batch_storage_url, DocumentTypes.BATCH_REGISTRATION)
-    return batch_location_report_response(raw_data, report_url, notify)
+def batch_location_report_exists(batch_storage_url: str, notify: bool):
+    """Create the download link response when the batch noc location registration report already exists."""
+    logger.info(f"Fetching batch noc location registration report link for: {batch_storage_url}.")
+    report_url: str = GoogleStorageService.get_document_link(
+        batch_storage_url, DocumentTypes.BATCH_REGISTRATION, DEFAULT_DOWNLOAD_DAYS
+    )
+    return batch_location_report_response(None, report_url, notify)
 
 
 def save_batch_location_report(registrations, raw_data, return_link: bool) -> str:
@@ -19,11 +19,14 @@ from __future__ import annotations
 
 from http import HTTPStatus
 
+from sqlalchemy.orm import selectinload
+
 from mhr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from mhr_api.models import utils as model_utils
 from mhr_api.utils.base import BaseEnum
 from mhr_api.utils.logging import logger
 
+from .client_code import ClientCode
 from .db import db
 from .general_collateral import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     GeneralCollateral,
@@ -403,6 +406,44 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
 
         return statement
 
+    @classmethod
+    def find_all_by_ids(cls, financing_ids: list) -> dict:
+        """Return financing statements keyed by id, bulk loaded with the relationships used to generate the JSON."""
+        statements = {}
+        ids = list(dict.fromkeys(financing_ids))
+        if not ids:
+            return statements
+        try:
+            results = (
+                db.session.query(FinancingStatement)
+                .filter(FinancingStatement.id.in_(ids))
+                .options(*FinancingStatement.bulk_load_options())
+                .all()
+            )
+            for statement in results:
+                statements[statement.id] = statement
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_ids exception: " + str(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        return statements
+
+    @classmethod
+    def bulk_load_options(cls) -> list:
+        """Return the eager loading options for all relationships used to generate the financing statement JSON."""
+        registration = selectinload(FinancingStatement.registration)
+        parties = selectinload(FinancingStatement.parties)
+        return [
+            registration.selectinload(Registration.reg_type),
+            registration.selectinload(Registration.court_order),
+            registration.selectinload(Registration.trust_indenture),
+            registration.selectinload(Registration.parties),
+            parties.selectinload(Party.address),
+            parties.selectinload(Party.client_code).selectinload(ClientCode.address),
+            selectinload(FinancingStatement.vehicle_collateral),
+            selectinload(FinancingStatement.general_collateral),
+            selectinload(FinancingStatement.trust_indenture),
+        ]
+
     @classmethod
     def find_by_registration_number(
         cls, registration_num: str, account_id: str, staff: bool = False, create: bool = False
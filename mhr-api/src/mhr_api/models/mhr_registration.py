@@ -18,11 +18,13 @@ from http import HTTPStatus
 
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import selectinload
 
 import mhr_api.models.registration_change_utils as change_utils
 import mhr_api.models.registration_json_utils as reg_json_utils
 import mhr_api.models.registration_utils as reg_utils
 from mhr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
+from mhr_api.models import search_cache
 from mhr_api.models import utils as model_utils
 from mhr_api.models.mhr_extra_registration import MhrExtraRegistration
 from mhr_api.services.authz import STAFF_ROLE
@@ -36,6 +38,14 @@ from .mhr_location import MhrLocation
 from .mhr_note import MhrNote
 from .mhr_owner_group import MhrOwnerGroup
 from .mhr_party import MhrParty
+from .mhr_registration_snapshot import (
+    VIEW_CURRENT,
+    VIEW_CURRENT_STAFF,
+    VIEW_SEARCH,
+    VIEW_SEARCH_STAFF,
+    MhrRegistrationSnapshot,
+)
+from .mhr_search_index import MhrSearchIndex
 from .mhr_section import MhrSection
 from .type_tables import (
     MhrDocumentTypes,
@@ -63,6 +73,7 @@ REG_TO_DOC_TYPE = {
 }
 REG_TYPE = MhrRegistrationTypes.MHREG
 CONV_TYPE = MhrRegistrationTypes.MHREG_CONVERSION
+BULK_LOAD_BATCH_SIZE: int = 1000
 
 
 class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes, too-many-public-methods
@@ -126,6 +137,7 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
     staff: bool = False
     report_view: bool = False
     doc_id: str = None
+    use_snapshot: bool = False
 
     @property
     def json(self) -> dict:
@@ -211,7 +223,14 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
 
     @property
     def registration_json(self) -> dict:
-        """Return the search version of the registration as a json object."""
+        """Return the search version of the registration as a json object, from the snapshot if enabled."""
+        if self.use_snapshot:
+            view_type: str = VIEW_SEARCH_STAFF if self.staff else VIEW_SEARCH
+            return MhrRegistrationSnapshot.get_json(self, view_type, self.build_registration_json)
+        return self.build_registration_json()
+
+    def build_registration_json(self) -> dict:
+        """Build the search version of the registration as a json object."""
         self.current_view = True
         self.report_view = True
         doc_json = self.documents[0].json
@@ -237,6 +256,13 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
     @property
     def new_registration_json(self) -> dict:
         """Return the new registration or current/composite version of the registration as a json object."""
+        if self.use_snapshot and self.current_view and self.id and self.id > 0:
+            view_type: str = VIEW_CURRENT_STAFF if self.staff else VIEW_CURRENT
+            return MhrRegistrationSnapshot.get_json(self, view_type, self.build_new_registration_json)
+        return self.build_new_registration_json()
+
+    def build_new_registration_json(self) -> dict:
+        """Build the new registration or current/composite version of the registration as a json object."""
         if self.id and self.id > 0:
             doc_json = self.documents[0].json
             reg_json = {
@@ -297,7 +323,10 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
     def save(self):
         """Render a registration to the local cache."""
         db.session.add(self)
+        MhrSearchIndex.update_by_mhr_number(self.mhr_number)
+        MhrRegistrationSnapshot.delete_by_mhr_number(self.mhr_number)
         db.session.commit()
+        search_cache.update_data_version()
 
     def save_exemption(self, new_reg_id: int):
         """Set the state of the original MH registration to exempt."""
@@ -313,12 +342,18 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
                     note: MhrNote = reg.notes[0]
                     note.status_type = MhrNoteStatusTypes.CANCELLED
                     note.change_registration_id = new_reg_id
+        MhrSearchIndex.update_by_mhr_number(self.mhr_number)
+        MhrRegistrationSnapshot.delete_by_mhr_number(self.mhr_number)
         db.session.commit()
+        search_cache.update_data_version()
 
     def save_transfer(self, json_data, new_reg_id):
         """Update the original MH removed owner groups."""
         self.remove_groups(json_data, new_reg_id)
+        MhrSearchIndex.update_by_mhr_number(self.mhr_number)
+        MhrRegistrationSnapshot.delete_by_mhr_number(self.mhr_number)
         db.session.commit()
+        search_cache.update_data_version()
 
     def is_transfer(self) -> bool:
         """Determine if the registration is one of the transfer types."""
@@ -352,6 +387,62 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
 
         return registration
 
+    @classmethod
+    def find_all_by_ids_search(cls, registration_ids: list) -> dict:
+        """Return base registrations with their change registrations keyed by id, bulk loaded for search details.
+
+        All child collections used to generate the search registration JSON are eager loaded for the base and the
+        change registrations, so the number of queries is fixed by the number of relationships and batches rather
+        than the number of registrations. Missing ids are excluded.
+        """
+        registrations = {}
+        reg_ids = list(dict.fromkeys(reg_id for reg_id in registration_ids if reg_id))
+        try:
+            for index in range(0, len(reg_ids), BULK_LOAD_BATCH_SIZE):
+                batch = reg_ids[index : index + BULK_LOAD_BATCH_SIZE]
+                results = (
+                    db.session.query(MhrRegistration)
+                    .filter(MhrRegistration.id.in_(batch))
+                    .options(*MhrRegistration.bulk_load_options())
+                    .order_by(MhrRegistration.id)
+                    .all()
+                )
+                changes = {}
+                if results:
+                    change_results = (
+                        db.session.query(MhrRegistration)
+                        .filter(
+                            MhrRegistration.mhr_number.in_([reg.mhr_number for reg in results]),
+                            ~MhrRegistration.registration_type.in_([REG_TYPE, CONV_TYPE]),
+                        )
+                        .options(*MhrRegistration.bulk_load_options())
+                        .order_by(MhrRegistration.id)
+                        .all()
+                    )
+                    for change_reg in change_results:
+                        changes.setdefault(change_reg.mhr_number, []).append(change_reg)
+                for registration in results:
+                    registration.change_registrations = changes.get(registration.mhr_number, [])
+                    registrations[registration.id] = registration
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_ids_search exception: " + str(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        return registrations
+
+    @classmethod
+    def bulk_load_options(cls) -> list:
+        """Return the eager loading options for all relationships used to generate the search registration JSON."""
+        owner_groups = selectinload(MhrRegistration.owner_groups)
+        return [
+            selectinload(MhrRegistration.parties).selectinload(MhrParty.address),
+            selectinload(MhrRegistration.locations).selectinload(MhrLocation.address),
+            selectinload(MhrRegistration.documents),
+            selectinload(MhrRegistration.notes),
+            owner_groups.selectinload(MhrOwnerGroup.owners).selectinload(MhrParty.address),
+            selectinload(MhrRegistration.descriptions),
+            selectinload(MhrRegistration.sections),
+        ]
+
     @classmethod
     def find_summary_by_mhr_number(cls, account_id: str, mhr_number: str, staff: bool = False):
         """Return the MHR registration summary information matching the MH registration number."""
@@ -0,0 +1,151 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the persisted current state JSON of a manufactured home.
+
+Building the current view of a home combines every change registration. The rendered JSON is saved by MHR number and
+view with the latest registration id it was built from and the next note expiry that changes it. A snapshot is only
+current while both still hold, and registration changes to the home delete its snapshots in the same transaction.
+"""
+import json
+
+from flask import current_app
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import text
+
+from mhr_api.exceptions import DatabaseException
+from mhr_api.models import utils as model_utils
+from mhr_api.models.queries import (
+    DELETE_REGISTRATION_SNAPSHOTS,
+    QUERY_REGISTRATION_SNAPSHOTS,
+    UPSERT_REGISTRATION_SNAPSHOT,
+)
+from mhr_api.utils.logging import logger
+
+from .db import db
+
+# REGISTRATION_SNAPSHOT_MODE: OFF always builds the JSON, ON serves current snapshots, and VERIFY builds the JSON and
+# logs any difference from the current snapshot.
+SNAPSHOT_MODE_OFF = "OFF"
+SNAPSHOT_MODE_ON = "ON"
+SNAPSHOT_MODE_VERIFY = "VERIFY"
+VIEW_SEARCH = "SEARCH"
+VIEW_SEARCH_STAFF = "SEARCH_STAFF"
+VIEW_CURRENT = "CURRENT"
+VIEW_CURRENT_STAFF = "CURRENT_STAFF"
+
+
+class MhrRegistrationSnapshot(db.Model):
+    """This class maintains the current state JSON snapshots of a manufactured home by view."""
+
+    __tablename__ = "mhr_registration_snapshots"
+
+    mhr_number = db.mapped_column("mhr_number", db.String(7), primary_key=True)
+    view_type = db.mapped_column("view_type", db.String(20), primary_key=True)
+    registration_id = db.mapped_column("registration_id", db.Integer, nullable=False)
+    expiry_ts = db.mapped_column("expiry_ts", db.DateTime, nullable=True)
+    snapshot = db.mapped_column("snapshot", JSONB, nullable=False)
+    create_ts = db.mapped_column("create_ts", db.DateTime, nullable=False)
+
+    @staticmethod
+    def get_mode() -> str:
+        """Get the configured snapshot mode."""
+        return current_app.config.get("REGISTRATION_SNAPSHOT_MODE", SNAPSHOT_MODE_OFF)
+
+    @staticmethod
+    def find_current(mhr_numbers: list, view_type: str) -> dict:
+        """Return the current snapshot JSON of the view by MHR number for the homes that have one."""
+        snapshots = {}
+        if not mhr_numbers:
+            return snapshots
+        try:
+            rows = db.session.execute(
+                text(QUERY_REGISTRATION_SNAPSHOTS), {"mhr_numbers": list(mhr_numbers), "view_type": view_type}
+            ).fetchall()
+            for row in rows:
+                snapshots[str(row[0])] = row[1]
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB find_current registration snapshots exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
+        return snapshots
+
+    @staticmethod
+    def get_json(registration, view_type: str, build_json, commit: bool = True) -> dict:
+        """Get the registration view JSON from the current snapshot or build it, saving a new snapshot.
+
+        Set commit to False when the caller commits the request session after getting the JSON.
+        """
+        mode: str = MhrRegistrationSnapshot.get_mode()
+        if mode not in (SNAPSHOT_MODE_ON, SNAPSHOT_MODE_VERIFY):
+            return build_json()
+        snapshot = MhrRegistrationSnapshot.find_current([registration.mhr_number], view_type).get(
+            registration.mhr_number
+        )
+        if snapshot is not None and mode == SNAPSHOT_MODE_ON:
+            return snapshot
+        reg_json = build_json()
+        if snapshot is not None:
+            built = json.loads(json.dumps(reg_json))
+            if built == snapshot:
+                return reg_json
+            changed = sorted(key for key in set(built) | set(snapshot) if built.get(key) != snapshot.get(key))
+            logger.warning(f"Registration snapshot mhr={registration.mhr_number} view={view_type} differs: {changed}")
+        MhrRegistrationSnapshot.save_json(registration, view_type, reg_json, commit)
+        return reg_json
+
+    @staticmethod
+    def save_json(registration, view_type: str, reg_json: dict, commit: bool = True):
+        """Save the registration view JSON snapshot on the request session: failures are logged and ignored.
+
+        The upsert runs in a savepoint so a failure does not roll back other pending changes of the session.
+        """
+        reg_ids = [registration.id] + [reg.id for reg in (registration.change_registrations or [])]
+        params = {
+            "mhr_number": registration.mhr_number,
+            "view_type": view_type,
+            "registration_id": max(reg_ids),
+            "expiry_ts": MhrRegistrationSnapshot.get_expiry_ts(registration),
+        }
+        try:
+            params["snapshot"] = json.dumps(reg_json)
+            with db.session.begin_nested():
+                db.session.execute(text(UPSERT_REGISTRATION_SNAPSHOT), params)
+            if commit:
+                db.session.commit()
+        except Exception as db_exception:  # noqa: B902; the snapshot is only an optimization
+            logger.error(f"Registration snapshot save mhr={registration.mhr_number} exception: {db_exception}")
+            if commit:
+                db.session.rollback()
+
+    @staticmethod
+    def get_expiry_ts(registration):
+        """Get the earliest future note expiry: the rendered note, caution, and permit status change then."""
+        now_ts = model_utils.now_ts().timestamp()
+        expiry_ts = None
+        for reg in [registration] + list(registration.change_registrations or []):
+            for note in reg.notes or []:
+                if note.expiry_date and note.expiry_date.timestamp() > now_ts:
+                    if expiry_ts is None or note.expiry_date < expiry_ts:
+                        expiry_ts = note.expiry_date
+        return expiry_ts
+
+    @staticmethod
+    def delete_by_mhr_number(mhr_number: str):
+        """Delete the snapshots of the home when a registration changes it: the caller commits."""
+        if not mhr_number:
+            return
+        try:
+            db.session.execute(text(DELETE_REGISTRATION_SNAPSHOTS), {"mhr_number": mhr_number})
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB delete registration snapshots exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
@@ -0,0 +1,122 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the denormalized MHR search index data.
+
+Each row has the output columns of one of the MHR search views for a home (MHR), an active section (SERIAL), or an
+owner (OWNER_BUS, OWNER_IND). The rows for a home are replaced in the same transaction when a registration is saved,
+so the search queries read the table with a single indexed lookup instead of joining the registration tables.
+"""
+from sqlalchemy.sql import text
+
+from mhr_api.exceptions import DatabaseException
+from mhr_api.models import search_utils
+from mhr_api.utils.logging import logger
+
+from .db import db
+
+
+class MhrSearchIndex(db.Model):
+    """This class maintains the MHR search index: one row per home, active section, and owner."""
+
+    __tablename__ = "mhr_search_index"
+    __table_args__ = (
+        db.Index(
+            "ix_mhr_search_index_compressed_key", "compressed_key", postgresql_where=text("index_type = 'SERIAL'")
+        ),
+        db.Index(
+            "ix_mhr_search_index_compressed_name",
+            "index_type",
+            "compressed_name",
+            postgresql_ops={"compressed_name": "varchar_pattern_ops"},
+        ),
+        db.Index(
+            "ix_mhr_search_index_serial_number_trgm",
+            "serial_number",
+            postgresql_using="gin",
+            postgresql_ops={"serial_number": "gin_trgm_ops"},
+            postgresql_where=text("index_type = 'SERIAL'"),
+        ),
+    )
+
+    id = db.mapped_column("id", db.Integer, primary_key=True)
+    index_type = db.mapped_column("index_type", db.String(10), nullable=False)
+    mhr_number = db.mapped_column("mhr_number", db.String(7), nullable=False, index=True)
+    registration_id = db.mapped_column("registration_id", db.Integer, nullable=False)
+    status_type = db.mapped_column("status_type", db.String(20), nullable=False)
+    registration_ts = db.mapped_column("registration_ts", db.DateTime, nullable=False)
+    city = db.mapped_column("city", db.String(40), nullable=True)
+    serial_number = db.mapped_column("serial_number", db.String(20), nullable=True)
+    compressed_key = db.mapped_column("compressed_key", db.String(6), nullable=True)
+    section_id = db.mapped_column("section_id", db.Integer, nullable=True)
+    year_made = db.mapped_column("year_made", db.Integer, nullable=True)
+    make = db.mapped_column("make", db.String(60), nullable=True)
+    model = db.mapped_column("model", db.String(60), nullable=True)
+    owner_info = db.mapped_column("owner_info", db.String(300), nullable=True)
+    business_name = db.mapped_column("business_name", db.String(150), nullable=True)
+    last_name = db.mapped_column("last_name", db.String(50), nullable=True)
+    first_name = db.mapped_column("first_name", db.String(50), nullable=True)
+    middle_name = db.mapped_column("middle_name", db.String(50), nullable=True)
+    owner_status_type = db.mapped_column("owner_status_type", db.String(20), nullable=True)
+    compressed_name = db.mapped_column("compressed_name", db.String(30), nullable=True)
+    manufacturer_name = db.mapped_column("manufacturer_name", db.String(310), nullable=True)
+    civic_address = db.mapped_column("civic_address", db.String(500), nullable=True)
+    update_ts = db.mapped_column("update_ts", db.DateTime, nullable=False)
+
+    @classmethod
+    def find_by_mhr_number(cls, mhr_number: str) -> list:
+        """Return the search index rows matching the MHR number."""
+        rows = []
+        if mhr_number:
+            rows = (
+                db.session.query(MhrSearchIndex)
+                .filter(MhrSearchIndex.mhr_number == mhr_number)
+                .order_by(MhrSearchIndex.index_type, MhrSearchIndex.id)
+                .all()
+            )
+        return rows
+
+    @staticmethod
+    def update_by_mhr_number(mhr_number: str):
+        """Replace the search index rows for the home with the pending registration changes: the caller commits."""
+        if not mhr_number:
+            return
+        try:
+            db.session.flush()
+            params = {"mhr_number": mhr_number}
+            db.session.execute(text(search_utils.SEARCH_INDEX_LOCK), params)
+            db.session.execute(text(search_utils.SEARCH_INDEX_DELETE), params)
+            for insert in search_utils.SEARCH_INDEX_INSERTS:
+                query_s = insert.format(filter_clause=search_utils.SEARCH_INDEX_FILTER_MHR_NUMBER)
+                db.session.execute(text(query_s), params)
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB mhr search index update exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
+
+    @staticmethod
+    def rebuild() -> int:
+        """Replace all the search index rows from the search views in a single transaction.
+
+        Returns the number of rows created.
+        """
+        try:
+            db.session.execute(text(search_utils.SEARCH_INDEX_DELETE_ALL))
+            count: int = 0
+            for insert in search_utils.SEARCH_INDEX_INSERTS:
+                count += db.session.execute(text(insert.format(filter_clause=""))).rowcount
+            db.session.commit()
+            logger.info(f"MHR search index rebuilt: rows={count}")
+            return count
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB mhr search index rebuild exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
@@ -26,6 +26,15 @@ class MhrSection(db.Model):  # pylint: disable=too-many-instance-attributes
     """This class manages all of the MH section information."""
 
     __tablename__ = "mhr_sections"
+    __table_args__ = (
+        db.Index(
+            "ix_mhr_sections_serial_number_trgm",
+            "serial_number",
+            postgresql_using="gin",
+            postgresql_ops={"serial_number": "gin_trgm_ops"},
+            postgresql_where=text("status_type = 'ACTIVE'"),
+        ),
+    )
 
     id = db.mapped_column("id", db.Integer, db.Sequence("mhr_section_id_seq"), primary_key=True)
     compressed_key = db.mapped_column("compressed_key", db.String(6), nullable=False, index=True)
@@ -116,6 +116,25 @@ WHERE arv.registration_id = :query_value1
 AND r.id = arv.registration_id
 """
 )
+# Current state JSON snapshots: only current if built from the latest registration and before the next note expiry.
+QUERY_REGISTRATION_SNAPSHOTS = """
+SELECT s.mhr_number, s.snapshot
+  FROM mhr_registration_snapshots s
+ WHERE s.view_type = :view_type
+   AND s.mhr_number = ANY(CAST(:mhr_numbers AS VARCHAR[]))
+   AND (s.expiry_ts IS NULL OR s.expiry_ts > (now() at time zone 'utc'))
+   AND s.registration_id = (SELECT MAX(r.id) FROM mhr_registrations r WHERE r.mhr_number = s.mhr_number)
+"""
+UPSERT_REGISTRATION_SNAPSHOT = """
+INSERT INTO mhr_registration_snapshots(mhr_number, view_type, registration_id, expiry_ts, snapshot, create_ts)
+     VALUES (:mhr_number, :view_type, :registration_id, :expiry_ts, CAST(:snapshot AS JSONB),
+             (now() at time zone 'utc'))
+ON CONFLICT (mhr_number, view_type)
+DO UPDATE SET registration_id = excluded.registration_id, expiry_ts = excluded.expiry_ts,
+              snapshot = excluded.snapshot, create_ts = excluded.create_ts
+      WHERE mhr_registration_snapshots.registration_id <= excluded.registration_id
+"""
+DELETE_REGISTRATION_SNAPSHOTS = "DELETE FROM mhr_registration_snapshots WHERE mhr_number = :mhr_number"
 
 QUERY_ACCOUNT_REG_BASE_LAST = """
 SELECT arv.mhr_number, status_type, registration_ts, submitting_name, client_reference_id, registration_type,
@@ -15,9 +15,11 @@
 # pylint: disable=too-few-public-methods
 
 """This module holds additional methods to support registration model updates."""
-from mhr_api.models import MhrLocation
+from mhr_api.models import MhrLocation, search_cache
 from mhr_api.models import utils as model_utils
 from mhr_api.models.db import db
+from mhr_api.models.mhr_registration_snapshot import MhrRegistrationSnapshot
+from mhr_api.models.mhr_search_index import MhrSearchIndex
 from mhr_api.models.type_tables import MhrDocumentTypes, MhrNoteStatusTypes, MhrRegistrationStatusTypes, MhrStatusTypes
 from mhr_api.utils.logging import logger
 
@@ -37,12 +39,14 @@ def save_exemption(registration, new_reg_id: int):
                 note.status_type = MhrNoteStatusTypes.CANCELLED
                 note.change_registration_id = new_reg_id
     db.session.commit()
+    search_cache.update_data_version()
 
 
 def save_transfer(registration, json_data, new_reg_id):
     """Update the original MH removed owner groups."""
     registration.remove_groups(json_data, new_reg_id)
     db.session.commit()
+    search_cache.update_data_version()
 
 
 def save_permit(registration, json_data, new_reg_id):
@@ -99,7 +103,10 @@ def save_permit(registration, json_data, new_reg_id):
     ):
         registration.status_type = MhrRegistrationStatusTypes.EXEMPT
         logger.info("Transport Permit new location out of province, updating status to EXEMPT.")
+    MhrSearchIndex.update_by_mhr_number(registration.mhr_number)
+    MhrRegistrationSnapshot.delete_by_mhr_number(registration.mhr_number)
     db.session.commit()
+    search_cache.update_data_version()
 
 
 def setup_permit_extension_location(base_reg, registration, new_loc_json: dict):
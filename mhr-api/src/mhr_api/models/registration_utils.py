@@ -17,8 +17,11 @@
 from sqlalchemy.sql import text
 
 from mhr_api.exceptions import DatabaseException
+from mhr_api.models import search_cache
 from mhr_api.models import utils as model_utils
 from mhr_api.models.db import db
+from mhr_api.models.mhr_registration_snapshot import MhrRegistrationSnapshot
+from mhr_api.models.mhr_search_index import MhrSearchIndex
 from mhr_api.models.queries import (
     ACCOUNT_SORT_ASCENDING,
     ACCOUNT_SORT_DESCENDING,
@@ -629,6 +632,7 @@ def save_cancel_note(registration, json_data, new_reg_id):  # pylint: disable=to
                             note.status_type = MhrNoteStatusTypes.CANCELLED
                             note.change_registration_id = new_reg_id
         db.session.commit()
+        search_cache.update_data_version()
     else:
         logger.debug(f"No modernized note found to cancel for reg id= {registration.id}")
 
@@ -638,7 +642,10 @@ def save_active(registration):
     if registration.status_type:
         logger.info(f"Setting MH state to ACTIVE for registration id={registration.id}")
         registration.status_type = MhrRegistrationStatusTypes.ACTIVE
+        MhrSearchIndex.update_by_mhr_number(registration.mhr_number)
+        MhrRegistrationSnapshot.delete_by_mhr_number(registration.mhr_number)
         db.session.commit()
+        search_cache.update_data_version()
     else:
         logger.info("No modernized registration to set to active status.")
 
@@ -686,7 +693,10 @@ def save_admin(registration, json_data: dict, new_reg_id: int):
     # EXRE cancel exemption notes as well.
     if doc_type == MhrDocumentTypes.EXRE:
         cancel_note_exre(registration, new_reg_id)
+    MhrSearchIndex.update_by_mhr_number(registration.mhr_number)
+    MhrRegistrationSnapshot.delete_by_mhr_number(registration.mhr_number)
     db.session.commit()
+    search_cache.update_data_version()
 
 
 def save_description(registration, json_data: dict, new_reg_id: int):
@@ -873,7 +883,10 @@ def update_summary_snapshot_by_mhr_number(mhr_number: str):
         result = db.session.execute(query, {"query_value1": mhr_number})
         if result:
             logger.debug(f"Updated mhr registration summary snapshot for mhr_number {mhr_number}.")
+        MhrSearchIndex.update_by_mhr_number(mhr_number)
+        MhrRegistrationSnapshot.delete_by_mhr_number(mhr_number)
         db.session.commit()
+        search_cache.update_data_version()
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("update_summary_snapshot_by_mhr_number exception: " + str(db_exception))
         raise DatabaseException(db_exception) from db_exception
@@ -24,9 +24,10 @@ from http import HTTPStatus
 from sqlalchemy.sql import text
 
 from mhr_api.exceptions import BusinessException, DatabaseException
-from mhr_api.models import search_utils
+from mhr_api.models import search_cache, search_utils
 from mhr_api.models import utils as model_utils
 from mhr_api.utils.logging import logger
+from mhr_api.utils.metrics import SEARCH_RESULTS_SIZE
 
 from .db import db
 
@@ -64,6 +65,9 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     user_id = db.mapped_column("user_id", db.String(1000), nullable=True)
     updated_selection = db.mapped_column("updated_selection", db.JSON, nullable=True)
     search_value = db.mapped_column("search_value", db.String(320), nullable=True, index=True)
+    # Account search history summary values: set when the search is saved.
+    history_criteria = db.mapped_column("history_criteria", db.String(1000), nullable=True)
+    history_username = db.mapped_column("history_username", db.String(1000), nullable=True)
 
     pay_invoice_id = db.mapped_column("pay_invoice_id", db.Integer, nullable=True)
     pay_path = db.mapped_column("pay_path", db.String(256), nullable=True)
@@ -104,6 +108,7 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     def save(self):
         """Render a search query to the local cache."""
         try:
+            self.set_history_summary()
             db.session.add(self)
             db.session.commit()
             logger.debug("DB search_request.save completed")
@@ -111,6 +116,19 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
             logger.error("DB search_request save exception: " + str(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
+    def set_history_summary(self):
+        """Set the account search history summary values so the history query does not derive them per request."""
+        if self.history_username is None:
+            self.history_criteria = search_utils.get_history_criteria(self.search_type, self.search_criteria)
+            self.history_username = ""
+            if self.user_id:
+                result = db.session.execute(text(search_utils.QUERY_HISTORY_USERNAME), {"user_id": self.user_id})
+                row = result.first()
+                if row and row[0]:
+                    self.history_username = str(row[0])
+        if self.search_result:
+            self.search_result.set_history_counts()
+
     def update_search_selection(self, search_json):
         """Support UI search selection autosave: replace search response."""
         # Audit requirement: save original search summary results (before consumer selects registrations to include).
@@ -155,6 +173,8 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 SearchRequest.update_result_matches(results_json, match, SearchRequest.SearchTypes.SERIAL_NUM)
             self.returned_results_size = len(results_json)
             self.total_results_size = self.returned_results_size
+            if rows and self.request_json.get("wildcardSearch"):  # Capped: the total includes the rows not returned.
+                self.total_results_size = int(rows[0][12])
             self.search_response = results_json
         else:
             self.returned_results_size = 0
@@ -204,12 +224,35 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
             self.returned_results_size = 0
             self.total_results_size = 0
 
+    def get_cache_key(self) -> tuple:
+        """Build the search results cache key from the search criteria query parameter value."""
+        value: str = search_utils.get_query_value(self.request_json)
+        if self.search_type == self.SearchTypes.MANUFACTURED_HOME_NUM:
+            value = value.rjust(6, "0")
+        return (str(self.search_type), value, bool(self.request_json.get("wildcardSearch")))
+
     def search(self):
         """Execute a search with the previously set search type and criteria."""
         if self.search_type == self.SearchTypes.MANUFACTURED_HOME_NUM:
             # Format before searching
             search_utils.format_mhr_number(self.request_json)
 
+        cache_key = None
+        data_version = None
+        if search_cache.is_enabled():
+            cache_key = self.get_cache_key()
+            data_version = search_cache.get_data_version()
+            cached = search_cache.search_cache.get(cache_key, data_version)
+            if cached:
+                self.search_response = cached.get("searchResponse")
+                self.total_results_size = cached.get("totalResultsSize")
+                self.returned_results_size = cached.get("returnedResultsSize")
+                self.save()
+                SEARCH_RESULTS_SIZE.observe(
+                    self.returned_results_size or 0, search_type=self.search_type, stage="query"
+                )
+                return
+
         if self.search_type == self.SearchTypes.MANUFACTURED_HOME_NUM:
             self.search_by_mhr_number()
         elif self.search_type == self.SearchTypes.SERIAL_NUM:
@@ -220,7 +263,18 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
             self.search_by_owner_name()
         else:
             raise DatabaseException("SearchRequest.search PosgreSQL not yet implemented.")
+        if cache_key:
+            search_cache.search_cache.put(
+                cache_key,
+                data_version,
+                {
+                    "searchResponse": self.search_response,
+                    "totalResultsSize": self.total_results_size,
+                    "returnedResultsSize": self.returned_results_size,
+                },
+            )
         self.save()
+        SEARCH_RESULTS_SIZE.observe(self.returned_results_size or 0, search_type=self.search_type, stage="query")
 
     @classmethod
     def update_result_matches(cls, results, result, search_type: str) -> bool:
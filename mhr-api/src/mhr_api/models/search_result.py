@@ -25,11 +25,14 @@ from mhr_api.exceptions import BusinessException, DatabaseException, ResourceErr
 from mhr_api.models import FinancingStatement, MhrRegistration, search_utils
 from mhr_api.models import utils as model_utils
 from mhr_api.utils.logging import logger
+from mhr_api.utils.metrics import SEARCH_RESULTS_SIZE
 
 from .db import db
+from .mhr_registration_snapshot import SNAPSHOT_MODE_ON, VIEW_SEARCH, VIEW_SEARCH_STAFF, MhrRegistrationSnapshot
 
 # from .financing_statement import FinancingStatement
 from .search_request import SearchRequest
+from .search_selection import SelectionIndex, match_mhr_number
 from .search_utils import GET_HISTORY_DAYS_LIMIT
 
 # PPR UI search detail report callbackURL parameter: skip notification if request originates from UI.
@@ -50,6 +53,9 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     score = db.mapped_column("score", db.Integer, nullable=True)
     exact_match_count = db.mapped_column("exact_match_count", db.Integer, nullable=True)
     similar_match_count = db.mapped_column("similar_match_count", db.Integer, nullable=True)
+    # Account search history summary values: set when the search selection is saved.
+    selected_match_count = db.mapped_column("selected_match_count", db.Integer, nullable=True)
+    selected_exact_count = db.mapped_column("selected_exact_count", db.Integer, nullable=True)
     # large async report requests capture callbackURL
     callback_url = db.mapped_column("callback_url", db.String(1000), nullable=True)
     # large async report requests event listener updates when pdf generated and saved to document storage.
@@ -95,12 +101,18 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     def save(self):
         """Render a search results detail information to the local cache."""
         try:
+            self.set_history_counts()
             db.session.add(self)
             db.session.commit()
         except Exception as db_exception:  # noqa: B902; just logging
             logger.error("DB search_result save exception: " + str(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
+    def set_history_counts(self):
+        """Set the account search history selected match count: MHR searches have no exact match count."""
+        self.selected_match_count = len(self.search_select) if self.search_select is not None else None
+        self.selected_exact_count = -1
+
     def update_selection(self, search_select, account_name: str, pay_params: dict, pay_ref: dict):
         """Update the set of search details from the search query selection.
 
@@ -132,6 +144,7 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         # logger.debug('saving updates')
         # Update summary information and save.
         select_count = len(detail_response["details"])
+        SEARCH_RESULTS_SIZE.observe(select_count, search_type=self.search.search_type, stage="selection")
         self.exact_match_count = select_count
         detail_response["totalResultsSize"] = select_count
         self.search_response = detail_response
@@ -150,27 +163,42 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     def build_details(self, staff: bool = False):
         """Generate the search selection details."""
         new_results = []
+        index = SelectionIndex()
+        selected = []
         for select in self.search_select:
-            if "selected" not in select or select["selected"]:
-                mhr_num = select["mhrNumber"]
-                found = False
-                if new_results:  # Check for duplicates.
-                    for match in new_results:
-                        if match["mhrNumber"] == mhr_num:
-                            found = True
-                if not found:  # No duplicates.
-                    # Load registration details here.
-                    mh_id = select.get("mhId", None)
-                    logger.debug(f"find_by_id for mhr num {mhr_num} start id={mh_id}")
-                    record = MhrRegistration.find_by_id(mh_id, False, True)
-                    logger.debug(f"find_by_id for mhr num {mhr_num} end")
-                    record.staff = staff
-                    result = record.registration_json
-                    if select.get("includeLienInfo", False):
-                        logger.info(f"Searching PPR for MHR num {mhr_num}.")
-                        ppr_registrations = SearchResult.search_ppr_by_mhr_number(mhr_num)
-                        result["pprRegistrations"] = ppr_registrations
-                    new_results.append(result)
+            if ("selected" not in select or select["selected"]) and index.add_seen(select["mhrNumber"]):
+                selected.append(select)  # No duplicates.
+        # Serve current snapshots, then bulk load the remaining registration details and the PPR liens.
+        snapshots = {}
+        view_type: str = VIEW_SEARCH_STAFF if staff else VIEW_SEARCH
+        if MhrRegistrationSnapshot.get_mode() == SNAPSHOT_MODE_ON:
+            snapshots = MhrRegistrationSnapshot.find_current([select["mhrNumber"] for select in selected], view_type)
+        records = MhrRegistration.find_all_by_ids_search(
+            [select.get("mhId") for select in selected if select["mhrNumber"] not in snapshots]
+        )
+        logger.debug(
+            f"Bulk loaded {len(records)} registrations, {len(snapshots)} snapshots for {len(selected)} selections."
+        )
+        lien_mhr_nums = [select["mhrNumber"] for select in selected if select.get("includeLienInfo", False)]
+        liens = SearchResult.search_ppr_by_mhr_numbers(lien_mhr_nums) if lien_mhr_nums else {}
+        for select in selected:
+            mhr_num = select["mhrNumber"]
+            result = snapshots.get(mhr_num)
+            if result is None:
+                record = records.get(select.get("mhId", None))
+                if not record:
+                    raise BusinessException(
+                        error=model_utils.ERR_REGISTRATION_NOT_FOUND_MHR.format(
+                            code=ResourceErrorCodes.NOT_FOUND_ERR.value, mhr_number=mhr_num
+                        ),
+                        status_code=HTTPStatus.NOT_FOUND,
+                    )
+                record.staff = staff
+                # New snapshots are committed with the search result: a commit here expires the loaded records.
+                result = MhrRegistrationSnapshot.get_json(record, view_type, record.build_registration_json, False)
+            if select.get("includeLienInfo", False):
+                result["pprRegistrations"] = liens.get(mhr_num, [])
+            new_results.append(result)
         return new_results
 
     def set_search_selection(self, update_select):  # pylint: disable=too-many-branches
@@ -180,23 +208,26 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         # Remove duplicates
         reg_list = list(dict.fromkeys(reg_list))
         # Update lien info flag
+        lien_info = {
+            match["mhrNumber"]: match.get("includeLienInfo")
+            for match in update_select
+            if match.get("includeLienInfo", False)
+        }
         for result in original_results:
-            for match in update_select:
-                if result["mhrNumber"] == match["mhrNumber"]:
-                    if match.get("includeLienInfo", False):
-                        result["includeLienInfo"] = match.get("includeLienInfo")
+            if result["mhrNumber"] in lien_info:
+                result["includeLienInfo"] = lien_info[result["mhrNumber"]]
 
         final_selection = []
+        index = SelectionIndex(original_results, match_mhr_number)
         for reg_num in reg_list:
             # logger.info(f'reg_num={reg_num}')
             result = None
-            for original in original_results:
-                if original["mhrNumber"] == reg_num:
-                    if not result:
-                        result = original
-                        result["extraMatches"] = []
-                    else:  # Combine matches
-                        result["extraMatches"].append(original)
+            for original in index.all(reg_num):
+                if not result:
+                    result = original
+                    result["extraMatches"] = []
+                else:  # Combine matches
+                    result["extraMatches"].append(original)
             if result:
                 if not result.get("extraMatches"):
                     del result["extraMatches"]
@@ -372,13 +403,9 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
             # Check selection MHR numbers are all in the initial search matches.
             original_results = search_result.search.search_response
             if original_results:
+                index = SelectionIndex(original_results, match_mhr_number)
                 for match in select_json:
-                    exists: bool = False
-                    for result in original_results:
-                        if match.get("mhrNumber") == result.get("mhrNumber"):
-                            exists = True
-                            break
-                    if not exists:
+                    if match.get("mhrNumber") not in index:
                         error_msg = model_utils.ERR_SEARCH_INVALID.format(code=ResourceErrorCodes.VALIDATION_ERR.value)
                         logger.info(
                             f"Search {search_id} invalid mhr number in search selection: " + match.get("mhrNumber")
@@ -394,6 +421,47 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
         return search_result
 
+    @staticmethod
+    def search_ppr_by_mhr_numbers(mhr_numbers: list) -> dict:
+        """Execute a PPR MHR Number search query for all the MHR numbers at once.
+
+        Return the PPR registrations keyed by MHR number. Each matching financing statement is loaded and its JSON
+        generated once, then shared by all the homes with the lien.
+        """
+        mhr_nums = list(dict.fromkeys(mhr_numbers))
+        logger.info(f"Search_ppr_by_mhr_numbers search size={len(mhr_nums)}.")
+        rows = None
+        try:
+            query = text(search_utils.PPR_MHR_NUMBERS_QUERY)
+            result = db.session.execute(query, {"query_values": mhr_nums})
+            rows = result.fetchall()
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("Search_ppr_by_mhr_numbers query exception: " + str(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+
+        results = {}
+        if not rows:
+            return results
+        try:
+            statements = FinancingStatement.find_all_by_ids([int(row[1]) for row in rows])
+            statements_json = {}
+            for row in rows:
+                financing_id: int = int(row[1])
+                if financing_id not in statements_json:
+                    financing: FinancingStatement = statements[financing_id]
+                    financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
+                    # Set to true to include change history.
+                    financing.include_changes_json = True
+                    statements_json[financing_id] = financing.json
+                financing_json = {"matchType": "EXACT", "financingStatement": statements_json[financing_id]}
+                results.setdefault(str(row[0]), []).append(financing_json)
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("Search_ppr_by_mhr_numbers build results error: " + str(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+
+        logger.info(f"Search_ppr_by_mhr_numbers found {len(statements_json)} liens for {len(results)} homes.")
+        return results
+
     @staticmethod
     def search_ppr_by_mhr_number(mhr_number):
         """Execute a PPR MHR Number search query."""
@@ -21,6 +21,7 @@ Search constants and helper functions.
 # Disable E131: allow query strings to be more human readable.
 import re
 
+from flask import current_app
 from sqlalchemy.sql import text
 
 from mhr_api.exceptions import DatabaseException
@@ -112,6 +113,19 @@ ORDER BY sc.search_ts DESC
 FETCH FIRST {str(ACCOUNT_SEARCH_HISTORY_MAX_SIZE)} ROWS ONLY
 """
 
+# Search results cache data version: a sequence bumped after registration changes commit, so it never locks.
+QUERY_DATA_VERSION = "SELECT last_value FROM mhr_search_data_version_seq"
+UPDATE_DATA_VERSION = "SELECT nextval('mhr_search_data_version_seq')"
+QUERY_HISTORY_USERNAME = """
+SELECT CASE WHEN u.lastname IS NOT NULL AND u.firstname IS NOT NULL THEN u.firstname || ' ' || u.lastname
+            WHEN u.lastname IS NULL AND u.firstname IS NOT NULL THEN u.firstname
+            WHEN u.lastname IS NOT NULL AND u.firstname IS NULL THEN u.lastname
+            ELSE '' END
+  FROM users u
+ WHERE u.username = :user_id
+ FETCH FIRST 1 ROWS ONLY
+"""
+
 PPR_MHR_NUMBER_QUERY = """
 SELECT DISTINCT fs.id
   FROM registrations r, financing_statements fs, serial_collateral sc 
@@ -130,6 +144,25 @@ SELECT DISTINCT fs.id
    AND sc.mhr_number = (SELECT searchkey_mhr(:query_value))
 ORDER BY fs.id ASC
 """
+PPR_MHR_NUMBERS_QUERY = """
+SELECT DISTINCT q.mhr_number, fs.id
+  FROM unnest(CAST(:query_values AS VARCHAR[])) AS q(mhr_number), registrations r, financing_statements fs,
+       serial_collateral sc
+ WHERE r.financing_id = fs.id
+   AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
+   AND r.base_reg_number IS NULL
+   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND NOT EXISTS (SELECT r3.id 
+                     FROM registrations r3
+                    WHERE r3.financing_id = fs.id
+                      AND r3.registration_type_cl = 'DISCHARGE'
+                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+   AND sc.financing_id = fs.id
+   AND sc.registration_id_end IS NULL
+   AND sc.serial_type = 'MH'
+   AND sc.mhr_number = searchkey_mhr(q.mhr_number)
+ORDER BY q.mhr_number, fs.id ASC
+"""
 SEARCH_MHR_NUMBER_QUERY = """
 SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
        manufacturer_name, civic_address
@@ -143,17 +176,28 @@ SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made,
  WHERE compressed_key = mhr_serial_compressed_key(:query_value)
   ORDER BY section_id 
 """
+# Wildcard serial number searches: exact matches first, capped with the total number of matching homes. The
+# substring filter uses the serial number trigram index unless the fragment is too short to have a trigram.
+SERIAL_WILD_MIN_TRIGRAM_LENGTH = 3
+SERIAL_WILD_FILTER_TRIGRAM = "serial_number LIKE :query_like"
+SERIAL_WILD_FILTER_SCAN = "position(:query_value in serial_number) > 0"
 SEARCH_SERIAL_WILD_QUERY = """
+WITH q AS (
 SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
-       manufacturer_name, civic_address
+       manufacturer_name, civic_address, section_id
   FROM mhr_search_serial_vw
- WHERE position(:query_value in serial_number) > 0
-  ORDER BY 
+ WHERE {filter_clause}
+)
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
+       manufacturer_name, civic_address, (SELECT COUNT(DISTINCT mhr_number) FROM q) AS total_count
+  FROM q
+ ORDER BY
     CASE
         WHEN serial_number = :query_value THEN 0
         ELSE 1
     END,
     section_id
+FETCH FIRST :max_results_size ROWS ONLY
 """
 SEARCH_OWNER_BUS_QUERY = """
 SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id,
@@ -170,6 +214,168 @@ SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made,
  ORDER BY last_name ASC, first_name ASC, middle_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
 """
 
+# The mhr_search_index table has the search view output columns, with one row per home (MHR), active section (SERIAL),
+# and owner (OWNER_BUS, OWNER_IND). Rows for a home are replaced in the registration transaction.
+SEARCH_INDEX_MHR = "MHR"
+SEARCH_INDEX_SERIAL = "SERIAL"
+SEARCH_INDEX_OWNER_BUS = "OWNER_BUS"
+SEARCH_INDEX_OWNER_IND = "OWNER_IND"
+SEARCH_INDEX_LOCK = "SELECT pg_advisory_xact_lock(hashtext('mhr_search_index'), hashtext(:mhr_number))"
+SEARCH_INDEX_DELETE = "DELETE FROM mhr_search_index WHERE mhr_number = :mhr_number"
+SEARCH_INDEX_DELETE_ALL = "DELETE FROM mhr_search_index"
+SEARCH_INDEX_FILTER_MHR_NUMBER = " WHERE mhr_number = :mhr_number"
+SEARCH_INDEX_INSERT_MHR = """
+INSERT INTO mhr_search_index(index_type, mhr_number, status_type, registration_ts, city, serial_number, year_made,
+                             make, model, registration_id, owner_info, manufacturer_name, civic_address, update_ts)
+SELECT 'MHR', mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
+       manufacturer_name, civic_address, (now() at time zone 'utc')
+  FROM mhr_search_mhr_number_vw{filter_clause}
+"""
+SEARCH_INDEX_INSERT_SERIAL = """
+INSERT INTO mhr_search_index(index_type, mhr_number, status_type, registration_ts, city, serial_number, compressed_key,
+                             year_made, make, model, registration_id, owner_info, section_id, manufacturer_name,
+                             civic_address, update_ts)
+SELECT 'SERIAL', mhr_number, status_type, registration_ts, city, serial_number, compressed_key, year_made, make, model,
+       id, owner_info, section_id, manufacturer_name, civic_address, (now() at time zone 'utc')
+  FROM mhr_search_serial_vw{filter_clause}
+"""
+SEARCH_INDEX_INSERT_OWNER_BUS = """
+INSERT INTO mhr_search_index(index_type, mhr_number, status_type, registration_ts, city, serial_number, year_made,
+                             make, model, registration_id, business_name, owner_status_type, compressed_name,
+                             manufacturer_name, civic_address, update_ts)
+SELECT 'OWNER_BUS', mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id,
+       business_name, owner_status_type, compressed_name, manufacturer_name, civic_address, (now() at time zone 'utc')
+  FROM mhr_search_owner_bus_vw{filter_clause}
+"""
+SEARCH_INDEX_INSERT_OWNER_IND = """
+INSERT INTO mhr_search_index(index_type, mhr_number, status_type, registration_ts, city, serial_number, year_made,
+                             make, model, registration_id, last_name, first_name, middle_name, owner_status_type,
+                             compressed_name, manufacturer_name, civic_address, update_ts)
+SELECT 'OWNER_IND', mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id,
+       last_name, first_name, middle_name, owner_status_type, compressed_name, manufacturer_name, civic_address,
+       (now() at time zone 'utc')
+  FROM mhr_search_owner_ind_vw{filter_clause}
+"""
+SEARCH_INDEX_INSERTS = (
+    SEARCH_INDEX_INSERT_MHR,
+    SEARCH_INDEX_INSERT_SERIAL,
+    SEARCH_INDEX_INSERT_OWNER_BUS,
+    SEARCH_INDEX_INSERT_OWNER_IND,
+)
+SEARCH_INDEX_MHR_NUMBER_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_info, manufacturer_name, civic_address
+  FROM mhr_search_index
+ WHERE index_type = 'MHR'
+   AND mhr_number = :query_value
+"""
+SEARCH_INDEX_SERIAL_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_info, manufacturer_name, civic_address
+  FROM mhr_search_index
+ WHERE index_type = 'SERIAL'
+   AND compressed_key = mhr_serial_compressed_key(:query_value)
+ ORDER BY section_id
+"""
+SEARCH_INDEX_SERIAL_WILD_QUERY = """
+WITH q AS (
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_info, manufacturer_name, civic_address, section_id
+  FROM mhr_search_index
+ WHERE index_type = 'SERIAL'
+   AND {filter_clause}
+)
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_info, manufacturer_name, civic_address, (SELECT COUNT(DISTINCT mhr_number) FROM q) AS total_count
+  FROM q
+ ORDER BY
+    CASE
+        WHEN serial_number = :query_value THEN 0
+        ELSE 1
+    END,
+    section_id
+FETCH FIRST :max_results_size ROWS ONLY
+"""
+SEARCH_INDEX_OWNER_BUS_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       business_name, owner_status_type, manufacturer_name, civic_address
+  FROM mhr_search_index
+ WHERE index_type = 'OWNER_BUS'
+   AND compressed_name LIKE mhr_name_compressed_key(:query_value) || '%'
+ ORDER BY business_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
+"""
+SEARCH_INDEX_OWNER_IND_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_status_type, last_name, first_name, middle_name, manufacturer_name, civic_address
+  FROM mhr_search_index
+ WHERE index_type = 'OWNER_IND'
+   AND compressed_name LIKE mhr_name_compressed_key(:query_value) || '%'
+ ORDER BY last_name ASC, first_name ASC, middle_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
+"""
+# Configured search query source: the search views or the search index table.
+SEARCH_SOURCE_LEGACY = "LEGACY"
+SEARCH_SOURCE_TABLE = "TABLE"
+SEARCH_QUERIES = {
+    SEARCH_SOURCE_LEGACY: {
+        "MHR_NUMBER": SEARCH_MHR_NUMBER_QUERY,
+        "SERIAL": SEARCH_SERIAL_QUERY,
+        "SERIAL_WILD": SEARCH_SERIAL_WILD_QUERY,
+        "OWNER_BUS": SEARCH_OWNER_BUS_QUERY,
+        "OWNER_IND": SEARCH_OWNER_IND_QUERY,
+    },
+    SEARCH_SOURCE_TABLE: {
+        "MHR_NUMBER": SEARCH_INDEX_MHR_NUMBER_QUERY,
+        "SERIAL": SEARCH_INDEX_SERIAL_QUERY,
+        "SERIAL_WILD": SEARCH_INDEX_SERIAL_WILD_QUERY,
+        "OWNER_BUS": SEARCH_INDEX_OWNER_BUS_QUERY,
+        "OWNER_IND": SEARCH_INDEX_OWNER_IND_QUERY,
+    },
+}
+
+
+def get_history_criteria(search_type: str, search_criteria: dict) -> str:
+    """Get the normalized search criteria value displayed, sorted, and filtered in the account search history."""
+    criteria: dict = search_criteria.get("criteria", {}) if search_criteria else {}
+    if search_type == "MI":
+        name: dict = criteria.get("ownerName") or {}
+        return str(name.get("last") or "").upper() + " " + str(name.get("first") or "").upper()
+    value = criteria.get("value")
+    return str(value).upper() if value is not None else None
+
+
+def get_search_query(query_name: str) -> str:
+    """Get the named search query for the configured search source."""
+    source: str = current_app.config.get("SEARCH_MHR_SOURCE", SEARCH_SOURCE_LEGACY)
+    return SEARCH_QUERIES.get(source, SEARCH_QUERIES[SEARCH_SOURCE_LEGACY])[query_name]
+
+
+def get_serial_wild_query(query_template: str, serial_num: str) -> tuple:
+    """Get the wildcard serial number search query and parameters for the serial number fragment.
+
+    Fragments shorter than a trigram cannot use the trigram index and fall back to scanning the serial numbers.
+    """
+    value: str = serial_num.strip()
+    params = {"query_value": value, "max_results_size": SEARCH_RESULTS_MAX_SIZE}
+    if len(value) < SERIAL_WILD_MIN_TRIGRAM_LENGTH:
+        return query_template.format(filter_clause=SERIAL_WILD_FILTER_SCAN), params
+    escaped: str = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    params["query_like"] = "%" + escaped + "%"
+    return query_template.format(filter_clause=SERIAL_WILD_FILTER_TRIGRAM), params
+
+
+def get_query_value(request_json) -> str:
+    """Get the search criteria value bound to the search query: the owner name combines the name parts."""
+    criteria = request_json["criteria"]
+    if criteria.get("ownerName"):
+        owner_name = criteria["ownerName"]
+        name: str = owner_name.get("last")
+        if owner_name.get("first"):
+            name += " " + owner_name.get("first")
+        if owner_name.get("middle"):
+            name += " " + owner_name.get("middle").upper()
+        return name.strip()
+    return criteria["value"].strip()
+
 
 def format_mhr_number(request_json):
     """Trim and pad with zeroes search query mhr number query."""
@@ -180,11 +386,11 @@ def format_mhr_number(request_json):
 
 def search_by_mhr_number(request_json):
     """Execute a search by mhr number query."""
-    mhr_num: str = request_json["criteria"]["value"]
+    mhr_num: str = get_query_value(request_json)
     logger.info(f"search_by_mhr_number search value={mhr_num}.")
     try:
-        query = text(SEARCH_MHR_NUMBER_QUERY)
-        result = db.session.execute(query, {"query_value": mhr_num.strip()})
+        query = text(get_search_query("MHR_NUMBER"))
+        result = db.session.execute(query, {"query_value": mhr_num})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("Search_by_mhr_number exception: " + str(db_exception))
@@ -193,13 +399,17 @@ def search_by_mhr_number(request_json):
 
 def search_by_serial_number(request_json):
     """Execute a search by serial number query."""
-    serial_num: str = request_json["criteria"]["value"]
+    serial_num: str = get_query_value(request_json)
     logger.info(f"search_by_serial_number search value={serial_num}.")
     try:
-        query_text: str = SEARCH_SERIAL_QUERY if not request_json.get("wildcardSearch") else SEARCH_SERIAL_WILD_QUERY
+        if request_json.get("wildcardSearch"):
+            query_text, params = get_serial_wild_query(get_search_query("SERIAL_WILD"), serial_num)
+        else:
+            query_text = get_search_query("SERIAL")
+            params = {"query_value": serial_num}
         # logger.info(query_text)
         query = text(query_text)
-        result = db.session.execute(query, {"query_value": serial_num.strip()})
+        result = db.session.execute(query, params)
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("Search_by_serial_number exception: " + str(db_exception))
@@ -208,11 +418,11 @@ def search_by_serial_number(request_json):
 
 def search_by_owner_business(request_json):
     """Execute a search by owner business name query."""
-    bus_name: str = request_json["criteria"]["value"]
+    bus_name: str = get_query_value(request_json)
     logger.info(f"search_by_owner_business search value={bus_name}.")
     try:
-        query = text(SEARCH_OWNER_BUS_QUERY)
-        result = db.session.execute(query, {"query_value": bus_name.strip()})
+        query = text(get_search_query("OWNER_BUS"))
+        result = db.session.execute(query, {"query_value": bus_name})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("Search_by_owner_business exception: " + str(db_exception))
@@ -221,16 +431,11 @@ def search_by_owner_business(request_json):
 
 def search_by_owner_individual(request_json):
     """Execute a search by owner individual name query."""
-    owner_name = request_json["criteria"]["ownerName"]
-    name: str = owner_name.get("last")
-    if owner_name.get("first"):
-        name += " " + owner_name.get("first")
-    if owner_name.get("middle"):
-        name += " " + owner_name.get("middle").upper()
+    name: str = get_query_value(request_json)
     logger.info(f"search_by_owner_individual search value={name}.")
     try:
-        query = text(SEARCH_OWNER_IND_QUERY)
-        result = db.session.execute(query, {"query_value": name.strip()})
+        query = text(get_search_query("OWNER_IND"))
+        result = db.session.execute(query, {"query_value": name})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("Search_by_owner_individual exception: " + str(db_exception))
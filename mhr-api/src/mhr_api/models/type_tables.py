@@ -18,6 +18,7 @@ from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from mhr_api.utils.base import BaseEnum
 
 from .db import db
+from .reference_cache import reference_cache
 
 
 class CountryType(db.Model):  # pylint: disable=too-few-public-methods
@@ -33,6 +34,16 @@ class CountryType(db.Model):  # pylint: disable=too-few-public-methods
     # Relationships - Address
     address = db.relationship("Address", back_populates="country_type")
 
+    @classmethod
+    def find_all(cls):
+        """Return all the type records."""
+        return reference_cache.get_all(CountryType)
+
+    @classmethod
+    def find_by_country_type(cls, country_type: str):
+        """Return the country type record matching the country code."""
+        return reference_cache.get(CountryType, country_type)
+
 
 class ProvinceType(db.Model):  # pylint: disable=too-few-public-methods
     """This class defines the model for the province_type table."""
@@ -50,6 +61,16 @@ class ProvinceType(db.Model):  # pylint: disable=too-few-public-methods
     # Relationships - Address
     address = db.relationship("Address", back_populates="province_type")
 
+    @classmethod
+    def find_all(cls):
+        """Return all the type records."""
+        return reference_cache.get_all(ProvinceType)
+
+    @classmethod
+    def find_by_province_type(cls, province_type: str):
+        """Return the province type record matching the province/state code."""
+        return reference_cache.get(ProvinceType, province_type)
+
 
 class PartyType(db.Model):  # pylint: disable=too-few-public-methods
     """This class defines the model for the party_type table."""
@@ -347,14 +368,14 @@ class MhrDocumentType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrDocumentType).all()
+        return reference_cache.get_all(MhrDocumentType)
 
     @classmethod
     def find_by_doc_type(cls, doc_type: str):
         """Return a specific record by type."""
         if not doc_type or doc_type not in MhrDocumentTypes:
             return None
-        return db.session.query(MhrDocumentType).filter(MhrDocumentType.document_type == doc_type).one_or_none()
+        return reference_cache.get(MhrDocumentType, doc_type)
 
 
 class MhrLocationType(db.Model):  # pylint: disable=too-few-public-methods
@@ -372,7 +393,7 @@ class MhrLocationType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrLocationType).all()
+        return reference_cache.get_all(MhrLocationType)
 
 
 class MhrNoteStatusType(db.Model):  # pylint: disable=too-few-public-methods
@@ -391,7 +412,7 @@ class MhrNoteStatusType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrNoteStatusType).all()
+        return reference_cache.get_all(MhrNoteStatusType)
 
 
 class MhrOwnerStatusType(db.Model):  # pylint: disable=too-few-public-methods
@@ -410,7 +431,7 @@ class MhrOwnerStatusType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrOwnerStatusType).all()
+        return reference_cache.get_all(MhrOwnerStatusType)
 
 
 class MhrPartyType(db.Model):  # pylint: disable=too-few-public-methods
@@ -427,7 +448,7 @@ class MhrPartyType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrPartyType).all()
+        return reference_cache.get_all(MhrPartyType)
 
 
 class MhrRegistrationStatusType(db.Model):  # pylint: disable=too-few-public-methods
@@ -446,7 +467,7 @@ class MhrRegistrationStatusType(db.Model):  # pylint: disable=too-few-public-met
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrRegistrationStatusType).all()
+        return reference_cache.get_all(MhrRegistrationStatusType)
 
 
 class MhrRegistrationType(db.Model):  # pylint: disable=too-few-public-methods
@@ -466,7 +487,7 @@ class MhrRegistrationType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrRegistrationType).all()
+        return reference_cache.get_all(MhrRegistrationType)
 
 
 class MhrReviewStatusType(db.Model):  # pylint: disable=too-few-public-methods
@@ -485,7 +506,7 @@ class MhrReviewStatusType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrReviewStatusType).all()
+        return reference_cache.get_all(MhrReviewStatusType)
 
 
 class MhrStatusType(db.Model):  # pylint: disable=too-few-public-methods
@@ -502,7 +523,7 @@ class MhrStatusType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrStatusType).all()
+        return reference_cache.get_all(MhrStatusType)
 
 
 class MhrTenancyType(db.Model):  # pylint: disable=too-few-public-methods
@@ -519,4 +540,21 @@ class MhrTenancyType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(MhrTenancyType).all()
+        return reference_cache.get_all(MhrTenancyType)
+
+
+# The type tables served from the reference cache, loaded at startup.
+REFERENCE_TYPES = (
+    CountryType,
+    ProvinceType,
+    MhrDocumentType,
+    MhrLocationType,
+    MhrNoteStatusType,
+    MhrOwnerStatusType,
+    MhrPartyType,
+    MhrRegistrationStatusType,
+    MhrRegistrationType,
+    MhrReviewStatusType,
+    MhrStatusType,
+    MhrTenancyType,
+)
@@ -12,11 +12,9 @@
 # pylint: disable=too-many-lines
 import copy
 from http import HTTPStatus
-from pathlib import Path
 
 import markupsafe
 import pycountry
-import requests
 from flask import current_app, jsonify
 
 from mhr_api.exceptions import ResourceErrorCodes
@@ -25,6 +23,7 @@ from mhr_api.models.type_tables import MhrDocumentTypes, MhrRegistrationTypes, M
 from mhr_api.reports import ppr_report_utils
 from mhr_api.reports.v2 import report_utils
 from mhr_api.reports.v2.report_utils import ReportTypes
+from mhr_api.services import report_service
 from mhr_api.services.gcp_auth.auth_service import GoogleAuthService
 from mhr_api.utils.logging import logger
 
@@ -73,7 +72,7 @@ class Report:  # pylint: disable=too-few-public-methods
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key)
         headers = Report.get_headers()
-        response = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response = report_service.post(url, headers, meta_data, files)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response.status_code
@@ -100,7 +99,7 @@ class Report:  # pylint: disable=too-few-public-methods
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key)
         headers = Report.get_headers()
-        response_reg = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response_reg = report_service.post(url, headers, meta_data, files)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response_reg.status_code
@@ -123,7 +122,7 @@ class Report:  # pylint: disable=too-few-public-methods
         )
         files = report_utils.get_report_files(data_final, self._report_key)
         logger.info("Search report regenerating with TOC page numbers set.")
-        response = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response = report_service.post(url, headers, meta_data, files)
         logger.info("Search report regeneration with TOC page numbers completed.")
         if response.status_code != HTTPStatus.OK:
             content = ResourceErrorCodes.REPORT_ERR + ": " + response.content.decode("ascii")
@@ -142,7 +141,7 @@ class Report:  # pylint: disable=too-few-public-methods
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, False)
         headers = Report.get_headers()
-        response_cover = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response_cover = report_service.post(url, headers, meta_data, files)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response_cover.status_code
@@ -177,7 +176,7 @@ class Report:  # pylint: disable=too-few-public-methods
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, False)
         headers = Report.get_headers()
-        response_cover = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response_cover = report_service.post(url, headers, meta_data, files)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response_cover.status_code
@@ -232,7 +231,7 @@ class Report:  # pylint: disable=too-few-public-methods
         )
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, False)
-        response_reg = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response_reg = report_service.post(url, headers, meta_data, files)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response_reg.status_code
@@ -275,7 +274,7 @@ class Report:  # pylint: disable=too-few-public-methods
             files[filename] = pdf
         headers = Report.get_headers()
         url = current_app.config.get("REPORT_SVC_URL") + MERGE_URI
-        response = requests.post(url=url, headers=headers, files=files, timeout=1800.0)
+        response = report_service.post(url, headers, files=files)
         logger.debug("Batch merge reports response status: {0}.".format(response.status_code))
         if response.status_code != HTTPStatus.OK:
             content = ResourceErrorCodes.REPORT_ERR + ": " + response.content.decode("ascii")
@@ -291,6 +290,7 @@ class Report:  # pylint: disable=too-few-public-methods
         data = {
             "reportName": self._get_report_filename(),
             "template": template,
+            "templateName": self._get_template_filename(),
             "templateVars": self._get_template_data(),
         }
         logger.debug("Setup report data completed.")
@@ -326,89 +326,12 @@ class Report:  # pylint: disable=too-few-public-methods
         return report_id
 
     def _get_template(self):
-        """Load from the local file system the template matching the report type."""
+        """Get the assembled template source matching the report type from the template registry."""
         try:
-            template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-            template_code = Path(f"{template_path}/{self._get_template_filename()}").read_text(encoding="UTF-8")
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            return report_utils.TemplateRegistry.get_source(self._get_template_filename())
         except Exception as err:  # noqa: B902; just logging
             logger.error(err)
             raise err
-        return template_code
-
-    @staticmethod
-    def _substitute_template_parts(template_code):
-        """Substitute template parts in main template.
-
-        Template parts are marked by [[partname.html]] in templates.
-
-        This functionality is restricted by:
-        - markup must be exactly [[partname.html]] and have no extra spaces around file name
-        - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
-        parts. There is no recursive search and replace.
-
-        :param template_code: string
-        :return: template_code string, modified.
-        """
-        template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-        template_parts = [
-            "v2/style",
-            "v2/styleMail",
-            "v2/stylePage",
-            "v2/stylePageCover",
-            "v2/stylePageDraft",
-            "v2/stylePageMail",
-            "v2/stylePageRegistration",
-            "v2/stylePageRegistrationDraft",
-            "stylePageMail",
-            "logo",
-            "macros",
-            "registrarSignature",
-            "registrarSignatureBlack",
-            "registration/details",
-            "registration/givingNoticeParty",
-            "registration/location",
-            "registration/notes",
-            "registration/owners",
-            "registration/sections",
-            "registration/submittingParty",
-            "search-result/details",
-            "search-result/location",
-            "search-result/notes",
-            "search-result/owners",
-            "search-result/pprRegistrations",
-            "v2/search-result/selected",
-            "search-result/sections",
-            "v2/search-result/registration",
-            "search-result-ppr/financingStatement",
-            "search-result-ppr/amendmentStatement",
-            "search-result-ppr/changeStatement",
-            "search-result-ppr/renewalStatement",
-            "search-result-ppr/dischargeStatement",
-            "search-result-ppr/securedParties",
-            "search-result-ppr/courtOrderInformation",
-            "search-result-ppr/debtors",
-            "search-result-ppr/registeringParty",
-            "search-result-ppr/vehicleCollateral",
-            "search-result-ppr/generalCollateral",
-        ]
-
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            if template_code.find("[[{}.html]]".format(template_part)) >= 0:
-                template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
-                    encoding="UTF-8"
-                )
-                for template_part_nested in template_parts:
-                    template_reference = "[[{}.html]]".format(template_part_nested)
-                    if template_part_code.find(template_reference) >= 0:
-                        path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
-                        template_nested_code = path.read_text(encoding="UTF-8")
-                        template_part_code = template_part_code.replace(template_reference, template_nested_code)
-                template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
-
-        return template_code
 
     def _get_template_filename(self):
         """Get the report template filename from the report type."""
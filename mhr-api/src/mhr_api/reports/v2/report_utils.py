@@ -11,12 +11,13 @@
 """Helper/utility functions for report generation."""
 import copy
 import io
+import threading
 from pathlib import Path
 
 import pycountry
 import PyPDF2
 from flask import current_app
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, Template
 
 from mhr_api.models.type_tables import MhrDocumentTypes
 from mhr_api.utils.base import BaseEnum
@@ -45,6 +46,48 @@ REPORT_META_DATA = {
     "printBackground": True,
 }
 REPORT_FILES = {"index.html": "", "header.html": "", "footer.html": ""}
+# Template parts substituted in report templates: marked up by [[partname.html]].
+TEMPLATE_PARTS = [
+    "v2/style",
+    "v2/styleMail",
+    "v2/stylePage",
+    "v2/stylePageCover",
+    "v2/stylePageDraft",
+    "v2/stylePageMail",
+    "v2/stylePageRegistration",
+    "v2/stylePageRegistrationDraft",
+    "stylePageMail",
+    "logo",
+    "macros",
+    "registrarSignature",
+    "registrarSignatureBlack",
+    "registration/details",
+    "registration/givingNoticeParty",
+    "registration/location",
+    "registration/notes",
+    "registration/owners",
+    "registration/sections",
+    "registration/submittingParty",
+    "search-result/details",
+    "search-result/location",
+    "search-result/notes",
+    "search-result/owners",
+    "search-result/pprRegistrations",
+    "v2/search-result/selected",
+    "search-result/sections",
+    "v2/search-result/registration",
+    "search-result-ppr/financingStatement",
+    "search-result-ppr/amendmentStatement",
+    "search-result-ppr/changeStatement",
+    "search-result-ppr/renewalStatement",
+    "search-result-ppr/dischargeStatement",
+    "search-result-ppr/securedParties",
+    "search-result-ppr/courtOrderInformation",
+    "search-result-ppr/debtors",
+    "search-result-ppr/registeringParty",
+    "search-result-ppr/vehicleCollateral",
+    "search-result-ppr/generalCollateral",
+]
 REG_PAGE_PREFIX = "Manufactured Home Registration Number: "
 
 
@@ -67,6 +110,106 @@ class ReportTypes(BaseEnum):
     SEARCH_BODY_REPORT = "searchBody"
 
 
+class TemplateRegistry:
+    """Report templates assembled from the template parts once and compiled into a shared Jinja environment.
+
+    Set REPORT_TEMPLATE_RELOAD to assemble and compile the templates for every report when editing templates.
+    """
+
+    _environment: Environment = None
+    _sources: dict = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_environment(cls) -> Environment:
+        """Get the shared template environment with a bytecode cache, creating it on first use."""
+        with cls._lock:
+            if cls._environment is None:
+                cache_dir = current_app.config.get("REPORT_TEMPLATE_CACHE_DIR")
+                cls._environment = Environment(
+                    loader=FunctionLoader(cls._load_template),
+                    autoescape=True,
+                    auto_reload=is_template_reload(),
+                    cache_size=-1,
+                    bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else FileSystemBytecodeCache(),
+                )
+            return cls._environment
+
+    @classmethod
+    def get_source(cls, file_name: str) -> str:
+        """Get the assembled template source for the report template file name."""
+        source = None if is_template_reload() else cls._sources.get(file_name)
+        if source is None:
+            source = assemble_template(file_name)
+            cls._sources[file_name] = source
+        return source
+
+    @classmethod
+    def get_template(cls, file_name: str) -> Template:
+        """Get the compiled template for the report template file name."""
+        return cls.get_environment().get_template(file_name)
+
+    @classmethod
+    def warm_up(cls, file_names) -> int:
+        """Assemble and compile the report templates: return the number of templates loaded."""
+        count: int = 0
+        for file_name in file_names:
+            try:
+                cls.get_template(file_name)
+                count += 1
+            except Exception as err:  # noqa: B902; just logging
+                logger.info(f"Report template {file_name} not loaded: {err}")
+        logger.info(f"Report template registry loaded {count} templates.")
+        return count
+
+    @classmethod
+    def clear(cls):
+        """Remove all assembled and compiled templates."""
+        with cls._lock:
+            cls._sources.clear()
+            if cls._environment is not None:
+                cls._environment.cache.clear()
+
+    @classmethod
+    def _load_template(cls, file_name: str):
+        """Jinja loader function returning the assembled template source."""
+        reload: bool = is_template_reload()
+        return cls.get_source(file_name), None, lambda: not reload
+
+
+def is_template_reload() -> bool:
+    """Check the configuration: dev mode assembles and compiles the templates for every report."""
+    return bool(current_app.config.get("REPORT_TEMPLATE_RELOAD"))
+
+
+def assemble_template(file_name: str) -> str:
+    """Load from the local file system the report template and substitute the template parts.
+
+    Template parts are marked by [[partname.html]] in templates.
+
+    This functionality is restricted by:
+    - markup must be exactly [[partname.html]] and have no extra spaces around file name
+    - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
+    parts. There is no recursive search and replace.
+    """
+    template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
+    template_code = Path(f"{template_path}/{file_name}").read_text(encoding="UTF-8")
+    # substitute template parts - marked up by [[filename]]
+    for template_part in TEMPLATE_PARTS:
+        if template_code.find("[[{}.html]]".format(template_part)) >= 0:
+            template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
+                encoding="UTF-8"
+            )
+            for template_part_nested in TEMPLATE_PARTS:
+                template_reference = "[[{}.html]]".format(template_part_nested)
+                if template_part_code.find(template_reference) >= 0:
+                    path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
+                    template_nested_code = path.read_text(encoding="UTF-8")
+                    template_part_code = template_part_code.replace(template_reference, template_nested_code)
+            template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
+    return template_code
+
+
 class Config:  # pylint: disable=too-few-public-methods
     """Configuration that loads report template static data."""
 
@@ -364,7 +507,10 @@ def get_report_files(  # pylint: disable=too-many-branches
 
 def get_html_from_data(request_data) -> str:
     """Get html by merging the template with the report data."""
-    template_ = Template(request_data["template"], autoescape=True)
+    if request_data.get("templateName"):
+        template_ = TemplateRegistry.get_template(request_data["templateName"])
+    else:
+        template_ = Template(request_data["template"], autoescape=True)
     html_output = template_.render(request_data["templateVars"])
     return html_output
 
@@ -15,13 +15,15 @@
 from enum import Enum
 from http import HTTPStatus
 
-from flask import current_app, jsonify, request
+from flask import Response, current_app, jsonify, request
+from werkzeug.datastructures import ContentRange
 
 from mhr_api.exceptions import ResourceErrorCodes
 from mhr_api.models import registration_utils as reg_utils
 from mhr_api.models import utils as model_utils
 from mhr_api.models.registration_utils import AccountRegistrationParams
 from mhr_api.services.authz import is_bcol_help, is_reg_staff_account, is_sbc_office_account, user_orgs
+from mhr_api.services.document_storage.storage_service import GoogleStorageService
 from mhr_api.services.payment.exceptions import SBCPaymentException
 from mhr_api.utils import admin_validator, manufacturer_validator, note_validator, registration_validator
 from mhr_api.utils.logging import logger
@@ -99,6 +101,53 @@ def is_pdf(req):
     return accept and accept.upper() == "APPLICATION/PDF"
 
 
+def get_document_range(req, etag: str, size: int) -> tuple:
+    """Evaluate the If-None-Match, If-Range and Range request headers for a stored document.
+
+    Return the response status with the [start, stop) byte range to send. Multiple ranges and a non-matching
+    If-Range are answered with the whole document.
+    """
+    if req.if_none_match.contains_weak(etag):
+        return HTTPStatus.NOT_MODIFIED, 0, 0
+    byte_range = req.range
+    if byte_range is None or len(byte_range.ranges) != 1:
+        return HTTPStatus.OK, 0, size
+    if_range = req.if_range
+    if if_range.date is not None or (if_range.etag is not None and if_range.etag != etag):
+        return HTTPStatus.OK, 0, size
+    bounds = byte_range.range_for_length(size)
+    if bounds is None:
+        return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, 0, 0
+    return HTTPStatus.PARTIAL_CONTENT, bounds[0], bounds[1]
+
+
+def document_storage_response(doc_name: str, doc_type: str = None, status=HTTPStatus.OK):
+    """Stream a PDF from document storage, supporting conditional (ETag) and single byte range requests.
+
+    Only the document metadata is fetched before the response starts: the contents are streamed from storage in
+    chunks. Range and If-None-Match are only evaluated for a 200 response status.
+    """
+    blob = GoogleStorageService.get_document_info(doc_name, doc_type)
+    size: int = blob.size
+    start: int = 0
+    stop: int = size
+    if status == HTTPStatus.OK:
+        status, start, stop = get_document_range(request, blob.etag, size)
+    has_body: bool = status not in (HTTPStatus.NOT_MODIFIED, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+    body = GoogleStorageService.stream_document(blob, doc_type, start, stop) if has_body else ()
+    response = Response(body, status=status, content_type="application/pdf")
+    response.headers["Accept-Ranges"] = "bytes"
+    response.set_etag(blob.etag)
+    if has_body:
+        response.content_length = stop - start
+    if status == HTTPStatus.PARTIAL_CONTENT:
+        response.content_range = ContentRange("bytes", start, stop, size)
+    elif status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+        response.content_range = ContentRange("bytes", None, None, size)
+    logger.info(f"Streaming {doc_name} status={int(status)} bytes {start}-{stop} of {size}.")
+    return response
+
+
 def get_apikey(req):
     """Get gateway api key from request headers or parameter."""
     key = req.headers.get("x-apikey")
@@ -23,6 +23,7 @@ from .drafts import bp as drafts_bp
 from .exemptions import bp as exemptions_bp
 from .manufacturer import bp as manufacturers_bp
 from .meta import bp as meta_bp
+from .metrics import bp as metrics_bp
 from .notes import bp as notes_bp
 from .ops import bp as ops_bp
 from .other_registrations import bp as other_registrations_bp
@@ -60,6 +61,7 @@ class V1Endpoint:
         self.app.register_blueprint(exemptions_bp)
         self.app.register_blueprint(manufacturers_bp)
         self.app.register_blueprint(meta_bp)
+        self.app.register_blueprint(metrics_bp)
         self.app.register_blueprint(notes_bp)
         self.app.register_blueprint(ops_bp)
         self.app.register_blueprint(other_registrations_bp)
@@ -0,0 +1,30 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Endpoint to scrape the service metrics in the Prometheus text exposition format."""
+from http import HTTPStatus
+
+from flask import Blueprint, Response, jsonify
+
+from mhr_api.models import db
+from mhr_api.utils.metrics import CONTENT_TYPE, metrics
+
+bp = Blueprint("METRICS1", __name__, url_prefix="/metrics")  # pylint: disable=invalid-name
+
+
+@bp.route("", methods=["GET"])
+def get_metrics():
+    """Return this process's request, database pool, report service, storage and search metrics."""
+    if not metrics.enabled:
+        return jsonify({"message": "metrics are not enabled"}), HTTPStatus.NOT_FOUND
+    return Response(metrics.render(db.engine.pool), mimetype=CONTENT_TYPE)
@@ -212,6 +212,7 @@ def get_registrations(mhr_number: str):  # pylint: disable=too-many-return-state
             )
             registration.current_view = True
             registration.staff = is_staff(jwt)
+            registration.use_snapshot = True
         else:
             registration = MhrRegistration.find_original_by_mhr_number(
                 mhr_number, account_id, is_all_staff_account(account_id)
@@ -401,10 +402,11 @@ def post_batch_noc_locations():  # pylint: disable=too-many-return-statements
         registrations = batch_utils.get_batch_location_report_data(start_ts, end_ts)
         if not registrations:
             return batch_utils.batch_location_report_empty(notify, start_ts, end_ts)
-        if registrations[0].get("batchStorageUrl"):  # Report already generated so fetch it.
-            return batch_utils.batch_location_report_exists(
-                registrations[0].get("batchStorageUrl"), notify, return_link
-            )
+        batch_storage_url: str = registrations[0].get("batchStorageUrl")
+        if batch_storage_url and not return_link:  # Report already generated so stream it.
+            return resource_utils.document_storage_response(batch_storage_url, DocumentTypes.BATCH_REGISTRATION)
+        if batch_storage_url:  # Report already generated so fetch the link.
+            return batch_utils.batch_location_report_exists(batch_storage_url, notify)
         raw_data, status_code, headers = get_batch_noc_location_report(registrations)
         if status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
             logger.error("Batch noc location report merge call failed: " + raw_data.get_data(as_text=True))
@@ -528,16 +530,13 @@ def save_batch_manufacturer_report(registrations, raw_data, return_link: bool) -
 
 def batch_manufacturer_report_exists(batch_storage_url: str, notify: bool, return_link: bool):
     """Create response when batch manufacturer registration report already exists."""
-    report_url: str = None
-    raw_data = None
     logger.info(f"Fetching batch manufacturer registration report for: {batch_storage_url}.")
-    if return_link:
-        report_url = GoogleStorageService.get_document_link(
-            batch_storage_url, DocumentTypes.BATCH_REGISTRATION, batch_utils.DEFAULT_DOWNLOAD_DAYS
-        )
-    else:
-        raw_data = GoogleStorageService.get_document(batch_storage_url, DocumentTypes.BATCH_REGISTRATION)
-    return batch_manufacturer_report_response(raw_data, report_url, notify)
+    if not return_link:
+        return resource_utils.document_storage_response(batch_storage_url, DocumentTypes.BATCH_REGISTRATION)
+    report_url: str = GoogleStorageService.get_document_link(
+        batch_storage_url, DocumentTypes.BATCH_REGISTRATION, batch_utils.DEFAULT_DOWNLOAD_DAYS
+    )
+    return batch_manufacturer_report_response(None, report_url, notify)
 
 
 def batch_manufacturer_report_empty(notify: bool, start_ts: str, end_ts: str):
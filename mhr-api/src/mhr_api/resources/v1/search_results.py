@@ -215,11 +215,10 @@ def get_search_results(search_id: str):  # pylint: disable=too-many-branches
                     return resource_utils.bad_request_response(error_msg)
                 return generate_search_report(search_detail, search_id)
 
-            # If the request is for a report, fetch binary data from doc storage.
+            # If the request is for a report, stream it from doc storage.
             doc_name = search_detail.doc_storage_url
             logger.info(f"Fetching search report {doc_name} from doc storage.")
-            raw_data = GoogleStorageService.get_document(doc_name)
-            return raw_data, HTTPStatus.OK, {"Content-Type": "application/pdf"}
+            return resource_utils.document_storage_response(doc_name)
 
         response_data = search_detail.json
         response_data["reportAvailable"] = search_detail.doc_storage_url is not None
@@ -27,7 +27,6 @@ from mhr_api.models import utils as model_utils
 from mhr_api.resources import utils as resource_utils
 from mhr_api.services.abstract_storage_service import DocumentTypes
 from mhr_api.services.authz import authorized
-from mhr_api.services.document_storage.storage_service import GoogleStorageService
 from mhr_api.services.utils.exceptions import StorageException
 from mhr_api.utils.auth import jwt
 from mhr_api.utils.logging import logger
@@ -86,8 +85,7 @@ def get_agreement_versions(version: str):  # pylint: disable=too-many-return-sta
         if resource_utils.is_pdf(request):
             doc_name = agreement.doc_storage_url
             logger.info(f"Fetching service agreement pdf {doc_name} from doc storage.")
-            raw_data = GoogleStorageService.get_document(doc_name, DocumentTypes.SERVICE_AGREEMENT)
-            return raw_data, HTTPStatus.OK, {"Content-Type": "application/pdf"}
+            return resource_utils.document_storage_response(doc_name, DocumentTypes.SERVICE_AGREEMENT)
 
         return jsonify(agreement.json), HTTPStatus.OK
     except DatabaseException as db_exception:
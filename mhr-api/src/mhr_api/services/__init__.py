@@ -17,7 +17,11 @@ from .authz import BASIC_USER, MHR_ROLE, STAFF_ROLE, SYSTEM_ROLE, authorized, is
 from .document_storage.storage_service import GoogleStorageService
 from .gcp_auth.auth_service import GoogleAuthService
 from .queue_service import GoogleQueueService
+from .report_service import ReportService
+from .sql_profiler import SqlProfiler
 
 auth_service = GoogleAuthService()
 queue_service = GoogleQueueService()
+report_service = ReportService()
+sql_profiler = SqlProfiler()
 storage_service = GoogleStorageService()
@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This manages all of the authentication and authorization service."""
+import base64
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
 from http import HTTPStatus
 from typing import List
 
@@ -50,6 +56,113 @@ SEARCH_USER_GROUP = "mhr_search_user"
 SBC_STAFF_ACCOUNT = "SBC_STAFF"
 
 
+class AuthCache:
+    """Bounded time to live cache of auth api responses keyed by the token subject and account id.
+
+    Failed requests are cached for a shorter time so an unavailable auth api is not called for every request.
+    """
+
+    def __init__(self):
+        """Create an empty cache."""
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """Return a tuple of found and the cached value for the key."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                return True, copy.deepcopy(entry[1])
+            if entry:
+                del self.entries[key]
+            return False, None
+
+    def put(self, key: tuple, value, ttl: int, max_size: int):
+        """Add or replace the value for the key for ttl seconds, evicting the least recently used when full."""
+        if ttl <= 0 or max_size < 1:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, subject: str = None, account_id: str = None):
+        """Remove the entries for the token subject and/or account id, or all entries if neither is provided."""
+        with self.lock:
+            if not subject and not account_id:
+                self.entries.clear()
+                return
+            for key in list(self.entries.keys()):
+                if (not subject or key[0] == subject) and (not account_id or key[1] == account_id):
+                    del self.entries[key]
+
+
+auth_cache = AuthCache()
+_auth_session: Session = None
+_auth_session_lock = threading.Lock()
+
+
+def get_auth_session() -> Session:
+    """Get the auth api session shared by the worker threads, with a keep-alive connection pool and retries."""
+    global _auth_session  # pylint: disable=global-statement
+    with _auth_session_lock:
+        if _auth_session is None:
+            retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+            adapter = HTTPAdapter(max_retries=retries)
+            _auth_session = Session()
+            _auth_session.mount("http://", adapter)
+            _auth_session.mount("https://", adapter)
+        return _auth_session
+
+
+def get_token_subject(token: str) -> str:
+    """Get the subject claim from a request token the JWT manager has already validated: only for cache keys."""
+    try:
+        payload: str = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return claims.get("sub")
+    except Exception:  # pylint: disable=broad-except # noqa F841; do not cache.
+        return None
+
+
+def invalidate_auth_cache(subject: str = None, account_id: str = None):
+    """Remove cached auth api responses for a user and/or account, for example after an account change."""
+    auth_cache.invalidate(subject, account_id)
+
+
+def auth_api_get(api_url: str, token: str, account_id: str = None):
+    """Auth API GET request using the shared session: return the response status code and json data.
+
+    Responses are cached by the token subject and account id, failures for a shorter time.
+    """
+    key: tuple = None
+    subject: str = get_token_subject(token)
+    if subject:
+        key = (subject, account_id, api_url)
+        found, value = auth_cache.get(key)
+        if found:
+            return value
+    status_code = None
+    data = None
+    try:
+        headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
+        ret_val = get_auth_session().get(url=api_url, headers=headers)
+        status_code = ret_val.status_code
+        data = ret_val.json()
+    finally:
+        if key:
+            ttl_key: str = "AUTH_CACHE_TTL" if status_code == HTTPStatus.OK and data else "AUTH_CACHE_NEGATIVE_TTL"
+            auth_cache.put(
+                key,
+                (status_code, data),
+                int(current_app.config.get(ttl_key, 0)),
+                int(current_app.config.get("AUTH_CACHE_MAX_SIZE", 1000)),
+            )
+    return status_code, data
+
+
 def authorized(identifier: str, jwt: JwtManager) -> bool:
     """Verify the user is authorized to submit the request by inspecting the web token.
 
@@ -128,18 +241,13 @@ def authorized_token(  # pylint: disable=too-many-return-statements
         auth_url = template_url.format(**vars())
 
         token = jwt.get_token_auth_header()
-        headers = {"Authorization": "Bearer " + token}
         try:
-            with Session() as http:
-                retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-                http.mount("http://", HTTPAdapter(max_retries=retries))
-                rv = http.get(url=auth_url, headers=headers)
+            status_code, auth_data = auth_api_get(auth_url, token, identifier)
+            if status_code != HTTPStatus.OK or not auth_data or not auth_data.get("roles"):
+                return False
 
-                if rv.status_code != HTTPStatus.OK or not rv.json().get("roles"):
-                    return False
-
-                if all(elem.lower() in rv.json().get("roles") for elem in action):
-                    return True
+            if all(elem.lower() in auth_data.get("roles") for elem in action):
+                return True
 
         except (
             exceptions.ConnectionError,  # pylint: disable=broad-except
@@ -165,16 +273,8 @@ def user_orgs(token: str) -> dict:
     api_url += USER_ORGS_PATH
 
     try:
-        headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
-        # logger.debug('Auth get user orgs url=' + url)
-        with Session() as http:
-            retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-            http.mount("http://", HTTPAdapter(max_retries=retries))
-            ret_val = http.get(url=api_url, headers=headers)
-            logger.debug("Auth get user orgs response status: " + str(ret_val.status_code))
-            # logger.debug('Auth get user orgs response data:')
-            response = ret_val.json()
-            # logger.debug(response)
+        status_code, response = auth_api_get(api_url, token)
+        logger.debug("Auth get user orgs response status: " + str(status_code))
     except (
         exceptions.ConnectionError,  # pylint: disable=broad-except
         exceptions.Timeout,
@@ -197,16 +297,8 @@ def account_org(token: str, account_id: str) -> dict:
     api_url += f"orgs/{account_id}"
 
     try:
-        headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
-        # logger.debug('Auth get user orgs url=' + url)
-        with Session() as http:
-            retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-            http.mount("http://", HTTPAdapter(max_retries=retries))
-            ret_val = http.get(url=api_url, headers=headers)
-            logger.debug("Auth get user orgs response status: " + str(ret_val.status_code))
-            # logger.debug('Auth get account org response data:')
-            response = ret_val.json()
-            # logger.debug(response)
+        status_code, response = auth_api_get(api_url, token, account_id)
+        logger.debug("Auth get account org response status: " + str(status_code))
     except (
         exceptions.ConnectionError,  # pylint: disable=broad-except
         exceptions.Timeout,
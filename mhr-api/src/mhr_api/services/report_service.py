@@ -0,0 +1,72 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This class is the report service (Gotenberg) client shared by the API report requests.
+
+Requests reuse persistent keep-alive connections from the session pool instead of opening a new connection for every
+report service call.
+"""
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mhr_api.utils.logging import logger
+from mhr_api.utils.metrics import REPORT_LATENCY, REPORT_RETRIES
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 1800.0
+
+
+class ReportService:
+    """Report service client with an app scoped connection pool and the 502, 503 retry strategy."""
+
+    session: requests.Session = None
+    timeout: float = DEFAULT_TIMEOUT
+
+    @staticmethod
+    def init_app(app):
+        """Set up the service connection pool from the app configuration."""
+        pool_size: int = int(app.config.get("REPORT_SVC_POOL_SIZE", DEFAULT_POOL_SIZE))
+        ReportService.timeout = float(app.config.get("REPORT_SVC_TIMEOUT", DEFAULT_TIMEOUT))
+        ReportService.session = ReportService.create_session(pool_size)
+        logger.info(f"Report service client pool size={pool_size} timeout={ReportService.timeout}")
+
+    @staticmethod
+    def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+        """Create a session with a connection pool of up to pool size keep-alive connections per host."""
+        retry_strategy = Retry(total=4, backoff_factor=1.0, status_forcelist=[502, 503])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry_strategy)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def post(self, url: str, headers: dict, data=None, files=None, timeout: float = None) -> requests.Response:
+        """Post a report service request using a pooled connection: the timeout defaults to the configured value."""
+        if ReportService.session is None:
+            ReportService.session = ReportService.create_session()
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = ReportService.session.post(
+                url=url, headers=headers, data=data, files=files, timeout=timeout or ReportService.timeout
+            )
+            status = response.status_code
+            retries = getattr(response.raw, "retries", None)
+            if retries and retries.history:
+                REPORT_RETRIES.inc(len(retries.history))
+            return response
+        finally:
+            REPORT_LATENCY.observe(time.perf_counter() - start, status=status)
@@ -0,0 +1,173 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Optional per request SQL profiling using SQLAlchemy engine events.
+
+When enabled every request records the number of statements executed, the total database time, the slowest
+statements and the repeated (N+1) statement signatures. Statements are normalized: bind parameters and literals are
+replaced so no registry data is recorded. Profiles are logged when a request is slow or repeats a statement, are
+optionally returned as response headers, and a sample is kept in a ring buffer available from the ops endpoint.
+
+This module is mirrored in the ppr-api and mhr-api packages: keep the copies identical apart from the package
+imports.
+"""
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from mhr_api.utils.logging import logger
+
+HEADER_QUERY_COUNT = "X-SQL-Query-Count"
+HEADER_QUERY_TIME = "X-SQL-Query-Time-Ms"
+MAX_STATEMENT_LENGTH: int = 500
+SLOWEST_COUNT: int = 5
+
+_BIND_PARAM = re.compile(r"%\(\w+\)s|%s")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Replace bind parameters, literals and parameter lists so statements differing only by value match."""
+    if not statement:
+        return ""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()[:MAX_STATEMENT_LENGTH]
+
+
+class RequestProfile:
+    """The statements executed by a single request."""
+
+    def __init__(self):
+        """Create an empty profile starting now."""
+        self.start: float = time.perf_counter()
+        self.count: int = 0
+        self.db_time: float = 0.0
+        self.statements: Counter = Counter()
+        self.slowest: list = []
+
+    def add(self, statement: str, duration: float):
+        """Record one executed statement and its duration in seconds."""
+        self.count += 1
+        self.db_time += duration
+        normalized = normalize_statement(statement)
+        self.statements[normalized] += 1
+        self.slowest.append((duration, normalized))
+        if len(self.slowest) > SLOWEST_COUNT:
+            self.slowest.sort(key=lambda entry: entry[0], reverse=True)
+            self.slowest.pop()
+
+    def summary(self, repeat_threshold: int) -> dict:
+        """Build the profile summary: statements executed at least repeat_threshold times are N+1 signatures."""
+        slowest = sorted(self.slowest, key=lambda entry: entry[0], reverse=True)
+        return {
+            "queryCount": self.count,
+            "queryTimeMs": round(self.db_time * 1000, 2),
+            "requestTimeMs": round((time.perf_counter() - self.start) * 1000, 2),
+            "slowest": [{"statement": stmt, "timeMs": round(duration * 1000, 2)} for duration, stmt in slowest],
+            "repeated": [
+                {"statement": stmt, "count": count}
+                for stmt, count in self.statements.most_common()
+                if repeat_threshold > 0 and count >= repeat_threshold
+            ],
+        }
+
+
+class SqlProfiler:
+    """Flask extension recording per request SQL statement profiles."""
+
+    def __init__(self, app=None):
+        """Initialize this object."""
+        self.enabled: bool = False
+        self.headers: bool = False
+        self.sample_rate: float = 0.0
+        self.slow_ms: int = 500
+        self.repeat_threshold: int = 10
+        self.profiles: deque = deque(maxlen=100)
+        self.lock = threading.Lock()
+        if app:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Set up from the configuration, registering the engine and request hooks only if enabled."""
+        self.enabled = app.config.get("SQL_PROFILER_ENABLED", False)
+        if not self.enabled:
+            return
+        self.headers = app.config.get("SQL_PROFILER_HEADERS", False)
+        self.sample_rate = float(app.config.get("SQL_PROFILER_SAMPLE_RATE", 0.1))
+        self.slow_ms = int(app.config.get("SQL_PROFILER_SLOW_MS", 500))
+        self.repeat_threshold = int(app.config.get("SQL_PROFILER_REPEAT_THRESHOLD", 10))
+        self.profiles = deque(maxlen=int(app.config.get("SQL_PROFILER_BUFFER_SIZE", 100)))
+        if not event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+        app.before_request(self.start_request)
+        app.after_request(self.end_request)
+        logger.info(f"SQL profiler enabled sample rate={self.sample_rate} slow ms={self.slow_ms}")
+
+    @staticmethod
+    def start_request():
+        """Start recording the request statements."""
+        g.sql_profile = RequestProfile()
+
+    def end_request(self, response):
+        """Log, sample and optionally return the request profile as response headers."""
+        profile: RequestProfile = g.pop("sql_profile", None)
+        if not profile:
+            return response
+        summary = profile.summary(self.repeat_threshold)
+        summary["method"] = request.method
+        summary["path"] = request.url_rule.rule if request.url_rule else request.path
+        summary["status"] = response.status_code
+        if self.headers:
+            response.headers[HEADER_QUERY_COUNT] = str(summary["queryCount"])
+            response.headers[HEADER_QUERY_TIME] = str(summary["queryTimeMs"])
+        if summary["repeated"] or (summary["slowest"] and summary["slowest"][0]["timeMs"] >= self.slow_ms):
+            logger.warning(f"SQL profile {summary['method']} {summary['path']}", additional=summary)
+        if self.sample_rate > 0 and random.random() < self.sample_rate:  # noqa: S311; sampling only
+            with self.lock:
+                self.profiles.append(summary)
+        return response
+
+    def get_profiles(self) -> list:
+        """Return the sampled request profiles, most recent first."""
+        with self.lock:
+            return list(reversed(self.profiles))
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    """Engine event: note the statement start time."""
+    conn.info.setdefault("sql_profiler_start", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    """Engine event: add the statement duration to the current request profile, if any."""
+    starts = conn.info.get("sql_profiler_start")
+    if not starts:
+        return
+    duration: float = time.perf_counter() - starts.pop()
+    if has_request_context():
+        profile: RequestProfile = g.get("sql_profile")
+        if profile:
+            profile.add(statement, duration)
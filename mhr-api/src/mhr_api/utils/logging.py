@@ -61,11 +61,11 @@ class CallerFilter(logging.Filter):
 def caller_reader(f):
     """This wrapper updates the context with the callor infos"""
 
-    def wrapper(self, *args):
+    def wrapper(self, *args, **kwargs):
         caller = getframeinfo(stack()[1][0])
         self.logger.filters[0].filename = caller.filename
         self.logger.filters[0].lineno = caller.lineno
-        return f(self, *args)
+        return f(self, *args, **kwargs)
 
     return wrapper
 
@@ -0,0 +1,249 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in, in-process Prometheus compatible metrics for the API hot paths.
+
+Counters and histograms are kept per process and rendered in the Prometheus text exposition format by the /metrics
+endpoint: each server worker process is a separate scrape target. Recording is a no-op unless METRICS_ENABLED is set.
+Metric names are prefixed with the METRICS_NAMESPACE configuration value.
+
+This module is mirrored in the ppr-api and mhr-api packages: keep the copies identical apart from the package
+imports.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from mhr_api.utils.logging import logger
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+SIZE_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+BYTES_BUCKETS = (10240, 102400, 512000, 1048576, 5242880, 10485760, 52428800, 104857600)
+
+
+def _escape(value) -> str:
+    """Escape a label value as the exposition format requires."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_names: tuple, label_values: tuple, extra: str = None) -> str:
+    """Format the label set, with an optional extra preformatted label."""
+    labels = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+class Metric:
+    """Base class for a named metric with a fixed set of label names."""
+
+    metric_type: str = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: tuple = ()):
+        """Create an empty metric."""
+        self.name: str = name
+        self.description: str = description
+        self.label_names: tuple = label_names
+        self.values: dict = {}
+        self.lock = threading.Lock()
+
+    def label_values(self, labels: dict) -> tuple:
+        """Get the label values as strings in label name order."""
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    @property
+    def full_name(self) -> str:
+        """Get the metric name prefixed with the registry namespace."""
+        return f"{metrics.namespace}_{self.name}"
+
+    def render(self) -> list:
+        """Render the metric in the text exposition format."""
+        lines = [f"# HELP {self.full_name} {self.description}", f"# TYPE {self.full_name} {self.metric_type}"]
+        with self.lock:
+            for label_values, value in sorted(self.values.items()):
+                lines.extend(self.render_value(label_values, value))
+        return lines
+
+    def render_value(self, label_values: tuple, value) -> list:
+        """Render a single label set value."""
+        return [f"{self.full_name}{_format_labels(self.label_names, label_values)} {value}"]
+
+    def clear(self):
+        """Remove all recorded values."""
+        with self.lock:
+            self.values.clear()
+
+
+class Counter(Metric):
+    """A monotonically increasing count."""
+
+    metric_type: str = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        """Increment the count for the labels."""
+        if not metrics.enabled:
+            return
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    """Observation counts by upper bound bucket, with the observation sum and count."""
+
+    metric_type: str = "histogram"
+
+    def __init__(self, name: str, description: str, label_names: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        """Create an empty histogram with the bucket upper bounds."""
+        super().__init__(name, description, label_names)
+        self.buckets: tuple = buckets
+
+    def observe(self, value: float, **labels):
+        """Add an observation for the labels."""
+        if not metrics.enabled:
+            return
+        key = self.label_values(labels)
+        index: int = bisect_left(self.buckets, value)
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self.values[key] = entry
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def render_value(self, label_values: tuple, value) -> list:
+        """Render the cumulative bucket counts, sum and count."""
+        lines = []
+        cumulative: int = 0
+        for index, upper in enumerate(self.buckets + ("+Inf",)):
+            cumulative += value[0][index]
+            labels = _format_labels(self.label_names, label_values, f'le="{upper}"')
+            lines.append(f"{self.full_name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.label_names, label_values)
+        lines.append(f"{self.full_name}_sum{labels} {value[1]}")
+        lines.append(f"{self.full_name}_count{labels} {value[2]}")
+        return lines
+
+
+class Metrics:
+    """The metrics registry: request hooks, database pool events and the exposition format rendering."""
+
+    def __init__(self):
+        """Create an empty disabled registry."""
+        self.enabled: bool = False
+        self.namespace: str = "api"
+        self.registered: list = []
+
+    def counter(self, name: str, description: str, label_names: tuple = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, description, label_names)
+        self.registered.append(metric)
+        return metric
+
+    def histogram(self, name: str, description: str, label_names: tuple = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, description, label_names, buckets)
+        self.registered.append(metric)
+        return metric
+
+    def init_app(self, app):
+        """Enable recording from the configuration, registering the request hooks and pool listeners."""
+        self.namespace = app.config.get("METRICS_NAMESPACE", self.namespace)
+        self.enabled = app.config.get("METRICS_ENABLED", False)
+        if not self.enabled:
+            return
+        if not event.contains(Pool, "checkout", pool_checkout):
+            event.listen(Pool, "checkout", pool_checkout)
+            event.listen(Pool, "connect", pool_connect)
+        app.before_request(start_request)
+        app.after_request(end_request)
+        logger.info("Metrics recording enabled.")
+
+    def render(self, pool=None) -> str:
+        """Render all the registered metrics, and the database pool state if available."""
+        lines = []
+        for metric in self.registered:
+            lines.extend(metric.render())
+        if pool is not None and hasattr(pool, "checkedout"):
+            for name, description, value in (
+                ("db_pool_size", "Database connection pool size.", pool.size()),
+                ("db_pool_checked_out", "Database connections currently checked out.", pool.checkedout()),
+                ("db_pool_overflow", "Database connections open beyond the pool size.", max(pool.overflow(), 0)),
+            ):
+                lines.append(f"# HELP {self.namespace}_{name} {description}")
+                lines.append(f"# TYPE {self.namespace}_{name} gauge")
+                lines.append(f"{self.namespace}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Remove all recorded values."""
+        for metric in self.registered:
+            metric.clear()
+
+
+metrics = Metrics()
+
+REQUEST_LATENCY = metrics.histogram(
+    "http_request_duration_seconds", "API request latency.", ("blueprint", "route", "method", "status")
+)
+DB_POOL_CHECKOUTS = metrics.counter("db_pool_checkouts_total", "Database pool connection checkouts.")
+DB_POOL_CONNECTS = metrics.counter("db_pool_connects_total", "New database connections opened by the pool.")
+REPORT_LATENCY = metrics.histogram(
+    "report_service_request_duration_seconds", "Report service request latency.", ("status",)
+)
+REPORT_RETRIES = metrics.counter("report_service_retries_total", "Report service request retries.")
+STORAGE_LATENCY = metrics.histogram(
+    "document_storage_duration_seconds", "Document storage request latency.", ("operation", "doc_type")
+)
+STORAGE_BYTES = metrics.histogram(
+    "document_storage_bytes", "Document storage get and save sizes.", ("operation", "doc_type"), BYTES_BUCKETS
+)
+SEARCH_RESULTS_SIZE = metrics.histogram(
+    "search_results_size", "Search query and selection result sizes.", ("search_type", "stage"), SIZE_BUCKETS
+)
+
+
+def start_request():
+    """Note the request start time."""
+    g.metrics_start = time.perf_counter()
+
+
+def end_request(response):
+    """Record the request latency by blueprint and route."""
+    start = g.pop("metrics_start", None)
+    if start is not None:
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - start,
+            blueprint=request.blueprint or "",
+            route=request.url_rule.rule if request.url_rule else "unmatched",
+            method=request.method,
+            status=response.status_code,
+        )
+    return response
+
+
+def pool_checkout(dbapi_connection, connection_record, connection_proxy):  # pylint: disable=unused-argument
+    """Pool event: count connection checkouts."""
+    DB_POOL_CHECKOUTS.inc()
+
+
+def pool_connect(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+    """Pool event: count new connections."""
+    DB_POOL_CONNECTS.inc()
@@ -3,6 +3,8 @@ DELETE FROM mhr_registration_reports WHERE id >= 200000000;
 DELETE FROM mhr_registration_reports WHERE registration_id >= 200000000;
 DELETE FROM mhr_manufacturers WHERE id >= 200000000;
 DELETE FROM mhr_qualified_suppliers WHERE id >= 200000000;
+DELETE FROM mhr_search_index WHERE registration_id >= 200000000;
+DELETE FROM mhr_registration_snapshots WHERE registration_id >= 200000000;
 DELETE FROM mhr_sections WHERE id >= 200000000;
 DELETE FROM mhr_descriptions WHERE id >= 200000000;
 DELETE FROM mhr_notes WHERE id >= 200000000;
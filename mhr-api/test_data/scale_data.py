@@ -0,0 +1,525 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generate a synthetic MHR dataset at production scale for local benchmarks and query plan work.
+
+Manufactured home registrations are created in batches with set based INSERT ... SELECT statements, one transaction
+per batch. Keys, MHR numbers and document numbers come from the database sequences and number functions, and the
+owner and serial number compressed key columns are set with the same mhr_*_compressed_key functions the API uses.
+Names, parks and manufacturers are drawn from skewed distributions so common values repeat, as they do in
+production. Each home has a location, a description, 1 to 3 sections and 1 or more owner groups; a fraction of the
+homes have a transfer that replaces the owner groups. Intended for use only in local and development environments.
+"""
+import random
+import time
+
+from sqlalchemy.sql import text
+
+LAST_NAMES = [
+    "SMITH",
+    "BROWN",
+    "LEE",
+    "WILSON",
+    "MARTIN",
+    "JOHNSON",
+    "SINGH",
+    "WANG",
+    "LI",
+    "CHEN",
+    "TAYLOR",
+    "ANDERSON",
+    "THOMPSON",
+    "WHITE",
+    "CAMPBELL",
+    "WONG",
+    "STEWART",
+    "CLARK",
+    "NGUYEN",
+    "GILL",
+    "SANDHU",
+    "DHALIWAL",
+    "GREWAL",
+    "KIM",
+    "PARK",
+    "MACDONALD",
+    "MCDONALD",
+    "ROBERTSON",
+    "SCOTT",
+    "YOUNG",
+    "WALKER",
+    "MILLER",
+    "MORRISON",
+    "REID",
+    "ROSS",
+    "MURPHY",
+    "KELLY",
+    "O'BRIEN",
+    "VAN DER MEER",
+    "DE JONG",
+    "ST. PIERRE",
+    "LEBLANC",
+    "TREMBLAY",
+    "GAGNON",
+    "ROY",
+    "COTE",
+    "BOUCHARD",
+    "PATEL",
+    "SHARMA",
+    "HUANG",
+    "ZHANG",
+    "LIU",
+    "HO",
+    "CHAN",
+    "TAN",
+    "NAKAMURA",
+    "TANAKA",
+    "JACKSON",
+    "HARRIS",
+    "LEWIS",
+    "HALL",
+    "ALLEN",
+    "KING",
+    "WRIGHT",
+    "HILL",
+    "GREEN",
+    "ADAMS",
+    "BAKER",
+    "NELSON",
+    "CARTER",
+    "MITCHELL",
+    "ROBINSON",
+    "FRASER",
+    "MACKENZIE",
+    "HAMILTON",
+    "GRAHAM",
+    "WATSON",
+    "JONES",
+    "WILLIAMS",
+    "DAVIS",
+    "EVANS",
+    "THOMAS",
+    "ROBERTS",
+    "JOHNSTON",
+    "SMITH-JONES",
+    "BAINS",
+    "SIDHU",
+    "JOHAL",
+    "DE LA CRUZ",
+]
+FIRST_NAMES = [
+    "JOHN",
+    "DAVID",
+    "MICHAEL",
+    "ROBERT",
+    "JAMES",
+    "WILLIAM",
+    "RICHARD",
+    "DANIEL",
+    "MARK",
+    "PAUL",
+    "STEVEN",
+    "BRIAN",
+    "KEVIN",
+    "JASON",
+    "CHRISTOPHER",
+    "RYAN",
+    "MATTHEW",
+    "JENNIFER",
+    "MARY",
+    "SARAH",
+    "LISA",
+    "KAREN",
+    "SUSAN",
+    "MICHELLE",
+    "LINDA",
+    "PATRICIA",
+    "ELIZABETH",
+    "JESSICA",
+    "EMILY",
+    "AMANDA",
+    "ASHLEY",
+    "ANGELA",
+    "NICOLE",
+    "HEATHER",
+    "JAGDEEP",
+    "HARPREET",
+    "GURPREET",
+    "MANDEEP",
+    "WEI",
+    "JIAN",
+    "MING",
+    "YAN",
+    "HUI",
+    "MIN-JUN",
+    "JEAN-PIERRE",
+    "MARIE",
+    "ANNE",
+    "PIERRE",
+    "MOHAMMED",
+    "ALI",
+    "FATIMA",
+    "PRIYA",
+    "RAJ",
+    "ANIL",
+    "HIROSHI",
+    "YUKI",
+    "TYLER",
+    "BRANDON",
+    "KYLE",
+    "JORDAN",
+    "TAYLOR",
+    "MORGAN",
+    "BOB",
+    "BILL",
+    "JIM",
+    "MIKE",
+    "DAVE",
+    "CHRIS",
+]
+BUSINESS_NAMES = [
+    "PACIFIC HOME SALES LTD.",
+    "OKANAGAN MOBILE HOMES INC.",
+    "NORTHERN HOUSING CORP.",
+    "CARIBOO MODULAR HOMES LTD.",
+    "ISLAND PARK COMMUNITIES INC.",
+    "FRASER VALLEY HOME CENTRE LTD.",
+    "KOOTENAY MANUFACTURED HOMES LTD.",
+    "PEACE COUNTRY HOMES INC.",
+    "SUNRISE ESTATES LTD.",
+    "MAPLE LEAF HOMES CORPORATION",
+]
+SUBMITTING_NAMES = [
+    "ABC SEARCH COMPANY",
+    "NORTH SHORE NOTARIES",
+    "PACIFIC LAW CORPORATION",
+    "MODULINE INDUSTRIES (CANADA) LTD.",
+    "BC HOUSING MANAGEMENT COMMISSION",
+    "TRIPLE M HOUSING LTD.",
+    "OKANAGAN CONVEYANCING LTD.",
+]
+CITIES = [
+    "VANCOUVER",
+    "SURREY",
+    "BURNABY",
+    "RICHMOND",
+    "ABBOTSFORD",
+    "COQUITLAM",
+    "KELOWNA",
+    "LANGLEY",
+    "SAANICH",
+    "DELTA",
+    "NANAIMO",
+    "KAMLOOPS",
+    "CHILLIWACK",
+    "VICTORIA",
+    "MAPLE RIDGE",
+    "PRINCE GEORGE",
+    "NEW WESTMINSTER",
+    "PENTICTON",
+    "VERNON",
+    "CAMPBELL RIVER",
+    "COURTENAY",
+    "FORT ST. JOHN",
+    "CRANBROOK",
+    "SQUAMISH",
+    "DAWSON CREEK",
+    "TERRACE",
+    "WILLIAMS LAKE",
+    "PRINCE RUPERT",
+    "NELSON",
+    "SMITHERS",
+]
+STREETS = [
+    "MAIN",
+    "KING GEORGE",
+    "GOVERNMENT",
+    "DOUGLAS",
+    "FRASER",
+    "HASTINGS",
+    "KINGSWAY",
+    "OAK",
+    "CEDAR",
+    "MAPLE",
+    "1ST",
+    "2ND",
+    "10TH",
+    "152ND",
+    "RIVER",
+    "LAKESHORE",
+    "HIGHLAND",
+    "PARK",
+    "VICTORIA",
+    "JOHNSTON",
+]
+STREET_TYPES = ["ST", "AVE", "RD", "DR", "BLVD", "WAY", "CRES", "HWY"]
+PARK_NAMES = [
+    "SUNRISE MOBILE HOME PARK",
+    "WILLOW CREEK ESTATES",
+    "LAKESIDE MANOR",
+    "PINE RIDGE MOBILE HOME PARK",
+    "RIVERSIDE VILLAGE",
+    "CEDAR GROVE ESTATES",
+    "MOUNTAIN VIEW PARK",
+    "COUNTRY MEADOWS",
+    "SHADY ACRES",
+    "HOLIDAY PARK",
+]
+BAND_NAMES = [
+    "WESTBANK FIRST NATION",
+    "TSAWWASSEN FIRST NATION",
+    "SQUAMISH NATION",
+    "OSOYOOS INDIAN BAND",
+    "COWICHAN TRIBES",
+    "LHEIDLI T'ENNEH FIRST NATION",
+]
+# Manufactured home descriptions are MANUFACTURER|MAKE|MODEL|SERIAL PREFIX.
+HOMES = [
+    "MODULINE INDUSTRIES (CANADA) LTD.|MODULINE|ADVANTAGE|",
+    "TRIPLE M HOUSING LTD.|TRIPLE M|MHCSA|",
+    "SRI HOMES INC.|SRI|WESTWOOD|SRI",
+    "GLENDALE INTERNATIONAL CORP.|GLENDALE|CANADIANA|G",
+    "NORTHLANDS HOMES LTD.|NORTHLANDS|PRESTIGE|N",
+    "SAFEWAY MOBILE HOMES|SAFEWAY|SENTINEL|S",
+    "PARKWOOD HOMES LTD.|PARKWOOD|PREMIER|P",
+    "CHAMPION HOMES|CHAMPION|REGENT|C",
+]
+
+
+def pick(name: str, skew: int = 2) -> str:
+    """SQL expression choosing a random value from an array bind parameter: a higher skew favours the first values."""
+    array = f"CAST(:{name} AS VARCHAR[])"
+    return f"({array})[1 + floor(power(random(), {skew}) * cardinality({array}))::int]"
+
+
+LETTER = "substr('ABCEGHJKLMNPRSTVWXYZ', 1 + floor(random() * 20)::int, 1)"
+DIGIT = "floor(random() * 10)::int::text"
+
+CREATE_BATCH = f"""
+CREATE TEMPORARY TABLE scale_batch ON COMMIT DROP AS
+SELECT s.*,
+       nextval('mhr_registration_id_seq') AS registration_id,
+       nextval('mhr_draft_id_seq') AS draft_id,
+       get_mhr_number() AS mhr_number,
+       nextval('address_id_seq') AS location_address_id,
+       nextval('address_id_seq') AS submitting_address_id,
+       CASE WHEN s.transferred THEN nextval('mhr_registration_id_seq') END AS transfer_id,
+       CASE WHEN s.transferred THEN nextval('mhr_draft_id_seq') END AS transfer_draft_id,
+       s.registration_ts + s.age * random() AS transfer_ts
+  FROM (SELECT t.*,
+               (now() at time zone 'utc') - t.age AS registration_ts
+          FROM (SELECT g,
+                       random() * interval '7300 days' AS age,
+                       random() < :transfer_rate AS transferred,
+                       CASE WHEN random() < :exempt_rate THEN 'EXEMPT' ELSE 'ACTIVE' END AS status_type,
+                       CASE WHEN random() < 0.85 THEN 1 ELSE 2 END AS group_count,
+                       (ARRAY[1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 3])[1 + floor(random() * 11)::int] AS section_count,
+                       (100000 + floor(power(random(), 3) * :account_count)::int)::text AS account_id,
+                       {pick("submitting_names", 3)} AS submitting_name,
+                       {pick("homes")} AS home
+                  FROM generate_series(1, :size) AS g) t) s
+"""
+# Each transfer replaces all the owner groups of the home with a new sole owner group.
+CREATE_GROUPS = """
+CREATE TEMPORARY TABLE scale_groups ON COMMIT DROP AS
+SELECT nextval('mhr_owner_group_id_seq') AS id,
+       nextval('address_id_seq') AS address_id,
+       o.*,
+       CASE WHEN o.group_count > 1 THEN 'COMMON' WHEN o.owner_count > 1 THEN 'JOINT' ELSE 'SOLE' END AS tenancy_type
+  FROM (SELECT b.registration_id,
+               COALESCE(b.transfer_id, b.registration_id) AS change_registration_id,
+               CASE WHEN b.transferred THEN 'PREVIOUS' ELSE 'ACTIVE' END AS status_type,
+               n AS sequence_number,
+               b.group_count,
+               1 + floor(power(random(), 2) * 2)::int AS owner_count
+          FROM scale_batch b, generate_series(1, b.group_count) AS n
+        UNION ALL
+        SELECT b.transfer_id, b.transfer_id, 'ACTIVE', 1, 1, 1
+          FROM scale_batch b
+         WHERE b.transferred) o
+"""
+INSERT_DRAFTS = """
+INSERT INTO mhr_drafts(id, draft_number, account_id, registration_type, create_ts, draft, mhr_number)
+SELECT draft_id, get_mhr_draft_number(), account_id, 'MHREG', registration_ts, CAST('{}' AS JSON), mhr_number
+  FROM scale_batch
+UNION ALL
+SELECT transfer_draft_id, get_mhr_draft_number(), account_id, 'TRANS', transfer_ts, CAST('{}' AS JSON), mhr_number
+  FROM scale_batch
+ WHERE transferred
+"""
+INSERT_REGISTRATIONS = """
+INSERT INTO mhr_registrations(id, mhr_number, account_id, registration_type, registration_ts, status_type, draft_id)
+SELECT registration_id, mhr_number, account_id, 'MHREG', registration_ts, status_type, draft_id
+  FROM scale_batch
+UNION ALL
+SELECT transfer_id, mhr_number, account_id, 'TRANS', transfer_ts, status_type, transfer_draft_id
+  FROM scale_batch
+ WHERE transferred
+"""
+INSERT_DOCUMENTS = """
+INSERT INTO mhr_documents(id, document_type, registration_id, document_id, document_registration_number,
+                          change_registration_id)
+SELECT nextval('mhr_document_id_seq'), d.document_type, d.registration_id, get_mhr_doc_qualified_id(),
+       get_mhr_doc_reg_number(), d.registration_id
+  FROM scale_batch b,
+       LATERAL (VALUES ('REG_101', b.registration_id), ('TRAN', b.transfer_id)) AS d(document_type, registration_id)
+ WHERE d.registration_id IS NOT NULL
+"""
+INSERT_ADDRESSES = f"""
+INSERT INTO addresses(id, street, city, region, postal_code, country)
+SELECT a.id,
+       (100 + floor(random() * 19900)::int)::text || ' ' || {pick("streets")} || ' ' || {pick("street_types")},
+       {pick("cities")},
+       'BC',
+       'V' || {DIGIT} || {LETTER} || ' ' || {DIGIT} || {LETTER} || {DIGIT},
+       'CA'
+  FROM (SELECT location_address_id AS id FROM scale_batch
+        UNION ALL
+        SELECT submitting_address_id FROM scale_batch
+        UNION ALL
+        SELECT address_id FROM scale_groups) a
+"""
+INSERT_OWNER_GROUPS = """
+INSERT INTO mhr_owner_groups(id, sequence_number, registration_id, status_type, tenancy_type, interest,
+                             tenancy_specified, interest_numerator, interest_denominator, change_registration_id,
+                             group_sequence_number)
+SELECT id, sequence_number, registration_id, status_type, tenancy_type,
+       CASE WHEN tenancy_type = 'COMMON' THEN 'UNDIVIDED' END, 'Y',
+       CASE WHEN tenancy_type = 'COMMON' THEN 1 END,
+       CASE WHEN tenancy_type = 'COMMON' THEN group_count END,
+       change_registration_id, sequence_number
+  FROM scale_groups
+"""
+INSERT_SUBMITTING_PARTIES = """
+INSERT INTO mhr_parties(id, party_type, status_type, registration_id, change_registration_id, business_name,
+                        compressed_name, address_id)
+SELECT nextval('mhr_party_id_seq'), 'SUBMITTING', 'ACTIVE', p.registration_id, p.registration_id, b.submitting_name,
+       mhr_name_compressed_key(b.submitting_name), b.submitting_address_id
+  FROM scale_batch b,
+       LATERAL (VALUES (b.registration_id), (b.transfer_id)) AS p(registration_id)
+ WHERE p.registration_id IS NOT NULL
+"""
+INSERT_OWNERS = f"""
+INSERT INTO mhr_parties(id, party_type, status_type, registration_id, change_registration_id, first_name,
+                        middle_name, last_name, business_name, compressed_name, address_id, owner_group_id)
+SELECT nextval('mhr_party_id_seq'), o.party_type, o.status_type, o.registration_id, o.change_registration_id,
+       o.first_name, o.middle_name, o.last_name, o.business_name,
+       mhr_name_compressed_key(COALESCE(o.business_name, o.last_name || ' ' || o.first_name ||
+                                                         COALESCE(' ' || o.middle_name, ''))),
+       o.address_id, o.owner_group_id
+  FROM (SELECT p.*,
+               CASE WHEN p.party_type = 'OWNER_IND' THEN {pick("first_names")} END AS first_name,
+               CASE WHEN p.party_type = 'OWNER_IND' AND random() < 0.3 THEN {pick("first_names")} END AS middle_name,
+               CASE WHEN p.party_type = 'OWNER_IND' THEN {pick("last_names", 3)} END AS last_name,
+               CASE WHEN p.party_type = 'OWNER_BUS' THEN {pick("business_names")} END AS business_name
+          FROM (SELECT g.registration_id, g.change_registration_id, g.status_type, g.address_id,
+                       g.id AS owner_group_id,
+                       CASE WHEN random() < :individual_rate THEN 'OWNER_IND' ELSE 'OWNER_BUS' END AS party_type
+                  FROM scale_groups g, generate_series(1, g.owner_count) AS n) p) o
+"""
+INSERT_LOCATIONS = f"""
+INSERT INTO mhr_locations(id, location_type, status_type, registration_id, change_registration_id, address_id,
+                          park_name, park_pad, pid_number, band_name, reserve_number, leave_province,
+                          tax_certification)
+SELECT nextval('mhr_location_id_seq'), l.location_type, 'ACTIVE', l.registration_id, l.registration_id, l.address_id,
+       CASE WHEN l.location_type = 'MH_PARK' THEN {pick("park_names")} END,
+       CASE WHEN l.location_type = 'MH_PARK' THEN (1 + floor(random() * 150)::int)::text END,
+       CASE WHEN l.location_type IN ('OTHER', 'STRATA') THEN lpad(floor(random() * 1000000000)::int::text, 9, '0') END,
+       CASE WHEN l.location_type = 'RESERVE' THEN {pick("band_names")} END,
+       CASE WHEN l.location_type = 'RESERVE' THEN (1 + floor(random() * 20)::int)::text END,
+       'N', 'N'
+  FROM (SELECT b.registration_id, b.location_address_id AS address_id,
+               CASE WHEN r < 0.55 THEN 'MH_PARK' WHEN r < 0.90 THEN 'OTHER' WHEN r < 0.95 THEN 'RESERVE'
+                    ELSE 'STRATA' END AS location_type
+          FROM (SELECT b.*, random() AS r FROM scale_batch b) b) l
+"""
+INSERT_DESCRIPTIONS = """
+INSERT INTO mhr_descriptions(id, status_type, registration_id, number_of_sections, year_made, manufacturer_name,
+                             make, model, change_registration_id)
+SELECT nextval('mhr_description_id_seq'), 'ACTIVE', registration_id, section_count,
+       1965 + floor(random() * (EXTRACT(YEAR FROM registration_ts)::int - 1964))::int,
+       split_part(home, '|', 1), split_part(home, '|', 2), split_part(home, '|', 3), registration_id
+  FROM scale_batch
+"""
+INSERT_SECTIONS = """
+INSERT INTO mhr_sections(id, registration_id, status_type, compressed_key, serial_number, length_feet, width_feet,
+                         change_registration_id)
+SELECT nextval('mhr_section_id_seq'), s.registration_id, 'ACTIVE', mhr_serial_compressed_key(s.serial_number),
+       s.serial_number, 40 + floor(random() * 37)::int, 12 + floor(random() * 5)::int, s.registration_id
+  FROM (SELECT b.registration_id,
+               split_part(b.home, '|', 4) || lpad(floor(random() * 100000)::int::text, 5, '0') ||
+               CASE WHEN b.section_count > 1 THEN substr('ABC', n, 1) ELSE '' END AS serial_number
+          FROM scale_batch b, generate_series(1, b.section_count) AS n) s
+"""
+BATCH_STATEMENTS = [
+    ("mhr_drafts", INSERT_DRAFTS),
+    ("mhr_registrations", INSERT_REGISTRATIONS),
+    ("mhr_documents", INSERT_DOCUMENTS),
+    ("addresses", INSERT_ADDRESSES),
+    ("mhr_owner_groups", INSERT_OWNER_GROUPS),
+    ("mhr_parties", INSERT_SUBMITTING_PARTIES),
+    ("mhr_parties", INSERT_OWNERS),
+    ("mhr_locations", INSERT_LOCATIONS),
+    ("mhr_descriptions", INSERT_DESCRIPTIONS),
+    ("mhr_sections", INSERT_SECTIONS),
+]
+
+
+def generate(  # pylint: disable=too-many-arguments
+    session,
+    registration_count: int,
+    batch_size: int = 10000,
+    seed: int = None,
+    transfer_rate: float = 0.3,
+    exempt_rate: float = 0.05,
+    individual_rate: float = 0.9,
+    account_count: int = 2000,
+) -> dict:
+    """Insert registration_count synthetic home registrations in batches, returning the inserted row counts by table.
+
+    With a seed the random values are repeatable: the generated keys and MHR numbers depend on the current database
+    sequence values.
+    """
+    params = {
+        "transfer_rate": transfer_rate,
+        "exempt_rate": exempt_rate,
+        "individual_rate": individual_rate,
+        "account_count": account_count,
+        "last_names": LAST_NAMES,
+        "first_names": FIRST_NAMES,
+        "business_names": BUSINESS_NAMES,
+        "submitting_names": SUBMITTING_NAMES,
+        "cities": CITIES,
+        "streets": STREETS,
+        "street_types": STREET_TYPES,
+        "park_names": PARK_NAMES,
+        "band_names": BAND_NAMES,
+        "homes": HOMES,
+    }
+    seeds = random.Random(seed)  # noqa: S311; test data only
+    counts: dict = {}
+    start = time.perf_counter()
+    created: int = 0
+    while created < registration_count:
+        params["size"] = min(batch_size, registration_count - created)
+        if seed is not None:
+            session.execute(text("SELECT setseed(:seed)"), {"seed": seeds.uniform(-1, 1)})
+        session.execute(text(CREATE_BATCH), params)
+        session.execute(text(CREATE_GROUPS), params)
+        for table, statement in BATCH_STATEMENTS:
+            result = session.execute(text(statement), params)
+            counts[table] = counts.get(table, 0) + result.rowcount
+        session.commit()
+        created += params["size"]
+        print(f"Created {created} of {registration_count} home registrations in {time.perf_counter() - start:.1f}s")
+    print(f"Row counts: {counts}")
+    return counts
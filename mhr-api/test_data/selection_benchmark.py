@@ -0,0 +1,78 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark the search step 2 selection index against the previous nested list scans.
+
+Combining the search matches of a selection of up to the maximum search results size by MHR number is timed with the
+selection index and with the nested scans it replaced, and the results of both are compared. No database is used.
+"""
+import time
+
+from mhr_api.models import search_utils
+from mhr_api.models.search_selection import SelectionIndex, match_mhr_number
+
+SIZES = (500, 1000, 2500, search_utils.SEARCH_RESULTS_MAX_SIZE)
+
+
+def build_data(size: int) -> tuple:
+    """Build the selection MHR numbers and search matches: every 5th home has 2 owner matches."""
+    original_results = []
+    for count in range(size):
+        original_results.append({"mhrNumber": f"{count:06d}", "ownerName": "A"})
+        if count % 5 == 0:
+            original_results.append({"mhrNumber": f"{count:06d}", "ownerName": "B"})
+    reg_list = [f"{count:06d}" for count in reversed(range(size))]
+    return reg_list, original_results
+
+
+def group_matches_index(reg_list: list, original_results: list) -> list:
+    """Combine the search matches by MHR number with the selection index."""
+    index = SelectionIndex(original_results, match_mhr_number)
+    return [index.all(reg_num) for reg_num in reg_list]
+
+
+def group_matches_nested(reg_list: list, original_results: list) -> list:
+    """Combine the search matches by MHR number with the nested list scans the selection index replaced."""
+    selection = []
+    for reg_num in reg_list:
+        matches = []
+        for original in original_results:
+            if original["mhrNumber"] == reg_num:
+                matches.append(original)
+        selection.append(matches)
+    return selection
+
+
+def time_best(function, iterations: int, *args) -> tuple:
+    """Return the fastest of the timed runs in milliseconds and the function result."""
+    best: float = None
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 3), result
+
+
+def run(sizes: tuple = SIZES, iterations: int = 5) -> list:
+    """Run the benchmark for each selection size, returning the sizes where the results differ."""
+    mismatches = []
+    for size in sizes:
+        reg_list, original_results = build_data(size)
+        index_ms, index_result = time_best(group_matches_index, iterations, reg_list, original_results)
+        nested_ms, nested_result = time_best(group_matches_nested, iterations, reg_list, original_results)
+        if index_result != nested_result:
+            mismatches.append(size)
+        print(f"group matches size={size:<6} index={index_ms}ms nested={nested_ms}ms")
+    return mismatches
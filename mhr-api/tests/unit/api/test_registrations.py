@@ -18,6 +18,7 @@ Test-Suite to ensure that the /registrations endpoint is working as expected.
 """
 import copy
 from http import HTTPStatus
+from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import current_app
@@ -42,6 +43,7 @@ from mhr_api.resources.registration_utils import (
 )
 from mhr_api.services.authz import COLIN_ROLE, MHR_ROLE, STAFF_ROLE, BCOL_HELP_ROLE, ASSETS_HELP
 from mhr_api.services.authz import REGISTER_MH, TRANSFER_SALE_BENEFICIARY, MANUFACTURER_GROUP
+from mhr_api.services.document_storage.storage_service import DocumentTypes
 
 from tests.unit.services.utils import create_header, create_header_account
 
@@ -221,6 +223,13 @@ TEST_BATCH_NOC_LOCATION_DATA = [
      True, True),
     ('Valid default interval may have data', None, None, HTTPStatus.OK, True, False)
 ]
+# testdata pattern is ({description}, {method}, {path}, {report data function}, {download_link})
+TEST_BATCH_STORED_DATA = [
+    ('Location stream', 'post', 'noclocation', 'batch_utils.get_batch_location_report_data', False),
+    ('Location link', 'post', 'noclocation', 'batch_utils.get_batch_location_report_data', True),
+    ('Manufacturer stream', 'get', 'manufacturer', 'model_reg_utils.get_batch_manufacturer_reg_report_data', False),
+    ('Manufacturer link', 'get', 'manufacturer', 'model_reg_utils.get_batch_manufacturer_reg_report_data', True)
+]
 # testdata pattern is ({description}, {roles}, {status}, {account}, {start_ts}, {end_ts})
 TEST_GET_BATCH_REGISTRATIONS = [
     ('Missing account', [MHR_ROLE], HTTPStatus.BAD_REQUEST, None, None, None),
@@ -605,6 +614,40 @@ def test_post_batch_location_report(session, client, jwt, desc, start_ts, end_ts
         assert rv.json.get('reportDownloadUrl')
 
 
+@pytest.mark.parametrize('desc,method,path,data_function,download_link', TEST_BATCH_STORED_DATA)
+def test_batch_report_stored(session, client, jwt, desc, method, path, data_function, download_link):
+    """Assert that an existing batch report is streamed from document storage or returned as a download link."""
+    apikey = current_app.config.get('SUBSCRIPTION_API_KEY')
+    if not apikey:
+        return
+    params: str = '?x-apikey=' + apikey
+    if download_link:
+        params += '&downloadLink=true&notify=false'
+    registrations = [{'batchStorageUrl': 'batch-report.pdf'}]
+    blob = MagicMock(size=100, etag='etag1')
+    with (
+        patch('mhr_api.resources.v1.registrations.' + data_function, return_value=registrations),
+        patch('mhr_api.services.document_storage.storage_service.GoogleStorageService.get_document_link',
+              return_value='https://test-link') as mock_link,
+        patch('mhr_api.resources.utils.GoogleStorageService.get_document_info', return_value=blob) as mock_info,
+        patch('mhr_api.resources.utils.GoogleStorageService.stream_document',
+              return_value=iter([b'x' * 100])) as mock_stream
+    ):
+        rv = getattr(client, method)('/api/v1/registrations/batch/' + path + params)
+        assert rv.status_code == HTTPStatus.OK
+        if download_link:
+            assert rv.json.get('reportDownloadUrl') == 'https://test-link'
+            mock_info.assert_not_called()
+            mock_stream.assert_not_called()
+        else:
+            assert rv.headers['Content-Type'] == 'application/pdf'
+            assert rv.headers['ETag'] == '"etag1"'
+            assert rv.get_data() == b'x' * 100
+            mock_info.assert_called_once_with('batch-report.pdf', DocumentTypes.BATCH_REGISTRATION)
+            mock_stream.assert_called_once_with(blob, DocumentTypes.BATCH_REGISTRATION, 0, 100)
+            mock_link.assert_not_called()
+
+
 @pytest.mark.parametrize('desc,roles,status,account_id,start_ts,end_ts', TEST_GET_BATCH_REGISTRATIONS)
 def test_get_batch_registrations(session, client, jwt, desc, roles, status, account_id, start_ts, end_ts):
     """Assert that a get account registration by MHR number works as expected."""
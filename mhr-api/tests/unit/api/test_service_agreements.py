@@ -18,10 +18,12 @@ Test-Suite to ensure that the /service-agreements/* endpoints are working as exp
 """
 import copy
 from http import HTTPStatus
+from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import current_app
 
+from mhr_api.services.abstract_storage_service import DocumentTypes
 from mhr_api.services.authz import COLIN_ROLE, MHR_ROLE, STAFF_ROLE
 
 from tests.unit.services.utils import create_header, create_header_account
@@ -140,3 +142,23 @@ def test_post_agreement_version(session, client, jwt, desc, roles, status, accou
         assert agreement.get('version')
         assert agreement.get('accepted')
         assert agreement.get('acceptedDateTime')
+
+
+def test_get_agreement_pdf(session, client, jwt):
+    """Assert that a service agreement pdf range is streamed from document storage."""
+    headers = create_header_account(jwt, [MHR_ROLE])
+    headers['Accept'] = 'application/pdf'
+    headers['Range'] = 'bytes=0-9'
+    blob = MagicMock(size=100, etag='etag1')
+    with (
+        patch('mhr_api.resources.utils.GoogleStorageService.get_document_info', return_value=blob) as mock_info,
+        patch('mhr_api.resources.utils.GoogleStorageService.stream_document',
+              return_value=iter([b'x' * 10])) as mock_stream
+    ):
+        response = client.get('/api/v1/service-agreements/v1', headers=headers)
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert response.headers['Content-Type'] == 'application/pdf'
+        assert response.headers['Content-Range'] == 'bytes 0-9/100'
+        assert response.get_data() == b'x' * 10
+        assert mock_info.call_args[0][1] == DocumentTypes.SERVICE_AGREEMENT
+        mock_stream.assert_called_once_with(blob, DocumentTypes.SERVICE_AGREEMENT, 0, 10)
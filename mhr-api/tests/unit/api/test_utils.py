@@ -0,0 +1,61 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resource helper utilities test suite."""
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mhr_api.resources import utils as resource_utils
+from mhr_api.services.document_storage.storage_service import DocumentTypes
+
+
+# testdata pattern is ({description}, {headers}, {status}, {start}, {stop})
+TEST_DOCUMENT_RANGE_DATA = [
+    ('No conditions', {}, HTTPStatus.OK, 0, 1000),
+    ('ETag match', {'If-None-Match': '"etag1"'}, HTTPStatus.NOT_MODIFIED, 0, 0),
+    ('Range', {'Range': 'bytes=100-199'}, HTTPStatus.PARTIAL_CONTENT, 100, 200),
+    ('Range suffix', {'Range': 'bytes=-10'}, HTTPStatus.PARTIAL_CONTENT, 990, 1000),
+    ('Range unsatisfiable', {'Range': 'bytes=1000-'}, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, 0, 0),
+    ('If-Range changed', {'Range': 'bytes=0-9', 'If-Range': '"etag2"'}, HTTPStatus.OK, 0, 1000)
+]
+
+
+@pytest.mark.parametrize('desc,headers,status,start,stop', TEST_DOCUMENT_RANGE_DATA)
+def test_get_document_range(app, desc, headers, status, start, stop):
+    """Assert that the conditional and range request headers are evaluated as expected."""
+    with app.test_request_context(headers=headers) as context:
+        result = resource_utils.get_document_range(context.request, 'etag1', 1000)
+    assert result == (status, start, stop)
+
+
+def test_document_storage_response(app):
+    """Assert that a stored document range is streamed with the expected headers."""
+    blob = MagicMock(size=1000, etag='etag1')
+    with (
+        app.test_request_context(headers={'Range': 'bytes=100-199'}),
+        patch('mhr_api.resources.utils.GoogleStorageService.get_document_info', return_value=blob) as mock_info,
+        patch('mhr_api.resources.utils.GoogleStorageService.stream_document',
+              return_value=iter([b'x' * 100])) as mock_stream
+    ):
+        response = resource_utils.document_storage_response('test.pdf', DocumentTypes.BATCH_REGISTRATION)
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert response.headers['Content-Range'] == 'bytes 100-199/1000'
+        assert response.headers['Content-Length'] == '100'
+        assert response.headers['ETag'] == '"etag1"'
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert response.get_data() == b'x' * 100
+        mock_info.assert_called_once_with('test.pdf', DocumentTypes.BATCH_REGISTRATION)
+        mock_stream.assert_called_once_with(blob, DocumentTypes.BATCH_REGISTRATION, 100, 200)
@@ -334,6 +334,13 @@ TEST_ID_DATA = [
     (200000001, True, False),
     (300000000, False, False)
 ]
+# testdata pattern is ({description}, {reg_ids}, {results_size}, {change_counts})
+TEST_BULK_LOAD_DATA = [
+    ('Multiple', [200000001, 200000019, 200000047], 3, [0, 1, 2]),
+    ('Duplicates', [200000019, 200000019, None], 1, [1]),
+    ('Not found excluded', [200000001, 300000000], 1, [0]),
+    ('Empty', [], 0, [])
+]
 # testdata pattern is ({mhr_number}, {has_results}, {account_id})
 TEST_MHR_NUM_DATA = [
     ('UX-XXX', False, 'PS12345'),
@@ -592,6 +599,19 @@ def test_find_account_registrations_frozen(session, account_id, staff, frozen_li
                     assert registration.get('frozenDocumentType') == reg.get('documentType')
 
 
+@pytest.mark.parametrize('desc, reg_ids, results_size, change_counts', TEST_BULK_LOAD_DATA)
+def test_find_all_by_ids_search(session, desc, reg_ids, results_size, change_counts):
+    """Assert that bulk loading MHR registrations for search details works as expected."""
+    registrations = MhrRegistration.find_all_by_ids_search(reg_ids)
+    assert len(registrations) == results_size
+    assert [len(reg.change_registrations) for reg in registrations.values()] == change_counts
+    for reg_id, registration in registrations.items():
+        reg_json = registration.registration_json
+        expected: MhrRegistration = MhrRegistration.find_by_id(reg_id, False, True)
+        assert reg_json == expected.registration_json
+        assert reg_json.get('mhrNumber') == registration.mhr_number
+
+
 @pytest.mark.parametrize('reg_id, has_results, legacy', TEST_ID_DATA)
 def test_find_by_id(session, reg_id, has_results, legacy):
     """Assert that finding an MHR registration by id works as expected."""
@@ -0,0 +1,79 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the MHR registration snapshot Model is working as expected."""
+import json
+
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from mhr_api.models import MhrRegistration, MhrRegistrationSnapshot
+from mhr_api.models.mhr_registration_snapshot import (
+    SNAPSHOT_MODE_OFF,
+    SNAPSHOT_MODE_ON,
+    SNAPSHOT_MODE_VERIFY,
+    VIEW_SEARCH,
+)
+from mhr_api.models.queries import UPSERT_REGISTRATION_SNAPSHOT
+
+# testdata pattern is ({description}, {registration id}, {mode}, {snapshot saved})
+TEST_MODE_DATA = [
+    ('Off', 200000019, SNAPSHOT_MODE_OFF, False),
+    ('On', 200000019, SNAPSHOT_MODE_ON, True),
+    ('Verify', 200000019, SNAPSHOT_MODE_VERIFY, True)
+]
+
+
+@pytest.mark.parametrize('desc,reg_id,mode,saved', TEST_MODE_DATA)
+def test_registration_json_mode(session, desc, reg_id, mode, saved):
+    """Assert that the registration JSON is the same and a snapshot is only saved when enabled."""
+    mode_config = current_app.config.get('REGISTRATION_SNAPSHOT_MODE')
+    registration: MhrRegistration = MhrRegistration.find_all_by_ids_search([reg_id]).get(reg_id)
+    assert registration
+    mhr_number: str = registration.mhr_number
+    try:
+        MhrRegistrationSnapshot.delete_by_mhr_number(mhr_number)
+        current_app.config['REGISTRATION_SNAPSHOT_MODE'] = mode
+        expected = json.loads(json.dumps(registration.build_registration_json()))
+        registration.use_snapshot = True
+        reg_json = registration.registration_json
+        assert json.loads(json.dumps(reg_json)) == expected
+        snapshot = MhrRegistrationSnapshot.find_current([mhr_number], VIEW_SEARCH).get(mhr_number)
+        if not saved:
+            assert snapshot is None
+        else:
+            assert snapshot == expected
+            # A second request returns the same JSON from or checked against the snapshot.
+            assert json.loads(json.dumps(registration.registration_json)) == expected
+    finally:
+        current_app.config['REGISTRATION_SNAPSHOT_MODE'] = mode_config
+
+
+def test_delete_by_mhr_number(session):
+    """Assert that a registration change deletes the snapshots of the home."""
+    registration: MhrRegistration = MhrRegistration.find_all_by_ids_search([200000019]).get(200000019)
+    mhr_number: str = registration.mhr_number
+    params = {
+        'mhr_number': mhr_number,
+        'view_type': VIEW_SEARCH,
+        'registration_id': max([registration.id] + [reg.id for reg in registration.change_registrations]),
+        'expiry_ts': MhrRegistrationSnapshot.get_expiry_ts(registration),
+        'snapshot': json.dumps(registration.build_registration_json())
+    }
+    session.execute(text(UPSERT_REGISTRATION_SNAPSHOT), params)
+    assert MhrRegistrationSnapshot.find_current([mhr_number], VIEW_SEARCH).get(mhr_number)
+    MhrRegistrationSnapshot.delete_by_mhr_number(mhr_number)
+    assert not MhrRegistrationSnapshot.find_current([mhr_number], VIEW_SEARCH)
+    assert MhrRegistrationSnapshot.find_current([], VIEW_SEARCH) == {}
@@ -0,0 +1,130 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the MHR search index Model is working as expected."""
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from mhr_api.models import MhrSearchIndex, SearchRequest, search_utils
+
+
+MHR_NUMBER_JSON = {
+    'type': 'MHR_NUMBER',
+    'criteria': {
+        'value': '000900'
+    },
+    'clientReferenceId': 'T-SQ-MH-1'
+}
+SERIAL_NUMBER_JSON = {
+    'type': 'SERIAL_NUMBER',
+    'criteria': {
+        'value': '000060'
+    },
+    'clientReferenceId': 'T-SQ-MS-1'
+}
+ORG_NAME_JSON = {
+    'type': 'ORGANIZATION_NAME',
+    'criteria': {
+        'value': 'CELESTIAL HEAVENLY HOMES'
+    },
+    'clientReferenceId': 'T-SQ-MO-1'
+}
+OWNER_NAME_JSON = {
+    'type': 'OWNER_NAME',
+    'criteria': {
+        'ownerName': {
+            'first': 'BOB',
+            'last': 'MCKAY'
+        }
+    },
+    'clientReferenceId': 'T-SQ-MI-1'
+}
+# testdata pattern is ({description}, {mhr_number}, {index type}, {view})
+TEST_UPDATE_DATA = [
+    ('MHR number', '000900', 'MHR', 'mhr_search_mhr_number_vw'),
+    ('Serial number', '000900', 'SERIAL', 'mhr_search_serial_vw'),
+    ('Owner business', '000900', 'OWNER_BUS', 'mhr_search_owner_bus_vw'),
+    ('Owner individual', '000900', 'OWNER_IND', 'mhr_search_owner_ind_vw'),
+    ('Non-existent', 'TESTXX', 'MHR', 'mhr_search_mhr_number_vw')
+]
+# testdata pattern is ({description}, {search JSON})
+TEST_SOURCE_DATA = [
+    ('MHR number', MHR_NUMBER_JSON),
+    ('Serial number', SERIAL_NUMBER_JSON),
+    ('Owner business', ORG_NAME_JSON),
+    ('Owner individual', OWNER_NAME_JSON)
+]
+
+
+def search_results(request_json: dict, source: str) -> list:
+    """Run the search with the search source and return the results."""
+    source_config = current_app.config.get('SEARCH_MHR_SOURCE')
+    current_app.config['SEARCH_MHR_SOURCE'] = source
+    try:
+        query: SearchRequest = SearchRequest.create_from_json(request_json, 'PS12345', 'UNIT_TEST')
+        if query.search_type == SearchRequest.SearchTypes.MANUFACTURED_HOME_NUM:
+            query.search_by_mhr_number()
+        elif query.search_type == SearchRequest.SearchTypes.SERIAL_NUM:
+            query.search_by_serial_number()
+        elif query.search_type == SearchRequest.SearchTypes.ORGANIZATION_NAME:
+            query.search_by_organization_name()
+        else:
+            query.search_by_owner_name()
+        return query.json.get('results', [])
+    finally:
+        current_app.config['SEARCH_MHR_SOURCE'] = source_config
+
+
+@pytest.mark.parametrize('desc,mhr_number,index_type,view', TEST_UPDATE_DATA)
+def test_update_by_mhr_number(session, desc, mhr_number, index_type, view):
+    """Assert that updating the search index for a home creates a row for each search view row."""
+    MhrSearchIndex.update_by_mhr_number(mhr_number)
+    view_count = session.execute(text(f'SELECT COUNT(*) FROM {view} WHERE mhr_number = :mhr_number'),
+                                 {'mhr_number': mhr_number}).scalar()
+    rows = MhrSearchIndex.find_by_mhr_number(mhr_number)
+    index_rows = [row for row in rows if row.index_type == index_type]
+    assert len(index_rows) == view_count
+    for row in index_rows:
+        assert row.mhr_number == mhr_number
+        assert row.registration_id
+        assert row.update_ts
+    # Updating again replaces the rows.
+    MhrSearchIndex.update_by_mhr_number(mhr_number)
+    assert len(MhrSearchIndex.find_by_mhr_number(mhr_number)) == len(rows)
+
+
+@pytest.mark.parametrize('desc,request_json', TEST_SOURCE_DATA)
+def test_search_source(session, desc, request_json):
+    """Assert that the search index table results match the search view results."""
+    legacy_results = search_results(request_json, search_utils.SEARCH_SOURCE_LEGACY)
+    assert legacy_results
+    for mhr_number in {result['mhrNumber'] for result in legacy_results}:
+        MhrSearchIndex.update_by_mhr_number(mhr_number)
+    table_results = search_results(request_json, search_utils.SEARCH_SOURCE_TABLE)
+    assert table_results == legacy_results
+
+
+def test_get_search_query(session):
+    """Assert that the search query matches the configured search source."""
+    source_config = current_app.config.get('SEARCH_MHR_SOURCE')
+    try:
+        current_app.config['SEARCH_MHR_SOURCE'] = search_utils.SEARCH_SOURCE_LEGACY
+        assert search_utils.get_search_query('SERIAL') == search_utils.SEARCH_SERIAL_QUERY
+        current_app.config['SEARCH_MHR_SOURCE'] = search_utils.SEARCH_SOURCE_TABLE
+        assert search_utils.get_search_query('SERIAL') == search_utils.SEARCH_INDEX_SERIAL_QUERY
+        current_app.config['SEARCH_MHR_SOURCE'] = 'JUNK'
+        assert search_utils.get_search_query('SERIAL') == search_utils.SEARCH_SERIAL_QUERY
+    finally:
+        current_app.config['SEARCH_MHR_SOURCE'] = source_config
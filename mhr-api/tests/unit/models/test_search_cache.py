@@ -0,0 +1,145 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search results cache is working as expected."""
+import copy
+
+import pytest
+from flask import current_app
+
+from mhr_api.models import SearchRequest, search_cache
+from mhr_api.models.search_cache import SearchCache
+
+
+MHR_NUMBER_JSON = {
+    'type': 'MHR_NUMBER',
+    'criteria': {
+        'value': '000900'
+    },
+    'clientReferenceId': 'T-SQ-MH-1'
+}
+ORG_NAME_JSON = {
+    'type': 'ORGANIZATION_NAME',
+    'criteria': {
+        'value': 'CELESTIAL HEAVENLY HOMES'
+    },
+    'clientReferenceId': 'T-SQ-MO-1'
+}
+# testdata pattern is ({description}, {max size}, {ttl}, {version}, {lookup version}, {hit})
+TEST_CACHE_DATA = [
+    ('Hit', 10, 300, 1, 1, True),
+    ('Data version changed', 10, 300, 1, 2, False),
+    ('Expired', 10, -1, 1, 1, False),
+    ('Disabled', 0, 300, 1, 1, False)
+]
+# testdata pattern is ({description}, {search type}, {criteria}, {criteria variant})
+TEST_KEY_DATA = [
+    ('MHR number padded', 'MHR_NUMBER', {'value': '000900'}, {'value': ' 900 '}),
+    ('Serial number trimmed', 'SERIAL_NUMBER', {'value': '000060'}, {'value': '000060  '}),
+    ('Organization trimmed', 'ORGANIZATION_NAME', {'value': 'CELESTIAL HOMES'}, {'value': ' CELESTIAL HOMES'}),
+    ('Owner middle case', 'OWNER_NAME', {'ownerName': {'last': 'MCKAY', 'first': 'BOB', 'middle': 'J'}},
+     {'ownerName': {'last': 'MCKAY', 'first': 'BOB', 'middle': 'j'}})
+]
+# testdata pattern is ({search type}, {JSON data})
+TEST_SEARCH_DATA = [
+    ('MM', MHR_NUMBER_JSON),
+    ('MO', ORG_NAME_JSON)
+]
+
+
+@pytest.mark.parametrize('desc,max_size,ttl,version,lookup_version,hit', TEST_CACHE_DATA)
+def test_cache_get(session, desc, max_size, ttl, version, lookup_version, hit):
+    """Assert that cache lookups by key and data version work as expected."""
+    cache = SearchCache(max_size, ttl)
+    value = {'searchResponse': [{'mhrNumber': '000900'}]}
+    cache.put(('MS', '000900', False), version, value)
+    result = cache.get(('MS', '000900', False), lookup_version)
+    stats = cache.stats()
+    if hit:
+        assert result == value
+        assert result is not value
+        assert stats['hits'] == 1
+        assert stats['misses'] == 0
+    else:
+        assert result is None
+        assert stats['hits'] == 0
+        assert stats['misses'] == 1
+
+
+def test_cache_eviction(session):
+    """Assert that the least recently used entries are evicted when the cache is full."""
+    cache = SearchCache(2, 300)
+    cache.put('key1', 1, 'value1')
+    cache.put('key2', 1, 'value2')
+    assert cache.get('key1', 1) == 'value1'
+    cache.put('key3', 1, 'value3')
+    assert cache.get('key2', 1) is None
+    assert cache.get('key1', 1) == 'value1'
+    assert cache.get('key3', 1) == 'value3'
+    stats = cache.stats()
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+    cache.clear()
+    assert cache.stats()['size'] == 0
+
+
+@pytest.mark.parametrize('desc,search_type,criteria,variant', TEST_KEY_DATA)
+def test_cache_key(session, desc, search_type, criteria, variant):
+    """Assert that criteria the search query binds to the same value have the same cache key."""
+    query1 = SearchRequest.create_from_json({'type': search_type, 'criteria': criteria}, 'PS12345')
+    query2 = SearchRequest.create_from_json({'type': search_type, 'criteria': variant}, 'PS12345')
+    assert query1.get_cache_key() == query2.get_cache_key()
+
+
+@pytest.mark.parametrize('search_type,json_data', TEST_SEARCH_DATA)
+def test_search_cached(session, search_type, json_data):
+    """Assert that a repeated search is returned from the cache until the data version changes."""
+    enabled = current_app.config.get('SEARCH_CACHE_ENABLED')
+    current_app.config['SEARCH_CACHE_ENABLED'] = True
+    try:
+        search_cache.search_cache.clear()
+        query1 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query1.search()
+        assert search_cache.search_cache.stats()['misses'] == 1
+        query2 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query2.search()
+        assert search_cache.search_cache.stats()['hits'] == 1
+        assert query2.id != query1.id
+        assert query2.search_response == query1.search_response
+        assert query2.total_results_size == query1.total_results_size
+        assert query2.returned_results_size == query1.returned_results_size
+        search_cache.update_data_version()
+        query3 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query3.search()
+        assert search_cache.search_cache.stats()['hits'] == 1
+        assert search_cache.search_cache.stats()['misses'] == 2
+        assert query3.search_response == query1.search_response
+    finally:
+        current_app.config['SEARCH_CACHE_ENABLED'] = enabled
+        search_cache.search_cache.clear()
+
+
+def test_update_data_version(session):
+    """Assert that the data version only changes when the cache is enabled."""
+    enabled = current_app.config.get('SEARCH_CACHE_ENABLED')
+    try:
+        current_app.config['SEARCH_CACHE_ENABLED'] = False
+        version = search_cache.get_data_version()
+        search_cache.update_data_version()
+        assert search_cache.get_data_version() == version
+        current_app.config['SEARCH_CACHE_ENABLED'] = True
+        search_cache.update_data_version()
+        assert search_cache.get_data_version() > version
+    finally:
+        current_app.config['SEARCH_CACHE_ENABLED'] = enabled
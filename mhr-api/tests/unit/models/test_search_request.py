@@ -370,6 +370,12 @@ TEST_SERIAL_NUMBER_DATA = [
     ('WIN24440204003A', 1, '000902', 'WIN24440204003A', '000902', 'WIN24440204003B', False),
     ('9987', 2, '000907', '9987', '000906', '998765', True)
 ]
+# testdata pattern is ({description}, {search_value}, {filter}, {query_like})
+TEST_SERIAL_WILD_QUERY_DATA = [
+    ('Trigram', ' 9987 ', search_utils.SERIAL_WILD_FILTER_TRIGRAM, '%9987%'),
+    ('Trigram escaped', 'A_1%', search_utils.SERIAL_WILD_FILTER_TRIGRAM, '%A\\_1\\%%'),
+    ('Short fragment scan', '99', search_utils.SERIAL_WILD_FILTER_SCAN, None)
+]
 
 # testdata pattern is ({last_name}, {first_name}, count)
 TEST_OWNER_IND_DATA = [
@@ -468,6 +474,8 @@ def test_search_valid(session, search_type, json_data):
     assert query.search_response
     assert query.account_id == 'PS12345'
     assert query.user_id == 'UNIT_TEST'
+    assert query.history_criteria
+    assert query.history_username is not None
     assert result['searchId']
     assert result['searchQuery']
     assert result['searchDateTime']
@@ -592,6 +600,18 @@ def test_search_serial(session, search_value, count, mhr1, result1, mhr2, result
             assert len(result['results']) > 1
             assert result['results'][0]['serialNumber'] == search_value
             assert result['results'][-1]['serialNumber'] != search_value
+            assert result['totalResultsSize'] >= len(result['results'])
+
+
+@pytest.mark.parametrize('desc,search_value,filter_clause,query_like', TEST_SERIAL_WILD_QUERY_DATA)
+def test_serial_wild_query(session, desc, search_value, filter_clause, query_like):
+    """Assert that the wildcard serial number query uses the trigram filter unless the fragment is too short."""
+    query, params = search_utils.get_serial_wild_query(search_utils.SEARCH_SERIAL_WILD_QUERY, search_value)
+    assert filter_clause in query
+    assert '{filter_clause}' not in query
+    assert params['query_value'] == search_value.strip()
+    assert params['max_results_size'] == search_utils.SEARCH_RESULTS_MAX_SIZE
+    assert params.get('query_like') == query_like
 
 
 @pytest.mark.parametrize('last_name,first_name,count', TEST_OWNER_IND_DATA)
@@ -318,6 +318,16 @@ def test_search_ppr_by_mhr_number(session, desc, json_data, mhr_num, match_count
                 assert statement['vehicleCollateral'] or statement['generalCollateral']
 
 
+def test_search_ppr_by_mhr_numbers(session):
+    """Assert that a set based PPR MHR number search returns the same results as the single MHR number search."""
+    mhr_nums = [mhr_num for desc, json_data, mhr_num, match_count in TEST_PPR_SEARCH_DATA]
+    results = SearchResult.search_ppr_by_mhr_numbers(mhr_nums + mhr_nums[:1])
+    for desc, json_data, mhr_num, match_count in TEST_PPR_SEARCH_DATA:
+        assert len(results.get(mhr_num, [])) == match_count
+        if match_count:
+            assert results[mhr_num] == SearchResult.search_ppr_by_mhr_number(mhr_num)
+
+
 @pytest.mark.parametrize('mhr1,mhr2,mhr3,mhr4,search_type', TEST_SELECT_SORT_DATA)
 def test_search_sort_mhr(session, client, jwt, mhr1, mhr2, mhr3, mhr4, search_type):
     """Assert that submitting a new search selection is sorted as expected."""
@@ -0,0 +1,76 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search selection index is working as expected."""
+import pytest
+
+from mhr_api.models.search_selection import SelectionIndex, match_mhr_number
+
+
+# testdata pattern is ({description}, {mhr numbers}, {lookup number}, {expected count})
+TEST_INDEX_DATA = [
+    ('Single', ['000900', '000901'], '000900', 1),
+    ('Multiple', ['000900', '000901', '000900'], '000900', 2),
+    ('Not found', ['000900', '000901'], '000999', 0)
+]
+# testdata pattern is ({description}, {selection size})
+TEST_NESTED_DATA = [
+    ('Empty', 0),
+    ('Single', 1),
+    ('Multiple', 12)
+]
+
+
+def group_matches_nested(reg_list, original_results):
+    """Previous implementation of combining matches by MHR number: nested list scans."""
+    selection = []
+    for reg_num in reg_list:
+        matches = []
+        for original in original_results:
+            if original['mhrNumber'] == reg_num:
+                matches.append(original)
+        selection.append(matches)
+    return selection
+
+
+@pytest.mark.parametrize('desc,mhr_nums,lookup,count', TEST_INDEX_DATA)
+def test_selection_index(desc, mhr_nums, lookup, count):
+    """Assert that the selection index lookups work as expected."""
+    items = [{'mhrNumber': mhr_num} for mhr_num in mhr_nums]
+    index = SelectionIndex(items, match_mhr_number)
+    assert len(index.all(lookup)) == count
+    if count:
+        assert lookup in index
+        assert index.first(lookup) == items[mhr_nums.index(lookup)]
+    else:
+        assert lookup not in index
+        assert index.first(lookup) is None
+    assert index.add_seen(lookup)
+    assert not index.add_seen(lookup)
+
+
+@pytest.mark.parametrize('desc,size', TEST_NESTED_DATA)
+def test_group_matches(desc, size):
+    """Assert that combining matches with the index matches the previous nested scan results."""
+    # Every 5th home has 2 owner matches.
+    original_results = []
+    for count in range(size):
+        original_results.append({'mhrNumber': f'{count:06d}', 'ownerName': 'A'})
+        if count % 5 == 0:
+            original_results.append({'mhrNumber': f'{count:06d}', 'ownerName': 'B'})
+    reg_list = [f'{count:06d}' for count in reversed(range(size))]
+    index = SelectionIndex(original_results, match_mhr_number)
+    selection = [index.all(reg_num) for reg_num in reg_list]
+    expected = group_matches_nested(reg_list, original_results)
+    assert selection == expected
@@ -68,6 +68,20 @@ def test_get_html_from_data(session):
     current_app.logger.info('html_data length=' + str(len(html_data)))
 
 
+def test_template_registry(session):
+    """Assert that the report template registry assembles and compiles a template once."""
+    report_utils.TemplateRegistry.clear()
+    file_name = 'searchResultV2.html'
+    source = report_utils.TemplateRegistry.get_source(file_name)
+    assert source
+    assert source.find('[[') == -1
+    assert report_utils.TemplateRegistry.get_source(file_name) is source
+    template = report_utils.TemplateRegistry.get_template(file_name)
+    assert template
+    assert report_utils.TemplateRegistry.get_template(file_name) is template
+    assert report_utils.TemplateRegistry.warm_up([file_name, 'unknown.html']) == 1
+
+
 def test_get_report_files(session):
     """Assert that getting the report source files from report data works as expected."""
     json_data = get_json_from_file(SEARCH_RESULT_MHR_DATAFILE)
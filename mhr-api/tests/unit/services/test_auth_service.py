@@ -15,10 +15,13 @@
 import base64
 import json
 import os
+import time
+
+import pytest
 
 from flask import current_app
 
-from mhr_api.services.gcp_auth.auth_service import GoogleAuthService
+from mhr_api.services.gcp_auth.auth_service import GoogleAuthService, TokenCache
 
 
 def test_get_token(session, client, jwt):
@@ -79,3 +82,32 @@ def test_security_account(session, client, jwt):
         assert decoded_sa.get('token_uri')
         assert decoded_sa.get('auth_provider_x509_cert_url')
         assert decoded_sa.get('client_x509_cert_url')
+
+
+
+# testdata pattern is ({description}, {expires in seconds}, {second token}, {fetch count}, {cached token})
+TEST_CACHE_DATA = [
+    ('Valid token reused', 3600, 'token1', 1, 'token1'),
+    ('Expiring token refreshed in the background', 60, 'token1', 2, 'token2'),
+    ('Expired token fetched', -60, 'token2', 2, 'token2')
+]
+
+
+@pytest.mark.parametrize('desc,expires_in,second_token,fetch_count,cached_token', TEST_CACHE_DATA)
+def test_token_cache(session, desc, expires_in, second_token, fetch_count, cached_token):
+    """Assert that the service token cache reuses and refreshes tokens as expected."""
+    cache = TokenCache()
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return f'token{len(fetched)}', time.time() + expires_in
+
+    assert cache.get('audience', fetch) == 'token1'
+    assert cache.get('audience', fetch) == second_token
+    for _ in range(40):
+        if not cache.refreshing:
+            break
+        time.sleep(0.05)
+    assert len(fetched) == fetch_count
+    assert cache.tokens['audience'][0] == cached_token
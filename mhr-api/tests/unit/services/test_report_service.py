@@ -0,0 +1,43 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Report service client tests."""
+import pytest
+
+from mhr_api.services.report_service import ReportService
+
+
+# testdata pattern is ({pool_size})
+TEST_POOL_DATA = [
+    (1),
+    (10)
+]
+
+
+@pytest.mark.parametrize('pool_size', TEST_POOL_DATA)
+def test_create_session(session, pool_size):
+    """Assert that creating the pooled report service session works as expected."""
+    http = ReportService.create_session(pool_size)
+    for prefix in ('https://', 'http://'):
+        adapter = http.get_adapter(prefix + 'localhost')
+        assert adapter._pool_maxsize == pool_size
+        assert adapter.max_retries.total == 4
+        assert 502 in adapter.max_retries.status_forcelist
+        assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_init_app(app):
+    """Assert that the report service client is set up from the app configuration."""
+    ReportService.init_app(app)
+    assert ReportService.session
+    assert ReportService.timeout == float(app.config.get('REPORT_SVC_TIMEOUT'))
@@ -0,0 +1,129 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per request SQL profiler tests."""
+import json
+import logging
+
+import pytest
+from flask import g
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from mhr_api.services.sql_profiler import (
+    HEADER_QUERY_COUNT,
+    HEADER_QUERY_TIME,
+    RequestProfile,
+    SqlProfiler,
+    after_cursor_execute,
+    before_cursor_execute,
+    normalize_statement,
+)
+
+
+# testdata pattern is ({description}, {statement}, {normalized})
+TEST_NORMALIZE_DATA = [
+    ('Bind parameters', 'SELECT * FROM registrations WHERE id = %(id_1)s', 'SELECT * FROM registrations WHERE id = ?'),
+    ('String literal', "SELECT * FROM parties WHERE name = 'O''BRIEN'", 'SELECT * FROM parties WHERE name = ?'),
+    ('Number literal', 'SELECT * FROM parties LIMIT 100', 'SELECT * FROM parties LIMIT ?'),
+    ('In list', 'SELECT * FROM parties WHERE id IN (%(id_1_1)s, %(id_1_2)s)', 'SELECT * FROM parties WHERE id IN (?)'),
+    ('Whitespace', 'SELECT 1\n  FROM dual', 'SELECT ? FROM dual'),
+    ('Empty', None, '')
+]
+# testdata pattern is ({description}, {repeat count}, {threshold}, {repeated})
+TEST_REPEATED_DATA = [
+    ('N+1', 10, 10, True),
+    ('Below threshold', 9, 10, False),
+    ('Disabled', 10, 0, False)
+]
+# testdata pattern is ({description}, {repeat count}, {slowest seconds}, {logged})
+TEST_LOG_DATA = [
+    ('Slow', 1, 0.6, True),
+    ('N+1', 10, 0.001, True),
+    ('Fast no repeats', 1, 0.001, False)
+]
+
+
+@pytest.mark.parametrize('desc,statement,normalized', TEST_NORMALIZE_DATA)
+def test_normalize_statement(desc, statement, normalized):
+    """Assert that statements differing only by value normalize to the same signature."""
+    assert normalize_statement(statement) == normalized
+
+
+@pytest.mark.parametrize('desc,repeat_count,threshold,repeated', TEST_REPEATED_DATA)
+def test_profile_summary(desc, repeat_count, threshold, repeated):
+    """Assert that the request profile summary counts, times and repeated statements are as expected."""
+    profile = RequestProfile()
+    for index in range(repeat_count):
+        profile.add(f'SELECT * FROM parties WHERE id = {index}', 0.001)
+    profile.add('SELECT * FROM registrations', 0.5)
+    summary = profile.summary(threshold)
+    assert summary['queryCount'] == repeat_count + 1
+    assert summary['queryTimeMs'] >= 500
+    assert len(summary['slowest']) == 5
+    assert summary['slowest'][0]['statement'] == 'SELECT * FROM registrations'
+    if repeated:
+        assert summary['repeated'][0]['statement'] == 'SELECT * FROM parties WHERE id = ?'
+        assert summary['repeated'][0]['count'] == repeat_count
+    else:
+        assert not summary['repeated']
+
+
+def test_end_request(session, app):
+    """Assert that statements executed in a request are recorded, sampled and returned as headers."""
+    profiler = SqlProfiler()
+    profiler.headers = True
+    profiler.sample_rate = 1.0
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+    try:
+        with app.test_request_context('/api/v1/ops/healthz'):
+            profiler.start_request()
+            session.execute(text('select 1'))
+            assert g.sql_profile.count == 1
+            response = profiler.end_request(app.response_class())
+            assert response.headers[HEADER_QUERY_COUNT] == '1'
+            assert response.headers[HEADER_QUERY_TIME]
+    finally:
+        event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+        event.remove(Engine, 'after_cursor_execute', after_cursor_execute)
+    profiles = profiler.get_profiles()
+    assert len(profiles) == 1
+    assert profiles[0]['path'] == '/api/v1/ops/healthz'
+    assert profiles[0]['slowest'][0]['statement'] == 'select ?'
+
+
+@pytest.mark.parametrize('desc,repeat_count,duration,logged', TEST_LOG_DATA)
+def test_end_request_log(app, caplog, desc, repeat_count, duration, logged):
+    """Assert that a slow or N+1 request profile is logged with the summary and the response is returned."""
+    profiler = SqlProfiler()
+    with app.test_request_context('/api/v1/ops/healthz'):
+        profiler.start_request()
+        for index in range(repeat_count):
+            g.sql_profile.add(f'SELECT * FROM parties WHERE id = {index}', duration)
+        response = app.response_class()
+        with caplog.at_level(logging.WARNING, logger='appLogger'):
+            assert profiler.end_request(response) == response
+    records = [record for record in caplog.records if record.getMessage().startswith('SQL profile')]
+    if not logged:
+        assert not records
+    else:
+        assert len(records) == 1
+        assert records[0].getMessage() == 'SQL profile GET /api/v1/ops/healthz'
+        summary = json.loads(records[0].additional)
+        assert summary['queryCount'] == repeat_count
+        assert summary['status'] == response.status_code
+        if repeat_count >= profiler.repeat_threshold:
+            assert summary['repeated'][0]['count'] == repeat_count
+        else:
+            assert summary['slowest'][0]['timeMs'] >= profiler.slow_ms
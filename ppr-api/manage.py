@@ -17,6 +17,7 @@
 import logging
 import os
 
+import click
 from flask.cli import FlaskGroup  # replaces flask_script Manager
 from sqlalchemy.sql import text
 
@@ -24,6 +25,7 @@ from sqlalchemy.sql import text
 from ppr_api import models  # pylint: disable=unused-import
 from ppr_api import create_app
 from ppr_api.models import db
+from test_data import scale_data, search_benchmark, selection_benchmark
 
 APP = create_app()
 CLI = FlaskGroup(APP)  # replaces MANAGER
@@ -72,6 +74,42 @@ def create_test_data():
         execute_script(db.session, os.path.join(os.getcwd(), ("test_data/postgres_data_files/" + filename)))
 
 
+@CLI.command("generate_scale_data")
+@click.option("--count", type=int, default=100000, help="Number of financing statements to add.")
+@click.option("--batch-size", "batch_size", type=int, default=10000, help="Number of records per transaction.")
+@click.option("--seed", type=int, default=None, help="Random seed for repeatable names and serial numbers.")
+@click.option("--amend-rate", "amend_rate", type=float, default=0.2, help="Fraction amended.")
+@click.option("--discharge-rate", "discharge_rate", type=float, default=0.15, help="Fraction discharged.")
+@click.confirmation_option(prompt="Add synthetic financing statements to the configured database?")
+def generate_scale_data(count, batch_size, seed, amend_rate, discharge_rate):
+    """Add synthetic financing statements for local scale testing: never run in a shared environment."""
+    scale_data.generate(db.session, count, batch_size, seed, amend_rate=amend_rate, discharge_rate=discharge_rate)
+
+
+@CLI.command("benchmark_search")
+@click.option("--iterations", type=int, default=10, help="Timed runs of each query and criteria value.")
+@click.option("--criteria", "criteria_file", type=click.Path(exists=True), help="JSON criteria by benchmark name.")
+@click.option("--baseline", "baseline_file", help="Baseline JSON file to compare to, or to create.")
+@click.option("--save-baseline", "save_baseline", is_flag=True, help="Save the results as the baseline.")
+@click.option("--output", "output_file", help="JSON file for the results, including the query plans.")
+@click.option("--tolerance", type=float, default=0.5, help="Allowed p95 latency increase as a baseline fraction.")
+def benchmark_search(iterations, criteria_file, baseline_file, save_baseline, output_file, tolerance):
+    """Benchmark the search queries, exiting with an error on a plan or latency regression from the baseline."""
+    regressions = search_benchmark.run(
+        db.session, iterations, criteria_file, baseline_file, save_baseline, output_file, tolerance
+    )
+    if regressions:
+        raise SystemExit(1)
+
+
+@CLI.command("benchmark_selection")
+@click.option("--iterations", type=int, default=5, help="Timed runs of each selection size: the fastest is reported.")
+def benchmark_selection(iterations):
+    """Benchmark the search selection index, exiting with an error if its results differ from the nested scans."""
+    if selection_benchmark.run(iterations=iterations):
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
     logging.log(logging.INFO, "Running the Flask CLI")
     CLI()
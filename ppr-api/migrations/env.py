@@ -30,7 +30,8 @@ from database.postgres_functions import (
     get_mhr_doc_gov_agent_id,
     mhr_name_compressed_key,
     mhr_serial_compressed_key,
-    get_mhr_doc_staff_id
+    get_mhr_doc_staff_id,
+    searchable_financing_statements_reconcile
 )
 from database.postgres_views import (
     account_draft_vw,
@@ -116,7 +117,8 @@ register_entities([get_draft_document_number,
                    mhr_search_owner_bus_vw,
                    mhr_search_owner_ind_vw,
                    mhr_search_serial_vw,
-                   get_mhr_doc_staff_id
+                   get_mhr_doc_staff_id,
+                   searchable_financing_statements_reconcile
                    ])
 
 
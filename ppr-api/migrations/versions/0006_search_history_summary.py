@@ -0,0 +1,44 @@
+"""0006_search_history_summary
+
+Revision ID: c3a91e5d7f20
+Revises: 1b8f5a2c6e47
+Create Date: 2026-10-18 13:22:05.417391
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a91e5d7f20'
+down_revision = '1b8f5a2c6e47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ### Manually created: the tables are shared by the PPR and MHR APIs, so add the columns only if they do not exist.
+    # Existing rows are populated by the ppr-registrations-historical job. ###
+    op.execute("""
+ALTER TABLE search_requests
+  ADD COLUMN IF NOT EXISTS history_criteria VARCHAR(1000),
+  ADD COLUMN IF NOT EXISTS history_username VARCHAR(1000)
+    """)
+    op.execute("""
+ALTER TABLE search_results
+  ADD COLUMN IF NOT EXISTS selected_match_count INTEGER,
+  ADD COLUMN IF NOT EXISTS selected_exact_count INTEGER
+    """)
+    # ### end Alembic commands ###
+
+
+def downgrade():
+    op.execute("""
+ALTER TABLE search_results
+  DROP COLUMN IF EXISTS selected_match_count,
+  DROP COLUMN IF EXISTS selected_exact_count
+    """)
+    op.execute("""
+ALTER TABLE search_requests
+  DROP COLUMN IF EXISTS history_criteria,
+  DROP COLUMN IF EXISTS history_username
+    """)
@@ -39,3 +39,4 @@ from .get_mhr_doc_gov_agent_id import get_mhr_doc_gov_agent_id
 from .mhr_name_compressed_key import mhr_name_compressed_key
 from .mhr_serial_compressed_key import mhr_serial_compressed_key
 from .get_mhr_doc_staff_id import get_mhr_doc_staff_id
+from .searchable_financing_statements_reconcile import searchable_financing_statements_reconcile
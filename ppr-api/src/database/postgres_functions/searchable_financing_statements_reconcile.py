@@ -0,0 +1,49 @@
+"""Maintain db function searchable_financing_statements_reconcile here.
+
+The single definition of the searchable_financing_statements reconcile SQL: the migration backfill, the API model and
+the ppr-registrations-historical job all call this function.
+"""
+from alembic_utils.pg_function import PGFunction
+
+
+searchable_financing_statements_reconcile = PGFunction(
+    schema="public",
+    signature="searchable_financing_statements_reconcile()",
+    definition=r"""
+    RETURNS TABLE(deleted_count INTEGER, updated_count INTEGER)
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+            v_cutoff_ts TIMESTAMP := (now() at time zone 'utc') - interval '30 days';
+            BEGIN
+            DELETE
+              FROM searchable_financing_statements sfs
+             WHERE (sfs.expire_date IS NOT NULL AND sfs.expire_date <= v_cutoff_ts)
+                OR (sfs.discharge_ts IS NOT NULL AND sfs.discharge_ts < v_cutoff_ts);
+            GET DIAGNOSTICS deleted_count = ROW_COUNT;
+            INSERT INTO searchable_financing_statements(financing_id, expire_date, discharge_ts, update_ts)
+            SELECT fs.id, fs.expire_date,
+                   (SELECT MIN(r.registration_ts)
+                      FROM registrations r
+                     WHERE r.financing_id = fs.id
+                       AND r.registration_type_cl = 'DISCHARGE') AS discharge_ts,
+                   (now() at time zone 'utc')
+              FROM financing_statements fs
+             WHERE (fs.expire_date IS NULL OR fs.expire_date > v_cutoff_ts)
+               AND NOT EXISTS (SELECT r3.id
+                                 FROM registrations r3
+                                WHERE r3.financing_id = fs.id
+                                  AND r3.registration_type_cl = 'DISCHARGE'
+                                  AND r3.registration_ts < v_cutoff_ts)
+            ON CONFLICT (financing_id) DO UPDATE
+               SET expire_date = EXCLUDED.expire_date, discharge_ts = EXCLUDED.discharge_ts,
+                   update_ts = EXCLUDED.update_ts
+             WHERE searchable_financing_statements.expire_date IS DISTINCT FROM EXCLUDED.expire_date
+                OR searchable_financing_statements.discharge_ts IS DISTINCT FROM EXCLUDED.discharge_ts;
+            GET DIAGNOSTICS updated_count = ROW_COUNT;
+            RETURN NEXT;
+            END
+            ;
+    $$;
+    """
+)
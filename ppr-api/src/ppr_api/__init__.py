@@ -23,17 +23,19 @@ from flask_migrate import Migrate, upgrade
 from registry_schemas import __version__ as registry_schemas_version
 from sqlalchemy.sql import text
 
-from ppr_api import errorhandlers, models
+from ppr_api import errorhandlers, models, reports
 from ppr_api.callback import auth_service, storage_service
 from ppr_api.config import config
 from ppr_api.metadata import APP_RUNNING_ENVIRONMENT, APP_VERSION
-from ppr_api.models import db
+from ppr_api.models import db, reference_cache
+from ppr_api.models.type_tables import REFERENCE_TYPES
 from ppr_api.resources import endpoints
 from ppr_api.schemas import rsbc_schemas
-from ppr_api.services import flags, queue_service
+from ppr_api.services import flags, queue_service, report_service, sql_profiler
 from ppr_api.translations import babel
 from ppr_api.utils.auth import jwt
 from ppr_api.utils.logging import logger, setup_logging
+from ppr_api.utils.metrics import metrics
 
 setup_logging(os.path.join(os.path.abspath(os.path.dirname(__file__)), "logging.yaml"))  # important to do this first
 
@@ -65,6 +67,10 @@ def create_app(service_environment=APP_RUNNING_ENVIRONMENT, **kwargs):
     storage_service.init_app(app)
     endpoints.init_app(app)
     queue_service.init_app(app)
+    report_service.init_app(app)
+    sql_profiler.init_app(app)
+    metrics.init_app(app)
+    reports.init_app(app)
 
     setup_jwt_manager(app, jwt)
 
@@ -79,6 +85,7 @@ def create_app(service_environment=APP_RUNNING_ENVIRONMENT, **kwargs):
     if app.config.get("DEPLOYMENT_ENV", "") == "testing":  # CI only create test data.
         with app.app_context():
             setup_test_data()
+    reference_cache.init_app(app, REFERENCE_TYPES)
 
     return app
 
@@ -14,8 +14,12 @@
 """This maintains access tokens for API calls."""
 import base64
 import json
+import threading
+import time
 from abc import ABC, abstractmethod
+from datetime import timezone
 
+import google.auth.jwt
 import google.auth.transport.requests
 import google.oauth2.id_token
 from flask import current_app
@@ -23,6 +27,70 @@ from google.oauth2 import service_account
 
 from ppr_api.utils.logging import logger
 
+# Refresh cached tokens in the background when they expire within this many seconds.
+TOKEN_REFRESH_SECONDS = 300
+
+
+class TokenCache:
+    """Thread safe cache of service tokens keyed by audience, reused until shortly before they expire.
+
+    Within the refresh window the cached token is still returned while a single background thread fetches its
+    replacement, so only the first request for an audience waits for the token endpoint.
+    """
+
+    def __init__(self, refresh_seconds: int = TOKEN_REFRESH_SECONDS):
+        """Create an empty cache refreshing tokens refresh_seconds before they expire."""
+        self.refresh_seconds: int = refresh_seconds
+        self.tokens: dict = {}
+        self.refreshing: set = set()
+        self.lock = threading.Lock()
+
+    def get(self, audience: str, fetch) -> str:
+        """Get the token for the audience: fetch returns a new token and its expiry timestamp when required."""
+        now = time.time()
+        with self.lock:
+            entry = self.tokens.get(audience)
+            if entry and entry[1] - now > self.refresh_seconds:
+                return entry[0]
+            if entry and entry[1] > now:
+                if audience not in self.refreshing:
+                    self.refreshing.add(audience)
+                    threading.Thread(target=self._refresh, args=(audience, fetch), daemon=True).start()
+                return entry[0]
+        token, expiry = fetch()
+        with self.lock:
+            self.tokens[audience] = (token, expiry)
+        return token
+
+    def clear(self):
+        """Remove all cached tokens."""
+        with self.lock:
+            self.tokens.clear()
+
+    def _refresh(self, audience: str, fetch):
+        """Background thread replacement of an expiring token."""
+        try:
+            token, expiry = fetch()
+            with self.lock:
+                self.tokens[audience] = (token, expiry)
+            logger.debug(f"Refreshed cached token for {audience}.")
+        except Exception as err:  # noqa: B902; the cached token is used until it expires.
+            logger.error(f"Background token refresh failed for {audience}: {err}")
+        finally:
+            with self.lock:
+                self.refreshing.discard(audience)
+
+
+def fetch_id_token(audience: str):
+    """Fetch a service to service ID token for the audience: return the token and its expiry timestamp."""
+    auth_req = google.auth.transport.requests.Request()
+    token = google.oauth2.id_token.fetch_id_token(auth_req, audience)
+    claims = google.auth.jwt.decode(token, verify=False)
+    return token, float(claims.get("exp", time.time()))
+
+
+token_cache = TokenCache()
+
 
 class TokenService(ABC):  # pylint: disable=too-few-public-methods
     """Token Service abstract class with single get_token method."""
@@ -62,15 +130,21 @@ class GoogleStorageTokenService(TokenService):  # pylint: disable=too-few-public
 
     @classmethod
     def get_token(cls):
-        """Generate an OAuth access token with cloud storage access."""
+        """Get a cached OAuth access token with cloud storage access, refreshed before it expires."""
         if cls.credentials is None:
             cls.credentials = service_account.Credentials.from_service_account_info(
                 cls.service_account_info, scopes=cls.gcp_sa_scopes
             )
+        return token_cache.get("storage", cls._refresh_credentials)
+
+    @classmethod
+    def _refresh_credentials(cls):
+        """Refresh the service account access token: return the token and its expiry timestamp."""
         request = google.auth.transport.requests.Request()
         cls.credentials.refresh(request)
         logger.info("Call successful: obtained token.")
-        return cls.credentials.token
+        expiry = cls.credentials.expiry.replace(tzinfo=timezone.utc).timestamp() if cls.credentials.expiry else 0
+        return cls.credentials.token, expiry
 
     @classmethod
     def get_credentials(cls):
@@ -84,13 +158,10 @@ class GoogleStorageTokenService(TokenService):  # pylint: disable=too-few-public
 
     @classmethod
     def get_report_api_token(cls, rs_url: str = None):
-        """Generate an OAuth access token with IAM configured auth mhr api container to report api container."""
+        """Get a cached ID token with IAM configured auth api container to report api container."""
         audience: str = rs_url if rs_url else current_app.config.get("REPORT_API_AUDIENCE")
         if rs_url:
             logger.info(f"Getting report service token for {rs_url}")
         if not audience:
             return None
-        auth_req = google.auth.transport.requests.Request()
-        token = google.oauth2.id_token.fetch_id_token(auth_req, audience)
-        logger.debug("Call successful: obtained token.")
-        return token
+        return token_cache.get(audience, lambda: fetch_id_token(audience))
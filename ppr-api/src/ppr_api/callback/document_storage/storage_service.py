@@ -13,6 +13,7 @@
 # limitations under the License.
 """This class is a wrapper for document storage API calls."""
 import datetime
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -21,11 +22,21 @@ from google.cloud import storage
 from ppr_api.callback.auth.token_service import GoogleStorageTokenService
 from ppr_api.callback.utils.exceptions import StorageException
 from ppr_api.utils.logging import logger
+from ppr_api.utils.metrics import STORAGE_BYTES, STORAGE_LATENCY
 
 HTTP_DELETE = "delete"
 HTTP_GET = "get"
 HTTP_POST = "post"
 CONTENT_TYPE_PDF = "application/pdf"
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _record_metrics(operation: str, doc_type, start: float, size: int = None):
+    """Record the storage request latency and, if available, the document size."""
+    doc_type_label: str = getattr(doc_type, "value", doc_type) or DocumentTypes.SEARCH_RESULTS.value
+    STORAGE_LATENCY.observe(time.perf_counter() - start, operation=operation, doc_type=doc_type_label)
+    if size is not None:
+        STORAGE_BYTES.observe(size, operation=operation, doc_type=doc_type_label)
 
 
 class DocumentTypes(str, Enum):
@@ -95,6 +106,40 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
             logger.error(f"get_document failed for doc type={doc_type}, name={name}. {err}")
             raise StorageException("The system failed to retrieve the specified document.") from err
 
+    @classmethod
+    def get_document_info(cls, name: str, doc_type: str = None):
+        """Fetch the uniquely named document metadata (size, etag, generation) from cloud storage as a blob."""
+        try:
+            logger.info(f"Fetching doc info type={doc_type}, name={name}.")
+            credentials = GoogleStorageTokenService.get_credentials()
+            storage_client = storage.Client(credentials=credentials)
+            blob = storage_client.bucket(cls.__get_bucket_id(doc_type)).get_blob(name)
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"get_document_info failed for doc type={doc_type}, name={name}. {err}")
+            raise StorageException("The system failed to retrieve the specified document.") from err
+        if blob is None:
+            raise StorageException(f"The document {name} does not exist in storage.")
+        return blob
+
+    @staticmethod
+    def stream_document(blob, doc_type: str = None, start: int = 0, stop: int = None):
+        """Generate the blob contents from start up to stop (exclusive) in STREAM_CHUNK_SIZE ranged downloads.
+
+        Downloads are pinned to the blob generation, so a document replaced mid-stream fails rather than mixing
+        versions. At most one chunk is held in memory.
+        """
+        begin = time.perf_counter()
+        stop = blob.size if stop is None else stop
+        offset: int = start
+        while offset < stop:
+            end: int = min(offset + STREAM_CHUNK_SIZE, stop) - 1  # end is inclusive
+            chunk = blob.download_as_bytes(start=offset, end=end, if_generation_match=blob.generation, checksum=None)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+        _record_metrics("stream", doc_type, begin, offset - start)
+
     @classmethod
     def delete_document(cls, name: str, doc_type: str = None):
         """Delete the uniquely named document from cloud storage (unit testing only)."""
@@ -152,6 +197,7 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
         doc_type: str = None,
     ):
         """Call the Cloud Storage API."""
+        start = time.perf_counter()
         credentials = GoogleStorageTokenService.get_credentials()
         storage_client = storage.Client(credentials=credentials)
         bucket = storage_client.bucket(cls.__get_bucket_id(doc_type))
@@ -159,18 +205,22 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
         if method == HTTP_POST:
             media_type: str = CONTENT_TYPE_PDF
             blob.upload_from_string(data=data, content_type=media_type)
+            _record_metrics("save", doc_type, start, len(data) if data else 0)
             return blob.time_created
         if method == HTTP_GET:
             contents = blob.download_as_bytes()
+            _record_metrics("get", doc_type, start, len(contents) if contents else 0)
             return contents
         if method == HTTP_DELETE:
             blob.delete()
+            _record_metrics("delete", doc_type, start)
             return None
         return None
 
     @classmethod
     def __call_cs_api_link(cls, name: str, data=None, doc_type: str = None, available_days: int = 1):
         """Call the Cloud Storage API, returning a time-limited download link."""
+        start = time.perf_counter()
         credentials = GoogleStorageTokenService.get_credentials()
         storage_client = storage.Client(credentials=credentials)
         bucket = storage_client.bucket(cls.__get_bucket_id(doc_type))
@@ -181,4 +231,5 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
         url = blob.generate_signed_url(
             version="v4", expiration=datetime.timedelta(days=available_days, hours=0, minutes=0), method="GET"
         )
+        _record_metrics("save_link" if data else "get_link", doc_type, start, len(data) if data else None)
         return url
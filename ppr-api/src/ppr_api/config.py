@@ -86,9 +86,21 @@ class Config:  # pylint: disable=too-few-public-methods
     REPORT_SVC_LARGE_URL = os.getenv("REPORT_API_LARGE_URL", "")
 
     AUTH_SVC_URL = f"{AUTH_API_URL + AUTH_API_VERSION}"
+    # Auth api organization and role lookup cache: responses are cached by token subject and account id.
+    AUTH_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_CACHE_MAX_SIZE", "1000"))
+    AUTH_CACHE_TTL: int = int(os.getenv("AUTH_CACHE_TTL", "300"))
+    AUTH_CACHE_NEGATIVE_TTL: int = int(os.getenv("AUTH_CACHE_NEGATIVE_TTL", "10"))
     PAYMENT_SVC_URL = f"{PAY_API_URL + PAY_API_VERSION}"
     REPORT_SVC_URL = f"{REPORT_API_URL}"
+    # Report service client keep-alive connection pool size and default request timeout in seconds.
+    REPORT_SVC_POOL_SIZE: int = int(os.getenv("REPORT_SVC_POOL_SIZE", "10"))
+    REPORT_SVC_TIMEOUT: float = float(os.getenv("REPORT_SVC_TIMEOUT", "1800"))
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_TEMPLATE_PATH", "report-templates")
+    # Report templates are assembled and compiled once: optionally at app start, or for every report when editing.
+    REPORT_TEMPLATE_WARM_UP: bool = os.getenv("REPORT_TEMPLATE_WARM_UP", "false").lower() == "true"
+    REPORT_TEMPLATE_RELOAD: bool = os.getenv("REPORT_TEMPLATE_RELOAD", "false").lower() == "true"
+    # Compiled report template bytecode cache directory: defaults to the system temporary directory.
+    REPORT_TEMPLATE_CACHE_DIR = os.getenv("REPORT_TEMPLATE_CACHE_DIR", "")
 
     LD_SDK_KEY = os.getenv("LD_SDK_KEY", None)
     SECRET_KEY = "a secret"
@@ -152,6 +164,31 @@ class Config:  # pylint: disable=too-few-public-methods
     SIMILARITY_QUOTIENT_LAST_NAME: float = float(os.getenv("SIMILARITY_QUOTIENT_LAST_NAME", "0.29"))
     SIMILARITY_QUOTIENT_DEFAULT: float = float(os.getenv("SIMILARITY_QUOTIENT_DEFAULT", "0.5"))
 
+    # PPR search financing statement filter mode: LEGACY evaluates the expiry date and discharge history per candidate
+    # row, TABLE joins to the maintained searchable_financing_statements table.
+    SEARCH_FINANCING_FILTER = os.getenv("SEARCH_FINANCING_FILTER", "LEGACY")
+
+    # Opt-in in-process search results cache: maximum number of entries and entry time to live in seconds.
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "false").lower() == "true"
+    SEARCH_CACHE_MAX_SIZE: int = int(os.getenv("SEARCH_CACHE_MAX_SIZE", "1000"))
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+
+    # In-process type table (reference data) cache time to live in seconds: 0 disables the cache.
+    REFERENCE_CACHE_TTL: int = int(os.getenv("REFERENCE_CACHE_TTL", "3600"))
+
+    # Opt-in per request SQL profiling: sampled profiles ring buffer size and sample rate, statement time in
+    # milliseconds to log as slow, statement executions per request to log as an N+1 signature.
+    SQL_PROFILER_ENABLED: bool = os.getenv("SQL_PROFILER_ENABLED", "false").lower() == "true"
+    SQL_PROFILER_HEADERS: bool = os.getenv("SQL_PROFILER_HEADERS", "false").lower() == "true"
+    SQL_PROFILER_BUFFER_SIZE: int = int(os.getenv("SQL_PROFILER_BUFFER_SIZE", "100"))
+    SQL_PROFILER_SAMPLE_RATE: float = float(os.getenv("SQL_PROFILER_SAMPLE_RATE", "0.1"))
+    SQL_PROFILER_SLOW_MS: int = int(os.getenv("SQL_PROFILER_SLOW_MS", "500"))
+    SQL_PROFILER_REPEAT_THRESHOLD: int = int(os.getenv("SQL_PROFILER_REPEAT_THRESHOLD", "10"))
+
+    # Opt-in in-process request, DB pool, report service, document storage and search size metrics at /metrics.
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_NAMESPACE: str = os.getenv("METRICS_NAMESPACE", "ppr_api")
+
     # Search results report number of financing statements threshold for async requests.
     SEARCH_PDF_ASYNC_THRESHOLD: int = int(os.getenv("SEARCH_PDF_ASYNC_THRESHOLD", "75"))
 
@@ -193,6 +230,11 @@ class Config:  # pylint: disable=too-few-public-methods
     REPORT_API_AUDIENCE = os.getenv("REPORT_API_AUDIENCE", "https://gotenberg-p56lvhvsqa-nn.a.run.app")
     # Number of registrations threshold for search report light format.
     REPORT_SEARCH_LIGHT: int = int(os.getenv("REPORT_SEARCH_LIGHT", "700"))
+    # Maximum number of large search sub-reports concurrently generated by the report service.
+    REPORT_SEARCH_MAX_WORKERS: int = int(os.getenv("REPORT_SEARCH_MAX_WORKERS", "4"))
+    # Search report TOC mode: RENDER (default) prints TOC page numbers, LINK renders once with TOC links only.
+    # Large search reports (sub-reports) always use RENDER.
+    REPORT_SEARCH_TOC_MODE = os.getenv("REPORT_SEARCH_TOC_MODE", "RENDER")
 
     DEPLOYMENT_ENV = os.getenv("DEPLOYMENT_ENV", "development")
     if not GOOGLE_DEFAULT_SA and DEPLOYMENT_ENV in ("unitTesting", "testing"):
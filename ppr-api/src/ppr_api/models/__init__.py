@@ -33,6 +33,7 @@ from .previous_financing_statement import PreviousFinancingStatement
 from .registration import Registration
 from .search_request import SearchRequest
 from .search_result import SearchResult
+from .searchable_financing_statement import SearchableFinancingStatement
 from .securities_act_notice import SecuritiesActNotice
 from .securities_act_order import SecuritiesActOrder
 from .trust_indenture import TrustIndenture
@@ -81,6 +82,7 @@ __all__ = (
     "RegistrationTypeClass",
     "SearchRequest",
     "SearchResult",
+    "SearchableFinancingStatement",
     "SearchType",
     "StateType",
     "SerialType",
@@ -20,14 +20,17 @@ from __future__ import annotations
 from http import HTTPStatus
 
 from flask import current_app
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import text
 
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
+from ppr_api.models import search_cache
 from ppr_api.models import utils as model_utils
 from ppr_api.models.type_tables import RegistrationType, RegistrationTypes
 from ppr_api.utils.base import BaseEnum
 from ppr_api.utils.logging import logger
 
+from .client_code import ClientCode
 from .db import db
 from .general_collateral import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     GeneralCollateral,
@@ -37,6 +40,7 @@ from .party import Party  # noqa: F401 pylint: disable=unused-import; needed by
 from .registration import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     Registration,
 )
+from .searchable_financing_statement import SearchableFinancingStatement
 from .securities_act_notice import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     SecuritiesActNotice,
 )
@@ -50,6 +54,9 @@ from .vehicle_collateral import (  # noqa: F401 pylint: disable=unused-import; n
     VehicleCollateral,
 )
 
+# Maximum number of registration numbers included in a single bulk load query IN clause.
+BULK_LOAD_BATCH_SIZE: int = 1000
+
 
 class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attributes
     """This class maintains financing statement information."""
@@ -477,12 +484,15 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
     def save(self):
         """Save the object to the database immediately."""
         db.session.add(self)
+        db.session.flush()
+        SearchableFinancingStatement.update_by_financing_id(self.id)
         db.session.commit()
 
         # Now save draft
         draft = self.registration[0].draft
         db.session.add(draft)
         db.session.commit()
+        search_cache.update_data_version()
 
     @classmethod
     def find_all_by_account_id(cls, account_id):
@@ -581,6 +591,63 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
             )
         return statement
 
+    @classmethod
+    def find_all_by_registration_numbers(cls, registration_nums: list) -> dict:
+        """Return financing statements keyed by base registration number, bulk loaded for search details.
+
+        All child collections used to generate the financing statement JSON are eager loaded, so the number of
+        queries is fixed by the number of relationships and batches rather than the number of registrations.
+        Account id/historical checks are skipped: the same as the staff find_by_registration_number.
+        """
+        statements = {}
+        if not registration_nums:
+            return statements
+        reg_nums = list(dict.fromkeys(registration_nums))
+        try:
+            for index in range(0, len(reg_nums), BULK_LOAD_BATCH_SIZE):
+                batch = reg_nums[index : index + BULK_LOAD_BATCH_SIZE]
+                results = (
+                    db.session.query(FinancingStatement)
+                    .filter(
+                        FinancingStatement.id == Registration.financing_id,
+                        Registration.registration_num.in_(batch),
+                        Registration.registration_type_cl.in_(["PPSALIEN", "MISCLIEN", "CROWNLIEN"]),
+                    )
+                    .options(*FinancingStatement.bulk_load_options())
+                    .all()
+                )
+                for statement in results:
+                    statements[statement.registration[0].registration_num] = statement
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_registration_numbers exception: " + repr(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        return statements
+
+    @classmethod
+    def bulk_load_options(cls) -> list:
+        """Return the eager loading options for all relationships used to generate the financing statement JSON."""
+        registration = selectinload(FinancingStatement.registration)
+        parties = selectinload(FinancingStatement.parties)
+        return [
+            registration.selectinload(Registration.reg_type),
+            registration.selectinload(Registration.court_order),
+            registration.selectinload(Registration.trust_indenture),
+            registration.selectinload(Registration.parties),
+            registration.selectinload(Registration.securities_act_notices).selectinload(
+                SecuritiesActNotice.securities_act_orders
+            ),
+            registration.selectinload(Registration.securities_act_notices).selectinload(
+                SecuritiesActNotice.sec_act_type
+            ),
+            parties.selectinload(Party.address),
+            parties.selectinload(Party.client_code).selectinload(ClientCode.address),
+            selectinload(FinancingStatement.vehicle_collateral),
+            selectinload(FinancingStatement.general_collateral),
+            selectinload(FinancingStatement.general_collateral_legacy),
+            selectinload(FinancingStatement.trust_indenture),
+            selectinload(FinancingStatement.previous_statement),
+        ]
+
     @classmethod
     def find_by_financing_id(cls, financing_id: int = None):
         """Return a financing statement by financing statement ID."""
@@ -0,0 +1,143 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the in-process, read-through cache of type table (reference data) records.
+
+Type tables are loaded in full on first use (or at startup) and served from memory until the time to live expires or
+the ops reload endpoint is called. Cached records are transient copies of the database rows: they are never attached
+to a session, so they are safe to share between requests and must only be read.
+
+This module is mirrored in the ppr-api and mhr-api packages: keep the copies identical apart from the package
+imports.
+"""
+import threading
+import time
+from enum import Enum
+
+from ppr_api.exceptions import DatabaseException
+from ppr_api.utils.logging import logger
+
+from .db import db
+
+
+def _record_key(value):
+    """Type table keys may be loaded as enums: always look up by the string value."""
+    return value.value if isinstance(value, Enum) else value
+
+
+class ReferenceCache:
+    """Type table records by table name and primary key, refreshed after a time to live."""
+
+    def __init__(self, ttl: int = 3600):
+        """Create an empty cache: a ttl less than 1 disables the cache and every lookup queries the database."""
+        self.ttl: int = ttl
+        self.tables: dict = {}
+        self.lock = threading.Lock()
+        self.version: int = 0
+        self.hits: int = 0
+        self.loads: int = 0
+
+    def get_all(self, model) -> list:
+        """Return all the records for the type table model."""
+        return list(self._get_table(model).values())
+
+    def get(self, model, key):
+        """Return the type table model record matching the key, or None."""
+        if not key:
+            return None
+        return self._get_table(model).get(_record_key(key))
+
+    def load(self, models) -> int:
+        """Load or replace the cached records for the type table models, returning the number of records loaded."""
+        count: int = 0
+        for model in models:
+            count += len(self._load_table(model))
+        return count
+
+    def reload(self, models) -> int:
+        """Discard all cached records and load the type table models again: the version changes on every reload."""
+        with self.lock:
+            self.tables.clear()
+            self.version += 1
+        return self.load(models)
+
+    def clear(self):
+        """Remove all records and reset the counters."""
+        with self.lock:
+            self.tables.clear()
+            self.hits = 0
+            self.loads = 0
+
+    def stats(self) -> dict:
+        """Return the cached table record counts and the counters."""
+        with self.lock:
+            return {
+                "version": self.version,
+                "ttl": self.ttl,
+                "tables": {name: len(entry[1]) for name, entry in self.tables.items()},
+                "hits": self.hits,
+                "loads": self.loads,
+            }
+
+    def _get_table(self, model) -> dict:
+        """Get the cached table records, loading them if missing or expired."""
+        with self.lock:
+            entry = self.tables.get(model.__tablename__)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        try:
+            return self._load_table(model)
+        except DatabaseException:
+            if not entry:
+                raise
+            logger.warning(f"Reference cache reload failed for {model.__tablename__}: using the expired records.")
+            return entry[1]
+
+    def _load_table(self, model) -> dict:
+        """Query all the type table rows and cache transient copies of them by primary key."""
+        try:
+            mapper = model.__mapper__
+            key_name: str = mapper.get_property_by_column(mapper.primary_key[0]).key
+            attr_names = [attr.key for attr in mapper.column_attrs]
+            records = {}
+            for row in db.session.query(model).all():
+                record = model(**{name: getattr(row, name) for name in attr_names})
+                records[_record_key(getattr(record, key_name))] = record
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB reference cache load {model.__tablename__} exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
+        if self.ttl > 0:
+            with self.lock:
+                self.tables[model.__tablename__] = (time.monotonic() + self.ttl, records)
+                self.loads += 1
+        return records
+
+
+reference_cache = ReferenceCache()
+
+
+def init_app(app, models):
+    """Size the cache time to live from the configuration and load the type table models at startup.
+
+    A startup load failure is not fatal: the tables are then loaded on first use.
+    """
+    reference_cache.ttl = int(app.config.get("REFERENCE_CACHE_TTL", 3600))
+    if reference_cache.ttl < 1:
+        return
+    with app.app_context():
+        try:
+            count: int = reference_cache.load(models)
+            logger.info(f"Reference cache loaded {count} type table records.")
+        except DatabaseException as load_err:
+            logger.warning(f"Reference cache startup load failed, loading on first use: {load_err}")
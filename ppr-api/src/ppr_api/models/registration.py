@@ -20,7 +20,7 @@ from http import HTTPStatus
 from sqlalchemy.sql import text
 
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
-from ppr_api.models import registration_utils
+from ppr_api.models import registration_utils, search_cache
 from ppr_api.models import utils as model_utils
 from ppr_api.models.registration_utils import AccountRegistrationParams
 from ppr_api.models.type_tables import RegistrationTypes
@@ -33,6 +33,7 @@ from .db import db
 from .draft import Draft
 from .general_collateral import GeneralCollateral
 from .party import Party
+from .searchable_financing_statement import SearchableFinancingStatement
 from .securities_act_notice import SecuritiesActNotice
 from .trust_indenture import TrustIndenture
 from .type_tables import RegistrationType
@@ -306,12 +307,15 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
     def save(self):
         """Render a registration to the local cache."""
         db.session.add(self)
+        db.session.flush()
+        SearchableFinancingStatement.update_by_financing_id(self.financing_id)
         db.session.commit()
 
         # Now save draft
         draft = self.draft
         db.session.add(draft)
         db.session.commit()
+        search_cache.update_data_version()
 
     def get_registration_type(self):
         """Lookup registration type record if it has not already been fetched."""
@@ -497,6 +501,9 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
         results_json = registration_utils.build_account_base_reg_results(params, rows)
         if results_json:
             results_json[0]["totalRegistrationCount"] = count
+            # A full page ordered by timestamp and id: the next page starts after the last registration.
+            if params.has_keyset_order() and len(rows) == query_params["page_size"]:
+                results_json[0]["nextCursor"] = model_utils.encode_page_cursor(rows[-1][1], rows[-1][20])
             # Get change registrations.
             query = registration_utils.build_account_change_query(params, results_json)
             results = db.session.execute(text(query), query_params)
@@ -515,6 +522,8 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
         params.registration_type = None
         params.status_type = None
         params.registering_name = None
+        params.cursor_ts = None
+        params.cursor_id = None
         query = registration_utils.build_account_reg_query(params)
         query_params = registration_utils.build_account_query_params(params, True)
         results = db.session.execute(text(query), query_params)
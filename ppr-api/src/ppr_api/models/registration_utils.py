@@ -238,6 +238,11 @@ QUERY_ACCOUNT_ADD_REGISTRATION = (
 QUERY_ACCOUNT_REG_DEFAULT_ORDER = " ORDER BY registration_ts DESC"
 QUERY_ACCOUNT_CHANGE_DEFAULT_ORDER = " ORDER BY arv2.registration_ts DESC"
 QUERY_ACCOUNT_REG_LIMIT = " LIMIT :page_size OFFSET :page_offset"
+QUERY_ACCOUNT_REG_KEYSET_LIMIT = " LIMIT :page_size"
+QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC = " ORDER BY registration_ts DESC, registration_id DESC"
+QUERY_ACCOUNT_REG_KEYSET_ORDER_ASC = " ORDER BY registration_ts ASC, registration_id ASC"
+QUERY_ACCOUNT_REG_KEYSET_DESC = " WHERE (registration_ts, registration_id) < (:cursor_ts, :cursor_id)"
+QUERY_ACCOUNT_REG_KEYSET_ASC = " WHERE (registration_ts, registration_id) > (:cursor_ts, :cursor_id)"
 QUERY_ACCOUNT_REG_NUM_CLAUSE = """
  AND (position(:reg_num in arv.registration_number) > 0 OR
       EXISTS (SELECT arv2.financing_id
@@ -318,6 +323,8 @@ class AccountRegistrationParams:
     status_type: str = None
     client_reference_id: str = None
     registering_name: str = None
+    cursor_ts = None
+    cursor_id: int = None
 
     def __init__(self, account_id, collapse: bool = False, account_name: str = None, sbc_staff: bool = False):
         """Set common base initialization."""
@@ -326,6 +333,18 @@ class AccountRegistrationParams:
         self.collapse = collapse
         self.sbc_staff = sbc_staff
 
+    def has_keyset_order(self) -> bool:
+        """Check if the results are ordered by registration timestamp, so a page can start after a cursor."""
+        return PARAM_TO_ORDER_BY.get(self.sort_criteria, "registration_ts") == "registration_ts"
+
+    def is_keyset_ascending(self) -> bool:
+        """Check if the results are ordered by registration timestamp in ascending order."""
+        return (
+            self.sort_criteria in PARAM_TO_ORDER_BY
+            and self.has_keyset_order()
+            and self.sort_direction in ("asc", "ascending")
+        )
+
 
 def can_access_report(account_id: str, account_name: str, reg_json, sbc_staff: bool = False) -> bool:
     """Determine if request account can view the registration verification statement."""
@@ -537,11 +556,27 @@ def build_account_reg_query(params: AccountRegistrationParams) -> str:
         query = model_utils.QUERY_ACCOUNT_BASE_REG_FILTER.replace("QUERY_ACCOUNT_BASE_REG_SUBQUERY", base_query)
     else:
         query = "SELECT * FROM (" + base_query + ") AS q "
+    if params.has_keyset_order():
+        return build_account_reg_keyset_clause(params, query)
     query += order_by
     query += QUERY_ACCOUNT_REG_LIMIT
     return query
 
 
+def build_account_reg_keyset_clause(params: AccountRegistrationParams, query: str) -> str:
+    """Add the order by registration timestamp and id and the page cursor or offset to the account query.
+
+    If the request has a page cursor the page starts after the cursor registration instead of at a page offset.
+    """
+    ascending: bool = params.is_keyset_ascending()
+    if params.cursor_id:
+        query += QUERY_ACCOUNT_REG_KEYSET_ASC if ascending else QUERY_ACCOUNT_REG_KEYSET_DESC
+    query += QUERY_ACCOUNT_REG_KEYSET_ORDER_ASC if ascending else QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC
+    if params.cursor_id:
+        return query + QUERY_ACCOUNT_REG_KEYSET_LIMIT
+    return query + QUERY_ACCOUNT_REG_LIMIT
+
+
 def build_account_change_query(params: AccountRegistrationParams, base_json: dict = None) -> str:
     """Build the account registration change query from the provided parameters."""
     if base_json:  # and params.start_date_time and params.end_date_time:
@@ -572,6 +607,9 @@ def build_account_query_params(params: AccountRegistrationParams, api_filter: bo
     else:
         page_offset = (page_offset - 1) * page_size
     query_params = {"query_account": params.account_id, "page_size": page_size, "page_offset": page_offset}
+    if params.cursor_id and params.has_keyset_order():
+        query_params["cursor_ts"] = params.cursor_ts
+        query_params["cursor_id"] = params.cursor_id
     if params.registration_number:
         query_params["reg_num"] = params.registration_number.upper()
     if params.registration_type:
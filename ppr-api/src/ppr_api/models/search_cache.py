@@ -0,0 +1,135 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the opt-in, in-process cache of search query (search step 1) results.
+
+Entries are keyed by the search query bind values and are only valid for the registry data version they were created
+with. The data version is a database sequence bumped after the registration changes commit, so results read before a
+commit are never tagged with the version that follows it. Entries are also evicted least recently used first and after
+a time to live, to bound the age of results that change without a registration (the PPR search 30 day
+discharge/expiry window).
+
+This module is mirrored in the ppr-api and mhr-api packages: keep the copies identical apart from the package
+imports.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+from sqlalchemy.sql import text
+
+from ppr_api.exceptions import DatabaseException
+from ppr_api.models import search_utils
+from ppr_api.utils.logging import logger
+
+from .db import db
+
+
+class SearchCache:
+    """Bounded least recently used search results cache with hit/miss counters."""
+
+    def __init__(self, max_size: int = 1000, ttl: int = 300):
+        """Create an empty cache holding at most max_size entries for at most ttl seconds."""
+        self.max_size: int = max_size
+        self.ttl: int = ttl
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get(self, key: tuple, data_version: int):
+        """Return a copy of the cached value for the key and data version, or None."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] == data_version and entry[1] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[2])
+            if entry:  # Stale: created with a previous data version or expired.
+                del self.entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, data_version: int, value):
+        """Add or replace the value for the key, evicting the least recently used entries when full."""
+        if self.max_size < 1:
+            return
+        with self.lock:
+            self.entries[key] = (data_version, time.monotonic() + self.ttl, copy.deepcopy(value))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return the cache size and counters."""
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+search_cache = SearchCache(0, 0)
+
+
+def is_enabled() -> bool:
+    """Check the configuration: if enabled size the cache from the configuration on first use."""
+    if not current_app.config.get("SEARCH_CACHE_ENABLED"):
+        return False
+    if search_cache.max_size < 1:
+        search_cache.max_size = int(current_app.config.get("SEARCH_CACHE_MAX_SIZE", 1000))
+        search_cache.ttl = int(current_app.config.get("SEARCH_CACHE_TTL", 300))
+    return True
+
+
+def get_data_version() -> int:
+    """Get the current registry data version: reading the sequence does not lock."""
+    try:
+        result = db.session.execute(text(search_utils.QUERY_DATA_VERSION))
+        row = result.first()
+        return int(row[0]) if row else 0
+    except Exception as db_exception:  # noqa: B902; return nicer error
+        logger.error(f"DB get_data_version exception: {db_exception}")
+        raise DatabaseException(db_exception) from db_exception
+
+
+def update_data_version():
+    """Bump the registry data version after registration changes commit if the cache is enabled.
+
+    The sequence is not transactional: bumping it before the commit could tag results read before the commit with the
+    new version. The registration is already committed, so errors are logged and the TTL bounds the result age.
+    """
+    if not is_enabled():
+        return
+    try:
+        db.session.execute(text(search_utils.UPDATE_DATA_VERSION))
+        db.session.commit()
+    except Exception as db_exception:  # noqa: B902; the registration is committed
+        logger.error(f"DB update_data_version exception: {db_exception}")
+        db.session.rollback()
@@ -33,6 +33,7 @@ from ppr_api.models import (
     search_utils,
 )
 from ppr_api.models import utils as model_utils
+from ppr_api.models.search_selection import SelectionIndex, build_selection_details
 from ppr_api.utils.logging import logger
 
 SEARCH_HISTORICAL_ID_QUERY = """
@@ -486,18 +487,13 @@ def create_from_search_query(search_query: SearchRequest, search_reg_id: int) ->
     query_results = search_query.search_response
     detail_results = []
     search_result.search_response = detail_results
+    statements = SearchResult.find_financing_statements(query_results)
+    index = SelectionIndex()
     for result in query_results:
         reg_num = result["baseRegistrationNumber"]
         match_type = result["matchType"]
-        found = False
-        if detail_results:  # Check for duplicates.
-            for statement in detail_results:
-                if statement["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                    found = True
-        if not found:  # No duplicates.
-            # Set to staff for small performance gain: skip account id/historical checks.
-            logger.debug(f"fetching registration for {reg_num}")
-            financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+        if index.add_seen(reg_num):  # No duplicates.
+            financing = SearchResult.get_financing_statement(statements, reg_num)
             financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
             # Set to true to include change history.
             financing.include_changes_json = True
@@ -741,24 +737,6 @@ def __is_edit_general_collateral(fin: FinancingStatement, registration_id: int,
 
 def update_details(search_result: SearchResult) -> dict:
     """Generate the search selection details from the search selection order without duplicates."""
-    results = search_result.search_response
-    new_results = []
-    similar_count = 0
-    # Use the same order as the search selection match list in the registration list.
-    for select in search_result.search_select:
-        if select["matchType"] == model_utils.SEARCH_MATCH_EXACT or ("selected" not in select or select["selected"]):
-            if select["matchType"] != model_utils.SEARCH_MATCH_EXACT:
-                similar_count += 1
-            reg_num = select["baseRegistrationNumber"]
-            found = False
-            if new_results:  # Check for duplicates.
-                for match in new_results:
-                    if match["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                        found = True
-            if not found:  # No duplicates.
-                for result in results:
-                    if reg_num == result["financingStatement"]["baseRegistrationNumber"]:
-                        new_results.append(result)
-                        break
+    new_results, similar_count = build_selection_details(search_result.search_select, search_result.search_response)
     search_result.similar_match_count = similar_count
     return new_results
@@ -24,11 +24,12 @@ from flask import current_app
 from sqlalchemy.sql import text
 
 from ppr_api.exceptions import BusinessException, DatabaseException
-from ppr_api.models import search_utils
+from ppr_api.models import search_cache, search_utils
 from ppr_api.models import utils as model_utils
 from ppr_api.models.search_utils import AccountSearchParams
 from ppr_api.utils.base import BaseEnum
 from ppr_api.utils.logging import logger
+from ppr_api.utils.metrics import SEARCH_RESULTS_SIZE
 from ppr_api.utils.validators import valid_charset
 
 from .db import db
@@ -69,6 +70,9 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     user_id = db.mapped_column("user_id", db.String(1000), nullable=True)
     updated_selection = db.mapped_column("updated_selection", db.JSON, nullable=True)
     search_value = db.mapped_column("search_value", db.String(320), nullable=True, index=True)
+    # Account search history summary values: set when the search is saved.
+    history_criteria = db.mapped_column("history_criteria", db.String(1000), nullable=True)
+    history_username = db.mapped_column("history_username", db.String(1000), nullable=True)
 
     pay_invoice_id = db.mapped_column("pay_invoice_id", db.Integer, nullable=True)
     pay_path = db.mapped_column("pay_path", db.String(256), nullable=True)
@@ -83,6 +87,8 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     )
 
     request_json = {}
+    # Number of exact matches in the search results: not persisted.
+    exact_results_size: int = 0
 
     @property
     def json(self) -> dict:
@@ -111,12 +117,26 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     def save(self):
         """Render a search query to the local cache."""
         try:
+            self.set_history_summary()
             db.session.add(self)
             db.session.commit()
         except Exception as db_exception:
             logger.error("DB search_client save exception: " + str(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
+    def set_history_summary(self):
+        """Set the account search history summary values so the history query does not derive them per request."""
+        if self.history_username is None:
+            self.history_criteria = search_utils.get_history_criteria(self.search_type, self.search_criteria)
+            self.history_username = ""
+            if self.user_id:
+                result = db.session.execute(text(search_utils.QUERY_HISTORY_USERNAME), {"user_id": self.user_id})
+                row = result.first()
+                if row and row[0]:
+                    self.history_username = str(row[0])
+        if self.search_result:  # The exact match count depends on the updated selection.
+            self.search_result.set_history_counts(self)
+
     def update_search_selection(self, search_json):
         """Support UI search selection autosave: replace search response."""
         # Audit requirement: save original search summary results (before consumer selects registrations to include).
@@ -129,7 +149,10 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
         reg_num = self.request_json["criteria"]["value"]
         row = None
         try:
-            result = db.session.execute(text(search_utils.REG_NUM_QUERY), {"query_value": reg_num.strip().upper()})
+            result = db.session.execute(
+                text(get_search_query(search_utils.REG_NUM_QUERY)),
+                {"query_value": search_utils.get_query_values(self.request_json)[0]},
+            )
             row = result.first()
         except Exception as db_exception:  # noqa: B902; return nicer error
             logger.error("DB search_by_registration_number exception: " + str(db_exception))
@@ -159,16 +182,13 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
 
     def search_by_serial_type(self):
         """Execute a search query for either an aircraft DOT, MHR number, or serial number search type."""
-        search_value = self.request_json["criteria"]["value"]
-        query = search_utils.SERIAL_NUM_QUERY
-        if self.search_type == "MH":
-            query = search_utils.MHR_NUM_QUERY
-            query = query.replace("CASE WHEN serial_number", "CASE WHEN mhr_number")
-        elif self.search_type == "AC":
-            query = search_utils.AIRCRAFT_DOT_QUERY
+        search_value = search_utils.get_query_values(self.request_json)[0]
         rows = None
         try:
-            result = db.session.execute(text(query), {"query_value": search_value.strip().upper()})
+            result = db.session.execute(
+                text(get_serial_search_query(self.search_type)),
+                {"query_value": search_value},
+            )
             rows = result.fetchall()
         except Exception as db_exception:  # noqa: B902; return nicer error
             logger.error("DB search_by_serial_type exception: " + str(db_exception))
@@ -200,23 +220,20 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 }
                 results_json.append(result_json)
 
-            self.returned_results_size = len(results_json)
-            self.total_results_size = self.returned_results_size
-            if self.returned_results_size > 0:
-                self.search_response = results_json
+            self.set_results(rows, results_json)
         else:
             self.returned_results_size = 0
             self.total_results_size = 0
 
     def search_by_business_name(self):
         """Execute a debtor business name search query."""
-        search_value = self.request_json["criteria"]["debtorName"]["business"]
+        search_value = search_utils.get_query_values(self.request_json)[0]
         rows = None
         try:
             result = db.session.execute(
-                text(search_utils.BUSINESS_NAME_QUERY),
+                text(get_search_query(search_utils.BUSINESS_NAME_QUERY)),
                 {
-                    "query_bus_name": search_value.strip().upper(),
+                    "query_bus_name": search_value,
                     "query_bus_quotient": current_app.config.get("SIMILARITY_QUOTIENT_BUSINESS_NAME"),
                 },
             )
@@ -239,10 +256,7 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 }
                 results_json.append(result_json)
 
-            self.returned_results_size = len(results_json)
-            self.total_results_size = self.returned_results_size
-            if self.returned_results_size > 0:
-                self.search_response = results_json
+            self.set_results(rows, results_json)
         else:
             self.returned_results_size = 0
             self.total_results_size = 0
@@ -250,23 +264,19 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     def search_by_individual_name(self):  # pylint: disable=too-many-locals; easier to follow
         """Execute a debtor individual name search query."""
         result = None
-        middle_name = None
-        last_name = self.request_json["criteria"]["debtorName"]["last"]
-        first_name = self.request_json["criteria"]["debtorName"]["first"]
+        last_name, first_name, middle_name = search_utils.get_query_values(self.request_json)
         quotient_first = current_app.config.get("SIMILARITY_QUOTIENT_FIRST_NAME")
         quotient_last = current_app.config.get("SIMILARITY_QUOTIENT_LAST_NAME")
         quotient_default = current_app.config.get("SIMILARITY_QUOTIENT_DEFAULT")
-        if "second" in self.request_json["criteria"]["debtorName"]:
-            middle_name = self.request_json["criteria"]["debtorName"]["second"]
         rows = None
         try:
-            if middle_name is not None and middle_name.strip() != "" and middle_name.strip().upper() != "NONE":
+            if middle_name:
                 result = db.session.execute(
-                    text(search_utils.INDIVIDUAL_NAME_MIDDLE_QUERY),
+                    text(get_search_query(search_utils.INDIVIDUAL_NAME_MIDDLE_QUERY)),
                     {
-                        "query_last": last_name.strip().upper(),
-                        "query_first": first_name.strip().upper(),
-                        "query_middle": middle_name.strip().upper(),
+                        "query_last": last_name,
+                        "query_first": first_name,
+                        "query_middle": middle_name,
                         "query_last_quotient": quotient_last,
                         "query_first_quotient": quotient_first,
                         "query_default_quotient": quotient_default,
@@ -274,10 +284,10 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 )
             else:
                 result = db.session.execute(
-                    text(search_utils.INDIVIDUAL_NAME_QUERY),
+                    text(get_search_query(search_utils.INDIVIDUAL_NAME_QUERY)),
                     {
-                        "query_last": last_name.strip().upper(),
-                        "query_first": first_name.strip().upper(),
+                        "query_last": last_name,
+                        "query_first": first_name,
                         "query_last_quotient": quotient_last,
                         "query_first_quotient": quotient_first,
                         "query_default_quotient": quotient_default,
@@ -307,65 +317,87 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 }
                 results_json.append(result_json)
 
-            self.returned_results_size = len(results_json)
-            self.total_results_size = self.returned_results_size
-            if self.returned_results_size > 0:
-                self.search_response = results_json
+            self.set_results(rows, results_json)
         else:
             self.returned_results_size = 0
             self.total_results_size = 0
 
-    def get_total_count(self):
-        """Execute a search to get the total match count for the search criteria. Only call if limit reached."""
-        query_text = search_utils.COUNT_QUERY_FROM_SEARCH_TYPE[self.search_type]
-        if query_text:
-            count_query = text(query_text)
-            result = None
-            if self.search_type == self.SearchTypes.BUSINESS_DEBTOR.value:
-                search_value = self.request_json["criteria"]["debtorName"]["business"]
-                quotient = current_app.config.get("SIMILARITY_QUOTIENT_BUSINESS_NAME")
-                result = db.session.execute(
-                    count_query, {"query_bus_name": search_value, "query_bus_quotient": quotient}
-                )
-            elif self.search_type == self.SearchTypes.INDIVIDUAL_DEBTOR.value:
-                last_name = self.request_json["criteria"]["debtorName"]["last"]
-                first_name = self.request_json["criteria"]["debtorName"]["first"]
-                quotient_first = current_app.config.get("SIMILARITY_QUOTIENT_FIRST_NAME")
-                quotient_last = current_app.config.get("SIMILARITY_QUOTIENT_LAST_NAME")
-                quotient_default = current_app.config.get("SIMILARITY_QUOTIENT_DEFAULT")
-                result = db.session.execute(
-                    count_query,
-                    {
-                        "query_last": last_name.strip().upper(),
-                        "query_first": first_name.strip().upper(),
-                        "query_first_quotient": quotient_first,
-                        "query_last_quotient": quotient_last,
-                        "query_default_quotient": quotient_default,
-                    },
-                )
-            else:
-                search_value = self.request_json["criteria"]["value"]
-                result = db.session.execute(count_query, {"query_value": search_value})
-
-            if result:
-                row = result.first()
-                self.total_results_size = int(row[0])
+    def set_results(self, rows, results_json: list):
+        """Set the search results and sizes: every row has the total and exact match counts as the last 2 columns."""
+        self.returned_results_size = len(results_json)
+        self.total_results_size = self.returned_results_size
+        self.exact_results_size = 0
+        if self.returned_results_size > 0:
+            self.search_response = results_json
+            self.total_results_size = int(rows[0][-2])
+            self.exact_results_size = int(rows[0][-1])
+
+    def get_cache_key(self) -> tuple:
+        """Build the search results cache key from the search query bind values and the search configuration.
+
+        Only criteria that bind the same query values share an entry: the values are not reduced to the searchkey_*
+        db function keys because the queries also use them directly (name designations, word counts, similarity).
+        """
+        values = search_utils.get_query_values(self.request_json)
+        if self.search_type == self.SearchTypes.REGISTRATION_NUM.value:
+            # The response includes the registration number as submitted.
+            values += (self.request_json["criteria"]["value"],)
+        return (
+            self.search_type,
+            values,
+            current_app.config.get("SIMILARITY_QUOTIENT_BUSINESS_NAME"),
+            current_app.config.get("SIMILARITY_QUOTIENT_FIRST_NAME"),
+            current_app.config.get("SIMILARITY_QUOTIENT_LAST_NAME"),
+            current_app.config.get("SIMILARITY_QUOTIENT_DEFAULT"),
+            current_app.config.get("SEARCH_FINANCING_FILTER"),
+        )
 
     def search(self):
         """Execute a search with the previously set search type and criteria."""
-        if self.search_type == self.SearchTypes.REGISTRATION_NUM.value:
-            self.search_by_registration_number()
-        elif self.search_type == self.SearchTypes.MANUFACTURED_HOME_NUM.value:
+        if self.search_type == self.SearchTypes.MANUFACTURED_HOME_NUM.value:
             # Format before searching
             search_utils.format_mhr_number(self.request_json)
-            self.search_by_serial_type()
-        elif self.search_type in (self.SearchTypes.SERIAL_NUM.value, self.SearchTypes.AIRCRAFT_AIRFRAME_DOT.value):
+        cache_key = None
+        data_version = None
+        if search_cache.is_enabled():
+            cache_key = self.get_cache_key()
+            data_version = search_cache.get_data_version()
+            cached = search_cache.search_cache.get(cache_key, data_version)
+            if cached:
+                self.search_response = cached.get("searchResponse")
+                self.total_results_size = cached.get("totalResultsSize")
+                self.returned_results_size = cached.get("returnedResultsSize")
+                self.exact_results_size = cached.get("exactResultsSize")
+                self.save()
+                SEARCH_RESULTS_SIZE.observe(
+                    self.returned_results_size or 0, search_type=self.search_type, stage="query"
+                )
+                return
+        if self.search_type == self.SearchTypes.REGISTRATION_NUM.value:
+            self.search_by_registration_number()
+        elif self.search_type in (
+            self.SearchTypes.MANUFACTURED_HOME_NUM.value,
+            self.SearchTypes.SERIAL_NUM.value,
+            self.SearchTypes.AIRCRAFT_AIRFRAME_DOT.value,
+        ):
             self.search_by_serial_type()
         elif self.search_type == self.SearchTypes.BUSINESS_DEBTOR.value:
             self.search_by_business_name()
         else:
             self.search_by_individual_name()
+        if cache_key:
+            search_cache.search_cache.put(
+                cache_key,
+                data_version,
+                {
+                    "searchResponse": self.search_response,
+                    "totalResultsSize": self.total_results_size,
+                    "returnedResultsSize": self.returned_results_size,
+                    "exactResultsSize": self.exact_results_size,
+                },
+            )
         self.save()
+        SEARCH_RESULTS_SIZE.observe(self.returned_results_size or 0, search_type=self.search_type, stage="query")
 
     @classmethod
     def find_by_id(cls, search_id: int):
@@ -400,6 +432,9 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
                 history_list.append(build_search_history_json(row, from_ui))
         if history_list:
             history_list[0]["searchHistoryTotal"] = count
+            # A full page ordered by timestamp and id: the next page starts after the last search.
+            if params.has_keyset_order() and len(rows) == query_params["page_size"]:
+                history_list[0]["nextCursor"] = model_utils.encode_page_cursor(rows[-1][1], rows[-1][0])
         return history_list
 
     @classmethod
@@ -500,7 +535,22 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
         return error_msg
 
 
-@staticmethod
+def get_search_query(query_template: str) -> str:
+    """Get the search query with the financing statement filter clauses for the configured filter mode."""
+    filter_mode = current_app.config.get("SEARCH_FINANCING_FILTER", search_utils.SEARCH_FILTER_LEGACY)
+    return search_utils.build_search_query(query_template, filter_mode)
+
+
+def get_serial_search_query(search_type: str) -> str:
+    """Get the serial collateral search query for a serial number, MHR number, or aircraft DOT search type."""
+    if search_type == "MH":
+        query = get_search_query(search_utils.MHR_NUM_QUERY)
+        return query.replace("CASE WHEN serial_number", "CASE WHEN mhr_number")
+    if search_type == "AC":
+        return get_search_query(search_utils.AIRCRAFT_DOT_QUERY)
+    return get_search_query(search_utils.SERIAL_NUM_QUERY)
+
+
 def build_search_history_query(account_id: str, history_params) -> str:
     """Build the account search history query based on the request parameters."""
     from_ui: bool = history_params.get("from_ui")
@@ -535,7 +585,7 @@ def build_search_history_json(row, from_ui: bool) -> dict:
     }
     if from_ui:
         # if api_result is null then the selections have not been finished
-        search["inProgress"] = not row[11] and row[11] != [] and search["totalResultsSize"] > 0
+        search["inProgress"] = bool(row[11]) and search["totalResultsSize"] > 0
         search["userId"] = str(row[12])
         if row[13] and int(row[13]) == PAY_PENDING:
             search["paymentPending"] = True
@@ -23,11 +23,13 @@ from flask import current_app
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from ppr_api.models import utils as model_utils
 from ppr_api.utils.logging import logger
+from ppr_api.utils.metrics import SEARCH_RESULTS_SIZE
 
 from .db import db
 from .financing_statement import FinancingStatement
 from .search_request import SearchRequest
-from .search_utils import GET_HISTORY_DAYS_LIMIT
+from .search_selection import SelectionIndex, build_selection_details
+from .search_utils import GET_HISTORY_DAYS_LIMIT, get_history_exact_count
 
 # PPR UI search detail report callbackURL parameter: skip notification is request originates from UI.
 UI_CALLBACK_URL = "PPR_UI"
@@ -50,6 +52,9 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     score = db.mapped_column("score", db.Integer, nullable=True)
     exact_match_count = db.mapped_column("exact_match_count", db.Integer, nullable=True)
     similar_match_count = db.mapped_column("similar_match_count", db.Integer, nullable=True)
+    # Account search history summary values: set when the search selection is saved.
+    selected_match_count = db.mapped_column("selected_match_count", db.Integer, nullable=True)
+    selected_exact_count = db.mapped_column("selected_exact_count", db.Integer, nullable=True)
     # large async report requests capture callbackURL
     callback_url = db.mapped_column("callback_url", db.String(1000), nullable=True)
     # large async report requests event listener updates when pdf generated and saved to document storage.
@@ -84,12 +89,22 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     def save(self):
         """Render a search results detail information to the local cache."""
         try:
+            self.set_history_counts()
             db.session.add(self)
             db.session.commit()
         except Exception as db_exception:  # noqa: B902; just logging
             logger.error("DB search_result save exception: " + repr(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
+    def set_history_counts(self, search: SearchRequest = None):
+        """Set the account search history selected and exact match counts from the current selection."""
+        search = search if search else self.search
+        selection = self.search_select
+        if search and search.updated_selection is not None:
+            selection = search.updated_selection
+        self.selected_match_count = len(self.search_select) if self.search_select is not None else None
+        self.selected_exact_count = get_history_exact_count(search.search_type if search else None, selection)
+
     def update_selection(self, search_select, account_name: str = None, callback_url: str = None):
         """Update the set of search details from the search query selection.
 
@@ -119,6 +134,7 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         detail_response["totalResultsSize"] = self.exact_match_count + self.similar_match_count
         detail_response["details"] = new_results
         self.search_response = detail_response
+        SEARCH_RESULTS_SIZE.observe(len(new_results), search_type=self.search.search_type, stage="selection")
         if account_name:
             self.account_name = account_name
         if callback_url:
@@ -148,27 +164,7 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
     def build_details(self):
         """Generate the search selection details from the search selection order without duplicates."""
-        results = self.search_response
-        new_results = []
-        similar_count = 0
-        # Use the same order as the search selection match list in the registration list.
-        for select in self.search_select:
-            if select["matchType"] == model_utils.SEARCH_MATCH_EXACT or (
-                "selected" not in select or select["selected"]
-            ):
-                if select["matchType"] != model_utils.SEARCH_MATCH_EXACT:
-                    similar_count += 1
-                reg_num = select["baseRegistrationNumber"]
-                found = False
-                if new_results:  # Check for duplicates.
-                    for match in new_results:
-                        if match["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                            found = True
-                if not found:  # No duplicates.
-                    for result in results:
-                        if reg_num == result["financingStatement"]["baseRegistrationNumber"]:
-                            new_results.append(result)
-                            break
+        new_results, similar_count = build_selection_details(self.search_select, self.search_response)
         self.similar_match_count = similar_count
         return new_results
 
@@ -181,18 +177,17 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         # Remove duplicates
         reg_list = list(dict.fromkeys(reg_list))
         update_select = []
+        similar_select = []
         # Always use original exact matches
         for original in original_select:
             if original["matchType"] == model_utils.SEARCH_MATCH_EXACT:
                 update_select.append(original)
+            else:
+                similar_select.append(original)
         # Set similar matches with no duplicates.
+        similar_index = SelectionIndex(similar_select, lambda item: item["baseRegistrationNumber"])
         for reg_num in reg_list:
-            for original in original_select:
-                if (
-                    original["matchType"] != model_utils.SEARCH_MATCH_EXACT
-                    and original["baseRegistrationNumber"] == reg_num
-                ):
-                    update_select.append(original)
+            update_select.extend(similar_index.all(reg_num))
 
         # Now sort by search type.
         if self.search.search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
@@ -330,18 +325,14 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
         search_result = SearchResult(search_id=search_query.id, exact_match_count=0, similar_match_count=0)
         query_results = search_query.search_response
+        statements = SearchResult.find_financing_statements(query_results)
         detail_results = []
+        index = SelectionIndex()
         for result in query_results:
             reg_num = result["baseRegistrationNumber"]
             match_type = result["matchType"]
-            found = False
-            if detail_results:  # Check for duplicates.
-                for statement in detail_results:
-                    if statement["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                        found = True
-            if not found:  # No duplicates.
-                # Set to staff for small performance gain: skip account id/historical checks.
-                financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+            if index.add_seen(reg_num):  # No duplicates.
+                financing = SearchResult.get_financing_statement(statements, reg_num)
                 financing.mark_update_json = mark_added  # Added for PDF, indicate if party or collateral was added.
                 # Set to true to include change history.
                 financing.include_changes_json = True
@@ -361,11 +352,11 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         search = SearchResult()
         search.search_id = search_id
         search.search_select = search_json
+        statements = SearchResult.find_financing_statements(search_json)
         detail_results = []
         for result in search_json:
             reg_num = result["baseRegistrationNumber"]
-            # Set to staff for small performance gain: skip account id/historical checks.
-            financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+            financing = SearchResult.get_financing_statement(statements, reg_num)
             # Set to true to include change history.
             financing.include_changes_json = True
             financing_json = {"financingStatement": financing.json}
@@ -374,6 +365,28 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
         return search
 
+    @staticmethod
+    def find_financing_statements(search_json) -> dict:
+        """Bulk load the financing statements for all search matches, keyed by base registration number.
+
+        Loaded as staff for small performance gain: skip account id/historical checks.
+        """
+        reg_nums = [result["baseRegistrationNumber"] for result in search_json]
+        return FinancingStatement.find_all_by_registration_numbers(reg_nums)
+
+    @staticmethod
+    def get_financing_statement(statements: dict, reg_num: str) -> FinancingStatement:
+        """Get a bulk loaded financing statement by base registration number: not found is an error."""
+        financing = statements.get(reg_num)
+        if not financing:
+            raise BusinessException(
+                error=model_utils.ERR_FINANCING_NOT_FOUND.format(
+                    code=ResourceErrorCodes.NOT_FOUND_ERR.value, registration_num=reg_num
+                ),
+                status_code=HTTPStatus.NOT_FOUND,
+            )
+        return financing
+
     @staticmethod
     def validate_search_select(select_json, search_id: int):  # pylint: disable=unused-argument
         """Perform any extra data validation here.
@@ -0,0 +1,80 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the search selection index used when building search results details (search step 2).
+
+Search matches and search details are matched by registration number: the index replaces nested list scans
+with dictionary lookups, so building details is linear in the number of search matches.
+"""
+from typing import Callable
+
+from ppr_api.models import utils as model_utils
+
+
+class SelectionIndex:
+    """Maintain a registration number to list position index and a set of registration numbers already used."""
+
+    def __init__(self, items: list = None, key: Callable = None):
+        """Index the items by key, preserving the list order of items that share a key."""
+        self.items: list = items or []
+        self.positions: dict = {}
+        self.seen: set = set()
+        if key:
+            for position, item in enumerate(self.items):
+                self.positions.setdefault(key(item), []).append(position)
+
+    def __contains__(self, key) -> bool:
+        """Return True if at least one item has the key."""
+        return key in self.positions
+
+    def first(self, key):
+        """Return the first item with the key, or None if no item has the key."""
+        positions = self.positions.get(key)
+        return self.items[positions[0]] if positions else None
+
+    def all(self, key) -> list:
+        """Return all items with the key in list order."""
+        return [self.items[position] for position in self.positions.get(key, [])]
+
+    def add_seen(self, key) -> bool:
+        """Record the key as used: return False if the key is a duplicate that has already been used."""
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+
+def financing_reg_num(result: dict) -> str:
+    """Return the base registration number of a search details financing statement result."""
+    return result["financingStatement"]["baseRegistrationNumber"]
+
+
+def build_selection_details(search_select: list, results: list) -> tuple:
+    """Generate the search selection details from the search selection order without duplicates.
+
+    Returns a tuple of the new results list and the number of selected similar matches.
+    """
+    index = SelectionIndex(results, financing_reg_num)
+    new_results = []
+    similar_count = 0
+    # Use the same order as the search selection match list in the registration list.
+    for select in search_select:
+        if select["matchType"] == model_utils.SEARCH_MATCH_EXACT or ("selected" not in select or select["selected"]):
+            if select["matchType"] != model_utils.SEARCH_MATCH_EXACT:
+                similar_count += 1
+            reg_num = select["baseRegistrationNumber"]
+            if index.add_seen(reg_num):  # No duplicates.
+                result = index.first(reg_num)
+                if result:
+                    new_results.append(result)
+    return new_results, similar_count
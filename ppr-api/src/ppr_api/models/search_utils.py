@@ -15,6 +15,8 @@
 
 Search constants and helper functions.
 """
+from functools import lru_cache
+
 from ppr_api.models import utils as model_utils
 
 # flake8: noqa Q000,E122,E131
@@ -38,6 +40,7 @@ RESULTS_SIZE_LIMIT_CLAUSE = "FETCH FIRST :max_results_size ROWS ONLY"
 FROM_UI_PARAM = "fromUI"
 FROM_UI_PARAM2 = "from_ui"
 PAGE_NUM_PARAM = "pageNumber"
+CURSOR_PARAM = "cursor"
 SORT_DIRECTION_PARAM = "sortDirection"
 SORT_CRITERIA_PARAM = "sortCriteriaName"
 START_TS_PARAM = "startDateTime"
@@ -68,6 +71,7 @@ TO_FILTER_SEARCH_TYPE = {
 }
 FILTER_SEARCH_TYPE_PPR = "PPR"
 FILTER_SEARCH_TYPE_MHR = "MHR"
+MHR_SEARCH_TYPES = ("MM", "MI", "MO", "MS")
 
 SEARCH_ORDER_BY_DATE = " ORDER BY search_ts"
 SEARCH_ORDER_BY_CLIENT_REF = " ORDER BY client_reference_id"
@@ -75,6 +79,10 @@ SEARCH_ORDER_BY_USERNAME = " ORDER BY username"
 SEARCH_ORDER_BY_SEARCH_TYPE = " ORDER BY search_type"
 SEARCH_ORDER_BY_SEARCH_CRITERIA = " ORDER BY search_criteria"
 SEARCH_ORDER_BY_DEFAULT = " ORDER BY search_ts DESC"
+SEARCH_ORDER_BY_KEYSET_DESC = " ORDER BY search_ts DESC, id DESC"
+SEARCH_ORDER_BY_KEYSET_ASC = " ORDER BY search_ts ASC, id ASC"
+SEARCH_FILTER_KEYSET_DESC = " AND (sc.search_ts, sc.id) < (:cursor_ts, :cursor_id)"
+SEARCH_FILTER_KEYSET_ASC = " AND (sc.search_ts, sc.id) > (:cursor_ts, :cursor_id)"
 SEARCH_FILTER_CLIENT_REF = "  AND position(:query_client_ref in UPPER(client_reference_id)) > 0"
 SEARCH_FILTER_USERNAME = " WHERE position(:query_username in UPPER(username)) > 0"
 SEARCH_FILTER_DATE = " AND search_ts BETWEEN :query_start AND :query_end"
@@ -97,6 +105,67 @@ QUERY_ACCOUNT_FILTER_BY = {
     SEARCH_CRITERIA_PARAM: SEARCH_FILTER_CRITERIA_DEFAULT,
 }
 
+# Financing statement search filter modes: LEGACY evaluates the expiry date and discharge history of every candidate
+# row, TABLE joins to the maintained searchable_financing_statements table.
+SEARCH_FILTER_LEGACY = "LEGACY"
+SEARCH_FILTER_TABLE = "TABLE"
+# Search query templates include the financing statement searchable join and filter clauses for the filter mode.
+SEARCH_FILTER_CLAUSES = {
+    SEARCH_FILTER_LEGACY: {
+        "searchable_from": "",
+        "searchable_where": """   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND NOT EXISTS (SELECT r3.id
+                     FROM registrations r3
+                    WHERE r3.financing_id = fs.id
+                      AND r3.registration_type_cl = 'DISCHARGE'
+                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))""",
+    },
+    SEARCH_FILTER_TABLE: {
+        "searchable_from": ", searchable_financing_statements sfs",
+        "searchable_where": """   AND sfs.financing_id = fs.id
+   AND (sfs.expire_date IS NULL OR sfs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND (sfs.discharge_ts IS NULL OR sfs.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))""",
+    },
+}
+
+# Searchable financing statements maintenance: one row per financing statement that is not expired or discharged
+# more than 30 days. Discharge timestamp is the earliest discharge registration timestamp.
+SEARCHABLE_UPSERT = """
+INSERT INTO searchable_financing_statements(financing_id, expire_date, discharge_ts, update_ts)
+SELECT fs.id, fs.expire_date,
+       (SELECT MIN(r.registration_ts)
+          FROM registrations r
+         WHERE r.financing_id = fs.id
+           AND r.registration_type_cl = 'DISCHARGE') AS discharge_ts,
+       (now() at time zone 'utc')
+  FROM financing_statements fs
+ WHERE fs.id = :financing_id
+ON CONFLICT (financing_id) DO UPDATE
+   SET expire_date = EXCLUDED.expire_date, discharge_ts = EXCLUDED.discharge_ts, update_ts = EXCLUDED.update_ts
+"""
+# The reconcile SQL is defined once in the searchable_financing_statements_reconcile db function.
+SEARCHABLE_RECONCILE = "SELECT deleted_count, updated_count FROM searchable_financing_statements_reconcile()"
+
+# Search queries with match counts: the window aggregates return the total and exact match counts in the same pass as
+# the results. Order by the search query output column names.
+SEARCH_COUNT_SELECT = """
+SELECT m.*, COUNT(*) OVER () AS total_results_size,
+       COUNT(*) FILTER (WHERE m.match_type = 'EXACT') OVER () AS exact_results_size
+  FROM ("""
+SEARCH_COUNT_END = """) m
+"""
+SERIAL_SEARCH_ORDER = """ORDER BY match_type, serial_number ASC, year ASC, base_registration_ts ASC
+"""
+BUSINESS_NAME_ORDER = """ORDER BY match_type, business_name ASC, base_registration_ts ASC
+"""
+INDIVIDUAL_NAME_ORDER = """ORDER BY match_type, last_name ASC, first_name ASC, middle_initial ASC, birth_date ASC,
+         base_registration_ts ASC
+"""
+
+# Search results cache data version: a sequence bumped after registration changes commit, so it never locks.
+QUERY_DATA_VERSION = "SELECT last_value FROM ppr_search_data_version_seq"
+UPDATE_DATA_VERSION = "SELECT nextval('ppr_search_data_version_seq')"
+
 
 # Serial number search base where clause
 SERIAL_SEARCH_BASE = """
@@ -105,16 +174,11 @@ SELECT r.registration_type,r.registration_ts AS base_registration_ts,
         r.registration_number AS base_registration_num,
         CASE WHEN serial_number = :query_value THEN 'EXACT' ELSE 'SIMILAR' END match_type,
         fs.expire_date,fs.state_type,sc.id AS vehicle_id, sc.mhr_number
-  FROM registrations r, financing_statements fs, serial_collateral sc 
+  FROM registrations r, financing_statements fs{searchable_from}, serial_collateral sc 
  WHERE r.financing_id = fs.id
    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id 
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+{searchable_where}
    AND sc.financing_id = fs.id
    AND sc.registration_id_end IS NULL
 """
@@ -124,50 +188,53 @@ REG_NUM_QUERY = """
 SELECT r2.registration_type, r2.registration_ts AS base_registration_ts, 
        r2.registration_number AS base_registration_num,
        'EXACT' AS match_type, fs.state_type, fs.expire_date
-  FROM registrations r, financing_statements fs, registrations r2
+  FROM registrations r, financing_statements fs{searchable_from}, registrations r2
  WHERE r.financing_id = fs.id
    AND r2.financing_id = fs.id
    AND r2.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.registration_number = :query_value
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+{searchable_where}
 """
 
 # Equivalent logic as DB view search_by_mhr_num_vw, but API determines the where clause.
 MHR_NUM_QUERY = (
-    SERIAL_SEARCH_BASE
+    SEARCH_COUNT_SELECT
+    + SERIAL_SEARCH_BASE
     + """
    AND sc.serial_type = 'MH' 
    AND sc.mhr_number = (SELECT searchkey_mhr(:query_value)) 
-ORDER BY match_type, sc.serial_number ASC, sc.year ASC, r.registration_ts ASC
 """
+    + SEARCH_COUNT_END
+    + SERIAL_SEARCH_ORDER
 )
 
 # Equivalent logic as DB view search_by_serial_num_vw, but API determines the where clause.
 SERIAL_NUM_QUERY = (
-    SERIAL_SEARCH_BASE
+    SEARCH_COUNT_SELECT
+    + SERIAL_SEARCH_BASE
     + """
    AND sc.serial_type NOT IN ('AC', 'AF', 'AP')
    AND sc.srch_vin = (SELECT searchkey_vehicle(:query_value)) 
-ORDER BY match_type, sc.serial_number ASC, sc.year ASC, r.registration_ts ASC
 """
+    + SEARCH_COUNT_END
+    + SERIAL_SEARCH_ORDER
 )
 
 # Equivalent logic as DB view search_by_aircraft_dot_vw, but API determines the where clause.
 AIRCRAFT_DOT_QUERY = (
-    SERIAL_SEARCH_BASE
+    SEARCH_COUNT_SELECT
+    + SERIAL_SEARCH_BASE
     + """
    AND sc.serial_type IN ('AC', 'AF', 'AP')
    AND sc.srch_vin = (SELECT searchkey_aircraft(:query_value)) 
-ORDER BY match_type, sc.serial_number ASC, sc.year ASC, r.registration_ts ASC
 """
+    + SEARCH_COUNT_END
+    + SERIAL_SEARCH_ORDER
 )
 
-BUSINESS_NAME_QUERY = """
+BUSINESS_NAME_QUERY = (
+    SEARCH_COUNT_SELECT
+    + """
 WITH q AS (
    SELECT(SELECT searchkey_business_name(:query_bus_name)) AS search_key,
    SUBSTR((SELECT searchkey_business_name(:query_bus_name)),1,1) AS search_key_char1,
@@ -179,16 +246,11 @@ SELECT r.registration_type,r.registration_ts AS base_registration_ts,
        CASE WHEN p.bus_name_base = search_name_base THEN 'EXACT'
             ELSE 'SIMILAR' END match_type,
        fs.expire_date,fs.state_type,p.id
-  FROM registrations r, financing_statements fs, parties p, q
+  FROM registrations r, financing_statements fs{searchable_from}, parties p, q
 WHERE r.financing_id = fs.id
    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+{searchable_where}
    AND p.financing_id = fs.id
    AND p.registration_id_end IS NULL
    AND p.party_type = 'DB'
@@ -200,10 +262,14 @@ WHERE r.financing_id = fs.id
           OR (LENGTH(search_key) >= 3 AND LEVENSHTEIN(search_key, p.business_srch_key) <= 1) AND 
               p.bus_name_key_char1 = search_key_char1
     )
-ORDER BY match_type, p.business_name ASC, r.registration_ts ASC
 """
+    + SEARCH_COUNT_END
+    + BUSINESS_NAME_ORDER
+)
 
-INDIVIDUAL_NAME_QUERY = """
+INDIVIDUAL_NAME_QUERY = (
+    SEARCH_COUNT_SELECT
+    + """
 WITH q AS (SELECT(searchkey_last_name(:query_last)) AS search_last_key)
 SELECT r.registration_type,r.registration_ts AS base_registration_ts,
        p.last_name,p.first_name,p.middle_initial,p.id,
@@ -219,25 +285,24 @@ SELECT r.registration_type,r.registration_ts AS base_registration_ts,
                  AND p.first_name_char1 = LEFT(:query_first, 1) THEN 'EXACT'
             ELSE 'SIMILAR' END match_type,
        fs.expire_date,fs.state_type, p.birth_date
-  FROM registrations r, financing_statements fs, parties p, q
+  FROM registrations r, financing_statements fs{searchable_from}, parties p, q
 WHERE r.financing_id = fs.id
    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+{searchable_where}
    AND p.financing_id = fs.id
    AND p.registration_id_end IS NULL
    AND p.party_type = 'DI'
    AND p.id IN (SELECT * FROM unnest(match_individual_name(:query_last, :query_first, :query_last_quotient,
                                                            :query_first_quotient, :query_default_quotient))) 
-ORDER BY match_type, p.last_name ASC, p.first_name ASC, p.middle_initial ASC, p.birth_date ASC,  r.registration_ts ASC
 """
+    + SEARCH_COUNT_END
+    + INDIVIDUAL_NAME_ORDER
+)
 
-INDIVIDUAL_NAME_MIDDLE_QUERY = """
+INDIVIDUAL_NAME_MIDDLE_QUERY = (
+    SEARCH_COUNT_SELECT
+    + """
 WITH q AS (SELECT(searchkey_last_name(:query_last)) AS search_last_key)
 SELECT r.registration_type,r.registration_ts AS base_registration_ts,
        p.last_name,p.first_name,p.middle_initial,p.id,
@@ -258,106 +323,21 @@ SELECT r.registration_type,r.registration_ts AS base_registration_ts,
                  (p.middle_initial is NULL OR LEFT(p.middle_initial, 1) = LEFT(:query_middle, 1)) THEN 'EXACT'
             ELSE 'SIMILAR' END match_type,
        fs.expire_date,fs.state_type, p.birth_date
-  FROM registrations r, financing_statements fs, parties p, q
+  FROM registrations r, financing_statements fs{searchable_from}, parties p, q
 WHERE r.financing_id = fs.id
    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
-   AND p.financing_id = fs.id
-   AND p.registration_id_end IS NULL
-   AND p.party_type = 'DI'
-   AND p.id IN (SELECT * FROM unnest(match_individual_name(:query_last, :query_first, :query_last_quotient,
-                                                           :query_first_quotient, :query_default_quotient))) 
-ORDER BY match_type, p.last_name ASC, p.first_name ASC, p.middle_initial ASC, p.birth_date ASC,  r.registration_ts ASC
-"""
-
-# Total result count queries for serial number, debtor name searches:
-BUSINESS_NAME_TOTAL_COUNT = """
-WITH q AS (
-   SELECT searchkey_business_name(:query_bus_name) AS search_key
-)
-SELECT COUNT(r.id) AS query_count
-  FROM registrations r, financing_statements fs, parties p, q
- WHERE r.financing_id = fs.id
-   AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
-   AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
-   AND p.financing_id = fs.id
-   AND p.registration_id_end IS NULL
-   AND p.party_type = 'DB'
-   AND SUBSTR(search_key,1,1) = SUBSTR(p.business_name,1,1)
-   AND (SIMILARITY(search_key, p.business_srch_key) >= :query_bus_quotient OR p.business_srch_key = search_key)
-"""
-
-INDIVIDUAL_NAME_TOTAL_COUNT = """
-SELECT COUNT(r.id) AS query_count
-  FROM registrations r, financing_statements fs, parties p
- WHERE r.financing_id = fs.id
-   AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
-   AND r.base_reg_number IS NULL
-   AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-   AND NOT EXISTS (SELECT r3.id
-                     FROM registrations r3
-                    WHERE r3.financing_id = fs.id
-                      AND r3.registration_type_cl = 'DISCHARGE'
-                      AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
+{searchable_where}
    AND p.financing_id = fs.id
    AND p.registration_id_end IS NULL
    AND p.party_type = 'DI'
    AND p.id IN (SELECT * FROM unnest(match_individual_name(:query_last, :query_first, :query_last_quotient,
                                                            :query_first_quotient, :query_default_quotient))) 
 """
-
-SERIAL_SEARCH_COUNT_BASE = """
-SELECT COUNT(r.id) AS query_count
-  FROM registrations r, financing_statements fs, serial_collateral sc
-  WHERE r.financing_id = fs.id
-    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
-    AND r.base_reg_number IS NULL
-    AND (fs.expire_date IS NULL OR fs.expire_date > ((now() at time zone 'utc') - interval '30 days'))
-    AND NOT EXISTS (SELECT r3.id
-                      FROM registrations r3
-                     WHERE r3.financing_id = fs.id
-                       AND r3.registration_type_cl = 'DISCHARGE'
-                       AND r3.registration_ts < ((now() at time zone 'utc') - interval '30 days'))
-    AND sc.financing_id = fs.id
-    AND sc.registration_id_end IS NULL 
-"""
-
-MHR_NUM_TOTAL_COUNT = (
-    SERIAL_SEARCH_COUNT_BASE + " AND sc.serial_type = 'MH' " + "AND sc.mhr_number = searchkey_mhr(:query_value)"
-)
-
-SERIAL_NUM_TOTAL_COUNT = (
-    SERIAL_SEARCH_COUNT_BASE
-    + " AND sc.serial_type NOT IN ('AC', 'AF') "
-    + "AND sc.srch_vin = searchkey_vehicle(:query_value)"
+    + SEARCH_COUNT_END
+    + INDIVIDUAL_NAME_ORDER
 )
 
-AIRCRAFT_DOT_TOTAL_COUNT = (
-    SERIAL_SEARCH_COUNT_BASE
-    + " AND sc.serial_type IN ('AC', 'AF') "
-    + "AND sc.srch_vin = searchkey_aircraft(:query_value)"
-)
-
-COUNT_QUERY_FROM_SEARCH_TYPE = {
-    "AC": AIRCRAFT_DOT_TOTAL_COUNT,
-    "BS": BUSINESS_NAME_TOTAL_COUNT,
-    "IS": INDIVIDUAL_NAME_TOTAL_COUNT,
-    "MH": MHR_NUM_TOTAL_COUNT,
-    "SS": SERIAL_NUM_TOTAL_COUNT,
-}
-
 QUERY_ACCOUNT_HISTORY_TOTAL = f"""
 SELECT COUNT(sc.id)
 FROM search_requests sc, search_results sr
@@ -373,33 +353,13 @@ WHERE sc.id = sr.search_id
 
 ACCOUNT_SEARCH_HISTORY_BASE = f"""
 SELECT sc.id, sc.search_ts, sc.api_criteria, sc.total_results_size, sc.returned_results_size,
-  (SELECT CASE WHEN sc.search_type IN ('MM', 'MI', 'MO', 'MS') THEN -1
-               WHEN sc.updated_selection IS NULL THEN
-                    (SELECT COUNT(*) 
-                       FROM json_array_elements(sr.api_result) sr2
-                      WHERE sr2 ->> 'matchType' = 'EXACT')
-               ELSE (SELECT COUNT(*) 
-                       FROM json_array_elements(sc.updated_selection) sc2
-                      WHERE sc2 ->> 'matchType' = 'EXACT') END) AS exact_match_count,
+  sr.selected_exact_count AS exact_match_count,
   sr.similar_match_count, sr.callback_url, sr.doc_storage_url,
-  json_array_length(sr.api_result) as selected_match_count,
-  (SELECT CASE WHEN sc.user_id IS NULL THEN ''
-     ELSE (SELECT CASE WHEN u.lastname IS NOT NULL AND u.firstname IS NOT NULL THEN u.firstname || ' ' || u.lastname 
-                       WHEN u.lastname IS NULL AND u.firstname IS NOT NULL THEN u.firstname
-                       WHEN u.lastname IS NOT NULL AND u.firstname IS NULL THEN u.lastname
-                       ELSE '' END
-             FROM users u WHERE u.username = sc.user_id FETCH FIRST 1 ROWS ONLY)
-      END) AS username,
-  sr.api_result, sc.user_id, sr.score, sc.pay_invoice_id,
+  sr.selected_match_count,
+  sc.history_username AS username,
+  sr.selected_match_count IS NULL AS selection_pending, sc.user_id, sr.score, sc.pay_invoice_id,
   sc.search_type, sc.client_reference_id,
-  CASE WHEN sc.search_type = 'BS' THEN UPPER(api_criteria -> 'criteria' -> 'debtorName' ->> 'business')
-       WHEN sc.search_type = 'IS' THEN concat(UPPER(api_criteria -> 'criteria' -> 'debtorName' ->> 'last'),
-                                              ' ',
-                                              UPPER(api_criteria -> 'criteria' -> 'debtorName' ->> 'first'))
-       WHEN sc.search_type = 'MI' THEN concat(UPPER(api_criteria -> 'criteria' -> 'ownerName' ->> 'last'),
-                                              ' ',
-                                              UPPER(api_criteria -> 'criteria' -> 'ownerName' ->> 'first'))
-       ELSE UPPER(api_criteria -> 'criteria' ->> 'value') END as search_criteria
+  sc.history_criteria AS search_criteria
 FROM search_requests sc, search_results sr
 WHERE sc.id = sr.search_id
   AND sc.account_id = :query_account
@@ -425,6 +385,59 @@ ACCOUNT_SEARCH_HISTORY_DATE_QUERY_NEW = ACCOUNT_SEARCH_HISTORY_DATE_QUERY
 ACCOUNT_SEARCH_HISTORY_QUERY_NEW = ACCOUNT_SEARCH_HISTORY_QUERY
 
 QUERY_ACCOUNT_HISTORY_LIMIT = " LIMIT :page_size OFFSET :page_offset"
+QUERY_HISTORY_USERNAME = """
+SELECT CASE WHEN u.lastname IS NOT NULL AND u.firstname IS NOT NULL THEN u.firstname || ' ' || u.lastname
+            WHEN u.lastname IS NULL AND u.firstname IS NOT NULL THEN u.firstname
+            WHEN u.lastname IS NOT NULL AND u.firstname IS NULL THEN u.lastname
+            ELSE '' END
+  FROM users u
+ WHERE u.username = :user_id
+ FETCH FIRST 1 ROWS ONLY
+"""
+QUERY_ACCOUNT_HISTORY_KEYSET_LIMIT = " LIMIT :page_size"
+
+
+@lru_cache(maxsize=64)
+def build_search_query(query_template: str, filter_mode: str = SEARCH_FILTER_LEGACY) -> str:
+    """Add the financing statement searchable join and filter clauses for the filter mode to a search query."""
+    clauses = SEARCH_FILTER_CLAUSES.get(filter_mode, SEARCH_FILTER_CLAUSES[SEARCH_FILTER_LEGACY])
+    return query_template.format(**clauses)
+
+
+def get_history_criteria(search_type: str, search_criteria: dict) -> str:
+    """Get the normalized search criteria value displayed, sorted, and filtered in the account search history."""
+    criteria: dict = search_criteria.get("criteria", {}) if search_criteria else {}
+    if search_type in ("IS", "MI"):
+        name: dict = criteria.get("debtorName" if search_type == "IS" else "ownerName") or {}
+        return str(name.get("last") or "").upper() + " " + str(name.get("first") or "").upper()
+    value = criteria.get("debtorName", {}).get("business") if search_type == "BS" else criteria.get("value")
+    return str(value).upper() if value is not None else None
+
+
+def get_history_exact_count(search_type: str, selection) -> int:
+    """Get the account search history number of exact matches in a search selection: -1 for MHR searches."""
+    if search_type in MHR_SEARCH_TYPES:
+        return -1
+    if not selection:
+        return 0
+    return len([result for result in selection if result.get("matchType") == model_utils.SEARCH_MATCH_EXACT])
+
+
+def get_query_values(request_json: dict) -> tuple:
+    """Get the search criteria values bound to the search query: trimmed and upper case.
+
+    Individual debtor names are the last, first, and middle names: a middle name of NONE is an empty middle name.
+    """
+    criteria = request_json["criteria"]
+    debtor_name = criteria.get("debtorName")
+    if not debtor_name:
+        return (criteria["value"].strip().upper(),)
+    if "business" in debtor_name:
+        return (debtor_name["business"].strip().upper(),)
+    middle_name: str = (debtor_name.get("second") or "").strip().upper()
+    if middle_name == "NONE":
+        middle_name = ""
+    return (debtor_name["last"].strip().upper(), debtor_name["first"].strip().upper(), middle_name)
 
 
 def format_mhr_number(request_json):
@@ -451,12 +464,22 @@ class AccountSearchParams:
     filter_end_date: str = None
     filter_last_name: str = None
     filter_first_name: str = None
+    cursor_ts = None
+    cursor_id: int = None
 
     def __init__(self, account_id, sbc_staff: bool = False):
         """Set common base initialization."""
         self.account_id = account_id
         self.sbc_staff = sbc_staff
 
+    def has_keyset_order(self) -> bool:
+        """Check if the results are ordered by search timestamp, so a page can start after a cursor."""
+        return not self.has_sort() or self.sort_criteria == SEARCH_TS_PARAM
+
+    def is_keyset_ascending(self) -> bool:
+        """Check if the results are ordered by search timestamp in ascending order."""
+        return self.sort_criteria == SEARCH_TS_PARAM and self.sort_direction == SORT_ASCENDING
+
     def has_sort(self) -> bool:
         """Check if sort criteria provided."""
         if self.sort_criteria:
@@ -568,12 +591,8 @@ def get_account_query_order(params: AccountSearchParams) -> str:
 
 def build_search_history_query(params: AccountSearchParams) -> str:
     """Build the account search history query based on the request parameters."""
-    if not params.has_filter() and not params.has_sort():
-        query: str = ACCOUNT_SEARCH_HISTORY_DATE_QUERY_NEW
-        if GET_HISTORY_DAYS_LIMIT <= 0:
-            query = ACCOUNT_SEARCH_HISTORY_QUERY_NEW
-        query += QUERY_ACCOUNT_HISTORY_LIMIT
-        return query
+    if params.has_keyset_order():
+        return build_search_history_keyset_query(params)
     query_text: str = ACCOUNT_SEARCH_HISTORY_BASE
     if params.has_filter():
         query_text = build_account_query_filter(query_text, params)
@@ -581,6 +600,22 @@ def build_search_history_query(params: AccountSearchParams) -> str:
     return query_text + QUERY_ACCOUNT_HISTORY_LIMIT
 
 
+def build_search_history_keyset_query(params: AccountSearchParams) -> str:
+    """Build the account search history query ordered by search timestamp and id.
+
+    If the request has a page cursor the page starts after the cursor search instead of at a page offset.
+    """
+    query_text: str = ACCOUNT_SEARCH_HISTORY_BASE
+    if params.cursor_id:
+        query_text += SEARCH_FILTER_KEYSET_ASC if params.is_keyset_ascending() else SEARCH_FILTER_KEYSET_DESC
+    if params.has_filter():
+        query_text = build_account_query_filter(query_text, params)
+    query_text += SEARCH_ORDER_BY_KEYSET_ASC if params.is_keyset_ascending() else SEARCH_ORDER_BY_KEYSET_DESC
+    if params.cursor_id:
+        return query_text + QUERY_ACCOUNT_HISTORY_KEYSET_LIMIT
+    return query_text + QUERY_ACCOUNT_HISTORY_LIMIT
+
+
 def build_account_query_params(
     params: AccountSearchParams,
 ) -> dict:
@@ -592,6 +627,9 @@ def build_account_query_params(
     else:
         page_offset = (page_offset - 1) * page_size
     query_params = {"query_account": params.account_id, "page_size": page_size, "page_offset": page_offset}
+    if params.cursor_id and params.has_keyset_order():
+        query_params["cursor_ts"] = params.cursor_ts
+        query_params["cursor_id"] = params.cursor_id
     if params.has_filter():
         if params.filter_start_date and params.filter_end_date:
             start_ts = model_utils.search_ts(params.filter_start_date, True)
@@ -0,0 +1,77 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds data for the financing statements that are included in PPR search results.
+
+A financing statement is searchable until it has been expired or discharged for more than 30 days. The table is
+updated in the same transaction when a registration is saved and reconciled by the ppr-registrations-historical job,
+so PPR search queries join to it instead of evaluating the discharge history of every candidate row.
+"""
+from sqlalchemy.sql import text
+
+from ppr_api.exceptions import DatabaseException
+from ppr_api.models import search_utils
+from ppr_api.utils.logging import logger
+
+from .db import db
+
+
+class SearchableFinancingStatement(db.Model):
+    """This class maintains the searchable financing statement expiry and discharge information."""
+
+    __tablename__ = "searchable_financing_statements"
+
+    financing_id = db.mapped_column(
+        "financing_id", db.Integer, db.ForeignKey("financing_statements.id"), primary_key=True, nullable=False
+    )
+    expire_date = db.mapped_column("expire_date", db.DateTime, nullable=True)
+    discharge_ts = db.mapped_column("discharge_ts", db.DateTime, nullable=True)
+    update_ts = db.mapped_column("update_ts", db.DateTime, nullable=False)
+
+    @classmethod
+    def find_by_financing_id(cls, financing_id: int):
+        """Return the searchable financing statement matching the financing statement id."""
+        searchable = None
+        if financing_id:
+            searchable = (
+                db.session.query(SearchableFinancingStatement)
+                .filter(SearchableFinancingStatement.financing_id == financing_id)
+                .one_or_none()
+            )
+        return searchable
+
+    @staticmethod
+    def update_by_financing_id(financing_id: int):
+        """Insert or update the financing statement expiry and discharge information: the caller commits."""
+        if not financing_id:
+            return
+        try:
+            db.session.execute(text(search_utils.SEARCHABLE_UPSERT), {"financing_id": financing_id})
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB searchable financing statement update exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
+
+    @staticmethod
+    def reconcile() -> dict:
+        """Remove financing statements that are no longer searchable and add missing or changed statements.
+
+        Returns the deleted and updated row counts.
+        """
+        try:
+            deleted, updated = db.session.execute(text(search_utils.SEARCHABLE_RECONCILE)).one()
+            db.session.commit()
+            logger.info(f"Searchable financing statements reconciled: deleted={deleted} updated={updated}")
+            return {"deleted": deleted, "updated": updated}
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error(f"DB searchable financing statement reconcile exception: {db_exception}")
+            raise DatabaseException(db_exception) from db_exception
@@ -37,6 +37,17 @@ class TestSearchBatch(db.Model):
     sim_val_business = db.mapped_column("sim_val_business", db.Float, nullable=True)
     sim_val_first_name = db.mapped_column("sim_val_first_name", db.Float, nullable=True)
     sim_val_last_name = db.mapped_column("sim_val_last_name", db.Float, nullable=True)
+    sim_val_default = db.mapped_column("sim_val_default", db.Float, nullable=True)
+    # Aggregate run statistics: times are in seconds.
+    workers = db.mapped_column("workers", db.Integer, nullable=True)
+    search_count = db.mapped_column("search_count", db.Integer, nullable=True)
+    elapsed_time = db.mapped_column("elapsed_time", db.Float, nullable=True)
+    p50_time = db.mapped_column("p50_time", db.Float, nullable=True)
+    p95_time = db.mapped_column("p95_time", db.Float, nullable=True)
+    p99_time = db.mapped_column("p99_time", db.Float, nullable=True)
+    db_time = db.mapped_column("db_time", db.Float, nullable=True)
+    python_time = db.mapped_column("python_time", db.Float, nullable=True)
+    build_time = db.mapped_column("build_time", db.Float, nullable=True)
 
     # parent keys
 
@@ -52,6 +63,21 @@ class TestSearchBatch(db.Model):
         elif self.search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
             batch["similarityValueFirst"] = self.sim_val_first_name
             batch["similarityValueLast"] = self.sim_val_last_name
+            if self.sim_val_default is not None:
+                batch["similarityValueDefault"] = self.sim_val_default
+        if self.search_count:
+            batch["stats"] = {
+                "workers": self.workers,
+                "searchCount": self.search_count,
+                "elapsedTime": self.elapsed_time,
+                "searchesPerSecond": round(self.search_count / self.elapsed_time, 2) if self.elapsed_time else None,
+                "p50Time": self.p50_time,
+                "p95Time": self.p95_time,
+                "p99Time": self.p99_time,
+                "dbTime": self.db_time,
+                "pythonTime": self.python_time,
+                "buildTime": self.build_time,
+            }
 
         searches = []
         for search in self.searches:
@@ -20,6 +20,7 @@ from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from ppr_api.utils.base import BaseEnum
 
 from .db import db
+from .reference_cache import reference_cache
 
 
 class RegistrationTypes(BaseEnum):
@@ -120,6 +121,16 @@ class CountryType(db.Model):  # pylint: disable=too-few-public-methods
     # Relationships - Address
     address = db.relationship("Address", back_populates="country_type")
 
+    @classmethod
+    def find_all(cls):
+        """Return all the type records."""
+        return reference_cache.get_all(CountryType)
+
+    @classmethod
+    def find_by_country_type(cls, country_type: str):
+        """Return the country type record matching the country code."""
+        return reference_cache.get(CountryType, country_type)
+
 
 class ProvinceType(db.Model):  # pylint: disable=too-few-public-methods
     """This class defines the model for the province_type table."""
@@ -137,6 +148,16 @@ class ProvinceType(db.Model):  # pylint: disable=too-few-public-methods
     # Relationships - Address
     address = db.relationship("Address", back_populates="province_type")
 
+    @classmethod
+    def find_all(cls):
+        """Return all the type records."""
+        return reference_cache.get_all(ProvinceType)
+
+    @classmethod
+    def find_by_province_type(cls, province_type: str):
+        """Return the province type record matching the province/state code."""
+        return reference_cache.get(ProvinceType, province_type)
+
 
 class PartyType(db.Model):  # pylint: disable=too-few-public-methods
     """This class defines the model for the party_type table."""
@@ -189,19 +210,12 @@ class RegistrationType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(RegistrationType).all()
+        return reference_cache.get_all(RegistrationType)
 
     @classmethod
     def find_by_registration_type(cls, registration_type: str):
         """Return the registration type matching the query type."""
-        reg_type = None
-        if registration_type:
-            reg_type = (
-                db.session.query(RegistrationType)
-                .filter(RegistrationType.registration_type == registration_type)
-                .one_or_none()
-            )
-        return reg_type
+        return reference_cache.get(RegistrationType, registration_type)
 
 
 class SearchType(db.Model):  # pylint: disable=too-few-public-methods
@@ -276,7 +290,7 @@ class SecuritiesActType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(SecuritiesActType).all()
+        return reference_cache.get_all(SecuritiesActType)
 
 
 class ClientCodeType(db.Model):  # pylint: disable=too-few-public-methods
@@ -295,4 +309,8 @@ class ClientCodeType(db.Model):  # pylint: disable=too-few-public-methods
     @classmethod
     def find_all(cls):
         """Return all the type records."""
-        return db.session.query(ClientCodeType).all()
+        return reference_cache.get_all(ClientCodeType)
+
+
+# The type tables served from the reference cache, loaded at startup.
+REFERENCE_TYPES = (ClientCodeType, CountryType, ProvinceType, RegistrationType, SecuritiesActType)
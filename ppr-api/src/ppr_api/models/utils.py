@@ -16,6 +16,7 @@
 Common constants used across models and utilities for mapping type codes
 between the API and the database in both directions.
 """
+import base64
 from datetime import date  # noqa: F401 pylint: disable=unused-import
 from datetime import datetime as _datetime
 from datetime import time, timedelta, timezone
@@ -310,7 +311,8 @@ SELECT registration_number, registration_ts, registration_type, registration_typ
                   WHERE arv.registration_id = r.id
                     AND r.draft_id = d.id)
             ELSE NULL END draft_number,
-       (SELECT r.ver_bypassed FROM registrations r WHERE r.id = arv.registration_id) as locked_status
+       (SELECT r.ver_bypassed FROM registrations r WHERE r.id = arv.registration_id) as locked_status,
+       arv.registration_id
   FROM account_registration_vw arv
  WHERE arv.account_id = :query_account
    AND arv.registration_type_cl IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
@@ -341,7 +343,8 @@ SELECT registration_number, registration_ts, registration_type, registration_typ
                   WHERE arv1.registration_id = r.id
                     AND r.draft_id = d.id)
             ELSE NULL END draft_number,
-       (SELECT r.ver_bypassed FROM registrations r WHERE r.id = arv1.registration_id) as locked_status
+       (SELECT r.ver_bypassed FROM registrations r WHERE r.id = arv1.registration_id) as locked_status,
+       arv1.registration_id
   FROM account_registration_vw arv1
  WHERE arv1.account_id = :query_account
    AND arv1.registration_type_cl IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
@@ -589,6 +592,22 @@ def ts_from_iso_format(timestamp_iso: str):
     return _datetime.utcfromtimestamp(time_stamp).replace(tzinfo=timezone.utc)
 
 
+def encode_page_cursor(time_stamp, row_id: int) -> str:
+    """Create an opaque account list page cursor from the timestamp and id of the last row in a page."""
+    value: str = time_stamp.isoformat() + "|" + str(row_id)
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("utf-8")
+
+
+def decode_page_cursor(cursor: str):
+    """Get the timestamp and id from an account list page cursor. Return None, None if the cursor is invalid."""
+    try:
+        value: str = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+        ts_iso, row_id = value.split("|")
+        return _datetime.fromisoformat(ts_iso), int(row_id)
+    except (AttributeError, TypeError, ValueError):
+        return None, None
+
+
 def expiry_ts_from_iso_format(timestamp_iso: str):
     """Create a datetime object from a timestamp string in the ISO format.
 
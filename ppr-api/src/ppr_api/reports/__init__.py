@@ -20,11 +20,20 @@ from ppr_api.utils.logging import logger
 
 from .report import Report, ReportTypes
 from .v2.report import Report as ReportV2
+from .v2.report_utils import ReportMeta as ReportMetaV2
+from .v2.report_utils import TemplateRegistry
 
 REPORT_VERSION_V2 = "2"
 DEFAULT_ERROR_MSG = "{code}: Data related error generating report.".format(code=ResourceErrorCodes.REPORT_ERR)
 
 
+def init_app(app):
+    """Optionally assemble and compile the report templates at app start."""
+    if app.config.get("REPORT_TEMPLATE_WARM_UP"):
+        with app.app_context():
+            TemplateRegistry.warm_up({meta["fileName"] + ".html" for meta in ReportMetaV2.reports.values()})
+
+
 def get_pdf(report_data, account_id, report_type=None, token=None):
     """Generate a PDF of the provided report type using the provided data."""
     try:
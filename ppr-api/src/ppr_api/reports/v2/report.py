@@ -10,21 +10,19 @@
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from http import HTTPStatus
-from pathlib import Path
 
 import markupsafe
 import pycountry
-import requests
 from flask import current_app
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from ppr_api.callback.auth.token_service import GoogleStorageTokenService
 from ppr_api.models import utils as model_utils
 from ppr_api.reports.v2 import report_utils
 from ppr_api.reports.v2.report_utils import ReportMeta, ReportTypes
+from ppr_api.services import report_service
 from ppr_api.utils.logging import logger
 
 SINGLE_URI = "/forms/chromium/convert/html"
@@ -33,6 +31,14 @@ SUBREPORT_SIZE = 500
 RS_TIMEOUT = 1800.0
 
 
+def _render_subreport(app, subreport, token, toc_pass: bool):
+    """Render a large search sub-report pass in a worker thread with the application context."""
+    with app.app_context():
+        if toc_pass:
+            return subreport.get_search_toc_data(token)
+        return subreport.get_search_toc_pdf(token)
+
+
 class Report:  # pylint: disable=too-few-public-methods
     """Service to create report outputs."""
 
@@ -54,7 +60,7 @@ class Report:  # pylint: disable=too-few-public-methods
         return GoogleStorageTokenService.get_report_api_token(rs_url)
 
     def send_request(self, uri: str, meta_data, files, rs_token):
-        """Post report generation request to the report service with a retry strategy on 502, 503 responses."""
+        """Post report generation request to the pooled report service client: it retries 502, 503 responses."""
         url = current_app.config.get("REPORT_SVC_URL") + uri
         if self.large_container:
             if current_app.config.get("REPORT_SVC_LARGE_URL"):
@@ -68,15 +74,12 @@ class Report:  # pylint: disable=too-few-public-methods
         logger.debug(
             "Account {0} report type {1} calling report-api {2}.".format(self._account_id, self._report_key, url)
         )
-        retry_strategy = Retry(total=4, backoff_factor=1.0, status_forcelist=[502, 503])
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        http = requests.Session()
-        http.mount("https://", adapter)
-        response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
+        timeout = RS_TIMEOUT if self.large_container else None
+        response = report_service.post(url, headers, meta_data, files, timeout)
         if response.status_code == HTTPStatus.BAD_GATEWAY and self.large_container:
-            response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
+            response = report_service.post(url, headers, meta_data, files, timeout)
         if response.status_code == HTTPStatus.BAD_GATEWAY and self.large_container:
-            response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
+            response = report_service.post(url, headers, meta_data, files, timeout)
         logger.info(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response.status_code
@@ -112,21 +115,39 @@ class Report:  # pylint: disable=too-few-public-methods
         return response.content, response.status_code, {"Content-Type": "application/pdf"}
 
     def get_search_pdf(self):
-        """Render a search report with TOC page numbers set in a second report call."""
+        """Render a search report with TOC page numbers set in a second report call, or once in TOC link mode."""
         logger.debug("Account {0} report type {1} setting up report data.".format(self._account_id, self._report_key))
+        token = self.get_report_service_token()
+        if current_app.config.get("REPORT_SEARCH_TOC_MODE") == report_utils.TOC_MODE_LINK:
+            # Generate the search pdf once: TOC entries link to the registrations instead of showing page numbers.
+            self._report_data["tocLinks"] = True
+            return self.get_search_toc_pdf(token)
+        # 1, 2: Generate the search pdf with no TOC page numbers and set the TOC page numbers from it.
+        toc_data, error = self.get_search_toc_data(token)
+        if error:
+            return error
+        self._report_data = toc_data
+        # 3: Generate search report again with TOC page numbers and total page count.
+        return self.get_search_toc_pdf(token)
+
+    def get_search_toc_data(self, token):
+        """Render a search pdf with no TOC page numbers: return the report data with the TOC page numbers set.
+
+        Returns a tuple of the updated report data and None, or None and the report error response.
+        """
         data_copy = copy.deepcopy(self._report_data)
-        # 1: Generate the search pdf with no TOC page numbers or total page count.
         data = self._setup_report_data()
         meta_data = report_utils.get_report_meta_data(self._report_key)
-        token = self.get_report_service_token()
         files = report_utils.get_report_files(data, self._report_key, False, False)
         response_reg = self.send_request(SINGLE_URI, meta_data, files, token)
         if response_reg.status_code != HTTPStatus.OK:
-            return report_utils.report_error(response_reg, self._report_key, self._account_id)
-        # 2: Set TOC page numbers in report data from initial search pdf page numbering.
-        self._report_data = report_utils.update_toc_page_numbers(data_copy, response_reg.content)
-        # 3: Generate search report again with TOC page numbers and total page count.
+            return None, report_utils.report_error(response_reg, self._report_key, self._account_id)
+        return report_utils.update_toc_page_numbers(data_copy, response_reg.content), None
+
+    def get_search_toc_pdf(self, token):
+        """Render a search pdf from report data with the TOC page numbers and total page count set."""
         data_final = self._setup_report_data()
+        meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data_final, self._report_key, False, False)
         logger.info("Search report regenerating with TOC page numbers set.")
         response = self.send_request(SINGLE_URI, meta_data, files, token)
@@ -136,60 +157,68 @@ class Report:  # pylint: disable=too-few-public-methods
         return response.content, response.status_code, {"Content-Type": "application/pdf"}
 
     def get_large_search_pdf(self):  # pylint: disable=too-many-locals
-        """Render a large search report as concatenated sub-reports."""
+        """Render a large search report as concatenated sub-reports.
+
+        Sub-reports are rendered concurrently up to the configured worker limit in 2 passes: the TOC page number
+        offsets of a sub-report depend on the page counts of the preceding sub-reports, so they are set between the
+        passes in sub-report order. The cover summary start pages also need the first pass page counts, so the
+        REPORT_SEARCH_TOC_MODE LINK mode falls back to the 2 pass render with TOC page numbers.
+        """
         logger.debug(f"Account {self._account_id} large search setting up report data.")
+        if current_app.config.get("REPORT_SEARCH_TOC_MODE") == report_utils.TOC_MODE_LINK:
+            logger.info("Large search report TOC link mode unsupported: rendering TOC page numbers in 2 passes.")
         data_copy = copy.deepcopy(self._report_data)
         data_length = len(data_copy["details"])
         search_ts = data_copy.get("searchDateTime")
-        subreport_count = 0
-        start_index = 0
-        end_index = SUBREPORT_SIZE
-        report_files = {}
-        details = data_copy["details"]
-        selected = data_copy["selected"]
+        details = data_copy.pop("details")
+        selected = data_copy.pop("selected")
         select_index = 0
         rep_count = int(data_length / SUBREPORT_SIZE) + ((data_length / SUBREPORT_SIZE) % 1 > 0)
         rep_summary = []
-        self._report_data["pageNumOffset"] = 0
-        while start_index < data_length:
-            subreport_count += 1
-            logger.info(f"Account {self._account_id} building subreport {subreport_count}")
-            logger.debug(f"Start index={start_index} end index={end_index}")
-            self._report_data["details"] = details[start_index:end_index]
-            logger.debug("Details length=" + str(len(self._report_data["details"])))
-            # logger.debug(f'Select index={select_index} length=' + str(len(selected)))
-            self._report_data["selected"] = report_utils.get_subreport_selected(
-                selected[select_index:], self._report_data["details"]
-            )
-            logger.debug(f"Select index={select_index} length=" + str(len(self._report_data["selected"])))
-            self._report_data["searchDateTime"] = search_ts
-            self._report_data["subreport"] = f"{subreport_count} of {rep_count}"
+        subreports = []
+        for start_index in range(0, data_length, SUBREPORT_SIZE):
+            subreport_count = len(subreports) + 1
+            logger.debug(f"Subreport {subreport_count} start index={start_index}")
+            sub_data = copy.deepcopy(data_copy)
+            sub_data["details"] = details[start_index : start_index + SUBREPORT_SIZE]
+            sub_data["selected"] = report_utils.get_subreport_selected(selected[select_index:], sub_data["details"])
+            logger.debug(f"Select index={select_index} length=" + str(len(sub_data["selected"])))
+            sub_data["searchDateTime"] = search_ts
+            sub_data["subreport"] = f"{subreport_count} of {rep_count}"
+            sub_data["pageNumOffset"] = 0
+            select_index += len(sub_data["selected"])
             rep_summary.append(
-                report_utils.get_report_summary(
-                    self._report_data["selected"],
-                    subreport_count,
-                    len(self._report_data["details"]),
-                    self._report_data["pageNumOffset"],
-                )
+                report_utils.get_report_summary(sub_data["selected"], subreport_count, len(sub_data["details"]), 0)
             )
-            content, status_code, headers = self.get_search_pdf()
+            subreports.append(self._get_subreport(sub_data))
+
+        # 1, 2: Generate the sub-reports with no TOC page numbers and set the sub-report TOC page numbers.
+        token = self.get_report_service_token()
+        toc_data_list = []
+        for toc_data, error in self._run_subreports(subreports, token, True):
+            if error:
+                return error
+            toc_data_list.append(toc_data)
+        page_count: int = report_utils.set_subreport_page_offsets(toc_data_list)
+        for index in range(1, len(toc_data_list)):
+            rep_summary[index]["startPage"] = max(toc_data_list[index - 1]["pageNumOffset"], 1)
+        # 3: Generate the sub-reports again with TOC page numbers and merge them in sub-report order.
+        subreports = [self._get_subreport(toc_data) for toc_data in toc_data_list]
+        report_files = {}
+        for index, (content, status_code, headers) in enumerate(self._run_subreports(subreports, token, False)):
             if status_code != HTTPStatus.OK:
                 return content, status_code, headers
-            report_key = f"pdf{subreport_count}.pdf"
-            report_files[report_key] = content
-            start_index += SUBREPORT_SIZE
-            end_index += SUBREPORT_SIZE
-            select_index += len(self._report_data["selected"])
+            report_files[f"pdf{index + 1}.pdf"] = content
 
         # Build cover summary
         cover_data = {
             "searchDateTime": search_ts,
-            "reportCount": subreport_count,
+            "reportCount": len(subreports),
             "totalResultsSize": data_length,
             "exactResultsSize": report_utils.get_exact_count(selected),
             "searchQuery": data_copy["searchQuery"],
             "reports": rep_summary,
-            "reportPageCount": self._report_data["pageNumOffset"],
+            "reportPageCount": page_count,
         }
         # logger.info(cover_data)
         self._report_key = ReportTypes.SEARCH_COVER_REPORT
@@ -201,6 +230,23 @@ class Report:  # pylint: disable=too-few-public-methods
         # Merge subreports
         return report_utils.merge_pdfs(report_files), status_code, {"Content-Type": "application/pdf"}
 
+    def _get_subreport(self, sub_data):
+        """Create a large search sub-report instance with its own copy of the report data."""
+        subreport = Report(sub_data, self._account_id, self._report_key, self._account_name)
+        subreport.large_container = self.large_container
+        return subreport
+
+    def _run_subreports(self, subreports, token, toc_pass: bool) -> list:
+        """Render the sub-reports concurrently up to the configured worker limit: results are in sub-report order."""
+        max_workers: int = max(1, min(current_app.config.get("REPORT_SEARCH_MAX_WORKERS", 4), len(subreports)))
+        logger.info(
+            f"Account {self._account_id} rendering {len(subreports)} subreports toc pass={toc_pass} "
+            + f"workers={max_workers}"
+        )
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda subreport: _render_subreport(app, subreport, token, toc_pass), subreports))
+
     def get_registration_mail_pdf(self):
         """Render a mail registration report with cover letter."""
         logger.debug(
@@ -243,6 +289,7 @@ class Report:  # pylint: disable=too-few-public-methods
         data = {
             "reportName": self._get_report_filename(),
             "template": template,
+            "templateName": self._get_template_filename(),
             "templateVars": self._get_template_data(),
         }
         logger.debug("Setup report data completed.")
@@ -285,88 +332,12 @@ class Report:  # pylint: disable=too-few-public-methods
         return report_id
 
     def _get_template(self):
-        """Load from the local file system the template matching the report type."""
+        """Get the assembled template source matching the report type from the template registry."""
         try:
-            template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-            template_code = Path(f"{template_path}/{self._get_template_filename()}").read_text(encoding="UTF-8")
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            return report_utils.TemplateRegistry.get_source(self._get_template_filename())
         except Exception as err:  # noqa: B902; just logging
             logger.error(err)
             raise err
-        return template_code
-
-    @staticmethod
-    def _substitute_template_parts(template_code):
-        """Substitute template parts in main template.
-
-        Template parts are marked by [[partname.html]] in templates.
-
-        This functionality is restricted by:
-        - markup must be exactly [[partname.html]] and have no extra spaces around file name
-        - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
-        parts. There is no recursive search and replace.
-
-        :param template_code: string
-        :return: template_code string, modified.
-        """
-        template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-        template_parts = [
-            "v2/style",
-            "v2/styleMail",
-            "v2/stylePage",
-            "v2/stylePageCover",
-            "v2/stylePageDraft",
-            "v2/stylePageMail",
-            "v2/stylePageRegistration",
-            "v2/stylePageRegistrationDraft",
-            "v2/stylePageLight",
-            "stylePageMail",
-            "logo",
-            "logoGrey",
-            "macros",
-            "registrarSignature",
-            "registration/securedParties",
-            "registration/courtOrderInformation",
-            "registration/debtors",
-            "registration/registeringParty",
-            "registration/vehicleCollateral",
-            "registration/generalCollateral",
-            "registration/amendmentStatement",
-            "registration/changeStatement",
-            "registration/dischargeStatement",
-            "registration/renewalStatement",
-            "registration/securitiesActNotice",
-            "v2/search-result/selected",
-            "search-result/financingStatement",
-            "search-result/amendmentStatement",
-            "search-result/changeStatement",
-            "search-result/renewalStatement",
-            "search-result/dischargeStatement",
-            "search-result/securedParties",
-            "search-result/courtOrderInformation",
-            "search-result/debtors",
-            "search-result/registeringParty",
-            "search-result/vehicleCollateral",
-            "search-result/generalCollateral",
-            "search-result/securitiesActNotice",
-        ]
-
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            if template_code.find("[[{}.html]]".format(template_part)) >= 0:
-                template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
-                    encoding="UTF-8"
-                )
-                for template_part_nested in template_parts:
-                    template_reference = "[[{}.html]]".format(template_part_nested)
-                    if template_part_code.find(template_reference) >= 0:
-                        path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
-                        template_nested_code = path.read_text(encoding="UTF-8")
-                        template_part_code = template_part_code.replace(template_reference, template_nested_code)
-                template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
-
-        return template_code
 
     def _get_template_filename(self):
         """Get the report template filename from the report type."""
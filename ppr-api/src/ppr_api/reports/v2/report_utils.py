@@ -11,12 +11,13 @@
 """Helper/utility functions for report generation."""
 import copy
 import io
+import threading
 from datetime import timedelta
 from pathlib import Path
 
 import PyPDF2
 from flask import current_app
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, Template
 
 from ppr_api.models import utils as model_utils
 from ppr_api.utils.base import BaseEnum
@@ -48,7 +49,51 @@ REPORT_META_DATA = {
     "printBackground": True,
 }
 REPORT_FILES = {"index.html": "", "header.html": "", "footer.html": ""}
+# Template parts substituted in report templates: marked up by [[partname.html]].
+TEMPLATE_PARTS = [
+    "v2/style",
+    "v2/styleMail",
+    "v2/stylePage",
+    "v2/stylePageCover",
+    "v2/stylePageDraft",
+    "v2/stylePageMail",
+    "v2/stylePageRegistration",
+    "v2/stylePageRegistrationDraft",
+    "v2/stylePageLight",
+    "stylePageMail",
+    "logo",
+    "logoGrey",
+    "macros",
+    "registrarSignature",
+    "registration/securedParties",
+    "registration/courtOrderInformation",
+    "registration/debtors",
+    "registration/registeringParty",
+    "registration/vehicleCollateral",
+    "registration/generalCollateral",
+    "registration/amendmentStatement",
+    "registration/changeStatement",
+    "registration/dischargeStatement",
+    "registration/renewalStatement",
+    "registration/securitiesActNotice",
+    "v2/search-result/selected",
+    "search-result/financingStatement",
+    "search-result/amendmentStatement",
+    "search-result/changeStatement",
+    "search-result/renewalStatement",
+    "search-result/dischargeStatement",
+    "search-result/securedParties",
+    "search-result/courtOrderInformation",
+    "search-result/debtors",
+    "search-result/registeringParty",
+    "search-result/vehicleCollateral",
+    "search-result/generalCollateral",
+    "search-result/securitiesActNotice",
+]
 REG_PAGE_PREFIX = "Number: "
+# Search report TOC modes: render twice to print TOC page numbers, or render once with TOC links only.
+TOC_MODE_RENDER = "RENDER"
+TOC_MODE_LINK = "LINK"
 
 # Map from API search type to report description
 TO_SEARCH_DESCRIPTION = {
@@ -173,6 +218,106 @@ class ReportMeta:  # pylint: disable=too-few-public-methods
     }
 
 
+class TemplateRegistry:
+    """Report templates assembled from the template parts once and compiled into a shared Jinja environment.
+
+    Set REPORT_TEMPLATE_RELOAD to assemble and compile the templates for every report when editing templates.
+    """
+
+    _environment: Environment = None
+    _sources: dict = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_environment(cls) -> Environment:
+        """Get the shared template environment with a bytecode cache, creating it on first use."""
+        with cls._lock:
+            if cls._environment is None:
+                cache_dir = current_app.config.get("REPORT_TEMPLATE_CACHE_DIR")
+                cls._environment = Environment(
+                    loader=FunctionLoader(cls._load_template),
+                    autoescape=True,
+                    auto_reload=is_template_reload(),
+                    cache_size=-1,
+                    bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else FileSystemBytecodeCache(),
+                )
+            return cls._environment
+
+    @classmethod
+    def get_source(cls, file_name: str) -> str:
+        """Get the assembled template source for the report template file name."""
+        source = None if is_template_reload() else cls._sources.get(file_name)
+        if source is None:
+            source = assemble_template(file_name)
+            cls._sources[file_name] = source
+        return source
+
+    @classmethod
+    def get_template(cls, file_name: str) -> Template:
+        """Get the compiled template for the report template file name."""
+        return cls.get_environment().get_template(file_name)
+
+    @classmethod
+    def warm_up(cls, file_names) -> int:
+        """Assemble and compile the report templates: return the number of templates loaded."""
+        count: int = 0
+        for file_name in file_names:
+            try:
+                cls.get_template(file_name)
+                count += 1
+            except Exception as err:  # noqa: B902; just logging
+                logger.info(f"Report template {file_name} not loaded: {err}")
+        logger.info(f"Report template registry loaded {count} templates.")
+        return count
+
+    @classmethod
+    def clear(cls):
+        """Remove all assembled and compiled templates."""
+        with cls._lock:
+            cls._sources.clear()
+            if cls._environment is not None:
+                cls._environment.cache.clear()
+
+    @classmethod
+    def _load_template(cls, file_name: str):
+        """Jinja loader function returning the assembled template source."""
+        reload: bool = is_template_reload()
+        return cls.get_source(file_name), None, lambda: not reload
+
+
+def is_template_reload() -> bool:
+    """Check the configuration: dev mode assembles and compiles the templates for every report."""
+    return bool(current_app.config.get("REPORT_TEMPLATE_RELOAD"))
+
+
+def assemble_template(file_name: str) -> str:
+    """Load from the local file system the report template and substitute the template parts.
+
+    Template parts are marked by [[partname.html]] in templates.
+
+    This functionality is restricted by:
+    - markup must be exactly [[partname.html]] and have no extra spaces around file name
+    - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
+    parts. There is no recursive search and replace.
+    """
+    template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
+    template_code = Path(f"{template_path}/{file_name}").read_text(encoding="UTF-8")
+    # substitute template parts - marked up by [[filename]]
+    for template_part in TEMPLATE_PARTS:
+        if template_code.find("[[{}.html]]".format(template_part)) >= 0:
+            template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
+                encoding="UTF-8"
+            )
+            for template_part_nested in TEMPLATE_PARTS:
+                template_reference = "[[{}.html]]".format(template_part_nested)
+                if template_part_code.find(template_reference) >= 0:
+                    path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
+                    template_nested_code = path.read_text(encoding="UTF-8")
+                    template_part_code = template_part_code.replace(template_reference, template_nested_code)
+            template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
+    return template_code
+
+
 class Config:  # pylint: disable=too-few-public-methods
     """Configuration that loads report template static data."""
 
@@ -442,13 +587,31 @@ def get_report_files(request_data: dict, report_type: str, mail: bool = False, l
 
 def get_html_from_data(request_data) -> str:
     """Get html by merging the template with the report data."""
-    template_ = Template(request_data["template"], autoescape=True)
+    if request_data.get("templateName"):
+        template_ = TemplateRegistry.get_template(request_data["templateName"])
+    else:
+        template_ = Template(request_data["template"], autoescape=True)
     html_output = template_.render(request_data["templateVars"])
     return html_output
 
 
+def get_anchor_page_indexes(bodypdf) -> dict:
+    """Get the search report registration anchor page indexes from the pdf named destinations (TOC links)."""
+    anchor_pages = {}
+    try:
+        for name, destination in bodypdf.named_destinations.items():
+            anchor_pages[name] = bodypdf.get_destination_page_number(destination)
+    except Exception as err:  # noqa: B902; fall back to scanning the page text.
+        logger.info(f"Search report named destinations unavailable: {err}")
+    return anchor_pages
+
+
 def update_toc_page_numbers(json_data, reg_pdf_data):
-    """Try and update toc page numbers from the registration pdf."""
+    """Try and update toc page numbers from the registration pdf.
+
+    Page numbers are read from the TOC link destinations if available, otherwise by scanning the page text for the
+    registration marker. The text of each page is extracted at most once.
+    """
     if json_data["totalResultsSize"] > 0:
         page_offset: int = 0
         if "pageNumOffset" in json_data:
@@ -458,22 +621,26 @@ def update_toc_page_numbers(json_data, reg_pdf_data):
         json_data["totalPageCount"] = pagecount
         page_index = 0
         logger.info(f" TOC totalPageCount={pagecount}, getting page numbers")
+        anchor_pages: dict = get_anchor_page_indexes(bodypdf)
+        page_texts = {}
         last_num: str = ""
         for select in json_data["selected"]:
             if select["baseRegistrationNumber"] != last_num:
                 reg_text = REG_PAGE_PREFIX + select["baseRegistrationNumber"]
                 last_num = select["baseRegistrationNumber"]
-                # logger.info(f'start page index={page_index} reg_text={reg_text}')
+                anchor_index = anchor_pages.get(last_num, -1)
+                if anchor_index >= page_index:
+                    page_index = anchor_index + 1
+                    select["pageNumber"] = page_index + page_offset
+                    continue
                 for i in range(page_index, pagecount):
-                    # logger.info(f'{reg_text} scanning page {i}')
-                    page = bodypdf.pages[i]
-                    text = page.extract_text()
-                    if text.find(reg_text) > 0:
-                        # logger.info(f'{reg_text} found page {i}')
+                    if i not in page_texts:
+                        page_texts[i] = bodypdf.pages[i].extract_text()
+                    if page_texts[i].find(reg_text) > 0:
                         page_index = i + 1
                         select["pageNumber"] = i + 1 + page_offset
                         break
-        logger.info("Collecting page numbers completed.")
+        logger.info(f"Collecting page numbers completed: {len(page_texts)} pages scanned.")
         if "pageNumOffset" in json_data:
             json_data["pageNumOffset"] = page_offset + pagecount
             logger.info("Updated page numbers offset=" + str(json_data["pageNumOffset"]))
@@ -577,6 +744,23 @@ def get_report_summary(selected, subreport_count: int, detail_length: int, page_
     return summary
 
 
+def set_subreport_page_offsets(subreports) -> int:
+    """Offset independently numbered subreport TOC page numbers by the preceding subreport page counts.
+
+    Each subreport pageNumOffset is its own page count on entry. Returns the total report page count.
+    """
+    page_offset: int = 0
+    for subreport in subreports:
+        page_count: int = subreport.get("pageNumOffset", 0)
+        if page_offset > 0:
+            for select in subreport["selected"]:
+                if select.get("pageNumber"):
+                    select["pageNumber"] += page_offset
+        page_offset += page_count
+        subreport["pageNumOffset"] = page_offset
+    return page_offset
+
+
 def get_exact_count(selected) -> int:
     """Get search report exact match count from selected."""
     exact_count = 0
@@ -395,8 +395,7 @@ def get_registration_report(  # pylint: disable=too-many-return-statements,too-m
         if report_info and report_info.doc_storage_url:
             doc_name = report_info.doc_storage_url
             logger.info(f"{registration_id} fetching doc storage report {doc_name}.")
-            raw_data = GoogleStorageService.get_document(doc_name, DocumentTypes.REGISTRATION)
-            return raw_data, response_status, {"Content-Type": "application/pdf"}
+            return resource_utils.document_storage_response(doc_name, DocumentTypes.REGISTRATION, response_status)
 
         if report_info and not report_info.doc_storage_url:
             # Check if report api error: more than 15 minutes has elapsed since the request was queued and no report.
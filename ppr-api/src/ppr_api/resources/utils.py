@@ -14,8 +14,10 @@
 """Resource helper utilities for processing requests."""
 from http import HTTPStatus
 
-from flask import current_app, g, jsonify, request
+from flask import Response, current_app, g, jsonify, request
+from werkzeug.datastructures import ContentRange
 
+from ppr_api.callback.document_storage.storage_service import GoogleStorageService
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from ppr_api.models import EventTracking, MailReport, Party, Registration, User, VerificationReport, search_utils
 from ppr_api.models import utils as model_utils
@@ -59,6 +61,7 @@ PATH_MISMATCH = (
     "{code}: The path value ({path_value}) does not match the expected data {description} value ({data_value}). "
 )
 HISTORICAL = "{code}: The specified {reg_num} Financing Statement has already been discharged."
+INVALID_CURSOR = "{code}: The request {param_name} parameter value is not a valid page cursor."
 DEBTOR_NAME = "{code}: No matching record was found for the given debtor name and registration number."
 REPORT = "{code}: An error occurred while generating the report, with additional details provided. {detail}"
 DEFAULT = "{code}: An error occurred while processing the request."
@@ -93,6 +96,7 @@ BCOL_STAFF_DESC = "BC Online Help"
 # Account registration request parameters
 FROM_UI_PARAM = "fromUI"
 PAGE_NUM_PARAM = "pageNumber"
+CURSOR_PARAM = "cursor"
 SORT_DIRECTION_PARAM = "sortDirection"
 SORT_CRITERIA_PARAM = "sortCriteriaName"
 REG_NUMBER_PARAM = "registrationNumber"
@@ -145,6 +149,53 @@ def is_pdf(req):
     return accept and accept.upper() == "APPLICATION/PDF"
 
 
+def get_document_range(req, etag: str, size: int) -> tuple:
+    """Evaluate the If-None-Match, If-Range and Range request headers for a stored document.
+
+    Return the response status with the [start, stop) byte range to send. Multiple ranges and a non-matching
+    If-Range are answered with the whole document.
+    """
+    if req.if_none_match.contains_weak(etag):
+        return HTTPStatus.NOT_MODIFIED, 0, 0
+    byte_range = req.range
+    if byte_range is None or len(byte_range.ranges) != 1:
+        return HTTPStatus.OK, 0, size
+    if_range = req.if_range
+    if if_range.date is not None or (if_range.etag is not None and if_range.etag != etag):
+        return HTTPStatus.OK, 0, size
+    bounds = byte_range.range_for_length(size)
+    if bounds is None:
+        return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, 0, 0
+    return HTTPStatus.PARTIAL_CONTENT, bounds[0], bounds[1]
+
+
+def document_storage_response(doc_name: str, doc_type: str = None, status=HTTPStatus.OK):
+    """Stream a PDF from document storage, supporting conditional (ETag) and single byte range requests.
+
+    Only the document metadata is fetched before the response starts: the contents are streamed from storage in
+    chunks. Range and If-None-Match are only evaluated for a 200 response status.
+    """
+    blob = GoogleStorageService.get_document_info(doc_name, doc_type)
+    size: int = blob.size
+    start: int = 0
+    stop: int = size
+    if status == HTTPStatus.OK:
+        status, start, stop = get_document_range(request, blob.etag, size)
+    has_body: bool = status not in (HTTPStatus.NOT_MODIFIED, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+    body = GoogleStorageService.stream_document(blob, doc_type, start, stop) if has_body else ()
+    response = Response(body, status=status, content_type="application/pdf")
+    response.headers["Accept-Ranges"] = "bytes"
+    response.set_etag(blob.etag)
+    if has_body:
+        response.content_length = stop - start
+    if status == HTTPStatus.PARTIAL_CONTENT:
+        response.content_range = ContentRange("bytes", start, stop, size)
+    elif status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+        response.content_range = ContentRange("bytes", None, None, size)
+    logger.info(f"Streaming {doc_name} status={int(status)} bytes {start}-{stop} of {size}.")
+    return response
+
+
 def get_apikey(req):
     """Get gateway api key from request headers."""
     return req.headers.get("x-apikey")
@@ -734,9 +785,24 @@ def get_account_registration_params(req: request, params: AccountRegistrationPar
         params.client_reference_id = params.client_reference_id.strip().upper()
     if params.registering_name:
         params.registering_name = params.registering_name.strip().upper()
+    params.cursor_ts, params.cursor_id = get_page_cursor(req, CURSOR_PARAM)
     return params
 
 
+def get_page_cursor(req: request, param_name: str):
+    """Get the account list page cursor timestamp and id from the request, if present."""
+    cursor = req.args.get(param_name, None)
+    if not cursor:
+        return None, None
+    cursor_ts, cursor_id = model_utils.decode_page_cursor(cursor.strip())
+    if cursor_id is None:
+        raise BusinessException(
+            error=INVALID_CURSOR.format(code=ResourceErrorCodes.VALIDATION_ERR.value, param_name=param_name),
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    return cursor_ts, cursor_id
+
+
 def valid_api_key(req) -> bool:
     """Verify the callback request api key is valid."""
     key = get_apikey(req)
@@ -838,6 +904,7 @@ def get_account_search_params(req: request, params: AccountSearchParams) -> Acco
         params.filter_end_date = remove_quotes(params.filter_end_date)
     if params.filter_search_type:
         params.filter_search_type = params.filter_search_type.upper()
+    params.cursor_ts, params.cursor_id = get_page_cursor(req, search_utils.CURSOR_PARAM)
     return set_search_params_criteria(params)
 
 
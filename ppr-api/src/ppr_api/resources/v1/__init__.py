@@ -22,6 +22,7 @@ from .drafts import bp as drafts_bp
 from .financing_statements import bp as financing_statements_bp
 from .historical_searches import bp as historical_searches_bp
 from .meta import bp as meta_bp
+from .metrics import bp as metrics_bp
 from .ops import bp as ops_bp
 from .party_codes import bp as party_codes_bp
 from .search_history import bp as search_history_bp
@@ -49,6 +50,7 @@ class V1Endpoint:
         self.app.register_blueprint(financing_statements_bp)
         self.app.register_blueprint(historical_searches_bp)
         self.app.register_blueprint(meta_bp)
+        self.app.register_blueprint(metrics_bp)
         self.app.register_blueprint(party_codes_bp)
         self.app.register_blueprint(ops_bp)
         self.app.register_blueprint(search_history_bp)
@@ -599,6 +599,8 @@ def get_registrations():
         return resource_utils.db_exception_response(
             db_exception, account_id, "GET Account Registration Summary id=" + account_id
         )
+    except BusinessException as exception:
+        return resource_utils.business_exception_response(exception)
     except Exception as default_exception:  # noqa: B902; return nicer default error
         return resource_utils.default_exception_response(default_exception)
 
@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Endpoints to check and manage the health of the service."""
-from flask import Blueprint, jsonify
+from http import HTTPStatus
+
+from flask import Blueprint, jsonify, request
 from sqlalchemy import exc, text
 
-from ppr_api.models import db
+from ppr_api.exceptions import DatabaseException
+from ppr_api.models import db, reference_cache
+from ppr_api.models.type_tables import REFERENCE_TYPES
+from ppr_api.resources import utils as resource_utils
+from ppr_api.services import sql_profiler
+from ppr_api.services.authz import is_staff
+from ppr_api.utils.auth import jwt
 from ppr_api.utils.logging import logger
 
 bp = Blueprint("OPS1", __name__, url_prefix="/ops")  # pylint: disable=invalid-name
@@ -46,3 +54,34 @@ def healthz():
 def readyz():
     """Status check to verify the service is ready to respond."""
     return jsonify({"message": "api is ready"}), 200
+
+
+@bp.route("/reference-cache", methods=["POST"])
+@jwt.requires_auth
+def reload_reference_cache():
+    """Staff only: force a reload of the in-process type table cache, returning the cache stats.
+
+    Each instance has its own cache: instances not receiving the request reload after the cache time to live.
+    """
+    try:
+        if not is_staff(jwt):
+            return resource_utils.unauthorized_error_response(resource_utils.get_account_id(request))
+        count: int = reference_cache.reference_cache.reload(REFERENCE_TYPES)
+        logger.info(f"Reference cache reloaded {count} type table records.")
+        return jsonify(reference_cache.reference_cache.stats()), HTTPStatus.OK
+    except DatabaseException as db_exception:
+        return resource_utils.db_exception_response(db_exception, None, "POST reference cache reload")
+    except Exception as default_exception:  # noqa: B902; return nicer default error
+        return resource_utils.default_exception_response(default_exception)
+
+
+@bp.route("/sql-profiles", methods=["GET"])
+@jwt.requires_auth
+def get_sql_profiles():
+    """Staff only: return the sampled per request SQL profiles of this instance, most recent first."""
+    try:
+        if not is_staff(jwt):
+            return resource_utils.unauthorized_error_response(resource_utils.get_account_id(request))
+        return jsonify({"enabled": sql_profiler.enabled, "profiles": sql_profiler.get_profiles()}), HTTPStatus.OK
+    except Exception as default_exception:  # noqa: B902; return nicer default error
+        return resource_utils.default_exception_response(default_exception)
@@ -18,7 +18,7 @@ import json
 from http import HTTPStatus
 
 import requests
-from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from flask import Blueprint, current_app, jsonify, request
 from flask_cors import cross_origin
 from registry_schemas import utils as schema_utils
 
@@ -53,8 +53,6 @@ CALLBACK_MESSAGES = {
 CALLBACK_PARAM = "callbackURL"
 REPORT_URL = "/ppr/api/v1/search-results/{search_id}"
 USE_CURRENT_PARAM = "useCurrent"
-STREAMING_THRESHOLD = 31 * 1024 * 1024
-HTTP_OK = "200"
 
 
 @bp.route("/<string:search_id>", methods=["POST", "OPTIONS"])
@@ -172,27 +170,10 @@ def get_search_results(search_id: str):  # pylint: disable=too-many-branches,too
 
             # If report in doc storage, fetch and return it.
             if search_detail.doc_storage_url is not None:
-                # Fetch binary data from doc storage.
+                # Stream the report from doc storage.
                 doc_name = search_detail.doc_storage_url
                 logger.info(f"Fetching search report {doc_name} from doc storage.")
-                raw_data = GoogleStorageService.get_document(doc_name)
-                size = len(raw_data)
-                if size < STREAMING_THRESHOLD:
-                    return raw_data, HTTPStatus.OK, {"Content-Type": "application/pdf"}
-                logger.info(f"streaming response report size={size}")
-
-                def stream(begin, end, raw_data):
-                    offset = max(0, begin)
-                    while offset < end:
-                        end_chunk = offset + (10 * 1024)
-                        buf = raw_data[offset:end_chunk]
-                        offset += len(buf)
-                        yield buf
-
-                resp = Response(stream_with_context(stream(0, size, raw_data)))
-                resp.headers["Content-Type"] = "application/pdf"
-                resp.status = HTTP_OK
-                return resp
+                return resource_utils.document_storage_response(doc_name)
 
             # If get to here report not yet generated: create, store, return it.
             logger.info(f"Generating search report for {search_id}.")
@@ -16,6 +16,10 @@
 from .authz import BASIC_USER, PPR_ROLE, STAFF_ROLE, SYSTEM_ROLE, authorized, is_staff
 from .flags import Flags
 from .queue_service import GoogleQueueService
+from .report_service import ReportService
+from .sql_profiler import SqlProfiler
 
 flags = Flags()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
 queue_service = GoogleQueueService()
+report_service = ReportService()
+sql_profiler = SqlProfiler()
@@ -600,3 +600,25 @@ INSERT INTO event_tracking(id, key_id, event_ts, event_tracking_type, status, me
   VALUES(200000016, 200000030, CURRENT_TIMESTAMP  at time zone 'utc' + interval '4 minutes', 'SURFACE_MAIL', 500, 'some error 3 9999999', null);
 INSERT INTO event_tracking(id, key_id, event_ts, event_tracking_type, status, message, email_address)
   VALUES(200000017, 200000030, CURRENT_TIMESTAMP  at time zone 'utc' + interval '6 minutes', 'SURFACE_MAIL', 500, 'max retries 9999999', null);
+
+-- Populate the account search history summary values of the test searches.
+UPDATE search_requests sc
+   SET history_criteria = CASE WHEN sc.search_type = 'BS' THEN UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'business')
+                               WHEN sc.search_type = 'IS' THEN concat(UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'last'), ' ', UPPER(sc.api_criteria -> 'criteria' -> 'debtorName' ->> 'first'))
+                               WHEN sc.search_type = 'MI' THEN concat(UPPER(sc.api_criteria -> 'criteria' -> 'ownerName' ->> 'last'), ' ', UPPER(sc.api_criteria -> 'criteria' -> 'ownerName' ->> 'first'))
+                               ELSE UPPER(sc.api_criteria -> 'criteria' ->> 'value') END,
+       history_username = ''
+ WHERE sc.id >= 200000000
+;
+UPDATE search_results sr
+   SET selected_match_count = CASE WHEN json_typeof(sr.api_result) = 'array' THEN json_array_length(sr.api_result) END,
+       selected_exact_count = (SELECT CASE WHEN sc.search_type IN ('MM', 'MI', 'MO', 'MS') THEN -1
+                                           WHEN json_typeof(sc.updated_selection) = 'array' THEN
+                                                (SELECT COUNT(*) FROM json_array_elements(sc.updated_selection) sc2 WHERE sc2 ->> 'matchType' = 'EXACT')
+                                           WHEN json_typeof(sr.api_result) = 'array' THEN
+                                                (SELECT COUNT(*) FROM json_array_elements(sr.api_result) sr2 WHERE sr2 ->> 'matchType' = 'EXACT')
+                                           ELSE 0 END
+                                 FROM search_requests sc
+                                WHERE sc.id = sr.search_id)
+ WHERE sr.search_id >= 200000000
+;
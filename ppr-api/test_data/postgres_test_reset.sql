@@ -27,6 +27,8 @@ DELETE FROM registrations
   WHERE financing_id >= 200000000;
 DELETE FROM previous_financing_statements
   WHERE financing_id >= 200000000;
+DELETE FROM searchable_financing_statements
+  WHERE financing_id >= 200000000;
 DELETE FROM financing_statements
   WHERE id >= 200000000;
 DELETE FROM drafts
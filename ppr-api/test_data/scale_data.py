@@ -0,0 +1,645 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generate a synthetic PPR dataset at production scale for local benchmarks and query plan work.
+
+Financing statements are created in batches with set based INSERT ... SELECT statements, one transaction per batch.
+Keys and registration numbers come from the database sequences and number functions, and all the debtor and serial
+search key columns are set with the same searchkey_* functions the API uses, so the data is searchable exactly like
+registry data. Names, makes and lenders are drawn from skewed distributions so common values repeat, as they do in
+production. A fraction of the statements have an amendment (adding a debtor and removing the first) and/or a
+discharge. Intended for use only in local and development environments.
+"""
+import random
+import time
+
+from sqlalchemy.sql import text
+
+from ppr_api.models import SearchableFinancingStatement
+
+LAST_NAMES = [
+    "SMITH",
+    "BROWN",
+    "LEE",
+    "WILSON",
+    "MARTIN",
+    "JOHNSON",
+    "SINGH",
+    "WANG",
+    "LI",
+    "CHEN",
+    "TAYLOR",
+    "ANDERSON",
+    "THOMPSON",
+    "WHITE",
+    "CAMPBELL",
+    "WONG",
+    "STEWART",
+    "CLARK",
+    "NGUYEN",
+    "GILL",
+    "SANDHU",
+    "DHALIWAL",
+    "GREWAL",
+    "KIM",
+    "PARK",
+    "MACDONALD",
+    "MCDONALD",
+    "ROBERTSON",
+    "SCOTT",
+    "YOUNG",
+    "WALKER",
+    "MILLER",
+    "MORRISON",
+    "REID",
+    "ROSS",
+    "MURPHY",
+    "KELLY",
+    "O'BRIEN",
+    "VAN DER MEER",
+    "DE JONG",
+    "ST. PIERRE",
+    "LEBLANC",
+    "TREMBLAY",
+    "GAGNON",
+    "ROY",
+    "COTE",
+    "BOUCHARD",
+    "PATEL",
+    "SHARMA",
+    "HUANG",
+    "ZHANG",
+    "LIU",
+    "HO",
+    "CHAN",
+    "TAN",
+    "NAKAMURA",
+    "TANAKA",
+    "JACKSON",
+    "HARRIS",
+    "LEWIS",
+    "HALL",
+    "ALLEN",
+    "KING",
+    "WRIGHT",
+    "HILL",
+    "GREEN",
+    "ADAMS",
+    "BAKER",
+    "NELSON",
+    "CARTER",
+    "MITCHELL",
+    "ROBINSON",
+    "FRASER",
+    "MACKENZIE",
+    "HAMILTON",
+    "GRAHAM",
+    "WATSON",
+    "JONES",
+    "WILLIAMS",
+    "DAVIS",
+    "EVANS",
+    "THOMAS",
+    "ROBERTS",
+    "JOHNSTON",
+    "SMITH-JONES",
+    "BAINS",
+    "SIDHU",
+    "JOHAL",
+    "DE LA CRUZ",
+]
+FIRST_NAMES = [
+    "JOHN",
+    "DAVID",
+    "MICHAEL",
+    "ROBERT",
+    "JAMES",
+    "WILLIAM",
+    "RICHARD",
+    "DANIEL",
+    "MARK",
+    "PAUL",
+    "STEVEN",
+    "BRIAN",
+    "KEVIN",
+    "JASON",
+    "CHRISTOPHER",
+    "RYAN",
+    "MATTHEW",
+    "JENNIFER",
+    "MARY",
+    "SARAH",
+    "LISA",
+    "KAREN",
+    "SUSAN",
+    "MICHELLE",
+    "LINDA",
+    "PATRICIA",
+    "ELIZABETH",
+    "JESSICA",
+    "EMILY",
+    "AMANDA",
+    "ASHLEY",
+    "ANGELA",
+    "NICOLE",
+    "HEATHER",
+    "JAGDEEP",
+    "HARPREET",
+    "GURPREET",
+    "MANDEEP",
+    "WEI",
+    "JIAN",
+    "MING",
+    "YAN",
+    "HUI",
+    "MIN-JUN",
+    "JEAN-PIERRE",
+    "MARIE",
+    "ANNE",
+    "PIERRE",
+    "MOHAMMED",
+    "ALI",
+    "FATIMA",
+    "PRIYA",
+    "RAJ",
+    "ANIL",
+    "HIROSHI",
+    "YUKI",
+    "TYLER",
+    "BRANDON",
+    "KYLE",
+    "JORDAN",
+    "TAYLOR",
+    "MORGAN",
+    "BOB",
+    "BILL",
+    "JIM",
+    "MIKE",
+    "DAVE",
+    "CHRIS",
+]
+BUSINESS_PREFIXES = [
+    "PACIFIC",
+    "COASTAL",
+    "NORTHERN",
+    "OKANAGAN",
+    "FRASER VALLEY",
+    "ISLAND",
+    "CASCADE",
+    "SUMMIT",
+    "EVERGREEN",
+    "GOLDEN",
+    "CEDAR",
+    "RIVERSIDE",
+    "MOUNTAIN VIEW",
+    "WESTCOAST",
+    "KOOTENAY",
+    "CARIBOO",
+    "SUNRISE",
+    "HARBOUR",
+    "MAPLE",
+    "ALPINE",
+    "THE BEST",
+    "A & B",
+    "J.R.",
+    "NORTH SHORE",
+    "PEACE RIVER",
+]
+BUSINESS_TYPES = [
+    "CONSTRUCTION",
+    "TRUCKING",
+    "LOGISTICS",
+    "EXCAVATING",
+    "CONTRACTING",
+    "DEVELOPMENTS",
+    "HOLDINGS",
+    "ENTERPRISES",
+    "LANDSCAPING",
+    "PLUMBING",
+    "ELECTRIC",
+    "FORESTRY",
+    "TRANSPORT",
+    "AUTO SALES",
+    "EQUIPMENT RENTALS",
+    "MARINE SERVICES",
+    "FARMS",
+    "ROOFING",
+    "PAVING",
+    "MOTORS",
+]
+BUSINESS_DESIGNATIONS = [
+    "LTD.",
+    "LTD",
+    "INC.",
+    "CORP.",
+    "LIMITED",
+    "INCORPORATED",
+    "CO. LTD.",
+    "CORPORATION",
+    "ULC",
+    "LLP",
+]
+LENDERS = [
+    "ROYAL BANK OF CANADA",
+    "THE TORONTO-DOMINION BANK",
+    "BANK OF MONTREAL",
+    "THE BANK OF NOVA SCOTIA",
+    "CANADIAN IMPERIAL BANK OF COMMERCE",
+    "FORD CREDIT CANADA COMPANY",
+    "TOYOTA CREDIT CANADA INC.",
+    "HONDA CANADA FINANCE INC.",
+    "GM FINANCIAL CANADA LEASING LTD.",
+    "VANCOUVER CITY SAVINGS CREDIT UNION",
+    "COAST CAPITAL SAVINGS FEDERAL CREDIT UNION",
+    "HYUNDAI CAPITAL LEASE INC.",
+    "NISSAN CANADA FINANCIAL SERVICES INC.",
+    "BMW CANADA INC.",
+    "MERCEDES-BENZ FINANCIAL SERVICES CANADA CORPORATION",
+    "CATERPILLAR FINANCIAL SERVICES LIMITED",
+    "JOHN DEERE FINANCIAL INC.",
+    "DE LAGE LANDEN FINANCIAL SERVICES CANADA INC.",
+    "RIFCO NATIONAL AUTO FINANCE CORP.",
+    "NATIONAL BANK OF CANADA",
+]
+CITIES = [
+    "VANCOUVER",
+    "SURREY",
+    "BURNABY",
+    "RICHMOND",
+    "ABBOTSFORD",
+    "COQUITLAM",
+    "KELOWNA",
+    "LANGLEY",
+    "SAANICH",
+    "DELTA",
+    "NANAIMO",
+    "KAMLOOPS",
+    "CHILLIWACK",
+    "VICTORIA",
+    "MAPLE RIDGE",
+    "PRINCE GEORGE",
+    "NEW WESTMINSTER",
+    "PENTICTON",
+    "VERNON",
+    "CAMPBELL RIVER",
+    "COURTENAY",
+    "FORT ST. JOHN",
+    "CRANBROOK",
+    "SQUAMISH",
+    "DAWSON CREEK",
+    "TERRACE",
+    "WILLIAMS LAKE",
+    "PRINCE RUPERT",
+    "NELSON",
+    "SMITHERS",
+]
+STREETS = [
+    "MAIN",
+    "KING GEORGE",
+    "GOVERNMENT",
+    "DOUGLAS",
+    "FRASER",
+    "HASTINGS",
+    "KINGSWAY",
+    "OAK",
+    "CEDAR",
+    "MAPLE",
+    "1ST",
+    "2ND",
+    "10TH",
+    "152ND",
+    "RIVER",
+    "LAKESHORE",
+    "HIGHLAND",
+    "PARK",
+    "VICTORIA",
+    "JOHNSTON",
+]
+STREET_TYPES = ["ST", "AVE", "RD", "DR", "BLVD", "WAY", "CRES", "HWY"]
+# Serial collateral values are MAKE|MODEL|SERIAL PREFIX.
+VEHICLES = [
+    "FORD|F-150|1FT",
+    "TOYOTA|COROLLA|2T1",
+    "HONDA|CIVIC|2HG",
+    "CHEVROLET|SILVERADO|1GC",
+    "FORD|ESCAPE|1FM",
+    "TOYOTA|RAV4|2T3",
+    "HONDA|CR-V|5J6",
+    "DODGE|RAM 1500|1C6",
+    "HYUNDAI|ELANTRA|KMH",
+    "KIA|SORENTO|5XY",
+    "NISSAN|ROGUE|JN8",
+    "MAZDA|CX-5|JM3",
+    "VOLKSWAGEN|JETTA|3VW",
+    "SUBARU|OUTBACK|4S4",
+    "GMC|SIERRA|1GT",
+    "TESLA|MODEL 3|5YJ",
+    "BMW|X5|5UX",
+    "JEEP|WRANGLER|1C4",
+    "KENWORTH|T880|1NK",
+    "FREIGHTLINER|CASCADIA|3AK",
+]
+TRAILERS = [
+    "WABASH|DRY VAN|1JJ",
+    "GREAT DANE|REEFER|1GR",
+    "FEATHERLITE|4926|4FG",
+    "BIG TEX|14LP|16V",
+    "JAYCO|JAY FLIGHT|1UJ",
+    "FOREST RIVER|ROCKWOOD|4X4",
+]
+HOMES = [
+    "MODULINE|ADVANTAGE|",
+    "TRIPLE M HOUSING|MHCSA|",
+    "SRI HOMES|WESTWOOD|",
+    "GLENDALE|CANADIANA|",
+    "NORTHLANDS|PRESTIGE|",
+    "SAFEWAY|SENTINEL|",
+]
+MARINE = [
+    "BAYLINER|ELEMENT|BUJ",
+    "SEA RAY|SUNDANCER|SER",
+    "BOSTON WHALER|MONTAUK|BWC",
+    "YAMAHA|F150|6AO",
+    "MERCURY|VERADO|2B0",
+    "HONDA MARINE|BF90|BBL",
+    "LUND|1875 CROSSOVER|LUN",
+]
+AIRCRAFT = [
+    "CESSNA|172S|172",
+    "PIPER|PA-28|28-",
+    "BEECHCRAFT|KING AIR 350|FL-",
+    "DE HAVILLAND|DHC-2 BEAVER|",
+    "BELL|206B|",
+    "AIRBUS HELICOPTERS|AS350|",
+]
+GENERAL_COLLATERAL = [
+    "ALL OF THE DEBTOR'S PRESENT AND AFTER ACQUIRED PERSONAL PROPERTY.",
+    "ALL PRESENT AND AFTER ACQUIRED INVENTORY AND PROCEEDS.",
+    "ALL PRESENT AND AFTER ACQUIRED ACCOUNTS RECEIVABLE.",
+    "ALL EQUIPMENT, TOOLS AND MACHINERY AND ALL ATTACHMENTS AND ACCESSIONS.",
+    "ALL CROPS AND LIVESTOCK NOW OR HEREAFTER OWNED BY THE DEBTOR.",
+    "ALL GOODS SUPPLIED BY THE SECURED PARTY FROM TIME TO TIME AND PROCEEDS.",
+]
+
+
+def pick(name: str, skew: int = 2) -> str:
+    """SQL expression choosing a random value from an array bind parameter: a higher skew favours the first values."""
+    array = f"CAST(:{name} AS VARCHAR[])"
+    return f"({array})[1 + floor(power(random(), {skew}) * cardinality({array}))::int]"
+
+
+LETTER = "substr('ABCEGHJKLMNPRSTVWXYZ', 1 + floor(random() * 20)::int, 1)"
+DIGIT = "floor(random() * 10)::int::text"
+
+CREATE_BATCH = f"""
+CREATE TEMPORARY TABLE scale_batch ON COMMIT DROP AS
+SELECT s.*,
+       nextval('financing_id_seq') AS financing_id,
+       nextval('registration_id_seq') AS registration_id,
+       nextval('draft_id_seq') AS draft_id,
+       get_registration_num() AS registration_num,
+       nextval('address_id_seq') AS address_id,
+       CASE WHEN s.life = 99 THEN NULL ELSE s.registration_ts + s.life * interval '365 days' END AS expire_date,
+       CASE WHEN s.amended THEN nextval('registration_id_seq') END AS amend_id,
+       CASE WHEN s.amended THEN nextval('draft_id_seq') END AS amend_draft_id,
+       CASE WHEN s.amended THEN get_registration_num() END AS amend_num,
+       s.registration_ts + s.span * 0.5 * random() AS amend_ts,
+       CASE WHEN s.discharged THEN nextval('registration_id_seq') END AS discharge_id,
+       CASE WHEN s.discharged THEN nextval('draft_id_seq') END AS discharge_draft_id,
+       CASE WHEN s.discharged THEN get_registration_num() END AS discharge_num,
+       s.registration_ts + s.span * (0.5 + 0.5 * random()) AS discharge_ts
+  FROM (SELECT t.*,
+               (now() at time zone 'utc') - t.age AS registration_ts,
+               CASE WHEN t.life = 99 THEN t.age ELSE LEAST(t.age, t.life * interval '365 days') END AS span
+          FROM (SELECT g,
+                       random() * interval '3650 days' AS age,
+                       (ARRAY[1, 1, 2, 3, 4, 5, 5, 5, 7, 10, 15, 25, 99])[1 + floor(random() * 13)::int] AS life,
+                       random() < :amend_rate AS amended,
+                       random() < :discharge_rate AS discharged,
+                       random() < :general_rate AS general,
+                       1 + floor(power(random(), 3) * :max_debtors)::int AS debtor_count,
+                       floor(power(random(), 2) * (:max_serials + 1))::int AS serial_count,
+                       (100000 + floor(power(random(), 3) * :account_count)::int)::text AS account_id,
+                       {pick("lenders", 3)} AS secured_name
+                  FROM generate_series(1, :size) AS g) t) s
+"""
+INSERT_DRAFTS = """
+INSERT INTO drafts(id, document_number, account_id, create_ts, registration_type_cl, registration_type,
+                   registration_number, draft)
+SELECT draft_id, get_draft_document_number(), account_id, registration_ts, 'PPSALIEN', 'SA', registration_num,
+       CAST('{}' AS JSON)
+  FROM scale_batch
+UNION ALL
+SELECT amend_draft_id, get_draft_document_number(), account_id, amend_ts, 'AMENDMENT', 'AM', amend_num,
+       CAST('{}' AS JSON)
+  FROM scale_batch
+ WHERE amended
+UNION ALL
+SELECT discharge_draft_id, get_draft_document_number(), account_id, discharge_ts, 'DISCHARGE', 'DC', discharge_num,
+       CAST('{}' AS JSON)
+  FROM scale_batch
+ WHERE discharged
+"""
+INSERT_FINANCING_STATEMENTS = """
+INSERT INTO financing_statements(id, state_type, expire_date, life, discharged)
+SELECT financing_id,
+       CASE WHEN discharged THEN 'HDC'
+            WHEN expire_date IS NOT NULL AND expire_date < (now() at time zone 'utc') THEN 'HEX'
+            ELSE 'ACT' END,
+       expire_date, life,
+       CASE WHEN discharged THEN 'Y' END
+  FROM scale_batch
+"""
+INSERT_REGISTRATIONS = """
+INSERT INTO registrations(id, financing_id, registration_number, base_reg_number, registration_type,
+                          registration_type_cl, registration_ts, draft_id, life, account_id)
+SELECT registration_id, financing_id, registration_num, NULL, 'SA', 'PPSALIEN', registration_ts, draft_id, life,
+       account_id
+  FROM scale_batch
+UNION ALL
+SELECT amend_id, financing_id, amend_num, registration_num, 'AM', 'AMENDMENT', amend_ts, amend_draft_id, NULL,
+       account_id
+  FROM scale_batch
+ WHERE amended
+UNION ALL
+SELECT discharge_id, financing_id, discharge_num, registration_num, 'DC', 'DISCHARGE', discharge_ts,
+       discharge_draft_id, NULL, account_id
+  FROM scale_batch
+ WHERE discharged
+"""
+INSERT_ADDRESSES = f"""
+INSERT INTO addresses(id, street, city, region, postal_code, country)
+SELECT address_id,
+       (100 + floor(random() * 19900)::int)::text || ' ' || {pick("streets")} || ' ' || {pick("street_types")},
+       {pick("cities")},
+       'BC',
+       'V' || {DIGIT} || {LETTER} || ' ' || {DIGIT} || {LETTER} || {DIGIT},
+       'CA'
+  FROM scale_batch
+"""
+INSERT_REGISTERING_SECURED_PARTIES = """
+INSERT INTO parties(id, party_type, registration_id, financing_id, business_name, address_id)
+SELECT nextval('party_id_seq'), p.party_type, p.registration_id, b.financing_id, b.secured_name, b.address_id
+  FROM scale_batch b,
+       LATERAL (VALUES ('RG', b.registration_id), ('SP', b.registration_id), ('RG', b.amend_id),
+                       ('RG', b.discharge_id)) AS p(party_type, registration_id)
+ WHERE p.registration_id IS NOT NULL
+"""
+# The first debtor of an amended statement is removed by the amendment, which adds a new debtor.
+INSERT_DEBTORS = f"""
+INSERT INTO parties(id, party_type, registration_id, financing_id, registration_id_end, first_name, middle_initial,
+                    last_name, business_name, address_id, first_name_key, last_name_key, business_srch_key,
+                    last_name_split1, last_name_split2, last_name_split3, first_name_split1, first_name_split2,
+                    first_name_char1, first_name_char2, first_name_key_char1, bus_name_base, bus_name_key_char1)
+SELECT nextval('party_id_seq'), k.party_type, k.registration_id, k.financing_id, k.registration_id_end,
+       k.first_name, k.middle_initial, k.last_name, k.business_name, k.address_id, k.first_name_key,
+       k.last_name_key, k.business_srch_key, k.last_name_split1, k.last_name_split2, k.last_name_split3,
+       k.first_name_split1, k.first_name_split2, substr(k.first_name, 1, 1), NULLIF(substr(k.first_name, 2, 1), ''),
+       substr(k.first_name_key, 1, 1), k.bus_name_base, substr(k.business_srch_key, 1, 1)
+  FROM (SELECT d.*,
+               CASE WHEN d.party_type = 'DI' THEN searchkey_individual(d.last_name, d.first_name) END AS first_name_key,
+               CASE WHEN d.party_type = 'DI' THEN searchkey_last_name(d.last_name) END AS last_name_key,
+               CASE WHEN d.party_type = 'DI' THEN individual_split_1(d.last_name) END AS last_name_split1,
+               CASE WHEN d.party_type = 'DI' THEN individual_split_2(d.last_name) END AS last_name_split2,
+               CASE WHEN d.party_type = 'DI' THEN individual_split_3(d.last_name) END AS last_name_split3,
+               CASE WHEN d.party_type = 'DI' THEN individual_split_1(d.first_name) END AS first_name_split1,
+               CASE WHEN d.party_type = 'DI' THEN individual_split_2(d.first_name) END AS first_name_split2,
+               CASE WHEN d.party_type = 'DB' THEN searchkey_business_name(d.business_name) END AS business_srch_key,
+               CASE WHEN d.party_type = 'DB' THEN business_name_strip_designation(d.business_name) END AS bus_name_base
+          FROM (SELECT p.*,
+                       CASE WHEN p.party_type = 'DI' THEN {pick("first_names")} END AS first_name,
+                       CASE WHEN p.party_type = 'DI' AND random() < 0.4 THEN {LETTER} END AS middle_initial,
+                       CASE WHEN p.party_type = 'DI' THEN {pick("last_names", 3)} END AS last_name,
+                       CASE WHEN p.party_type = 'DI' THEN NULL
+                            WHEN random() < 0.15
+                            THEN lpad(floor(random() * 10000000)::int::text, 7, '0') || ' B.C. LTD.'
+                            ELSE {pick("business_prefixes")} || ' ' || {pick("business_types")} || ' ' ||
+                                 {pick("business_designations")} END AS business_name
+                  FROM (SELECT b.registration_id, b.financing_id, b.address_id,
+                               CASE WHEN n = 1 AND b.amended THEN b.amend_id END AS registration_id_end,
+                               CASE WHEN random() < :individual_rate THEN 'DI' ELSE 'DB' END AS party_type
+                          FROM scale_batch b, generate_series(1, b.debtor_count) AS n
+                        UNION ALL
+                        SELECT b.amend_id, b.financing_id, b.address_id, NULL,
+                               CASE WHEN random() < :individual_rate THEN 'DI' ELSE 'DB' END
+                          FROM scale_batch b
+                         WHERE b.amended) p) d) k
+"""
+INSERT_SERIAL_COLLATERAL = f"""
+INSERT INTO serial_collateral(id, serial_type, registration_id, financing_id, year, make, model, serial_number,
+                              mhr_number, srch_vin)
+SELECT nextval('vehicle_id_seq'), v.serial_type, v.registration_id, v.financing_id, v.year,
+       split_part(v.vehicle, '|', 1), split_part(v.vehicle, '|', 2), v.serial_number,
+       CASE WHEN v.serial_type = 'MH' THEN searchkey_mhr(v.mhr_number) END,
+       CASE WHEN v.serial_type IN ('AC', 'AF', 'AP') THEN searchkey_aircraft(v.serial_number)
+            ELSE searchkey_vehicle(v.serial_number) END
+  FROM (SELECT s.*,
+               split_part(s.vehicle, '|', 3) ||
+               CASE WHEN s.serial_type IN ('MV', 'TR') THEN upper(substr(md5(random()::text), 1, 14))
+                    WHEN s.serial_type IN ('BO', 'OB') THEN upper(substr(md5(random()::text), 1, 9))
+                    WHEN s.serial_type = 'MH' THEN lpad(floor(random() * 1000000)::int::text, 6, '0')
+                    ELSE floor(random() * 99999)::int::text END AS serial_number,
+               lpad(floor(random() * 110000)::int::text, 6, '0') AS mhr_number
+          FROM (SELECT t.registration_id, t.financing_id, t.serial_type,
+                       CASE WHEN t.serial_type = 'MV' THEN {pick("vehicles")}
+                            WHEN t.serial_type = 'TR' THEN {pick("trailers")}
+                            WHEN t.serial_type = 'MH' THEN {pick("homes")}
+                            WHEN t.serial_type IN ('BO', 'OB') THEN {pick("marine")}
+                            ELSE {pick("aircraft")} END AS vehicle,
+                       CASE WHEN t.serial_type = 'MH' THEN 1965 + floor(random() * 55)::int
+                            ELSE EXTRACT(YEAR FROM now())::int - floor(power(random(), 2) * 25)::int END AS year
+                  FROM (SELECT b.registration_id, b.financing_id,
+                               CASE WHEN r < 0.70 THEN 'MV' WHEN r < 0.80 THEN 'TR' WHEN r < 0.86 THEN 'MH'
+                                    WHEN r < 0.92 THEN 'BO' WHEN r < 0.96 THEN 'OB' WHEN r < 0.98 THEN 'AC'
+                                    WHEN r < 0.99 THEN 'AF' ELSE 'AP' END AS serial_type
+                          FROM (SELECT b.*, n, random() AS r
+                                  FROM scale_batch b, generate_series(1, b.serial_count) AS n) b) t) s) v
+"""
+INSERT_GENERAL_COLLATERAL = f"""
+INSERT INTO general_collateral(id, registration_id, financing_id, description)
+SELECT nextval('general_id_seq'), registration_id, financing_id, {pick("general_collateral", 1)}
+  FROM scale_batch
+ WHERE general
+"""
+BATCH_STATEMENTS = [
+    ("drafts", INSERT_DRAFTS),
+    ("financing_statements", INSERT_FINANCING_STATEMENTS),
+    ("registrations", INSERT_REGISTRATIONS),
+    ("addresses", INSERT_ADDRESSES),
+    ("parties", INSERT_REGISTERING_SECURED_PARTIES),
+    ("parties", INSERT_DEBTORS),
+    ("serial_collateral", INSERT_SERIAL_COLLATERAL),
+    ("general_collateral", INSERT_GENERAL_COLLATERAL),
+]
+
+
+def generate(  # pylint: disable=too-many-arguments,too-many-locals
+    session,
+    financing_count: int,
+    batch_size: int = 10000,
+    seed: int = None,
+    amend_rate: float = 0.2,
+    discharge_rate: float = 0.15,
+    individual_rate: float = 0.7,
+    max_debtors: int = 3,
+    max_serials: int = 3,
+    account_count: int = 2000,
+) -> dict:
+    """Insert financing_count synthetic financing statements in batches, returning the inserted row counts by table.
+
+    With a seed the random values are repeatable: the generated keys and registration numbers depend on the
+    current database sequence values.
+    """
+    params = {
+        "amend_rate": amend_rate,
+        "discharge_rate": discharge_rate,
+        "general_rate": 0.4,
+        "individual_rate": individual_rate,
+        "max_debtors": max_debtors,
+        "max_serials": max_serials,
+        "account_count": account_count,
+        "last_names": LAST_NAMES,
+        "first_names": FIRST_NAMES,
+        "business_prefixes": BUSINESS_PREFIXES,
+        "business_types": BUSINESS_TYPES,
+        "business_designations": BUSINESS_DESIGNATIONS,
+        "lenders": LENDERS,
+        "cities": CITIES,
+        "streets": STREETS,
+        "street_types": STREET_TYPES,
+        "vehicles": VEHICLES,
+        "trailers": TRAILERS,
+        "homes": HOMES,
+        "marine": MARINE,
+        "aircraft": AIRCRAFT,
+        "general_collateral": GENERAL_COLLATERAL,
+    }
+    seeds = random.Random(seed)  # noqa: S311; test data only
+    counts: dict = {}
+    start = time.perf_counter()
+    created: int = 0
+    while created < financing_count:
+        params["size"] = min(batch_size, financing_count - created)
+        if seed is not None:
+            session.execute(text("SELECT setseed(:seed)"), {"seed": seeds.uniform(-1, 1)})
+        session.execute(text(CREATE_BATCH), params)
+        for table, statement in BATCH_STATEMENTS:
+            result = session.execute(text(statement), params)
+            counts[table] = counts.get(table, 0) + result.rowcount
+        session.commit()
+        created += params["size"]
+        print(f"Created {created} of {financing_count} financing statements in {time.perf_counter() - start:.1f}s")
+    print("Reconciling searchable financing statements")
+    SearchableFinancingStatement.reconcile()
+    print(f"Row counts: {counts}")
+    return counts
@@ -0,0 +1,179 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the PPR search queries and track their query plans against a stored baseline.
+
+Every search_utils search query runs with a fixed corpus of criteria, built exactly as the API builds it for the
+configured financing statement filter mode. Each query records the latency percentiles, the number of rows returned
+and the EXPLAIN (ANALYZE, BUFFERS) plan. Compared to a baseline from the same database, a changed plan shape (for
+example a sequential scan replacing an index scan) or a p95 latency increase beyond the tolerance is a regression.
+Intended for use against a local database loaded with generate_scale_data.
+"""
+import json
+import math
+import time
+
+from flask import current_app
+from sqlalchemy.sql import text
+
+from ppr_api.models import search_utils
+from ppr_api.models.search_request import get_search_query, get_serial_search_query
+
+# Benchmark name: criteria values. Individual debtor names are last, first and optional middle name.
+CRITERIA = {
+    "registration": ["TEST0001", "100001R", "999999X"],
+    "serial": ["KX8J3CA46JU622994", "JU622994", "1FT5D1A0B2C3D4E5F", "ZZ99999999"],
+    "mhr_number": ["21324", "022000", "109999"],
+    "aircraft": ["CFYXW", "17212345", "AF16031"],
+    "business": ["TEST BUS 3 DEBTOR", "PACIFIC TRUCKING LTD.", "0123456 B.C. LTD.", "NORTHERN CONSTRUCTION INC."],
+    "individual": [["SMITH", "JOHN"], ["VAN DER MEER", "ANNE"], ["LEE", "J"], ["TEST IND DEBTOR", "TEST"]],
+    "individual_middle": [["SMITH", "JOHN", "ROBERT"], ["NGUYEN", "MIN-JUN", "A"], ["O'BRIEN", "MARY", "ANNE"]],
+}
+SERIAL_SEARCH_TYPES = {"serial": "SS", "mhr_number": "MH", "aircraft": "AC"}
+PERCENTILES = (50, 95, 99)
+MIN_REGRESSION_MS: float = 5.0
+
+
+def get_cases(criteria: dict) -> list:
+    """Build the (benchmark name, criteria label, query, parameters) for every search query and criteria value."""
+    config = current_app.config
+    cases = []
+    for value in criteria.get("registration", []):
+        cases.append(("registration", value, get_search_query(search_utils.REG_NUM_QUERY), {"query_value": value}))
+    for name, search_type in SERIAL_SEARCH_TYPES.items():
+        query: str = get_serial_search_query(search_type)
+        for value in criteria.get(name, []):
+            cases.append((name, value, query, {"query_value": value}))
+    query = get_search_query(search_utils.BUSINESS_NAME_QUERY)
+    for value in criteria.get("business", []):
+        params = {
+            "query_bus_name": value,
+            "query_bus_quotient": config.get("SIMILARITY_QUOTIENT_BUSINESS_NAME"),
+        }
+        cases.append(("business", value, query, params))
+    name_params = {
+        "query_last_quotient": config.get("SIMILARITY_QUOTIENT_LAST_NAME"),
+        "query_first_quotient": config.get("SIMILARITY_QUOTIENT_FIRST_NAME"),
+        "query_default_quotient": config.get("SIMILARITY_QUOTIENT_DEFAULT"),
+    }
+    query = get_search_query(search_utils.INDIVIDUAL_NAME_QUERY)
+    for last, first in criteria.get("individual", []):
+        params = dict(name_params, query_last=last, query_first=first)
+        cases.append(("individual", f"{last}, {first}", query, params))
+    query = get_search_query(search_utils.INDIVIDUAL_NAME_MIDDLE_QUERY)
+    for last, first, middle in criteria.get("individual_middle", []):
+        params = dict(name_params, query_last=last, query_first=first, query_middle=middle)
+        cases.append(("individual_middle", f"{last}, {first} {middle}", query, params))
+    return cases
+
+
+def percentile(sorted_values: list, percent: int) -> float:
+    """Nearest rank percentile of an ascending list."""
+    return sorted_values[max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)]
+
+
+def plan_shape(node: dict) -> list:
+    """Get the plan node types in depth first order with the relation and index each node reads."""
+    shape = node.get("Node Type", "")
+    if node.get("Relation Name"):
+        shape += " on " + node["Relation Name"]
+    if node.get("Index Name"):
+        shape += " using " + node["Index Name"]
+    result = [shape]
+    for child in node.get("Plans", []):
+        result.extend(plan_shape(child))
+    return result
+
+
+def run_case(session, query: str, params: dict, iterations: int) -> dict:
+    """Time the query over the iterations after a warm up run, then capture the analyzed plan."""
+    session.execute(text(query), params).fetchall()
+    timings = []
+    rows: int = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        rows = len(session.execute(text(query), params).fetchall())
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    result = session.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query), params).scalar()
+    plan = result if isinstance(result, list) else json.loads(result)
+    session.rollback()
+    summary = {"rows": rows, "maxMs": round(timings[-1], 2)}
+    for percent in PERCENTILES:
+        summary[f"p{percent}Ms"] = round(percentile(timings, percent), 2)
+    summary["planShape"] = plan_shape(plan[0]["Plan"])
+    summary["plan"] = plan[0]
+    return summary
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> tuple:
+    """Compare the results to the baseline, returning the regressions and the warnings."""
+    regressions = []
+    warnings = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            warnings.append(f"{key}: not in the baseline")
+            continue
+        if result["planShape"] != previous["planShape"]:
+            seq_scans = {node for node in result["planShape"] if node.startswith("Seq Scan")}
+            new_scans = sorted(seq_scans - set(previous["planShape"]))
+            detail = f" new {', '.join(new_scans)}" if new_scans else ""
+            regressions.append(f"{key}: plan shape changed{detail}")
+        limit = previous["p95Ms"] * (1 + tolerance)
+        if result["p95Ms"] > limit and result["p95Ms"] - previous["p95Ms"] >= MIN_REGRESSION_MS:
+            regressions.append(f"{key}: p95 {result['p95Ms']}ms exceeds baseline {previous['p95Ms']}ms")
+        if result["rows"] != previous["rows"]:
+            warnings.append(f"{key}: {result['rows']} rows returned, baseline {previous['rows']}")
+    return regressions, warnings
+
+
+def run(  # pylint: disable=too-many-arguments
+    session,
+    iterations: int = 10,
+    criteria_file: str = None,
+    baseline_file: str = None,
+    save_baseline: bool = False,
+    output_file: str = None,
+    tolerance: float = 0.5,
+) -> list:
+    """Run the benchmark, optionally comparing to or saving the baseline, and return the regressions."""
+    criteria = CRITERIA
+    if criteria_file:
+        with open(criteria_file, "r") as data_file:
+            criteria = json.load(data_file)
+    results = {}
+    for name, label, query, params in get_cases(criteria):
+        summary = run_case(session, query, params, iterations)
+        results[f"{name}: {label}"] = summary
+        print(
+            f"{name:<18} {label:<32} rows={summary['rows']:<5} p50={summary['p50Ms']}ms "
+            f"p95={summary['p95Ms']}ms p99={summary['p99Ms']}ms"
+        )
+    if output_file:
+        with open(output_file, "w") as data_file:
+            json.dump(results, data_file, indent=2)
+    regressions = []
+    if baseline_file and save_baseline:
+        with open(baseline_file, "w") as data_file:
+            json.dump(results, data_file, indent=2)
+        print(f"Saved the baseline to {baseline_file}")
+    elif baseline_file:
+        with open(baseline_file, "r") as data_file:
+            baseline = json.load(data_file)
+        regressions, warnings = compare(results, baseline, tolerance)
+        for message in warnings:
+            print("WARNING " + message)
+        for message in regressions:
+            print("REGRESSION " + message)
+    return regressions
@@ -0,0 +1,88 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark the search step 2 selection index against the previous nested list scans.
+
+Building the search details from a selection of up to the maximum search results size is timed with the selection
+index and with the nested scans it replaced, and the results of both are compared. No database is used.
+"""
+import time
+
+from ppr_api.models import search_utils
+from ppr_api.models import utils as model_utils
+from ppr_api.models.search_selection import build_selection_details
+
+SIZES = (500, 1000, 2500, search_utils.SEARCH_RESULTS_MAX_SIZE)
+
+
+def build_data(size: int) -> tuple:
+    """Build the search selection and search details: every 4th similar match is not selected, every 10th repeats."""
+    search_select = []
+    results = []
+    for index in range(size):
+        reg_num = f"{index:06d}B"
+        match_type = model_utils.SEARCH_MATCH_EXACT if index % 2 == 0 else model_utils.SEARCH_MATCH_SIMILAR
+        select = {"baseRegistrationNumber": reg_num, "matchType": match_type}
+        if match_type == model_utils.SEARCH_MATCH_SIMILAR and index % 4 == 1:
+            select["selected"] = False
+        search_select.append(select)
+        if index % 10 == 0:
+            search_select.append(select)
+        results.append({"matchType": match_type, "financingStatement": {"baseRegistrationNumber": reg_num}})
+    return search_select, list(reversed(results))
+
+
+def build_details_nested(search_select: list, results: list) -> tuple:
+    """Build the search details with the nested list scans the selection index replaced."""
+    new_results = []
+    similar_count = 0
+    for select in search_select:
+        if select["matchType"] == model_utils.SEARCH_MATCH_EXACT or ("selected" not in select or select["selected"]):
+            if select["matchType"] != model_utils.SEARCH_MATCH_EXACT:
+                similar_count += 1
+            reg_num = select["baseRegistrationNumber"]
+            found = False
+            for match in new_results:
+                if match["financingStatement"]["baseRegistrationNumber"] == reg_num:
+                    found = True
+            if not found:
+                for result in results:
+                    if reg_num == result["financingStatement"]["baseRegistrationNumber"]:
+                        new_results.append(result)
+                        break
+    return new_results, similar_count
+
+
+def time_best(function, iterations: int, *args) -> tuple:
+    """Return the fastest of the timed runs in milliseconds and the function result."""
+    best: float = None
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 3), result
+
+
+def run(sizes: tuple = SIZES, iterations: int = 5) -> list:
+    """Run the benchmark for each selection size, returning the sizes where the results differ."""
+    mismatches = []
+    for size in sizes:
+        search_select, results = build_data(size)
+        index_ms, index_result = time_best(build_selection_details, iterations, search_select, results)
+        nested_ms, nested_result = time_best(build_details_nested, iterations, search_select, results)
+        if index_result != nested_result:
+            mismatches.append(size)
+        print(f"build details size={size:<6} index={index_ms}ms nested={nested_ms}ms")
+    return mismatches
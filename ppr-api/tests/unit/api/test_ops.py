@@ -18,6 +18,19 @@ Test-Suite to ensure that the /ops endpoint is working as expected.
 """
 from http import HTTPStatus
 
+import pytest
+
+from ppr_api.services.authz import PPR_ROLE, STAFF_ROLE
+from tests.unit.services.utils import create_header, create_header_account
+
+
+# testdata pattern is ({description}, {roles}, {status})
+TEST_OPS_STAFF_DATA = [
+    ('Staff', [PPR_ROLE, STAFF_ROLE], HTTPStatus.OK),
+    ('Non-staff', [PPR_ROLE], HTTPStatus.UNAUTHORIZED),
+    ('Missing token', None, HTTPStatus.UNAUTHORIZED)
+]
+
 
 def test_health_check(session, client, jwt):
     """Assert that a party code for a non-existent party returns a 404 error."""
@@ -27,3 +40,39 @@ def test_health_check(session, client, jwt):
     rv = client.get('/ops/healthz')
     # check
     assert rv.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize('desc,roles,status', TEST_OPS_STAFF_DATA)
+def test_reload_reference_cache(session, client, jwt, desc, roles, status):
+    """Assert that a reference cache reload request returns the expected status."""
+    # setup
+    headers = None
+    if roles and STAFF_ROLE in roles:
+        headers = create_header(jwt, roles)
+    elif roles:
+        headers = create_header_account(jwt, roles)
+    # test
+    rv = client.post('/ops/reference-cache', headers=headers)
+    # check
+    assert rv.status_code == status
+    if status == HTTPStatus.OK:
+        assert rv.json['version'] > 0
+        assert rv.json['tables']['registration_types'] > 0
+
+
+@pytest.mark.parametrize('desc,roles,status', TEST_OPS_STAFF_DATA)
+def test_get_sql_profiles(session, client, jwt, desc, roles, status):
+    """Assert that a get SQL profiles request returns the expected status."""
+    # setup
+    headers = None
+    if roles and STAFF_ROLE in roles:
+        headers = create_header(jwt, roles)
+    elif roles:
+        headers = create_header_account(jwt, roles)
+    # test
+    rv = client.get('/ops/sql-profiles', headers=headers)
+    # check
+    assert rv.status_code == status
+    if status == HTTPStatus.OK:
+        assert 'enabled' in rv.json
+        assert isinstance(rv.json['profiles'], list)
@@ -447,3 +447,45 @@ def test_patch_api_gw_user_if_missing(session, client, jwt, desc, from_api_gw):
             assert res
             mock_account_org.assert_called_once()
             mock_get_or_create.assert_called_once()
+
+
+# testdata pattern is ({description}, {headers}, {status}, {start}, {stop})
+TEST_DOCUMENT_RANGE_DATA = [
+    ('No conditions', {}, HTTPStatus.OK, 0, 1000),
+    ('ETag match', {'If-None-Match': '"etag1"'}, HTTPStatus.NOT_MODIFIED, 0, 0),
+    ('ETag no match', {'If-None-Match': '"etag2"'}, HTTPStatus.OK, 0, 1000),
+    ('Range', {'Range': 'bytes=100-199'}, HTTPStatus.PARTIAL_CONTENT, 100, 200),
+    ('Range open end', {'Range': 'bytes=900-'}, HTTPStatus.PARTIAL_CONTENT, 900, 1000),
+    ('Range suffix', {'Range': 'bytes=-10'}, HTTPStatus.PARTIAL_CONTENT, 990, 1000),
+    ('Range unsatisfiable', {'Range': 'bytes=1000-'}, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, 0, 0),
+    ('Multiple ranges', {'Range': 'bytes=0-9,20-29'}, HTTPStatus.OK, 0, 1000),
+    ('If-Range match', {'Range': 'bytes=0-9', 'If-Range': '"etag1"'}, HTTPStatus.PARTIAL_CONTENT, 0, 10),
+    ('If-Range changed', {'Range': 'bytes=0-9', 'If-Range': '"etag2"'}, HTTPStatus.OK, 0, 1000)
+]
+
+
+@pytest.mark.parametrize('desc,headers,status,start,stop', TEST_DOCUMENT_RANGE_DATA)
+def test_get_document_range(app, desc, headers, status, start, stop):
+    """Assert that the conditional and range request headers are evaluated as expected."""
+    with app.test_request_context(headers=headers) as context:
+        result = resource_utils.get_document_range(context.request, 'etag1', 1000)
+    assert result == (status, start, stop)
+
+
+def test_document_storage_response(app):
+    """Assert that a stored document range is streamed with the expected headers."""
+    blob = MagicMock(size=1000, etag='etag1')
+    with (
+        app.test_request_context(headers={'Range': 'bytes=100-199'}),
+        patch('ppr_api.resources.utils.GoogleStorageService.get_document_info', return_value=blob),
+        patch('ppr_api.resources.utils.GoogleStorageService.stream_document',
+              return_value=iter([b'x' * 100])) as mock_stream
+    ):
+        response = resource_utils.document_storage_response('test.pdf')
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert response.headers['Content-Range'] == 'bytes 100-199/1000'
+        assert response.headers['Content-Length'] == '100'
+        assert response.headers['ETag'] == '"etag1"'
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert response.get_data() == b'x' * 100
+        mock_stream.assert_called_once_with(blob, None, 100, 200)
@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Google Storage token tests."""
-from ppr_api.callback.auth.token_service import GoogleStorageTokenService
+import time
+
+import pytest
+
+from ppr_api.callback.auth.token_service import GoogleStorageTokenService, TokenCache
 
 
 def test_get_token(session, client, jwt):
@@ -26,3 +30,31 @@ def test_get_credentials(session, client, jwt):
     """Assert that the configuration to get a google storage token works as expected (no exceptions)."""
     credentials = GoogleStorageTokenService.get_credentials()
     assert credentials
+
+
+# testdata pattern is ({description}, {expires in seconds}, {second token}, {fetch count}, {cached token})
+TEST_CACHE_DATA = [
+    ('Valid token reused', 3600, 'token1', 1, 'token1'),
+    ('Expiring token refreshed in the background', 60, 'token1', 2, 'token2'),
+    ('Expired token fetched', -60, 'token2', 2, 'token2')
+]
+
+
+@pytest.mark.parametrize('desc,expires_in,second_token,fetch_count,cached_token', TEST_CACHE_DATA)
+def test_token_cache(session, desc, expires_in, second_token, fetch_count, cached_token):
+    """Assert that the service token cache reuses and refreshes tokens as expected."""
+    cache = TokenCache()
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return f'token{len(fetched)}', time.time() + expires_in
+
+    assert cache.get('audience', fetch) == 'token1'
+    assert cache.get('audience', fetch) == second_token
+    for _ in range(40):
+        if not cache.refreshing:
+            break
+        time.sleep(0.05)
+    assert len(fetched) == fetch_count
+    assert cache.tokens['audience'][0] == cached_token
@@ -73,6 +73,13 @@ TEST_DEBTOR_NAME_DATA = [
     ('Valid Business', 'TEST0002', 'DB', 'Test Bus', True),
     ('Invalid Business', 'TEST0002', 'DB', 'Text Bus', False),
 ]
+# testdata pattern is ({description}, {registration numbers}, {results size})
+TEST_BULK_LOAD_DATA = [
+    ('Multiple', ['TEST0001', 'TEST0002', 'TEST0022'], 3),
+    ('Duplicates', ['TEST0001', 'TEST0001', 'TEST0002'], 2),
+    ('Not found excluded', ['TEST0001', 'TESTXXXX'], 1),
+    ('Empty', [], 0)
+]
 # testdata pattern is ({registration number}, {results size})
 TEST_DEBTOR_NAMES_DATA = [
     ('TEST0001', 4),
@@ -271,6 +278,19 @@ def test_find_by_registration_number(session, desc, reg_number, reg_type, accoun
         assert request_err.value.status_code == status
 
 
+@pytest.mark.parametrize('desc,reg_nums,results_size', TEST_BULK_LOAD_DATA)
+def test_find_all_by_registration_numbers(session, desc, reg_nums, results_size):
+    """Assert that bulk loading financing statements by registration number works as expected."""
+    statements = FinancingStatement.find_all_by_registration_numbers(reg_nums)
+    assert len(statements) == results_size
+    for reg_num, statement in statements.items():
+        expected = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+        statement.include_changes_json = True
+        expected.include_changes_json = True
+        assert statement.json == expected.json
+        assert statement.json['baseRegistrationNumber'] == reg_num
+
+
 @pytest.mark.parametrize('desc,reg_number,type,debtor_name,valid', TEST_DEBTOR_NAME_DATA)
 def test_validate_debtor_name(session, desc, reg_number, type, debtor_name, valid):
     """Assert that base debtor check on an existing registration works as expected."""
@@ -0,0 +1,78 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the type table reference data cache is working as expected."""
+import pytest
+from sqlalchemy import inspect
+
+from ppr_api.models import CountryType, ProvinceType, RegistrationType, reference_cache
+from ppr_api.models.reference_cache import ReferenceCache
+from ppr_api.models.type_tables import REFERENCE_TYPES, RegistrationTypes
+
+
+# testdata pattern is ({description}, {ttl}, {loads})
+TEST_CACHE_DATA = [
+    ('Cached', 300, 1),
+    ('Expired', -1, 0),
+    ('Disabled', 0, 0)
+]
+# testdata pattern is ({model}, {key}, {exists})
+TEST_FIND_DATA = [
+    (RegistrationType, RegistrationTypes.CL.value, True),
+    (RegistrationType, 'XX', False),
+    (RegistrationType, None, False),
+    (CountryType, 'CA', True),
+    (ProvinceType, 'BC', True),
+    (ProvinceType, 'XX', False)
+]
+
+
+@pytest.mark.parametrize('desc,ttl,loads', TEST_CACHE_DATA)
+def test_cache_get(session, desc, ttl, loads):
+    """Assert that lookups are served from memory until the time to live expires."""
+    cache = ReferenceCache(ttl)
+    result = cache.get(RegistrationType, RegistrationTypes.CL.value)
+    assert result
+    assert result.registration_desc
+    result = cache.get(RegistrationType, RegistrationTypes.CL.value)
+    assert result
+    stats = cache.stats()
+    assert stats['loads'] == loads
+    assert stats['hits'] == loads
+
+
+@pytest.mark.parametrize('model,key,exists', TEST_FIND_DATA)
+def test_cache_find(session, model, key, exists):
+    """Assert that cached records are transient copies of the type table rows."""
+    result = reference_cache.reference_cache.get(model, key)
+    if exists:
+        assert result
+        assert inspect(result).transient
+        assert model.find_all()
+    else:
+        assert not result
+
+
+def test_cache_reload(session):
+    """Assert that a reload replaces all the cached tables and changes the version."""
+    cache = ReferenceCache(300)
+    cache.get(RegistrationType, RegistrationTypes.CL.value)
+    count: int = cache.reload(REFERENCE_TYPES)
+    stats = cache.stats()
+    assert count > 0
+    assert stats['version'] == 1
+    assert len(stats['tables']) == len(REFERENCE_TYPES)
+    assert stats['loads'] == len(REFERENCE_TYPES) + 1
+    cache.clear()
+    assert not cache.stats()['tables']
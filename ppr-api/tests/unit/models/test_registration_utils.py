@@ -80,7 +80,19 @@ TEST_QUERY_ORDER_DATA = [
     ('startDateTime', 'ascending', ' ORDER BY registration_ts ascending'),
     ('endDateTime', 'desc', ' ORDER BY registration_ts desc')
 ]
-
+# testdata pattern is ({sort_criteria}, {sort_order}, {cursor_id}, {start_ts}, {order_clause}, {cursor_clause})
+TEST_QUERY_KEYSET_DATA = [
+    (None, None, None, None, registration_utils.QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC, None),
+    (None, None, 200000000, None, registration_utils.QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC,
+     registration_utils.QUERY_ACCOUNT_REG_KEYSET_DESC),
+    ('invalid', 'asc', 200000000, None, registration_utils.QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC,
+     registration_utils.QUERY_ACCOUNT_REG_KEYSET_DESC),
+    ('startDateTime', 'ascending', 200000000, None, registration_utils.QUERY_ACCOUNT_REG_KEYSET_ORDER_ASC,
+     registration_utils.QUERY_ACCOUNT_REG_KEYSET_ASC),
+    (None, None, 200000000, '2021-09-02T16:00:00+00:00', registration_utils.QUERY_ACCOUNT_REG_KEYSET_ORDER_DESC,
+     registration_utils.QUERY_ACCOUNT_REG_KEYSET_DESC),
+    ('registrationNumber', 'asc', 200000000, None, ' ORDER BY registration_number asc', None)
+]
 # testdata pattern is ({reg_num}, {reg_type}, {client_ref}, {registering_name}, {status}, {start_ts}, {end_ts})
 TEST_QUERY_BASE_DATA = [
     (None, None, None, None, None, None, None),
@@ -281,6 +293,35 @@ def test_account_reg_query(session, reg_num, reg_type, client_ref, registering,
     assert query.find(registration_utils.QUERY_ACCOUNT_REG_LIMIT) != -1
 
 
+
+@pytest.mark.parametrize('sort_criteria,sort_order,cursor_id,start_ts,order_clause,cursor_clause',
+                         TEST_QUERY_KEYSET_DATA)
+def test_account_reg_keyset_query(session, sort_criteria, sort_order, cursor_id, start_ts, order_clause,
+                                  cursor_clause):
+    """Assert that the account registration query page cursor clauses are as expected."""
+    params: AccountRegistrationParams = AccountRegistrationParams(account_id='PS12345',
+                                                                  collapse=True,
+                                                                  account_name='Unit Testing',
+                                                                  sbc_staff=False)
+    params.sort_criteria = sort_criteria
+    params.sort_direction = sort_order
+    params.cursor_id = cursor_id
+    params.cursor_ts = model_utils.now_ts() if cursor_id else None
+    if start_ts:
+        params.start_date_time = start_ts
+        params.end_date_time = '2022-01-28T16:00:00+00:00'
+    query = registration_utils.build_account_reg_query(params)
+    query_params = registration_utils.build_account_query_params(params)
+    assert query.find(order_clause) != -1
+    if cursor_clause:
+        assert query.find(cursor_clause) != -1
+        assert query.endswith(registration_utils.QUERY_ACCOUNT_REG_KEYSET_LIMIT)
+        assert query_params['cursor_id'] == cursor_id
+    else:
+        assert query.find(':cursor_id') == -1
+        assert query.endswith(registration_utils.QUERY_ACCOUNT_REG_LIMIT)
+        assert 'cursor_id' not in query_params
+
 @pytest.mark.parametrize('reg_num,reg_type,client_ref,registering,status,start_ts,end_ts', TEST_QUERY_BASE_DATA)
 def test_account_change_query(session, reg_num, reg_type, client_ref, registering, status, start_ts, end_ts):
     """Assert that account change registration query is as expected."""
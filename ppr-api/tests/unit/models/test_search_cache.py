@@ -0,0 +1,156 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search results cache is working as expected."""
+import copy
+
+import pytest
+from flask import current_app
+
+from ppr_api.models import SearchRequest, search_cache
+from ppr_api.models.search_cache import SearchCache
+
+
+SERIAL_NUMBER_JSON = {
+    'type': 'SERIAL_NUMBER',
+    'criteria': {
+        'value': 'JU622994'
+    },
+    'clientReferenceId': 'T-SQ-SS-1'
+}
+BUSINESS_DEBTOR_JSON = {
+    'type': 'BUSINESS_DEBTOR',
+    'criteria': {
+        'debtorName': {
+            'business': 'TEST BUS 2 DEBTOR'
+        }
+    },
+    'clientReferenceId': 'T-SQ-DB-1'
+}
+# testdata pattern is ({description}, {search criteria}, {same key})
+TEST_KEY_DATA = [
+    ('Case and spaces', {'type': 'BUSINESS_DEBTOR', 'criteria': {'debtorName': {'business': ' test bus 2 debtor '}}},
+     True),
+    ('Business designation',
+     {'type': 'BUSINESS_DEBTOR', 'criteria': {'debtorName': {'business': 'TEST BUS 2 DEBTOR LTD'}}}, False),
+    ('Individual middle NONE', {'type': 'INDIVIDUAL_DEBTOR',
+                                'criteria': {'debtorName': {'last': 'Debtor', 'first': 'Test', 'second': 'None'}}},
+     True),
+    ('Registration number as submitted', {'type': 'REGISTRATION_NUMBER', 'criteria': {'value': 'test0001'}}, False)
+]
+# Search criteria the TEST_KEY_DATA criteria are compared with, by search type.
+TEST_KEY_BASE_DATA = {
+    'BUSINESS_DEBTOR': BUSINESS_DEBTOR_JSON,
+    'INDIVIDUAL_DEBTOR': {'type': 'INDIVIDUAL_DEBTOR', 'criteria': {'debtorName': {'last': 'DEBTOR', 'first': 'TEST'}}},
+    'REGISTRATION_NUMBER': {'type': 'REGISTRATION_NUMBER', 'criteria': {'value': 'TEST0001'}}
+}
+# testdata pattern is ({description}, {max size}, {ttl}, {version}, {lookup version}, {hit})
+TEST_CACHE_DATA = [
+    ('Hit', 10, 300, 1, 1, True),
+    ('Data version changed', 10, 300, 1, 2, False),
+    ('Expired', 10, -1, 1, 1, False),
+    ('Disabled', 0, 300, 1, 1, False)
+]
+# testdata pattern is ({search type}, {JSON data})
+TEST_SEARCH_DATA = [
+    ('SS', SERIAL_NUMBER_JSON),
+    ('BS', BUSINESS_DEBTOR_JSON)
+]
+
+
+@pytest.mark.parametrize('desc,max_size,ttl,version,lookup_version,hit', TEST_CACHE_DATA)
+def test_cache_get(session, desc, max_size, ttl, version, lookup_version, hit):
+    """Assert that cache lookups by key and data version work as expected."""
+    cache = SearchCache(max_size, ttl)
+    value = {'searchResponse': [{'baseRegistrationNumber': 'TEST0001'}]}
+    cache.put(('SS', ('JU622994',)), version, value)
+    result = cache.get(('SS', ('JU622994',)), lookup_version)
+    stats = cache.stats()
+    if hit:
+        assert result == value
+        assert result is not value
+        assert stats['hits'] == 1
+        assert stats['misses'] == 0
+    else:
+        assert result is None
+        assert stats['hits'] == 0
+        assert stats['misses'] == 1
+
+
+def test_cache_eviction(session):
+    """Assert that the least recently used entries are evicted when the cache is full."""
+    cache = SearchCache(2, 300)
+    cache.put('key1', 1, 'value1')
+    cache.put('key2', 1, 'value2')
+    assert cache.get('key1', 1) == 'value1'
+    cache.put('key3', 1, 'value3')
+    assert cache.get('key2', 1) is None
+    assert cache.get('key1', 1) == 'value1'
+    assert cache.get('key3', 1) == 'value3'
+    stats = cache.stats()
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+    cache.clear()
+    assert cache.stats()['size'] == 0
+
+
+@pytest.mark.parametrize('search_type,json_data', TEST_SEARCH_DATA)
+def test_search_cached(session, search_type, json_data):
+    """Assert that a repeated search is returned from the cache until the data version changes."""
+    enabled = current_app.config.get('SEARCH_CACHE_ENABLED')
+    current_app.config['SEARCH_CACHE_ENABLED'] = True
+    try:
+        search_cache.search_cache.clear()
+        query1 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query1.search()
+        assert search_cache.search_cache.stats()['misses'] == 1
+        query2 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query2.search()
+        assert search_cache.search_cache.stats()['hits'] == 1
+        assert query2.id != query1.id
+        assert query2.search_response == query1.search_response
+        assert query2.total_results_size == query1.total_results_size
+        assert query2.returned_results_size == query1.returned_results_size
+        search_cache.update_data_version()
+        query3 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+        query3.search()
+        assert search_cache.search_cache.stats()['hits'] == 1
+        assert search_cache.search_cache.stats()['misses'] == 2
+        assert query3.search_response == query1.search_response
+    finally:
+        current_app.config['SEARCH_CACHE_ENABLED'] = enabled
+        search_cache.search_cache.clear()
+
+
+@pytest.mark.parametrize('desc,json_data,same_key', TEST_KEY_DATA)
+def test_cache_key(session, desc, json_data, same_key):
+    """Assert that only search criteria binding the same query values share a cache key."""
+    query1 = SearchRequest.create_from_json(copy.deepcopy(TEST_KEY_BASE_DATA[json_data['type']]), 'PS12345')
+    query2 = SearchRequest.create_from_json(copy.deepcopy(json_data), 'PS12345')
+    assert (query1.get_cache_key() == query2.get_cache_key()) == same_key
+
+
+def test_update_data_version(session):
+    """Assert that the data version only changes when the cache is enabled."""
+    enabled = current_app.config.get('SEARCH_CACHE_ENABLED')
+    try:
+        current_app.config['SEARCH_CACHE_ENABLED'] = False
+        version = search_cache.get_data_version()
+        search_cache.update_data_version()
+        assert search_cache.get_data_version() == version
+        current_app.config['SEARCH_CACHE_ENABLED'] = True
+        search_cache.update_data_version()
+        assert search_cache.get_data_version() > version
+    finally:
+        current_app.config['SEARCH_CACHE_ENABLED'] = enabled
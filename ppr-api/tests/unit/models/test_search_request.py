@@ -20,10 +20,12 @@ from http import HTTPStatus
 import copy
 
 import pytest
+from flask import current_app
 
-from ppr_api.models import SearchRequest, search_utils
+from ppr_api.models import SearchableFinancingStatement, SearchRequest, search_utils
 from ppr_api.models.search_request import CHARACTER_SET_UNSUPPORTED
 from ppr_api.models.search_utils import AccountSearchParams
+from ppr_api.models import utils as model_utils
 from ppr_api.models.utils import now_ts_offset, format_ts
 from ppr_api.exceptions import BusinessException
 
@@ -395,6 +397,17 @@ TEST_EXPIRED_DATA = [
     ('BS', BS_EXPIRED_JSON, 'XXXXX99')
 ]
 
+# testdata pattern is ({search type}, {JSON data})
+TEST_FILTER_MODE_DATA = [
+    ('SS', SERIAL_NUMBER_JSON),
+    ('IS', INDIVIDUAL_DEBTOR_JSON),
+    ('BS', BUSINESS_DEBTOR_JSON),
+    ('RG', REGISTRATION_NUMBER_JSON),
+    ('RG', RG_DISCHARGED_JSON),
+    ('SS', SS_DISCHARGED_JSON),
+    ('SS', SS_EXPIRED_JSON)
+]
+
 # testdata pattern is ({description}, {reg number})
 TEST_REGISTRATION_TYPES = [
     ('Financing Statement', 'TEST0001'),
@@ -467,6 +480,8 @@ def test_search_valid(session, search_type, json_data):
     assert query.search_response
     assert query.account_id == 'PS12345'
     assert query.user_id == 'UNIT_TEST'
+    assert query.history_criteria
+    assert query.history_username is not None
     assert result['searchId']
     assert result['searchQuery']
     assert result['searchDateTime']
@@ -566,6 +581,24 @@ def test_search_discharged(session, search_type, json_data, excluded_match):
                 assert r['vehicleCollateral']['serialNumber'] != excluded_match
 
 
+@pytest.mark.parametrize('search_type,json_data', TEST_FILTER_MODE_DATA)
+def test_search_filter_mode(session, search_type, json_data):
+    """Assert that the legacy and searchable table financing statement filter modes return the same results."""
+    SearchableFinancingStatement.reconcile()
+    filter_mode = current_app.config.get('SEARCH_FINANCING_FILTER')
+    try:
+        current_app.config['SEARCH_FINANCING_FILTER'] = search_utils.SEARCH_FILTER_LEGACY
+        legacy_query = SearchRequest.create_from_json(json_data, 'PS12345')
+        legacy_query.search()
+        current_app.config['SEARCH_FINANCING_FILTER'] = search_utils.SEARCH_FILTER_TABLE
+        table_query = SearchRequest.create_from_json(json_data, 'PS12345')
+        table_query.search()
+    finally:
+        current_app.config['SEARCH_FINANCING_FILTER'] = filter_mode
+    assert legacy_query.returned_results_size == table_query.returned_results_size
+    assert legacy_query.search_response == table_query.search_response
+
+
 @pytest.mark.parametrize('desc,reg_num', TEST_REGISTRATION_TYPES)
 def test_registration_types(session, desc, reg_num):
     """Assert that a reg num searches on different registations returns the expected result."""
@@ -708,6 +741,22 @@ def test_find_by_account_id(session, account_id, from_ui, page_num, has_results)
         assert len(history) >= 1
 
 
+
+def test_find_by_account_id_cursor(session, monkeypatch):
+    """Assert that the account search history next page starts after the previous page cursor."""
+    monkeypatch.setattr(search_utils, 'ACCOUNT_SEARCH_HISTORY_MAX_SIZE', 1)
+    params: AccountSearchParams = AccountSearchParams('PS12345', False)
+    history = SearchRequest.find_all_by_account_id(params)
+    assert len(history) == 1
+    if history[0]['searchHistoryTotal'] > 1:
+        assert history[0].get('nextCursor')
+        params.cursor_ts, params.cursor_id = model_utils.decode_page_cursor(history[0]['nextCursor'])
+        next_history = SearchRequest.find_all_by_account_id(params)
+        assert len(next_history) == 1
+        assert next_history[0]['searchId'] != history[0]['searchId']
+        assert next_history[0]['searchDateTime'] <= history[0]['searchDateTime']
+
+
 def test_create_from_json(session):
     """Assert that the search_client creates from a json format correctly."""
     json_data = {
@@ -758,12 +807,25 @@ def test_search_invalid_criteria_400(session, client, jwt, search_type, json_dat
 
 
 @pytest.mark.parametrize('search_type,json_data,result_size', TEST_VALID_DATA_COUNT)
-def test_get_total_count(session, search_type, json_data, result_size):
-    """Assert that the get total count function works as expected."""
+def test_search_total_count(session, search_type, json_data, result_size):
+    """Assert that a search returns the total and exact match counts in the same pass as the results."""
     search_client = SearchRequest.create_from_json(json_data, 'PS12345')
-    search_client.get_total_count()
-    # print('test_total_count ' + search_type + ' actual results size=' + str(search_client.total_results_size))
+    search_client.search()
     assert search_client.total_results_size >= result_size
+    assert search_client.total_results_size == search_client.returned_results_size
+    exact_count = sum(1 for result in search_client.search_response if result['matchType'] == 'EXACT')
+    assert search_client.exact_results_size == exact_count
+
+
+@pytest.mark.parametrize('search_type,json_data,result_size', TEST_VALID_DATA_COUNT)
+def test_search_not_capped(session, monkeypatch, search_type, json_data, result_size):
+    """Assert that a search returns every match: the result set size limit is not applied to the results."""
+    monkeypatch.setattr(search_utils, 'SEARCH_RESULTS_MAX_SIZE', 1)
+    search_client = SearchRequest.create_from_json(json_data, 'PS12345')
+    search_client.search()
+    assert search_client.returned_results_size >= result_size
+    assert len(search_client.search_response) == search_client.returned_results_size
+    assert search_client.total_results_size == search_client.returned_results_size
 
 
 @pytest.mark.parametrize('desc,json_data,valid,message_content', TEST_DEBTOR_NAME_DATA)
@@ -0,0 +1,98 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the search selection index is working as expected."""
+import pytest
+
+from ppr_api.models.search_selection import SelectionIndex, build_selection_details, financing_reg_num
+
+
+# testdata pattern is ({description}, {registration numbers}, {lookup number}, {expected count})
+TEST_INDEX_DATA = [
+    ('Single', ['TEST0001', 'TEST0002'], 'TEST0001', 1),
+    ('Multiple', ['TEST0001', 'TEST0002', 'TEST0001'], 'TEST0001', 2),
+    ('Not found', ['TEST0001', 'TEST0002'], 'TESTXXXX', 0)
+]
+# testdata pattern is ({description}, {selection size})
+TEST_NESTED_DATA = [
+    ('Empty', 0),
+    ('Single', 1),
+    ('Multiple', 12)
+]
+
+
+def build_test_data(size: int):
+    """Build search selection and search details test data: every 4th similar match is not selected."""
+    search_select = []
+    results = []
+    for index in range(size):
+        reg_num = f'{index:06d}B'
+        match_type = 'EXACT' if index % 2 == 0 else 'SIMILAR'
+        select = {'baseRegistrationNumber': reg_num, 'matchType': match_type}
+        if match_type == 'SIMILAR' and index % 4 == 1:
+            select['selected'] = False
+        search_select.append(select)
+        # Duplicate selection of the same registration number.
+        if index % 10 == 0:
+            search_select.append(select)
+        results.append({'matchType': match_type, 'financingStatement': {'baseRegistrationNumber': reg_num}})
+    return search_select, list(reversed(results))
+
+
+def build_details_nested(search_select, results):
+    """Previous implementation of build details: nested list scans."""
+    new_results = []
+    similar_count = 0
+    for select in search_select:
+        if select['matchType'] == 'EXACT' or ('selected' not in select or select['selected']):
+            if select['matchType'] != 'EXACT':
+                similar_count += 1
+            reg_num = select['baseRegistrationNumber']
+            found = False
+            if new_results:
+                for match in new_results:
+                    if match['financingStatement']['baseRegistrationNumber'] == reg_num:
+                        found = True
+            if not found:
+                for result in results:
+                    if reg_num == result['financingStatement']['baseRegistrationNumber']:
+                        new_results.append(result)
+                        break
+    return new_results, similar_count
+
+
+@pytest.mark.parametrize('desc,reg_nums,lookup,count', TEST_INDEX_DATA)
+def test_selection_index(desc, reg_nums, lookup, count):
+    """Assert that the selection index lookups work as expected."""
+    items = [{'financingStatement': {'baseRegistrationNumber': reg_num}} for reg_num in reg_nums]
+    index = SelectionIndex(items, financing_reg_num)
+    assert len(index.all(lookup)) == count
+    if count:
+        assert lookup in index
+        assert index.first(lookup) == items[reg_nums.index(lookup)]
+    else:
+        assert lookup not in index
+        assert index.first(lookup) is None
+    assert index.add_seen(lookup)
+    assert not index.add_seen(lookup)
+
+
+@pytest.mark.parametrize('desc,size', TEST_NESTED_DATA)
+def test_build_details(desc, size):
+    """Assert that building details with the index matches the previous nested scan results."""
+    search_select, results = build_test_data(size)
+    new_results, similar_count = build_selection_details(search_select, results)
+    expected_results, expected_count = build_details_nested(search_select, results)
+    assert new_results == expected_results
+    assert similar_count == expected_count
@@ -64,6 +64,42 @@ TEST_QUERY_CRITERIA_DATA = [
     ("INDIVIDUAL_DEBTOR", "FNAME TEST", search_utils.SEARCH_FILTER_CRITERIA_DEFAULT),
     ("MHR_OWNER_NAME", "FNAME TEST", search_utils.SEARCH_FILTER_CRITERIA_DEFAULT),
 ]
+# testdata pattern is ({sort_criteria}, {sort_order}, {cursor_id}, {order_clause}, {cursor_clause})
+TEST_QUERY_KEYSET_DATA = [
+    (None, None, None, search_utils.SEARCH_ORDER_BY_KEYSET_DESC, None),
+    (None, None, 200000000, search_utils.SEARCH_ORDER_BY_KEYSET_DESC, search_utils.SEARCH_FILTER_KEYSET_DESC),
+    ('searchDateTime', 'descending', 200000000, search_utils.SEARCH_ORDER_BY_KEYSET_DESC,
+     search_utils.SEARCH_FILTER_KEYSET_DESC),
+    ('searchDateTime', 'ascending', 200000000, search_utils.SEARCH_ORDER_BY_KEYSET_ASC,
+     search_utils.SEARCH_FILTER_KEYSET_ASC),
+    ('type', 'ascending', 200000000, ' ORDER BY search_type ASC', None)
+]
+# testdata pattern is ({search_type}, {criteria}, {history_criteria})
+TEST_HISTORY_CRITERIA_DATA = [
+    ('RG', {'type': 'REGISTRATION_NUMBER', 'criteria': {'value': 'test0001'}}, 'TEST0001'),
+    ('BS', {'type': 'BUSINESS_DEBTOR', 'criteria': {'debtorName': {'business': 'Test Bus'}}}, 'TEST BUS'),
+    ('IS', {'type': 'INDIVIDUAL_DEBTOR', 'criteria': {'debtorName': {'last': 'Debtor', 'first': 'Test'}}},
+     'DEBTOR TEST'),
+    ('MI', {'type': 'MHR_OWNER_NAME', 'criteria': {'ownerName': {'last': 'Owner'}}}, 'OWNER '),
+    ('SS', {'type': 'SERIAL_NUMBER', 'criteria': {}}, None)
+]
+# testdata pattern is ({criteria}, {query_values})
+TEST_QUERY_VALUES_DATA = [
+    ({'type': 'REGISTRATION_NUMBER', 'criteria': {'value': ' test0001 '}}, ('TEST0001',)),
+    ({'type': 'BUSINESS_DEBTOR', 'criteria': {'debtorName': {'business': ' Test Bus '}}}, ('TEST BUS',)),
+    ({'type': 'INDIVIDUAL_DEBTOR', 'criteria': {'debtorName': {'last': 'Debtor ', 'first': ' Test'}}},
+     ('DEBTOR', 'TEST', '')),
+    ({'type': 'INDIVIDUAL_DEBTOR', 'criteria': {'debtorName': {'last': 'Debtor', 'first': 'Test', 'second': 'none'}}},
+     ('DEBTOR', 'TEST', '')),
+    ({'type': 'INDIVIDUAL_DEBTOR', 'criteria': {'debtorName': {'last': 'Debtor', 'first': 'Test', 'second': ' j'}}},
+     ('DEBTOR', 'TEST', 'J'))
+]
+# testdata pattern is ({search_type}, {selection}, {exact_count})
+TEST_HISTORY_EXACT_DATA = [
+    ('RG', None, 0),
+    ('BS', [{'matchType': 'EXACT'}, {'matchType': 'SIMILAR'}, {'matchType': 'EXACT'}], 2),
+    ('MM', [{'matchType': 'EXACT'}], -1)
+]
 
 @pytest.mark.parametrize('sort_criteria,sort_order,value', TEST_QUERY_ORDER_DATA)
 def test_account_search_order(session, sort_criteria, sort_order, value):
@@ -122,6 +158,46 @@ def test_account_filter_query(session, search_type, client_ref, username, start_
     assert query.find(search_utils.QUERY_ACCOUNT_HISTORY_LIMIT) != -1
 
 
+@pytest.mark.parametrize('search_type,criteria,history_criteria', TEST_HISTORY_CRITERIA_DATA)
+def test_history_criteria(session, search_type, criteria, history_criteria):
+    """Assert that the account search history criteria value is as expected."""
+    assert search_utils.get_history_criteria(search_type, criteria) == history_criteria
+
+
+@pytest.mark.parametrize('search_type,selection,exact_count', TEST_HISTORY_EXACT_DATA)
+def test_history_exact_count(session, search_type, selection, exact_count):
+    """Assert that the account search history exact match count is as expected."""
+    assert search_utils.get_history_exact_count(search_type, selection) == exact_count
+
+
+@pytest.mark.parametrize('criteria,query_values', TEST_QUERY_VALUES_DATA)
+def test_query_values(session, criteria, query_values):
+    """Assert that the search criteria values bound to the search query are as expected."""
+    assert search_utils.get_query_values(criteria) == query_values
+
+
+@pytest.mark.parametrize('sort_criteria,sort_order,cursor_id,order_clause,cursor_clause', TEST_QUERY_KEYSET_DATA)
+def test_account_keyset_query(session, sort_criteria, sort_order, cursor_id, order_clause, cursor_clause):
+    """Assert that the account search history query page cursor clauses are as expected."""
+    params: AccountSearchParams = AccountSearchParams(account_id='PS12345', sbc_staff=False)
+    params.sort_criteria = sort_criteria
+    params.sort_direction = sort_order
+    params.cursor_id = cursor_id
+    params.cursor_ts = model_utils.now_ts() if cursor_id else None
+    query: str = search_utils.build_search_history_query(params)
+    query_params = search_utils.build_account_query_params(params)
+    assert query.find(order_clause) != -1
+    if cursor_clause:
+        assert query.find(cursor_clause) != -1
+        assert query.endswith(search_utils.QUERY_ACCOUNT_HISTORY_KEYSET_LIMIT)
+        assert query_params['cursor_id'] == cursor_id
+        assert query_params['cursor_ts']
+    else:
+        assert query.find(':cursor_id') == -1
+        assert query.endswith(search_utils.QUERY_ACCOUNT_HISTORY_LIMIT)
+        assert 'cursor_id' not in query_params
+
+
 @pytest.mark.parametrize('search_type,client_ref,username,start_ts,end_ts,filter_clause', TEST_QUERY_FILTER_DATA)
 def test_account_query_params(session, search_type,client_ref,username,start_ts,end_ts,filter_clause):
     """Assert that account search history query params are as expected."""
@@ -0,0 +1,70 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the Searchable Financing Statement Model.
+
+Test-Suite to ensure that the Searchable Financing Statement Model is working as expected.
+"""
+import pytest
+
+from ppr_api.models import SearchableFinancingStatement, search_utils
+
+
+# testdata pattern is ({description}, {financing_id}, {searchable})
+TEST_RECONCILE_DATA = [
+    ('Active', 200000000, True),
+    ('Discharged more than 30 days', 200000008, False)
+]
+# testdata pattern is ({filter mode}, {expected from clause}, {expected where clause})
+TEST_QUERY_DATA = [
+    (search_utils.SEARCH_FILTER_LEGACY, 'financing_statements fs,', 'NOT EXISTS'),
+    (search_utils.SEARCH_FILTER_TABLE, 'searchable_financing_statements sfs', 'sfs.discharge_ts IS NULL'),
+    ('UNKNOWN', 'financing_statements fs,', 'NOT EXISTS')
+]
+
+
+@pytest.mark.parametrize('desc,financing_id,searchable', TEST_RECONCILE_DATA)
+def test_reconcile(session, desc, financing_id, searchable):
+    """Assert that reconciling the searchable financing statements works as expected."""
+    counts = SearchableFinancingStatement.reconcile()
+    assert counts.get('deleted') is not None
+    assert counts.get('updated') is not None
+    result = SearchableFinancingStatement.find_by_financing_id(financing_id)
+    if searchable:
+        assert result
+        assert result.financing_id == financing_id
+        assert result.update_ts
+        assert not result.discharge_ts
+    else:
+        assert not result
+
+
+def test_update_by_financing_id(session):
+    """Assert that updating a searchable financing statement by financing id works as expected."""
+    SearchableFinancingStatement.update_by_financing_id(200000000)
+    result = SearchableFinancingStatement.find_by_financing_id(200000000)
+    assert result
+    assert result.expire_date
+    assert not result.discharge_ts
+
+
+@pytest.mark.parametrize('filter_mode,from_clause,where_clause', TEST_QUERY_DATA)
+def test_build_search_query(session, filter_mode, from_clause, where_clause):
+    """Assert that building the search query for the filter mode works as expected."""
+    for template in (search_utils.SERIAL_NUM_QUERY, search_utils.REG_NUM_QUERY, search_utils.BUSINESS_NAME_QUERY,
+                     search_utils.INDIVIDUAL_NAME_QUERY, search_utils.INDIVIDUAL_NAME_MIDDLE_QUERY):
+        query = search_utils.build_search_query(template, filter_mode)
+        assert query.find('{') == -1
+        assert query.find(from_clause) > 0
+        assert query.find(where_clause) > 0
@@ -162,6 +162,14 @@ TEST_DATA_TRANSITION_RL = [
     (1, False),
     (-1, True),
 ]
+# testdata pattern is ({desc}, {cursor}, {valid})
+TEST_DATA_PAGE_CURSOR = [
+    ('Valid', model_utils.encode_page_cursor(model_utils.ts_from_iso_format('2021-02-16T23:00:00+00:00'), 200000001),
+     True),
+    ('Invalid encoding', '!!!', False),
+    ('Missing id', 'MjAyMS0wMi0xNlQyMzowMDowMCswMDowMA==', False),
+    ('Invalid id', 'MjAyMS0wMi0xNlQyMzowMDowMCswMDowMHxYWA==', False)
+]
 
 
 @pytest.mark.parametrize('registration_ts,offset,expiry_ts', TEST_DATA_EXPIRY)
@@ -240,6 +248,18 @@ def test_ts_from_iso_format():
     assert test_ts.hour == 7
 
 
+@pytest.mark.parametrize('desc,cursor,valid', TEST_DATA_PAGE_CURSOR)
+def test_page_cursor(desc, cursor, valid):
+    """Assert that decoding an account list page cursor works as expected."""
+    cursor_ts, cursor_id = model_utils.decode_page_cursor(cursor)
+    if valid:
+        assert cursor_ts == model_utils.ts_from_iso_format('2021-02-16T23:00:00+00:00')
+        assert cursor_id == 200000001
+    else:
+        assert cursor_ts is None
+        assert cursor_id is None
+
+
 def test_ts_from_date_iso_format():
     """Assert that creating a UTC datetime object from an ISO date-time formatted string is performing as expected."""
     if is_ci_testing():
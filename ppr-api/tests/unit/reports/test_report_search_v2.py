@@ -17,12 +17,24 @@
 Test-Suite to ensure that the report service search results report is working as expected.
 """
 from http import HTTPStatus
+import io
 import json
 
+import pytest
 from flask import current_app
+from PyPDF2 import PdfReader, PdfWriter
 
 from ppr_api.reports.v2.report import Report
-from ppr_api.reports.v2.report_utils import ReportTypes, merge_pdfs
+from ppr_api.reports.v2.report_utils import (
+    TOC_MODE_LINK,
+    TOC_MODE_RENDER,
+    ReportTypes,
+    TemplateRegistry,
+    get_anchor_page_indexes,
+    merge_pdfs,
+    set_subreport_page_offsets,
+    update_toc_page_numbers,
+)
 
 
 SEARCH_RESULT_RG_DATAFILE = 'tests/unit/reports/data/search-detail-reg-num-example.json'
@@ -64,6 +76,16 @@ SEARCH_COVER_DATAFILE = 'tests/unit/reports/data/search-cover-example.json'
 SEARCH_COVER_PDFFILE = 'tests/unit/reports/data/search-cover-example.pdf'
 REPORT_VERSION_V2 = '2'
 MERGE_PDFFILE = 'tests/unit/reports/data/search-merge.pdf'
+# testdata pattern is ({description}, {page number offset}, {TEST0001 page}, {TEST0003 page}, {new offset})
+TEST_TOC_ANCHOR_DATA = [
+    ('No offset', None, 2, 4, None),
+    ('Sub-report offset', 10, 12, 14, 15)
+]
+# testdata pattern is ({description}, {TOC mode}, {report calls}, {TOC link text})
+TEST_TOC_MODE_DATA = [
+    ('Render', TOC_MODE_RENDER, 2, 'PAGE'),
+    ('Link', TOC_MODE_LINK, 1, 'View')
+]
 
 
 def test_merge(session, client, jwt):
@@ -275,6 +297,114 @@ def test_search_cover(session, client, jwt):
         check_response(content, status, SEARCH_COVER_PDFFILE)
 
 
+def test_subreport_page_offsets(session):
+    """Assert that setting large search sub-report TOC page number offsets works as expected."""
+    subreports = [
+        {'pageNumOffset': 10, 'selected': [{'pageNumber': 3}, {'pageNumber': 8}]},
+        {'pageNumOffset': 7, 'selected': [{'pageNumber': 3}, {}]},
+        {'pageNumOffset': 5, 'selected': [{'pageNumber': 4}]}
+    ]
+    page_count = set_subreport_page_offsets(subreports)
+    assert page_count == 22
+    assert subreports[0]['selected'][0]['pageNumber'] == 3
+    assert subreports[0]['selected'][1]['pageNumber'] == 8
+    assert subreports[0]['pageNumOffset'] == 10
+    assert subreports[1]['selected'][0]['pageNumber'] == 13
+    assert not subreports[1]['selected'][1].get('pageNumber')
+    assert subreports[1]['pageNumOffset'] == 17
+    assert subreports[2]['selected'][0]['pageNumber'] == 21
+    assert subreports[2]['pageNumOffset'] == 22
+
+
+@pytest.mark.parametrize('desc,offset,page1,page3,new_offset', TEST_TOC_ANCHOR_DATA)
+def test_toc_page_numbers_anchors(session, desc, offset, page1, page3, new_offset):
+    """Assert that the TOC page numbers are set from the pdf named destinations of the TOC links."""
+    json_data = {
+        'totalResultsSize': 2,
+        'selected': [
+            {'baseRegistrationNumber': 'TEST0001'},
+            {'baseRegistrationNumber': 'TEST0001'},
+            {'baseRegistrationNumber': 'TEST0003'}
+        ]
+    }
+    if offset is not None:
+        json_data['pageNumOffset'] = offset
+    pdf_data = build_anchor_pdf(5, {'TEST0001': 1, 'TEST0003': 3})
+    assert get_anchor_page_indexes(PdfReader(io.BytesIO(pdf_data))) == {'TEST0001': 1, 'TEST0003': 3}
+    update_toc_page_numbers(json_data, pdf_data)
+    assert json_data['totalPageCount'] == 5
+    assert json_data['selected'][0]['pageNumber'] == page1
+    assert 'pageNumber' not in json_data['selected'][1]
+    assert json_data['selected'][2]['pageNumber'] == page3
+    assert json_data.get('pageNumOffset') == new_offset
+
+
+@pytest.mark.parametrize('desc,toc_mode,calls,link_text', TEST_TOC_MODE_DATA)
+def test_search_pdf_toc_mode(session, monkeypatch, desc, toc_mode, calls, link_text):
+    """Assert that a search report renders twice with TOC page numbers or once with TOC links by TOC mode."""
+    json_data = get_json_from_file(SEARCH_RESULT_BS_DATAFILE)
+    reg_nums = list(dict.fromkeys(select['baseRegistrationNumber'] for select in json_data['selected']))
+    anchors = {reg_num: index + 1 for index, reg_num in enumerate(reg_nums)}
+    pdf_data = build_anchor_pdf(len(reg_nums) + 1, anchors)
+    requests = []
+
+    def send_request(report, uri, meta_data, files, rs_token):
+        requests.append(files['index.html'])
+        return MockResponse(pdf_data)
+
+    monkeypatch.setattr(Report, 'get_report_service_token', lambda report: 'token')
+    monkeypatch.setattr(Report, 'send_request', send_request)
+    mode_config = current_app.config.get('REPORT_SEARCH_TOC_MODE')
+    try:
+        current_app.config['REPORT_SEARCH_TOC_MODE'] = toc_mode
+        report = Report(json_data, 'PS12345', ReportTypes.SEARCH_DETAIL_REPORT, 'Account Name')
+        content, status, headers = report.get_search_pdf()
+    finally:
+        current_app.config['REPORT_SEARCH_TOC_MODE'] = mode_config
+    assert status == HTTPStatus.OK
+    assert content == pdf_data
+    assert headers
+    assert len(requests) == calls
+    for reg_num, index in anchors.items():
+        text = str(index + 1) if link_text == 'PAGE' else link_text
+        assert requests[-1].find(f'href="#{reg_num}">{text}</a>') != -1
+
+
+def test_template_registry(session):
+    """Assert that the report template registry assembles and compiles a template once."""
+    TemplateRegistry.clear()
+    file_name = 'searchResultV2.html'
+    source = TemplateRegistry.get_source(file_name)
+    assert source
+    assert source.find('[[') == -1
+    assert TemplateRegistry.get_source(file_name) is source
+    template = TemplateRegistry.get_template(file_name)
+    assert template
+    assert TemplateRegistry.get_template(file_name) is template
+    assert TemplateRegistry.warm_up([file_name, 'unknown.html']) == 1
+
+
+class MockResponse:
+    """Report service response returning the pdf data."""
+
+    def __init__(self, content):
+        """Set the pdf content."""
+        self.status_code = HTTPStatus.OK
+        self.content = content
+
+
+def build_anchor_pdf(page_count: int, anchors: dict) -> bytes:
+    """Build a pdf of blank pages with a named destination by registration number at the page index."""
+    writer = PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(612, 792)
+    for reg_num, page_index in anchors.items():
+        writer.add_named_destination(reg_num, page_index)
+    pdf_data = io.BytesIO()
+    writer.write(pdf_data)
+    return pdf_data.getvalue()
+
+
 def get_json_from_file(data_file: str):
     """Get json data from report data file."""
     text_data = None
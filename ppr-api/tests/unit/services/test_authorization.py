@@ -16,6 +16,9 @@
 
 Test-Suite to ensure that the client for the auth-api service is working as expected.
 """
+import base64
+import json
+
 import pytest
 from flask import current_app
 
@@ -70,6 +73,14 @@ def test_user_orgs_mock(client, session, jwt):
     assert org['id']
     assert org['name']
 
+# testdata pattern is ({description}, {subject}, {account id}, {invalidate subject}, {invalidate account}, {cached})
+TEST_CACHE_DATA = [
+    ('Cached', 'user1', '1234', None, '2518', True),
+    ('Invalidate account', 'user1', '1234', None, '1234', False),
+    ('Invalidate subject', 'user1', '1234', 'user1', None, False),
+    ('Invalidate all', 'user1', None, None, None, False)
+]
+
 
 @pytest.mark.parametrize('desc,account_id,valid', TEST_SBC_DATA)
 def test_sbc_office_account(session, jwt, desc, account_id, valid):
@@ -99,3 +110,26 @@ def test_staff_account(session, desc, account_id, valid):
     result = authz.is_staff_account(account_id)
     # check
     assert result == valid
+
+
+@pytest.mark.parametrize('desc,subject,account_id,inv_subject,inv_account,cached', TEST_CACHE_DATA)
+def test_auth_cache(session, desc, subject, account_id, inv_subject, inv_account, cached):
+    """Assert that caching and invalidating auth api responses works as expected."""
+    cache = authz.AuthCache()
+    key = (subject, account_id, MOCK_URL)
+    cache.put(key, (200, {'orgType': 'PREMIUM'}), 300, 10)
+    found, value = cache.get(key)
+    assert found
+    assert value[1]['orgType'] == 'PREMIUM'
+    cache.invalidate(inv_subject, inv_account)
+    found, value = cache.get(key)
+    assert found == cached
+    cache.put(key, (None, None), 0, 10)
+    assert cache.get(key)[0] == cached
+
+
+def test_token_subject(session):
+    """Assert that getting the token subject for auth api cache keys works as expected."""
+    payload = base64.urlsafe_b64encode(json.dumps({'sub': 'user1'}).encode()).decode().rstrip('=')
+    assert authz.get_token_subject(f'header.{payload}.signature') == 'user1'
+    assert not authz.get_token_subject('invalid')
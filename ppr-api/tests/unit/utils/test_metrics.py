@@ -0,0 +1,117 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Prometheus compatible metrics tests."""
+from http import HTTPStatus
+
+import pytest
+
+from ppr_api.utils.metrics import (
+    REQUEST_LATENCY,
+    SEARCH_RESULTS_SIZE,
+    STORAGE_BYTES,
+    end_request,
+    metrics,
+    start_request,
+)
+
+
+# testdata pattern is ({description}, {enabled}, {count})
+TEST_OBSERVE_DATA = [
+    ('Enabled', True, 3),
+    ('Disabled', False, 0)
+]
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Enable recording for the test, restoring the original state after."""
+    enabled = metrics.enabled
+    metrics.enabled = True
+    metrics.clear()
+    yield metrics
+    metrics.clear()
+    metrics.enabled = enabled
+
+
+@pytest.mark.parametrize('desc,enabled,count', TEST_OBSERVE_DATA)
+def test_histogram_observe(app, desc, enabled, count):
+    """Assert that histogram observations are only recorded when enabled and render cumulative buckets."""
+    original = metrics.enabled
+    metrics.enabled = enabled
+    try:
+        for size in (0, 7, 3000):
+            SEARCH_RESULTS_SIZE.observe(size, search_type='SS', stage='query')
+        text = '\n'.join(SEARCH_RESULTS_SIZE.render())
+    finally:
+        metrics.enabled = original
+        SEARCH_RESULTS_SIZE.clear()
+    assert '# TYPE ppr_api_search_results_size histogram' in text
+    if count:
+        assert 'ppr_api_search_results_size_bucket{search_type="SS",stage="query",le="0"} 1' in text
+        assert 'ppr_api_search_results_size_bucket{search_type="SS",stage="query",le="10"} 2' in text
+        assert 'ppr_api_search_results_size_bucket{search_type="SS",stage="query",le="+Inf"} 3' in text
+        assert f'ppr_api_search_results_size_count{{search_type="SS",stage="query"}} {count}' in text
+    else:
+        assert 'ppr_api_search_results_size_count' not in text
+
+
+def test_request_latency(app, enabled_metrics):
+    """Assert that request latency is recorded by blueprint and route."""
+    with app.test_request_context('/ops/healthz'):
+        start_request()
+        end_request(app.response_class(status=200))
+    text = enabled_metrics.render()
+    labels = 'blueprint="OPS1",route="/ops/healthz",method="GET",status="200"'
+    assert f'ppr_api_http_request_duration_seconds_count{{{labels}}} 1' in text
+
+
+def test_namespace(app, enabled_metrics):
+    """Assert that metric names are prefixed with the configured namespace."""
+    assert app.config.get('METRICS_NAMESPACE') == 'ppr_api'
+    namespace = enabled_metrics.namespace
+    enabled_metrics.namespace = 'test_api'
+    try:
+        text = enabled_metrics.render()
+    finally:
+        enabled_metrics.namespace = namespace
+    assert '# TYPE test_api_http_request_duration_seconds histogram' in text
+    assert 'ppr_api_' not in text
+
+
+def test_label_escape(enabled_metrics):
+    """Assert that label values are escaped."""
+    STORAGE_BYTES.observe(100, operation='get', doc_type='A"B')
+    assert 'doc_type="A\\"B"' in enabled_metrics.render()
+
+
+def test_get_metrics(session, client, enabled_metrics):
+    """Assert that the metrics endpoint returns the exposition format with the database pool state."""
+    rv = client.get('/metrics')
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.content_type.startswith('text/plain')
+    text = rv.get_data(as_text=True)
+    assert '# TYPE ppr_api_http_request_duration_seconds histogram' in text
+    assert 'ppr_api_db_pool_checked_out' in text
+    assert REQUEST_LATENCY.name in text
+
+
+def test_get_metrics_disabled(session, client):
+    """Assert that the metrics endpoint is not available unless enabled."""
+    enabled = metrics.enabled
+    metrics.enabled = False
+    try:
+        rv = client.get('/metrics')
+    finally:
+        metrics.enabled = enabled
+    assert rv.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,46 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests that the modules mirrored in the mhr-api package have not drifted.
+
+The PPR and MHR APIs are separately built packages, so shared helpers are kept as identical copies. The copies may
+only differ in the package imports; per API differences belong in the configuration.
+"""
+import os
+
+import pytest
+
+
+MHR_API_SRC = '../mhr-api/src/mhr_api'
+PPR_API_SRC = 'src/ppr_api'
+# testdata pattern is ({module path})
+TEST_MIRROR_DATA = [
+    'models/reference_cache.py',
+    'models/search_cache.py',
+    'services/sql_profiler.py',
+    'utils/logging.py',
+    'utils/metrics.py'
+]
+
+
+@pytest.mark.parametrize('module_path', TEST_MIRROR_DATA)
+def test_mirrored_module(module_path):
+    """Assert that the mhr-api copy of the module only differs in the package imports."""
+    mhr_path = os.path.join(MHR_API_SRC, module_path)
+    if not os.path.exists(mhr_path):
+        pytest.skip('The mhr-api source is not available.')
+    with open(os.path.join(PPR_API_SRC, module_path), 'r') as ppr_file:
+        ppr_source = ppr_file.read()
+    with open(mhr_path, 'r') as mhr_file:
+        mhr_source = mhr_file.read()
+    assert ppr_source.replace('ppr_api', 'mhr_api') == mhr_source